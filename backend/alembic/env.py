@@ -1,3 +1,4 @@
+import re
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config, pool
@@ -32,6 +33,28 @@ if config.config_file_name is not None:
 target_metadata = SQLModel.metadata
 
 
+def include_object(_obj, name, type_, reflected, compare_to) -> bool:
+    """Keep database objects the models do not declare out of autogenerate.
+
+    The session search index (SESSION_SEARCH_DDL in db_models) is created with
+    raw DDL: the SQLite FTS5 table with its shadow tables, and the PostgreSQL
+    search_vector column with its GIN index. On PostgreSQL the events table
+    is partitioned by hour (events_default, events_pYYYYMMDDHH), and partitions
+    are created and dropped at runtime. Without this filter
+    `alembic revision --autogenerate` would drop them.
+    """
+    if reflected and compare_to is None:
+        if type_ == "table" and re.fullmatch(r"events_(default|p\d{10})", name):
+            return False
+        if type_ == "table" and name.startswith("session_search_fts"):
+            return False
+        if type_ == "column" and name == "search_vector":
+            return False
+        if type_ == "index" and name == "ix_session_search_vector":
+            return False
+    return True
+
+
 def run_migrations_online() -> None:
     """Run migrations by connecting to the database and executing SQL directly.
 
@@ -50,6 +73,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             render_as_batch=connection.dialect.name == "sqlite",
+            include_object=include_object,
         )
 
         with context.begin_transaction():
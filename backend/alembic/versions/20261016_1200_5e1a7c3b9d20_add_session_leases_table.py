@@ -0,0 +1,65 @@
+"""add session_leases table for queue capacity accounting
+
+Revision ID: 5e1a7c3b9d20
+Revises: b67c135119d7
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1a7c3b9d20"
+down_revision: Union[str, Sequence[str], None] = "b67c135119d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "session_leases" not in existing_tables:
+        op.create_table(
+            "session_leases",
+            sa.Column("session_id", sa.String(), nullable=False),
+            sa.Column("pod_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("acquired_at_us", sa.BIGINT(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["session_id"], ["alert_sessions.session_id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("session_id"),
+        )
+        with op.batch_alter_table("session_leases", schema=None) as batch_op:
+            batch_op.create_index("ix_session_leases_pod_id", ["pod_id"], unique=False)
+
+        # Seed leases for sessions already in progress so capacity is accounted for
+        # immediately after upgrade (the orphan-cleanup path keeps them in sync afterwards)
+        op.execute(
+            "INSERT INTO session_leases (session_id, pod_id, acquired_at_us) "
+            "SELECT session_id, COALESCE(pod_id, 'unknown'), last_interaction_at "
+            "FROM alert_sessions WHERE status = 'in_progress'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "session_leases" in existing_tables:
+        with op.batch_alter_table("session_leases", schema=None) as batch_op:
+            batch_op.drop_index("ix_session_leases_pod_id")
+        op.drop_table("session_leases")
@@ -0,0 +1,78 @@
+"""add queue priority to alert_sessions and alert_type to session_leases
+
+Revision ID: 6f2b8d4e1a37
+Revises: 5e1a7c3b9d20
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f2b8d4e1a37"
+down_revision: Union[str, Sequence[str], None] = "5e1a7c3b9d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    session_columns = [col["name"] for col in inspector.get_columns("alert_sessions")]
+    session_indexes = [idx["name"] for idx in inspector.get_indexes("alert_sessions")]
+    if "priority" not in session_columns:
+        with op.batch_alter_table("alert_sessions", schema=None) as batch_op:
+            # Existing sessions get NORMAL priority
+            batch_op.add_column(
+                sa.Column("priority", sa.Integer(), nullable=False, server_default="1")
+            )
+    if "ix_alert_sessions_queue_order" not in session_indexes:
+        with op.batch_alter_table("alert_sessions", schema=None) as batch_op:
+            batch_op.create_index(
+                "ix_alert_sessions_queue_order",
+                ["status", "alert_type", "priority", "started_at_us"],
+                unique=False,
+            )
+
+    lease_columns = [col["name"] for col in inspector.get_columns("session_leases")]
+    if "alert_type" not in lease_columns:
+        with op.batch_alter_table("session_leases", schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column("alert_type", sqlmodel.sql.sqltypes.AutoString(), nullable=True)
+            )
+        op.execute(
+            "UPDATE session_leases SET alert_type = ("
+            "SELECT alert_type FROM alert_sessions "
+            "WHERE alert_sessions.session_id = session_leases.session_id)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    lease_columns = [col["name"] for col in inspector.get_columns("session_leases")]
+    if "alert_type" in lease_columns:
+        with op.batch_alter_table("session_leases", schema=None) as batch_op:
+            batch_op.drop_column("alert_type")
+
+    session_columns = [col["name"] for col in inspector.get_columns("alert_sessions")]
+    session_indexes = [idx["name"] for idx in inspector.get_indexes("alert_sessions")]
+    if "ix_alert_sessions_queue_order" in session_indexes:
+        with op.batch_alter_table("alert_sessions", schema=None) as batch_op:
+            batch_op.drop_index("ix_alert_sessions_queue_order")
+    if "priority" in session_columns:
+        with op.batch_alter_table("alert_sessions", schema=None) as batch_op:
+            batch_op.drop_column("priority")
@@ -0,0 +1,64 @@
+"""add alert_fingerprint and duplicate_count to alert_sessions
+
+Revision ID: 8c3d5f7a9b12
+Revises: 6f2b8d4e1a37
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3d5f7a9b12"
+down_revision: Union[str, Sequence[str], None] = "6f2b8d4e1a37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    columns = [col["name"] for col in inspector.get_columns("alert_sessions")]
+    indexes = [idx["name"] for idx in inspector.get_indexes("alert_sessions")]
+
+    with op.batch_alter_table("alert_sessions", schema=None) as batch_op:
+        if "alert_fingerprint" not in columns:
+            batch_op.add_column(
+                sa.Column("alert_fingerprint", sqlmodel.sql.sqltypes.AutoString(), nullable=True)
+            )
+        if "duplicate_count" not in columns:
+            batch_op.add_column(
+                sa.Column("duplicate_count", sa.Integer(), nullable=False, server_default="0")
+            )
+        if "ix_alert_sessions_fingerprint_started_at" not in indexes:
+            batch_op.create_index(
+                "ix_alert_sessions_fingerprint_started_at",
+                ["alert_fingerprint", "started_at_us"],
+                unique=False,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    columns = [col["name"] for col in inspector.get_columns("alert_sessions")]
+    indexes = [idx["name"] for idx in inspector.get_indexes("alert_sessions")]
+
+    with op.batch_alter_table("alert_sessions", schema=None) as batch_op:
+        if "ix_alert_sessions_fingerprint_started_at" in indexes:
+            batch_op.drop_index("ix_alert_sessions_fingerprint_started_at")
+        if "duplicate_count" in columns:
+            batch_op.drop_column("duplicate_count")
+        if "alert_fingerprint" in columns:
+            batch_op.drop_column("alert_fingerprint")
@@ -0,0 +1,62 @@
+"""add mcp_tool_catalogs table and tool_catalog_hashes to mcp_communications
+
+Revision ID: 3a9d6e2f4c81
+Revises: 8c3d5f7a9b12
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3a9d6e2f4c81"
+down_revision: Union[str, Sequence[str], None] = "8c3d5f7a9b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "mcp_tool_catalogs" not in existing_tables:
+        op.create_table(
+            "mcp_tool_catalogs",
+            sa.Column("catalog_hash", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("server_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("tools", sa.JSON(), nullable=True),
+            sa.Column("created_at_us", sa.BIGINT(), nullable=True),
+            sa.PrimaryKeyConstraint("catalog_hash"),
+        )
+
+    # Existing rows keep their inline available_tools and are read as before
+    columns = [col["name"] for col in inspector.get_columns("mcp_communications")]
+    with op.batch_alter_table("mcp_communications", schema=None) as batch_op:
+        if "tool_catalog_hashes" not in columns:
+            batch_op.add_column(sa.Column("tool_catalog_hashes", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    columns = [col["name"] for col in inspector.get_columns("mcp_communications")]
+    with op.batch_alter_table("mcp_communications", schema=None) as batch_op:
+        if "tool_catalog_hashes" in columns:
+            batch_op.drop_column("tool_catalog_hashes")
+
+    if "mcp_tool_catalogs" in existing_tables:
+        op.drop_table("mcp_tool_catalogs")
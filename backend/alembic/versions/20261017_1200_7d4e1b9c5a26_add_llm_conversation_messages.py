@@ -0,0 +1,114 @@
+"""add llm_conversation_messages table and message_hashes to llm_interactions
+
+Revision ID: 7d4e1b9c5a26
+Revises: 3a9d6e2f4c81
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d4e1b9c5a26"
+down_revision: Union[str, Sequence[str], None] = "3a9d6e2f4c81"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "llm_conversation_messages" not in existing_tables:
+        op.create_table(
+            "llm_conversation_messages",
+            sa.Column("session_id", sa.String(), nullable=False),
+            sa.Column("message_hash", sa.String(), nullable=False),
+            sa.Column("role", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("content", sa.String(), nullable=False),
+            sa.Column("created_at_us", sa.BIGINT(), nullable=True),
+            sa.ForeignKeyConstraint(["session_id"], ["alert_sessions.session_id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("session_id", "message_hash"),
+        )
+
+    # Existing rows keep their inline conversation and are read as before
+    columns = [col["name"] for col in inspector.get_columns("llm_interactions")]
+    with op.batch_alter_table("llm_interactions", schema=None) as batch_op:
+        if "message_hashes" not in columns:
+            batch_op.add_column(sa.Column("message_hashes", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    columns = [col["name"] for col in inspector.get_columns("llm_interactions")]
+    if "message_hashes" in columns and "llm_conversation_messages" in existing_tables:
+        # Inline the conversations of rows stored as hashes before dropping them
+        _inline_conversations(conn)
+
+    with op.batch_alter_table("llm_interactions", schema=None) as batch_op:
+        if "message_hashes" in columns:
+            batch_op.drop_column("message_hashes")
+
+    if "llm_conversation_messages" in existing_tables:
+        op.drop_table("llm_conversation_messages")
+
+
+def _inline_conversations(conn) -> None:
+    """Write conversations referenced by message hashes back into llm_interactions."""
+    import json
+
+    interactions = sa.table(
+        "llm_interactions",
+        sa.column("interaction_id", sa.String()),
+        sa.column("session_id", sa.String()),
+        sa.column("conversation", sa.JSON()),
+        sa.column("message_hashes", sa.JSON()),
+    )
+    messages = sa.table(
+        "llm_conversation_messages",
+        sa.column("session_id", sa.String()),
+        sa.column("message_hash", sa.String()),
+        sa.column("role", sa.String()),
+        sa.column("content", sa.String()),
+    )
+    rows = conn.execute(
+        sa.select(interactions.c.interaction_id, interactions.c.session_id, interactions.c.message_hashes)
+        .where(interactions.c.message_hashes.isnot(None))
+        .order_by(interactions.c.session_id)
+    ).all()
+
+    session_messages: dict = {}
+    loaded_session = None
+    for interaction_id, session_id, message_hashes in rows:
+        if isinstance(message_hashes, str):
+            message_hashes = json.loads(message_hashes)
+        if session_id != loaded_session:
+            session_messages = {
+                message_hash: {"role": role, "content": content}
+                for message_hash, role, content in conn.execute(
+                    sa.select(messages.c.message_hash, messages.c.role, messages.c.content)
+                    .where(messages.c.session_id == session_id)
+                ).all()
+            }
+            loaded_session = session_id
+        conversation = {"messages": [session_messages[h] for h in message_hashes if h in session_messages]}
+        conn.execute(
+            interactions.update()
+            .where(interactions.c.interaction_id == interaction_id)
+            .values(conversation=conversation)
+        )
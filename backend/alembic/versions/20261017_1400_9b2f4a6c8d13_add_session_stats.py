@@ -0,0 +1,84 @@
+"""add session_stats rollup table for the session list
+
+Revision ID: 9b2f4a6c8d13
+Revises: 7d4e1b9c5a26
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2f4a6c8d13"
+down_revision: Union[str, Sequence[str], None] = "7d4e1b9c5a26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "session_stats" not in existing_tables:
+        op.create_table(
+            "session_stats",
+            sa.Column("session_id", sa.String(), nullable=False),
+            sa.Column("llm_interaction_count", sa.Integer(), nullable=False),
+            sa.Column("mcp_communication_count", sa.Integer(), nullable=False),
+            sa.Column("input_tokens", sa.Integer(), nullable=True),
+            sa.Column("output_tokens", sa.Integer(), nullable=True),
+            sa.Column("total_tokens", sa.Integer(), nullable=True),
+            sa.Column("chat_message_count", sa.Integer(), nullable=False),
+            sa.Column("has_parallel_stages", sa.Boolean(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["session_id"], ["alert_sessions.session_id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("session_id"),
+        )
+        with op.batch_alter_table("session_stats", schema=None) as batch_op:
+            batch_op.create_index("ix_session_stats_total_tokens", ["total_tokens"], unique=False)
+
+        # Backfill rollups of existing sessions (the repository maintains them afterwards)
+        op.execute(
+            "INSERT INTO session_stats (session_id, llm_interaction_count, mcp_communication_count, "
+            "input_tokens, output_tokens, total_tokens, chat_message_count, has_parallel_stages) "
+            "SELECT s.session_id, COALESCE(l.count, 0), COALESCE(m.count, 0), "
+            "l.input_tokens, l.output_tokens, l.total_tokens, COALESCE(c.count, 0), "
+            "CASE WHEN p.session_id IS NULL THEN FALSE ELSE TRUE END "
+            "FROM alert_sessions s "
+            "LEFT JOIN (SELECT session_id, COUNT(*) AS count, SUM(input_tokens) AS input_tokens, "
+            "SUM(output_tokens) AS output_tokens, SUM(total_tokens) AS total_tokens "
+            "FROM llm_interactions GROUP BY session_id) l ON l.session_id = s.session_id "
+            "LEFT JOIN (SELECT session_id, COUNT(*) AS count FROM mcp_communications "
+            "GROUP BY session_id) m ON m.session_id = s.session_id "
+            "LEFT JOIN (SELECT chats.session_id, COUNT(*) AS count FROM chat_user_messages "
+            "JOIN chats ON chats.chat_id = chat_user_messages.chat_id "
+            "GROUP BY chats.session_id) c ON c.session_id = s.session_id "
+            "LEFT JOIN (SELECT DISTINCT session_id FROM stage_executions "
+            "WHERE parallel_type != 'single' OR parent_stage_execution_id IS NOT NULL) p "
+            "ON p.session_id = s.session_id "
+            "WHERE l.session_id IS NOT NULL OR m.session_id IS NOT NULL "
+            "OR c.session_id IS NOT NULL OR p.session_id IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "session_stats" in existing_tables:
+        with op.batch_alter_table("session_stats", schema=None) as batch_op:
+            batch_op.drop_index("ix_session_stats_total_tokens")
+        op.drop_table("session_stats")
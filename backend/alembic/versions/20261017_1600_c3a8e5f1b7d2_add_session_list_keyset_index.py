@@ -0,0 +1,45 @@
+"""add (started_at_us, session_id) index for keyset pagination of sessions
+
+Revision ID: c3a8e5f1b7d2
+Revises: 9b2f4a6c8d13
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a8e5f1b7d2"
+down_revision: Union[str, Sequence[str], None] = "9b2f4a6c8d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_indexes = {index["name"] for index in inspector.get_indexes("alert_sessions")}
+
+    if "ix_alert_sessions_started_at_session" not in existing_indexes:
+        with op.batch_alter_table("alert_sessions", schema=None) as batch_op:
+            batch_op.create_index(
+                "ix_alert_sessions_started_at_session", ["started_at_us", "session_id"], unique=False
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_indexes = {index["name"] for index in inspector.get_indexes("alert_sessions")}
+
+    if "ix_alert_sessions_started_at_session" in existing_indexes:
+        with op.batch_alter_table("alert_sessions", schema=None) as batch_op:
+            batch_op.drop_index("ix_alert_sessions_started_at_session")
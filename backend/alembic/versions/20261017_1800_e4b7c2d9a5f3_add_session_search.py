@@ -0,0 +1,146 @@
+"""add session_search full-text index of alert sessions
+
+Revision ID: e4b7c2d9a5f3
+Revises: c3a8e5f1b7d2
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b7c2d9a5f3"
+down_revision: Union[str, Sequence[str], None] = "c3a8e5f1b7d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Sessions per backfill batch
+BACKFILL_BATCH_SIZE = 1000
+# Longest indexed document (matches the repository)
+MAX_DOCUMENT_CHARS = 200_000
+
+POSTGRESQL_DDL = (
+    "ALTER TABLE session_search ADD COLUMN search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', document)) STORED",
+    "CREATE INDEX ix_session_search_vector ON session_search USING GIN (search_vector)",
+)
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE session_search_fts USING fts5("
+    "document, content='session_search', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER session_search_ai AFTER INSERT ON session_search BEGIN "
+    "INSERT INTO session_search_fts(rowid, document) VALUES (new.id, new.document); END",
+    "CREATE TRIGGER session_search_ad AFTER DELETE ON session_search BEGIN "
+    "INSERT INTO session_search_fts(session_search_fts, rowid, document) "
+    "VALUES ('delete', old.id, old.document); END",
+    "CREATE TRIGGER session_search_au AFTER UPDATE ON session_search BEGIN "
+    "INSERT INTO session_search_fts(session_search_fts, rowid, document) "
+    "VALUES ('delete', old.id, old.document); "
+    "INSERT INTO session_search_fts(rowid, document) VALUES (new.id, new.document); END",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "session_search" not in existing_tables:
+        op.create_table(
+            "session_search",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("session_id", sa.String(), nullable=False),
+            sa.Column("document", sa.Text(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["session_id"], ["alert_sessions.session_id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("session_id"),
+        )
+        if conn.dialect.name == "postgresql":
+            for statement in POSTGRESQL_DDL:
+                op.execute(statement)
+        elif conn.dialect.name == "sqlite":
+            for statement in SQLITE_DDL:
+                op.execute(statement)
+
+        # Index existing sessions (the repository writes documents of new sessions)
+        _backfill_documents(conn)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "session_search" in existing_tables:
+        if conn.dialect.name == "sqlite":
+            for trigger in ("session_search_ai", "session_search_ad", "session_search_au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            op.execute("DROP TABLE IF EXISTS session_search_fts")
+        op.drop_table("session_search")
+
+
+def _backfill_documents(conn) -> None:
+    """Write the search document of every existing session, in batches."""
+    import json
+    import re
+
+    camel_case_word = re.compile(r"\b[A-Za-z0-9]*[a-z0-9][A-Z][A-Za-z0-9]*\b")
+    sessions = sa.table(
+        "alert_sessions",
+        sa.column("session_id", sa.String()),
+        sa.column("alert_type", sa.String()),
+        sa.column("agent_type", sa.String()),
+        sa.column("alert_data", sa.JSON()),
+        sa.column("session_metadata", sa.JSON()),
+        sa.column("error_message", sa.String()),
+        sa.column("final_analysis", sa.String()),
+        sa.column("final_analysis_summary", sa.String()),
+    )
+    search = sa.table(
+        "session_search",
+        sa.column("session_id", sa.String()),
+        sa.column("document", sa.Text()),
+    )
+
+    def add(parts: list, value) -> None:
+        if isinstance(value, dict):
+            for item in value.values():
+                add(parts, item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                add(parts, item)
+        elif isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            value = str(value)
+            parts.append(value)
+            parts.extend(re.sub(r"(?<=[a-z0-9])(?=[A-Z])", " ", word) for word in camel_case_word.findall(value))
+
+    last_session_id = None
+    while True:
+        statement = sa.select(*sessions.c).order_by(sessions.c.session_id).limit(BACKFILL_BATCH_SIZE)
+        if last_session_id is not None:
+            statement = statement.where(sessions.c.session_id > last_session_id)
+        rows = conn.execute(statement).all()
+        if not rows:
+            return
+        documents = []
+        for row in rows:
+            parts: list = []
+            for name, value in row._mapping.items():
+                if isinstance(value, str) and name in ("alert_data", "session_metadata"):
+                    value = json.loads(value)
+                if value and name != "session_id":
+                    add(parts, value)
+            documents.append({"session_id": row.session_id, "document": "\n".join(parts)[:MAX_DOCUMENT_CHARS]})
+        conn.execute(search.insert(), documents)
+        last_session_id = rows[-1].session_id
@@ -0,0 +1,114 @@
+"""partition events by created_at on PostgreSQL
+
+Revision ID: f6c1d8a3b2e7
+Revises: e4b7c2d9a5f3
+Create Date: 2026-10-17 20:00:00.000000
+
+Note: PostgreSQL only. The events table becomes range-partitioned by created_at,
+with one partition per hour (events_pYYYYMMDDHH) and a default partition, so event
+cleanup drops expired partitions instead of deleting rows. The primary key becomes
+(id, created_at) since it must include the partition key; ids keep coming from the
+same sequence. SQLite keeps the plain table.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6c1d8a3b2e7"
+down_revision: Union[str, Sequence[str], None] = "e4b7c2d9a5f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Hourly partitions created for existing events up to this age (older ones go to the
+# default partition, which event cleanup empties) and ahead of now (the event cleanup
+# service keeps creating them)
+PARTITIONS_BEHIND = timedelta(hours=48)
+PARTITIONS_AHEAD = timedelta(hours=24)
+INDEXES = (
+    ("idx_events_channel_id", "channel, id"),
+    ("idx_events_created_at", "created_at"),
+    ("ix_events_channel", "channel"),
+)
+
+
+def _relkind(conn) -> Union[str, None]:
+    return conn.execute(sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass('events')")).scalar()
+
+
+def _set_aside_events_table(conn, new_name: str) -> str:
+    """Rename events and its indexes out of the way; returns its id sequence."""
+    sequence = conn.execute(sa.text("SELECT pg_get_serial_sequence('events', 'id')")).scalar()
+    op.execute(f"ALTER TABLE events RENAME TO {new_name}")
+    op.execute(f"ALTER TABLE {new_name} RENAME CONSTRAINT events_pkey TO {new_name}_pkey")
+    for index, _ in INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {index} RENAME TO {index}_{new_name}")
+    return sequence
+
+
+def _move_events(old_name: str, sequence: str) -> None:
+    """Copy events over to the new table, hand it the id sequence and drop the old table."""
+    op.execute(
+        f"INSERT INTO events (id, channel, payload, created_at) "
+        f"SELECT id, channel, payload, created_at FROM {old_name}"
+    )
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY events.id")
+    op.execute(f"DROP TABLE {old_name} CASCADE")
+    for index, columns in INDEXES:
+        op.execute(f"CREATE INDEX {index} ON events ({columns})")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql" or _relkind(conn) != "r":
+        return
+
+    sequence = _set_aside_events_table(conn, "events_unpartitioned")
+    op.execute(
+        "CREATE TABLE events ("
+        f"id INTEGER NOT NULL DEFAULT nextval('{sequence}'::regclass), "
+        "channel VARCHAR(100) NOT NULL, "
+        "payload JSON, "
+        "created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(), "
+        "PRIMARY KEY (id, created_at)"
+        ") PARTITION BY RANGE (created_at)"
+    )
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+    # Hourly partitions from the oldest recent event (or now) until PARTITIONS_AHEAD from now
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    oldest = conn.execute(sa.text("SELECT min(created_at) FROM events_unpartitioned")).scalar()
+    start = min(max(oldest or now, now - PARTITIONS_BEHIND), now).replace(minute=0, second=0, microsecond=0)
+    while start < now + PARTITIONS_AHEAD:
+        end = start + timedelta(hours=1)
+        op.execute(
+            f"CREATE TABLE events_p{start:%Y%m%d%H} PARTITION OF events "
+            f"FOR VALUES FROM ('{start.isoformat(' ')}') TO ('{end.isoformat(' ')}')"
+        )
+        start = end
+
+    _move_events("events_unpartitioned", sequence)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql" or _relkind(conn) != "p":
+        return
+
+    sequence = _set_aside_events_table(conn, "events_partitioned")
+    op.execute(
+        "CREATE TABLE events ("
+        f"id INTEGER NOT NULL DEFAULT nextval('{sequence}'::regclass), "
+        "channel VARCHAR(100) NOT NULL, "
+        "payload JSON, "
+        "created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(), "
+        "CONSTRAINT events_pkey PRIMARY KEY (id)"
+        ")"
+    )
+    _move_events("events_partitioned", sequence)
@@ -0,0 +1,102 @@
+"""add compressed payload columns and drop the llm_interactions conversation GIN index
+
+Revision ID: a7e3c9d1f5b4
+Revises: f6c1d8a3b2e7
+Create Date: 2026-10-17 22:00:00.000000
+
+Note: Large tool results, tool catalogs and conversation messages are stored
+zlib-compressed in the new *_compressed columns by the repository; existing rows
+stay uncompressed and are read as before. No query filters on the JSONB content of
+llm_interactions.conversation (new rows leave it NULL), so its GIN index is dropped.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7e3c9d1f5b4"
+down_revision: Union[str, Sequence[str], None] = "f6c1d8a3b2e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> (compressed column, plain column it replaces)
+COMPRESSED_COLUMNS = {
+    "mcp_communications": ("tool_result_compressed", "tool_result"),
+    "mcp_tool_catalogs": ("tools_compressed", "tools"),
+    "llm_conversation_messages": ("content_compressed", "content"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    for table_name, (compressed_column, _) in COMPRESSED_COLUMNS.items():
+        if table_name not in existing_tables:
+            continue
+        columns = [col["name"] for col in inspector.get_columns(table_name)]
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            if compressed_column not in columns:
+                batch_op.add_column(sa.Column(compressed_column, sa.LargeBinary(), nullable=True))
+
+    if conn.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_llm_interactions_conversation")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    for table_name, (compressed_column, plain_column) in COMPRESSED_COLUMNS.items():
+        if table_name not in existing_tables:
+            continue
+        columns = [col["name"] for col in inspector.get_columns(table_name)]
+        if compressed_column not in columns:
+            continue
+        # Write compressed payloads back into their plain column before dropping them
+        _decompress_column(conn, table_name, compressed_column, plain_column)
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.drop_column(compressed_column)
+
+    if conn.dialect.name == "postgresql":
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_interactions_conversation "
+            "ON llm_interactions USING gin (conversation jsonb_path_ops)"
+        )
+
+
+def _decompress_column(conn, table_name: str, compressed_column: str, plain_column: str) -> None:
+    """Decompress a table's compressed payloads into their plain column."""
+    import json
+    import zlib
+
+    primary_key = sa.inspect(conn).get_pk_constraint(table_name)["constrained_columns"]
+    plain_type = sa.String() if plain_column == "content" else sa.JSON()
+    payloads = sa.table(
+        table_name,
+        *(sa.column(name, sa.String()) for name in primary_key),
+        sa.column(compressed_column, sa.LargeBinary()),
+        sa.column(plain_column, plain_type),
+    )
+    rows = conn.execute(
+        sa.select(*(payloads.c[name] for name in primary_key), payloads.c[compressed_column])
+        .where(payloads.c[compressed_column].isnot(None))
+    ).all()
+    for row in rows:
+        text = zlib.decompress(row[-1]).decode("utf-8")
+        conn.execute(
+            payloads.update()
+            .where(*(payloads.c[name] == value for name, value in zip(primary_key, row[:-1], strict=True)))
+            .values({plain_column: text if plain_column == "content" else json.loads(text)})
+        )
@@ -0,0 +1,51 @@
+"""add cached_input_tokens to llm_interactions
+
+Revision ID: b8f4d2e6a1c3
+Revises: a7e3c9d1f5b4
+Create Date: 2026-10-17 23:00:00.000000
+
+Note: Records how many input tokens of each LLM call were read from the
+provider's prompt cache. Existing rows stay NULL (not reported).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f4d2e6a1c3"
+down_revision: Union[str, Sequence[str], None] = "a7e3c9d1f5b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if "llm_interactions" not in inspector.get_table_names():
+        return
+
+    columns = [col["name"] for col in inspector.get_columns("llm_interactions")]
+    with op.batch_alter_table("llm_interactions", schema=None) as batch_op:
+        if "cached_input_tokens" not in columns:
+            batch_op.add_column(sa.Column("cached_input_tokens", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if "llm_interactions" not in inspector.get_table_names():
+        return
+
+    columns = [col["name"] for col in inspector.get_columns("llm_interactions")]
+    with op.batch_alter_table("llm_interactions", schema=None) as batch_op:
+        if "cached_input_tokens" in columns:
+            batch_op.drop_column("cached_input_tokens")
@@ -0,0 +1,75 @@
+"""add unique index on fingerprints of in-flight alert sessions
+
+Revision ID: c3e7a1f9d2b4
+Revises: b8f4d2e6a1c3
+Create Date: 2026-10-18 09:00:00.000000
+
+Note: Allows at most one PENDING/IN_PROGRESS/PAUSED session per alert
+fingerprint, so concurrent re-fires cannot both start a session. Sessions
+that raced past deduplication before this index keep running; only the newest
+of them keeps its fingerprint.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e7a1f9d2b4"
+down_revision: Union[str, Sequence[str], None] = "b8f4d2e6a1c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "uq_alert_sessions_in_flight_fingerprint"
+IN_FLIGHT = "status IN ('pending', 'in_progress', 'paused')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if "alert_sessions" not in inspector.get_table_names():
+        return
+
+    indexes = [idx["name"] for idx in inspector.get_indexes("alert_sessions")]
+    if INDEX_NAME in indexes:
+        return
+
+    conn.execute(sa.text(f"""
+        UPDATE alert_sessions SET alert_fingerprint = NULL
+        WHERE alert_fingerprint IS NOT NULL AND {IN_FLIGHT}
+          AND EXISTS (
+            SELECT 1 FROM alert_sessions newer
+            WHERE newer.alert_fingerprint = alert_sessions.alert_fingerprint
+              AND newer.{IN_FLIGHT}
+              AND (newer.started_at_us > alert_sessions.started_at_us
+                   OR (newer.started_at_us = alert_sessions.started_at_us
+                       AND newer.session_id > alert_sessions.session_id))
+          )
+    """))
+    op.create_index(
+        INDEX_NAME,
+        "alert_sessions",
+        ["alert_fingerprint"],
+        unique=True,
+        postgresql_where=sa.text(IN_FLIGHT),
+        sqlite_where=sa.text(IN_FLIGHT),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if "alert_sessions" not in inspector.get_table_names():
+        return
+
+    indexes = [idx["name"] for idx in inspector.get_indexes("alert_sessions")]
+    if INDEX_NAME in indexes:
+        op.drop_index(INDEX_NAME, table_name="alert_sessions")
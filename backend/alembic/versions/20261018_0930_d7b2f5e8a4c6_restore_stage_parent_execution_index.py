@@ -0,0 +1,53 @@
+"""restore index on stage_executions.parent_stage_execution_id
+
+Revision ID: d7b2f5e8a4c6
+Revises: c3e7a1f9d2b4
+Create Date: 2026-10-18 09:30:00.000000
+
+Note: The index created with parallel stage tracking was dropped again by
+f0dd17b71ce2. Set-based session deletes check the parent_stage_execution_id
+self-reference for every deleted stage, so migrated databases need it back.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7b2f5e8a4c6"
+down_revision: Union[str, Sequence[str], None] = "c3e7a1f9d2b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if "stage_executions" not in inspector.get_table_names():
+        return
+
+    indexes = [idx["name"] for idx in inspector.get_indexes("stage_executions")]
+    if "ix_stage_executions_parent_stage_execution_id" not in indexes:
+        op.create_index(
+            "ix_stage_executions_parent_stage_execution_id",
+            "stage_executions",
+            ["parent_stage_execution_id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if "stage_executions" not in inspector.get_table_names():
+        return
+
+    indexes = [idx["name"] for idx in inspector.get_indexes("stage_executions")]
+    if "ix_stage_executions_parent_stage_execution_id" in indexes:
+        op.drop_index("ix_stage_executions_parent_stage_execution_id", table_name="stage_executions")
@@ -0,0 +1,51 @@
+"""add pod_heartbeats table for splitting LLM rate limits across pods
+
+Revision ID: e4a9c2d7f1b5
+Revises: d7b2f5e8a4c6
+Create Date: 2026-10-18 10:00:00.000000
+
+Note: Pods without session leases still use part of the provider budget, so
+the LLM rate limit coordinator counts every pod with a recent heartbeat.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a9c2d7f1b5"
+down_revision: Union[str, Sequence[str], None] = "d7b2f5e8a4c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "pod_heartbeats" not in existing_tables:
+        op.create_table(
+            "pod_heartbeats",
+            sa.Column("pod_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("last_seen_at_us", sa.BIGINT(), nullable=True),
+            sa.PrimaryKeyConstraint("pod_id"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    from sqlalchemy import inspect
+
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    if "pod_heartbeats" in existing_tables:
+        op.drop_table("pod_heartbeats")
@@ -8,7 +8,7 @@ It implements common processing logic and defines abstract methods for agent-spe
 import asyncio
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Dict, List, Optional, assert_never
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, assert_never
 
 from tarsy.config.settings import get_settings
 from tarsy.integrations.llm.manager import LLMManager
@@ -48,6 +48,9 @@ from .prompts import get_prompt_builder
 
 logger = get_module_logger(__name__)
 
+# Concurrent tool calls per server for servers without a configured limit
+DEFAULT_MAX_CONCURRENT_TOOL_CALLS = 4
+
 
 class BaseAgent(ABC):
     """
@@ -110,6 +113,9 @@ class BaseAgent(ABC):
         # When set, completely overrides agent default (unless alert-level override is present)
         self._override_mcp_servers: Optional[List[str]] = None
         
+        # Per-server limits of concurrent tool calls (max_concurrent_tool_calls), created on first use
+        self._tool_call_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
         # Create appropriate iteration controller based on configuration
         self._iteration_controller: IterationController = self._create_iteration_controller(iteration_strategy)
         # Cache the iteration strategy to avoid redundant imports in property getter
@@ -741,6 +747,9 @@ class BaseAgent(ABC):
         
         This method provides the public interface for executing MCP tools,
         handling proper validation, error recovery, and result organization.
+        Calls run concurrently, at most max_concurrent_tool_calls (from the
+        server's config) at a time per server, and a failed call becomes an
+        error entry without affecting the others.
         
         Args:
             tools_to_call: List of tool call dictionaries with server, tool, parameters
@@ -754,16 +763,48 @@ class BaseAgent(ABC):
         Raises:
             ValueError: If tool call is not allowed by agent configuration or MCP selection
         """
-        results = {}
-        settings = get_settings()
-        mcp_timeout = settings.mcp_tool_call_timeout
+        # Results keep the requested order within each server
+        outcomes = await asyncio.gather(*(
+            self._execute_tool_call(tool_call, session_id, investigation_conversation, mcp_selection)
+            for tool_call in tools_to_call
+        ))
+        results: Dict[str, List[Dict]] = {}
+        for server_name, outcome in outcomes:
+            results.setdefault(server_name, []).append(outcome)
+        return results
+    
+    def _tool_call_semaphore(self, server_name: str) -> asyncio.Semaphore:
+        """Semaphore bounding this agent's concurrent tool calls on a server."""
+        semaphore = self._tool_call_semaphores.get(server_name)
+        if semaphore is None:
+            server_config = self.mcp_registry.get_server_config_safe(server_name)
+            limit = getattr(server_config, "max_concurrent_tool_calls", None)
+            if not isinstance(limit, int) or limit < 1:
+                limit = DEFAULT_MAX_CONCURRENT_TOOL_CALLS
+            semaphore = self._tool_call_semaphores[server_name] = asyncio.Semaphore(limit)
+        return semaphore
+    
+    async def _execute_tool_call(
+        self,
+        tool_call: Dict,
+        session_id: str,
+        investigation_conversation: Optional['LLMConversation'],
+        mcp_selection: Optional[MCPSelectionConfig],
+    ) -> Tuple[str, Dict]:
+        """
+        Execute one MCP tool call, turning failures into error results.
         
-        for tool_call in tools_to_call:
-            try:
-                server_name = tool_call.get("server")
-                tool_name = tool_call.get("tool")
-                tool_params = tool_call.get("parameters", {})
-                
+        Returns:
+            Server name and the call's result (or error) entry
+        """
+        server_name = tool_call.get("server")
+        tool_name = tool_call.get("tool")
+        tool_params = tool_call.get("parameters", {})
+        mcp_timeout = get_settings().mcp_tool_call_timeout
+        
+        try:
+            # Waiting for a slot does not count against the call's timeout
+            async with self._tool_call_semaphore(server_name):
                 # Pass investigation conversation for context-aware summarization
                 # MCP client now handles validation internally and records failures
                 # Wrap with timeout to catch cases where MCP client's internal timeout fails
@@ -784,41 +825,32 @@ class BaseAgent(ABC):
                     )
                 except asyncio.TimeoutError:
                     raise TimeoutError(f"MCP tool call {tool_name} on {server_name} exceeded {mcp_timeout}s timeout") from None
-                
-                # Organize results by server
-                if server_name not in results:
-                    results[server_name] = []
-                
-                results[server_name].append({
-                    "tool": tool_name,
-                    "parameters": tool_params,
-                    "result": result,
-                    "timestamp": datetime.now(UTC).isoformat()
-                })
-                
-            except Exception as e:
-                # Create structured error with recovery strategy
-                tool_exec_error = ToolExecutionError(
-                    message=f"Tool execution failed: {str(e)}",
-                    tool_name=tool_name,
-                    server_name=server_name,
-                    context={
-                        "parameters": tool_params,
-                        "agent_class": self.__class__.__name__
-                    }
-                )
-                logger.error(f"Tool execution failed: {tool_exec_error.to_dict()}")
-                
-                # Use recovery handler to create error result
-                if server_name not in results:
-                    results[server_name] = []
-                
-                error_result = ErrorRecoveryHandler.handle_tool_execution_error(tool_exec_error)
-                error_result.update({
+            
+            return server_name, {
+                "tool": tool_name,
+                "parameters": tool_params,
+                "result": result,
+                "timestamp": datetime.now(UTC).isoformat()
+            }
+            
+        except Exception as e:
+            # Create structured error with recovery strategy
+            tool_exec_error = ToolExecutionError(
+                message=f"Tool execution failed: {str(e)}",
+                tool_name=tool_name,
+                server_name=server_name,
+                context={
                     "parameters": tool_params,
-                    "timestamp": datetime.now(UTC).isoformat()
-                })
-                results[server_name].append(error_result)
-        
-        return results
+                    "agent_class": self.__class__.__name__
+                }
+            )
+            logger.error(f"Tool execution failed: {tool_exec_error.to_dict()}")
+            
+            # Use recovery handler to create error result
+            error_result = ErrorRecoveryHandler.handle_tool_execution_error(tool_exec_error)
+            error_result.update({
+                "parameters": tool_params,
+                "timestamp": datetime.now(UTC).isoformat()
+            })
+            return server_name, error_result
  
\ No newline at end of file
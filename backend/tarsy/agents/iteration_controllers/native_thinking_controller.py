@@ -16,7 +16,11 @@ import asyncio
 from typing import TYPE_CHECKING, Optional
 
 from tarsy.config.settings import get_settings
-from tarsy.integrations.llm.gemini_client import GeminiNativeThinkingClient
+from tarsy.integrations.llm.gemini_client import (
+    GeminiNativeThinkingClient,
+    NativeThinkingToolCall,
+)
+from tarsy.integrations.llm.rate_limiter import llm_iteration_timeout
 from tarsy.models.constants import LLMInteractionType
 from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
 from tarsy.utils.logger import get_module_logger
@@ -24,6 +28,7 @@ from tarsy.utils.logger import get_module_logger
 from .base_controller import IterationController
 
 if TYPE_CHECKING:
+    from ...agents.base_agent import BaseAgent
     from ...agents.prompts import PromptBuilder
     from ...integrations.llm.manager import LLMManager
     from ...models.processing_context import StageContext
@@ -231,8 +236,9 @@ class NativeThinkingController(IterationController):
                 parallel_metadata = agent.get_parallel_execution_metadata()
                 
                 # Call LLM with native thinking
-                response = await asyncio.wait_for(
-                    native_client.generate(
+                # Time queued for the shared LLM rate limit doesn't count towards the timeout
+                async with llm_iteration_timeout(iteration_timeout):
+                    response = await native_client.generate(
                         conversation=conversation,
                         session_id=context.session_id,
                         mcp_tools=mcp_tools,
@@ -240,9 +246,7 @@ class NativeThinkingController(IterationController):
                         thought_signature=thought_signature,
                         native_tools_override=native_tools_override,
                         parallel_metadata=parallel_metadata
-                    ),
-                    timeout=iteration_timeout
-                )
+                    )
                 
                 # Store thinking content for audit
                 if response.thinking_content:
@@ -270,61 +274,60 @@ class NativeThinkingController(IterationController):
                 if response.has_tool_calls:
                     self.logger.info(f"Executing {len(response.tool_calls)} tool calls")
                     
-                    for tool_call in response.tool_calls:
-                        try:
-                            self.logger.debug(
-                                f"Executing tool: {tool_call.server}.{tool_call.tool} "
-                                f"with params: {list(tool_call.parameters.keys())}"
-                            )
-                            
-                            # Convert to format expected by execute_mcp_tools
-                            tool_request = {
-                                "server": tool_call.server,
-                                "tool": tool_call.tool,
-                                "parameters": tool_call.parameters
-                            }
-                            
-                            # Execute tool
-                            mcp_data = await agent.execute_mcp_tools(
-                                [tool_request],
-                                context.session_id,
-                                conversation,
-                                context.chain_context.mcp
-                            )
-                            
+                    # Independent calls run concurrently (bounded per server by the agent);
+                    # observations are added in the order the model requested the calls
+                    outcomes = await asyncio.gather(
+                        *(
+                            self._execute_tool_call(agent, tool_call, context, conversation)
+                            for tool_call in response.tool_calls
+                        ),
+                        return_exceptions=True,
+                    )
+                    failed_calls = 0
+                    
+                    for tool_call, outcome in zip(response.tool_calls, outcomes, strict=True):
+                        if not isinstance(outcome, BaseException):
                             # Tool succeeded - reset timeout failure counter
                             consecutive_timeout_failures = 0
                             
                             # Format observation and append to conversation
-                            observation = self._format_tool_result(mcp_data)
+                            observation = self._format_tool_result(outcome)
                             conversation.append_observation(f"Tool Result: {observation}")
                             
                             self.logger.debug("Tool result added to conversation")
+                            continue
+                        if not isinstance(outcome, Exception):
+                            # Cancellation and other non-errors are not tool failures
+                            raise outcome
+                        
+                        e = outcome
+                        failed_calls += 1
+                        error_msg = f"Error executing {tool_call.server}.{tool_call.tool}: {str(e)}"
+                        self.logger.error(error_msg)
+                        conversation.append_observation(f"Tool Error: {error_msg}")
+                        
+                        # Track timeout failures specifically using exception type checking
+                        # Check for standard timeout exceptions from asyncio and built-in TimeoutError
+                        is_timeout = isinstance(e, (TimeoutError, asyncio.TimeoutError))
+                        
+                        # Note: We only check exception types, not messages, for reliability.
+                        # If other libraries raise custom timeout exceptions, they should either:
+                        # 1. Inherit from TimeoutError (proper design)
+                        # 2. Be caught and re-raised as TimeoutError by the calling code
+                        
+                        if is_timeout:
+                            consecutive_timeout_failures += 1
+                            self.logger.warning(f"Tool timeout detected ({consecutive_timeout_failures} consecutive)")
                             
-                        except Exception as e:
-                            error_msg = f"Error executing {tool_call.server}.{tool_call.tool}: {str(e)}"
-                            self.logger.error(error_msg)
-                            conversation.append_observation(f"Tool Error: {error_msg}")
-                            
-                            # Track timeout failures specifically using exception type checking
-                            # Check for standard timeout exceptions from asyncio and built-in TimeoutError
-                            is_timeout = isinstance(e, (TimeoutError, asyncio.TimeoutError))
-                            
-                            # Note: We only check exception types, not messages, for reliability.
-                            # If other libraries raise custom timeout exceptions, they should either:
-                            # 1. Inherit from TimeoutError (proper design)
-                            # 2. Be caught and re-raised as TimeoutError by the calling code
-                            
-                            if is_timeout:
-                                consecutive_timeout_failures += 1
-                                self.logger.warning(f"Tool timeout detected ({consecutive_timeout_failures} consecutive)")
-                                
-                                # Check if we should stop immediately (don't wait for next iteration)
-                                if consecutive_timeout_failures >= 2:
-                                    error_msg = _create_consecutive_timeout_error(consecutive_timeout_failures, "tool")
-                                    raise Exception(error_msg) from None
-                            else:
-                                consecutive_timeout_failures = 0  # Reset on non-timeout errors
+                            # Check if we should stop immediately (don't wait for next iteration)
+                            if consecutive_timeout_failures >= 2:
+                                error_msg = _create_consecutive_timeout_error(consecutive_timeout_failures, "tool")
+                                raise Exception(error_msg) from None
+                        else:
+                            consecutive_timeout_failures = 0  # Reset on non-timeout errors
+                    
+                    if failed_calls:
+                        self.logger.warning(f"{failed_calls} of {len(response.tool_calls)} tool calls failed")
                 else:
                     # No tool calls and not marked as final - unusual state
                     self.logger.warning("Response has no tool calls but is not marked as final")
@@ -440,8 +443,8 @@ class NativeThinkingController(IterationController):
         agent = context.agent
         native_client = self._get_native_client()
         
-        response = await asyncio.wait_for(
-            native_client.generate(
+        async with llm_iteration_timeout(timeout):
+            response = await native_client.generate(
                 conversation=conversation,
                 session_id=context.session_id,
                 mcp_tools=[],  # NO tools for forced conclusion
@@ -449,9 +452,7 @@ class NativeThinkingController(IterationController):
                 thought_signature=None,
                 parallel_metadata=agent.get_parallel_execution_metadata(),
                 interaction_type=LLMInteractionType.FORCED_CONCLUSION.value
-            ),
-            timeout=timeout
-        )
+            )
         
         # Extract final message from response
         if response.content:
@@ -486,6 +487,43 @@ class NativeThinkingController(IterationController):
             LLMMessage(role=MessageRole.USER, content=user_content)
         ])
     
+    async def _execute_tool_call(
+        self,
+        agent: 'BaseAgent',
+        tool_call: NativeThinkingToolCall,
+        context: 'StageContext',
+        conversation: LLMConversation
+    ) -> dict:
+        """
+        Execute one tool call requested by the model.
+        
+        Args:
+            agent: Agent executing the stage
+            tool_call: Native function call (server, tool, parameters)
+            context: Stage context
+            conversation: Conversation so far, for context-aware summarization
+            
+        Returns:
+            Results of execute_mcp_tools for the call
+        """
+        self.logger.debug(
+            f"Executing tool: {tool_call.server}.{tool_call.tool} "
+            f"with params: {list(tool_call.parameters.keys())}"
+        )
+        
+        # Convert to format expected by execute_mcp_tools
+        tool_request = {
+            "server": tool_call.server,
+            "tool": tool_call.tool,
+            "parameters": tool_call.parameters
+        }
+        return await agent.execute_mcp_tools(
+            [tool_request],
+            context.session_id,
+            conversation,
+            context.chain_context.mcp
+        )
+    
     def _format_tool_result(self, mcp_data: dict) -> str:
         """
         Format MCP tool result for conversation.
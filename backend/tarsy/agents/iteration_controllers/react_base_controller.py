@@ -11,6 +11,7 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING, Optional
 
 from ...config.settings import get_settings
+from ...integrations.llm.rate_limiter import llm_iteration_timeout
 from ...models.constants import LLMInteractionType
 from ...models.unified_interactions import LLMConversation, MessageRole
 from ..parsers.react_parser import ReActParser
@@ -181,7 +182,9 @@ class ReactController(IterationController):
                 
                 # Run iteration with configurable timeout (allows full MCP retry cycle to complete)
                 # If tools consistently timeout, consecutive_timeout_failures check will break the loop
-                result = await asyncio.wait_for(run_iteration(), timeout=iteration_timeout)
+                # Time queued for the shared LLM rate limit doesn't count towards the timeout
+                async with llm_iteration_timeout(iteration_timeout):
+                    result = await run_iteration()
                 
                 # Check if we got a final answer (string) or a conversation object
                 if isinstance(result, str):
@@ -297,17 +300,15 @@ class ReactController(IterationController):
         agent = context.agent
         stage_execution_id = agent.get_current_stage_execution_id()
         
-        response = await asyncio.wait_for(
-            self.llm_manager.generate_response(
+        async with llm_iteration_timeout(timeout):
+            response = await self.llm_manager.generate_response(
                 conversation=conversation,
                 session_id=context.session_id,
                 stage_execution_id=stage_execution_id,
                 interaction_type=LLMInteractionType.FORCED_CONCLUSION.value,
                 provider=self._llm_provider_name,
                 # NO mcp_event_id or tools - pure LLM call
-            ),
-            timeout=timeout
-        )
+            )
         
         # Extract final message
         final_message = response.get_latest_assistant_message()
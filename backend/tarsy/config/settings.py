@@ -11,12 +11,18 @@ from typing import Dict, List, Optional
 from urllib.parse import quote_plus, urlparse
 
 import yaml
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, ValidationInfo, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from tarsy.config.builtin_config import get_builtin_llm_providers
+from tarsy.models.constants import (
+    HistoryAsyncDbMode,
+    HistoryWriteDurability,
+    WebSocketOverflowPolicy,
+)
 from tarsy.models.llm_models import LLMProviderConfig, LLMProviderType
 
+
 def is_testing() -> bool:
     """Check if we're running in a test environment."""
     return (
@@ -94,12 +100,70 @@ class Settings(BaseSettings):
         default=True,
         description="Enable real-time streaming of LLM thoughts via WebSocket (PostgreSQL only)"
     )
+    llm_streaming_coalesce_ms: int = Field(
+        default=50,
+        description="How long snapshots of an LLM stream are coalesced before a delta is sent (milliseconds)"
+    )
+    
+    # LLM Provider Connection Pools (shared by all sessions in this process)
+    llm_max_connections_per_provider: int = Field(
+        default=100,
+        description="Maximum open HTTP connections to one LLM provider"
+    )
+    llm_max_keepalive_connections_per_provider: int = Field(
+        default=20,
+        description="Idle HTTP connections kept open per LLM provider for reuse"
+    )
+    llm_keepalive_expiry_seconds: float = Field(
+        default=120.0,
+        description="How long an idle LLM provider connection is kept open (seconds)"
+    )
+    llm_http2_enabled: bool = Field(
+        default=True,
+        description="Use HTTP/2 for LLM provider connections when the h2 package is installed"
+    )
+    llm_rate_limit_coordination_enabled: bool = Field(
+        default=False,
+        description="Split each provider's requests/min and tokens/min across pods in proportion "
+                    "to the session leases they hold (multi-pod deployments sharing one provider quota)"
+    )
+    llm_rate_limit_coordination_interval_seconds: float = Field(
+        default=15.0,
+        description="How often each pod recomputes its share of the provider rate limits (seconds)"
+    )
     
     # Database Configuration
     database_url: str = Field(
         default="",
         description="Database connection string for alert processing history"
     )
+    history_async_db: str = Field(
+        default=HistoryAsyncDbMode.AUTO.value,
+        description="When async history operations run on the async database engine instead of executor "
+                    "threads: 'auto' (PostgreSQL only), 'always' (also SQLite files) or 'never'"
+    )
+    history_write_durability: str = Field(
+        default=HistoryWriteDurability.STAGE.value,
+        description="When interaction history is committed: 'stage' (write-behind batches flushed every "
+                    "window, at stage boundaries and on shutdown) or 'immediate' (one commit per interaction)"
+    )
+    history_write_max_latency_ms: int = Field(
+        default=250,
+        description="How long a history write batch collects interactions before it is written (milliseconds)"
+    )
+    history_write_max_batch_size: int = Field(
+        default=500,
+        description="Maximum buffered history writes per batch"
+    )
+    history_write_max_pending: int = Field(
+        default=10000,
+        description="Buffered history writes before interaction logging waits for the batch writer"
+    )
+    history_session_count_cache_seconds: int = Field(
+        default=30,
+        description="How long approximate session list counts are reused before they are counted again "
+                    "(seconds, 0 disables the cache)"
+    )
     
     @field_validator('database_url', mode='after')
     @classmethod
@@ -135,6 +199,14 @@ class Settings(BaseSettings):
         default=12,
         description="How often to run history retention cleanup (hours)"
     )
+    history_retention_batch_size: int = Field(
+        default=500,
+        description="Expired sessions deleted per retention transaction"
+    )
+    history_retention_batch_pause_ms: int = Field(
+        default=200,
+        description="Pause between retention delete batches so writers are not starved (milliseconds)"
+    )
     orphaned_session_timeout_minutes: int = Field(
         default=30,
         description="Mark sessions as orphaned if no activity for N minutes"
@@ -153,6 +225,23 @@ class Settings(BaseSettings):
         default=6,
         description="How often to run event cleanup (hours)"
     )
+    event_publish_batching_enabled: bool = Field(
+        default=True,
+        description="Publish events through an in-process queue that persists them in batches "
+                    "with one NOTIFY per channel per batch, instead of one transaction per event"
+    )
+    event_publish_max_latency_ms: int = Field(
+        default=20,
+        description="How long a publish batch collects events before it is written (milliseconds)"
+    )
+    event_publish_max_batch_size: int = Field(
+        default=200,
+        description="Maximum events written per publish batch"
+    )
+    event_publish_max_pending: int = Field(
+        default=10000,
+        description="Queued events before publishers wait for the batch writer (backpressure)"
+    )
     
     # PostgreSQL Connection Pool Configuration
     postgres_pool_size: int = Field(
@@ -189,9 +278,51 @@ class Settings(BaseSettings):
     )
     queue_claim_interval_seconds: float = Field(
         default=1.0,
-        description="Interval between queue claim attempts (seconds)"
+        description="Interval between queue claim attempts (seconds). "
+                    "Acts as the fallback polling interval when queue notifications are enabled."
+    )
+    queue_claim_notifications_enabled: bool = Field(
+        default=True,
+        description="Wake the SessionClaimWorker on 'session.enqueued' notifications "
+                    "(PostgreSQL NOTIFY / SQLite event polling) instead of relying on polling alone"
     )
     
+    # WebSocket Delivery Configuration
+    websocket_send_queue_size: int = Field(
+        default=256,
+        description="Maximum events buffered per WebSocket connection before the overflow policy applies"
+    )
+    websocket_overflow_policy: str = Field(
+        default=WebSocketOverflowPolicy.DROP_TRANSIENT.value,
+        description="What gives way when a WebSocket connection's send queue is full: "
+                    "'drop_transient' drops the oldest pending LLM stream chunk, 'coalesce' merges new chunks into "
+                    "the pending chunk of the same stream, 'disconnect' evicts the slow client "
+                    "(it reconnects and catches up); a queue full of persisted events always evicts"
+    )
+    
+    # Alert Deduplication Configuration
+    alert_dedup_enabled: bool = Field(
+        default=False,
+        description="Coalesce re-fired alerts into the in-flight or recently completed session "
+                    "with the same fingerprint instead of starting a new investigation"
+    )
+    alert_dedup_window_minutes: int = Field(
+        default=30,
+        description="How long after completion a session still absorbs duplicates (minutes). "
+                    "Sessions that are still pending, in progress or paused always do."
+    )
+    alert_dedup_key_fields_str: str = Field(
+        default="fingerprint,labels",
+        alias="alert_dedup_key_fields",
+        description="Comma-separated alert data fields (dotted paths for nested fields) "
+                    "that identify an alert instance; alerts without any of them are never deduplicated"
+    )
+    
+    @property
+    def alert_dedup_key_fields(self) -> List[str]:
+        """Get alert deduplication key fields as a list."""
+        return [field.strip() for field in self.alert_dedup_key_fields_str.split(',') if field.strip()]
+    
     @field_validator('max_concurrent_alerts', mode='after')
     @classmethod
     def validate_max_concurrent_alerts(cls, v: int) -> int:
@@ -212,6 +343,161 @@ class Settings(BaseSettings):
             )
         return v
     
+    @field_validator('mcp_session_pool_max_per_server', 'mcp_session_pool_idle_timeout_seconds', mode='after')
+    @classmethod
+    def validate_mcp_session_pool_limits(cls, v: int, info: ValidationInfo) -> int:
+        """Ensure MCP session pool limits are positive integers."""
+        if not isinstance(v, int) or v < 1:
+            raise ValueError(
+                f"{info.field_name} must be an integer >= 1, got: {v}"
+            )
+        return v
+    
+    @field_validator('mcp_tool_catalog_ttl_seconds', mode='after')
+    @classmethod
+    def validate_mcp_tool_catalog_ttl_seconds(cls, v: int) -> int:
+        """Ensure mcp_tool_catalog_ttl_seconds is a non-negative integer."""
+        if not isinstance(v, int) or v < 0:
+            raise ValueError(
+                f"mcp_tool_catalog_ttl_seconds must be a non-negative integer, got: {v}"
+            )
+        return v
+    
+    @field_validator('event_publish_max_batch_size', 'event_publish_max_pending', mode='after')
+    @classmethod
+    def validate_event_publish_limits(cls, v: int, info: ValidationInfo) -> int:
+        """Ensure event publish batch limits are positive integers."""
+        if not isinstance(v, int) or v < 1:
+            raise ValueError(
+                f"{info.field_name} must be an integer >= 1, got: {v}"
+            )
+        return v
+    
+    @field_validator('event_publish_max_latency_ms', mode='after')
+    @classmethod
+    def validate_event_publish_max_latency_ms(cls, v: int) -> int:
+        """Ensure event_publish_max_latency_ms is a non-negative integer."""
+        if not isinstance(v, int) or v < 0:
+            raise ValueError(
+                f"event_publish_max_latency_ms must be an integer >= 0, got: {v}"
+            )
+        return v
+    
+    @field_validator('llm_streaming_coalesce_ms', mode='after')
+    @classmethod
+    def validate_llm_streaming_coalesce_ms(cls, v: int) -> int:
+        """Ensure llm_streaming_coalesce_ms is a non-negative integer."""
+        if not isinstance(v, int) or v < 0:
+            raise ValueError(
+                f"llm_streaming_coalesce_ms must be an integer >= 0, got: {v}"
+            )
+        return v
+    
+    @field_validator('llm_max_connections_per_provider', 'llm_max_keepalive_connections_per_provider', mode='after')
+    @classmethod
+    def validate_llm_connection_limits(cls, v: int, info: ValidationInfo) -> int:
+        """Ensure LLM provider connection limits are positive integers."""
+        if not isinstance(v, int) or v < 1:
+            raise ValueError(
+                f"{info.field_name} must be an integer >= 1, got: {v}"
+            )
+        return v
+    
+    @field_validator('llm_keepalive_expiry_seconds', mode='after')
+    @classmethod
+    def validate_llm_keepalive_expiry_seconds(cls, v: float) -> float:
+        """Ensure llm_keepalive_expiry_seconds is not negative."""
+        if v < 0:
+            raise ValueError(
+                f"llm_keepalive_expiry_seconds must be >= 0, got: {v}"
+            )
+        return v
+    
+    @field_validator('llm_rate_limit_coordination_interval_seconds', mode='after')
+    @classmethod
+    def validate_llm_rate_limit_coordination_interval_seconds(cls, v: float) -> float:
+        """Ensure llm_rate_limit_coordination_interval_seconds is positive."""
+        if v <= 0:
+            raise ValueError(
+                f"llm_rate_limit_coordination_interval_seconds must be > 0, got: {v}"
+            )
+        return v
+    
+    @field_validator('websocket_send_queue_size', mode='after')
+    @classmethod
+    def validate_websocket_send_queue_size(cls, v: int) -> int:
+        """Ensure websocket_send_queue_size is a positive integer."""
+        if not isinstance(v, int) or v < 1:
+            raise ValueError(
+                f"websocket_send_queue_size must be an integer >= 1, got: {v}"
+            )
+        return v
+    
+    @field_validator('history_async_db', mode='after')
+    @classmethod
+    def validate_history_async_db(cls, v: str) -> str:
+        """Ensure history_async_db is a known mode."""
+        if v not in HistoryAsyncDbMode.values():
+            raise ValueError(
+                f"history_async_db must be one of {HistoryAsyncDbMode.values()}, got: {v}"
+            )
+        return v
+    
+    @field_validator('history_write_durability', mode='after')
+    @classmethod
+    def validate_history_write_durability(cls, v: str) -> str:
+        """Ensure history_write_durability is a known mode."""
+        if v not in HistoryWriteDurability.values():
+            raise ValueError(
+                f"history_write_durability must be one of {HistoryWriteDurability.values()}, got: {v}"
+            )
+        return v
+    
+    @field_validator(
+        'history_write_max_batch_size', 'history_write_max_pending', 'history_retention_batch_size', mode='after'
+    )
+    @classmethod
+    def validate_history_write_limits(cls, v: int, info: ValidationInfo) -> int:
+        """Ensure history write and retention batch limits are positive integers."""
+        if not isinstance(v, int) or v < 1:
+            raise ValueError(
+                f"{info.field_name} must be an integer >= 1, got: {v}"
+            )
+        return v
+    
+    @field_validator(
+        'history_write_max_latency_ms', 'history_session_count_cache_seconds', 'history_retention_batch_pause_ms',
+        mode='after'
+    )
+    @classmethod
+    def validate_history_non_negative(cls, v: int, info: ValidationInfo) -> int:
+        """Ensure history latency, cache and retention pause durations are non-negative integers."""
+        if not isinstance(v, int) or v < 0:
+            raise ValueError(
+                f"{info.field_name} must be an integer >= 0, got: {v}"
+            )
+        return v
+    
+    @field_validator('websocket_overflow_policy', mode='after')
+    @classmethod
+    def validate_websocket_overflow_policy(cls, v: str) -> str:
+        """Ensure websocket_overflow_policy is a known policy."""
+        if v not in WebSocketOverflowPolicy.values():
+            raise ValueError(
+                f"websocket_overflow_policy must be one of {WebSocketOverflowPolicy.values()}, got: {v}"
+            )
+        return v
+    
+    @field_validator('alert_dedup_window_minutes', mode='after')
+    @classmethod
+    def validate_alert_dedup_window_minutes(cls, v: int) -> int:
+        """Ensure alert_dedup_window_minutes is a non-negative integer."""
+        if not isinstance(v, int) or v < 0:
+            raise ValueError(
+                f"alert_dedup_window_minutes must be an integer >= 0, got: {v}"
+            )
+        return v
+    
     @field_validator('queue_claim_interval_seconds', mode='after')
     @classmethod
     def validate_queue_claim_interval_seconds(cls, v: float) -> float:
@@ -236,6 +522,27 @@ class Settings(BaseSettings):
         description="Timeout in seconds for a single MCP tool call (default: 70 seconds)"
     )
     
+    # MCP Connection Pool Configuration
+    mcp_session_pool_enabled: bool = Field(
+        default=True,
+        description="Lease MCP server connections from a per-pod pool shared by alert sessions "
+                    "instead of connecting to every server for each session"
+    )
+    mcp_session_pool_max_per_server: int = Field(
+        default=4,
+        description="Maximum pooled connections kept per MCP server; sessions beyond it get a "
+                    "dedicated connection closed when the session ends"
+    )
+    mcp_session_pool_idle_timeout_seconds: int = Field(
+        default=300,
+        description="Idle time after which a pooled MCP connection is closed (seconds)"
+    )
+    mcp_tool_catalog_ttl_seconds: int = Field(
+        default=300,
+        description="How long listed MCP tool catalogs are served from the per-pod cache before "
+                    "being refetched (seconds, 0 disables the cache)"
+    )
+    
     # Agent Configuration
     agent_config_path: str = Field(
         default="../config/agents.yaml",
@@ -287,6 +287,15 @@ async def submit_alert(request: Request) -> AlertResponse:
         # Transform API alert to ProcessingAlert (adds metadata, keeps data pristine)
         processing_alert = ProcessingAlert.from_api_alert(alert_data, default_alert_type)
         
+        if settings.alert_dedup_enabled:
+            from tarsy.utils.alert_fingerprint import compute_alert_fingerprint
+            
+            processing_alert.fingerprint = compute_alert_fingerprint(
+                processing_alert.alert_type,
+                processing_alert.alert_data,
+                settings.alert_dedup_key_fields
+            )
+        
         # Generate session_id BEFORE starting background processing
         session_id = str(uuid.uuid4())
         
@@ -318,10 +327,29 @@ async def submit_alert(request: Request) -> AlertResponse:
                 }
             ) from e
         
-        # Check queue size limit (if configured)
         from tarsy.services.history_service import get_history_service
         
         history_service = get_history_service()
+        
+        # Coalesce re-fires of an alert that is already queued, being processed,
+        # or was recently completed into that session instead of starting a new one
+        if processing_alert.fingerprint:
+            existing_session_id = await asyncio.to_thread(
+                history_service.attach_duplicate_alert,
+                processing_alert.fingerprint,
+                settings.alert_dedup_window_minutes
+            )
+            if existing_session_id:
+                logger.info(
+                    f"Duplicate {processing_alert.alert_type} alert attached to session {existing_session_id}"
+                )
+                return AlertResponse(
+                    session_id=existing_session_id,
+                    status="duplicate",
+                    message="Duplicate alert attached to existing session"
+                )
+        
+        # Check queue size limit (if configured)
         if settings.max_queue_size is not None:
             pending_count = await asyncio.to_thread(
                 history_service.count_pending_sessions
@@ -340,10 +368,30 @@ async def submit_alert(request: Request) -> AlertResponse:
         # Create session in database BEFORE returning to client
         # This ensures the session exists when the frontend tries to fetch it
         # Session is created in PENDING state - SessionClaimWorker will claim it
-        session_created = alert_service.session_manager.create_chain_history_session(
-            alert_context, 
-            chain_definition
-        )
+        if processing_alert.fingerprint:
+            # Re-checks for duplicates in the same transaction, serialized per fingerprint,
+            # so concurrent re-fires that all passed the check above start one session
+            created_session_id = await asyncio.to_thread(
+                history_service.create_session_unless_duplicate,
+                alert_context,
+                chain_definition,
+                settings.alert_dedup_window_minutes
+            )
+            if created_session_id and created_session_id != session_id:
+                logger.info(
+                    f"Duplicate {processing_alert.alert_type} alert attached to session {created_session_id}"
+                )
+                return AlertResponse(
+                    session_id=created_session_id,
+                    status="duplicate",
+                    message="Duplicate alert attached to existing session"
+                )
+            session_created = created_session_id is not None
+        else:
+            session_created = alert_service.session_manager.create_chain_history_session(
+                alert_context, 
+                chain_definition
+            )
         
         if not session_created:
             logger.error(f"Failed to create session {session_id} in database")
@@ -357,6 +405,10 @@ async def submit_alert(request: Request) -> AlertResponse:
             )
         
         logger.info(f"Session {session_id} created in PENDING state, waiting for worker to claim")
+        
+        # Wake claim workers on all pods instead of waiting for their next polling tick
+        from tarsy.services.events.event_helpers import publish_session_enqueued
+        await publish_session_enqueued(session_id, processing_alert.alert_type)
         logger.info(f"Alert submitted with session_id: {session_id}")
         
         # Return session_id - session is guaranteed to exist in database
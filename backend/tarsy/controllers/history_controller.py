@@ -9,18 +9,34 @@ performance and consistency with the rest of the system.
 """
 
 import asyncio
+import hashlib
 import logging
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+from pydantic import BaseModel
 
 from tarsy.models.api_models import CancelAgentResponse, ErrorResponse
+from tarsy.models.constants import SessionCountMode
 from tarsy.models.history_models import (
     DetailedSession,
     FilterOptions,
     FinalAnalysisResponse,
+    LLMTimelineEvent,
+    MCPTimelineEvent,
     PaginatedSessions,
+    SessionCursor,
     SessionStats,
+    SessionTimeline,
 )
 from tarsy.services.history_service import HistoryService, get_history_service
 from tarsy.utils.logger import get_logger
@@ -36,6 +52,35 @@ VALID_EVENT_TYPES = {'llm', 'mcp', 'system'}
 
 router = APIRouter(prefix="/api/v1/history", tags=["history"])
 
+# Interaction payloads never change once recorded, so clients may keep them
+INTERACTION_CACHE_CONTROL = "private, max-age=86400, immutable"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match names the ETag (weak comparison)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _etag_response(
+    request: Request, body: BaseModel, etag: Optional[str] = None, cache_control: str = "no-cache"
+) -> Response:
+    """
+    JSON response with an ETag, or 304 Not Modified when the client's copy is current.
+    
+    Without an explicit ETag, a weak ETag of the serialized body is used.
+    """
+    content = body.model_dump_json()
+    if etag is None:
+        etag = f'W/"{hashlib.blake2b(content.encode(), digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
 @router.get(
     "/sessions", 
     response_model=PaginatedSessions,
@@ -59,6 +104,20 @@ router = APIRouter(prefix="/api/v1/history", tags=["history"])
     5. Search analysis content: `search=namespace terminating`
     6. Time range analysis: `start_date_us=1734476400000000&end_date_us=1734562799999999`
     
+    **Search:**
+    - `search` matches whole words and word prefixes (`kube` finds `kubernetes`) in the alert
+      data, alert and agent type, error message and final analysis; all words must match
+    - Without `sort_by`, results are ordered by relevance, and each session carries a
+      highlighted `search_snippet`
+    
+    **Pagination:**
+    - `page` + `page_size` address pages by number (OFFSET)
+    - `cursor` continues after the previous page using its `pagination.next_cursor`
+      (keyset pagination: deep pages cost the same as the first one); the cursor carries
+      the sort order, so `page`, `sort_by` and `sort_order` are ignored with it
+    - `count=approximate` accepts a planner estimate or a briefly cached total
+      (`pagination.total_is_estimate`) instead of counting on every request
+    
     **Timestamp Format:**
     - All timestamps are Unix timestamps in microseconds since epoch (UTC)
     """
@@ -73,8 +132,10 @@ async def list_sessions(
     end_date_us: Optional[int] = Query(None, description="Filter sessions started before this timestamp (microseconds since epoch UTC)"),
     page: int = Query(1, ge=1, description="Page number for pagination"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page (1-100)"),
-    sort_by: Optional[str] = Query(None, description="Field to sort by. Supported: 'started_at_us', 'status', 'alert_type', 'agent_type', 'author', 'duration_ms'. Unsupported values fall back to default ordering."),
+    sort_by: Optional[str] = Query(None, description="Field to sort by. Supported: 'started_at_us', 'status', 'alert_type', 'agent_type', 'author', 'duration_ms', 'session_total_tokens'. Unsupported values fall back to default ordering."),
     sort_order: Optional[str] = Query(None, description="Sort order: 'asc' or 'desc'"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from pagination.next_cursor of the previous page"),
+    count: SessionCountMode = Query(SessionCountMode.EXACT, description="Total item count: 'exact' or 'approximate'"),
     history_service: Annotated[HistoryService, Depends(get_history_service)]
 ) -> PaginatedSessions:
     """
@@ -90,9 +151,11 @@ async def list_sessions(
         page: Page number (starting from 1)
         page_size: Number of items per page (1-100)
         sort_by: Field to sort by. Supported: 'started_at_us', 'status', 'alert_type', 
-            'agent_type', 'author', 'duration_ms'. Unsupported values fall back to default 
-            ordering by 'started_at_us' descending.
+            'agent_type', 'author', 'duration_ms', 'session_total_tokens'. Unsupported values
+            fall back to default ordering by 'started_at_us' descending.
         sort_order: Sort order 'asc' or 'desc' (defaults to 'desc')
+        cursor: Optional keyset cursor of the next page (from pagination.next_cursor)
+        count: Whether the total item count is exact or approximate
         history_service: Injected history service
         
     Returns:
@@ -124,12 +187,21 @@ async def list_sessions(
                 detail="start_date_us must be before end_date_us"
             )
         
+        session_cursor = None
+        if cursor:
+            try:
+                session_cursor = SessionCursor.decode(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+        
         paginated_sessions = history_service.get_sessions_list(
             filters=filters,
             page=page,
             page_size=page_size,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=session_cursor,
+            count_mode=count.value,
         )
         
         if not paginated_sessions:
@@ -219,6 +291,145 @@ async def get_session_detail(
             detail=f"Failed to retrieve session details: {str(e)}"
         ) from e
 
+@router.get(
+    "/sessions/{session_id}/timeline",
+    response_model=SessionTimeline,
+    responses={
+        304: {"description": "Timeline unchanged since the ETag in If-None-Match"},
+        404: {"model": ErrorResponse, "description": "Session not found"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    },
+    summary="Get Session Timeline",
+    description="""
+    Retrieve a session's stages and interactions without their payloads (lightweight).
+    
+    **Response includes:**
+    - Session status, chain progress, interaction counts and token usage
+    - Stages (with parallel executions nested) and their interactions in chronological order:
+      IDs, timings, token counts, success, and truncated previews of the LLM response and
+      MCP tool arguments/result
+    
+    **Payloads on demand:**
+    - `GET /sessions/{session_id}/llm-interactions/{interaction_id}` - full conversation
+    - `GET /sessions/{session_id}/mcp-interactions/{communication_id}` - full tool payloads
+    
+    **Revalidation:**
+    - Responses carry an `ETag`; send it back as `If-None-Match` to get `304 Not Modified`
+      while the timeline is unchanged
+    """
+)
+async def get_session_timeline(
+    *,
+    request: Request,
+    session_id: str = Path(..., description="Unique session identifier"),
+    history_service: Annotated[HistoryService, Depends(get_history_service)]
+) -> Response:
+    """Get a session's timeline of stages and interaction summaries, with ETag revalidation."""
+    try:
+        timeline = history_service.get_session_timeline(session_id)
+        
+        if not timeline:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Session {session_id} not found"
+            )
+        return _etag_response(request, timeline)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve session timeline: {str(e)}"
+        ) from e
+
+@router.get(
+    "/sessions/{session_id}/llm-interactions/{interaction_id}",
+    response_model=LLMTimelineEvent,
+    responses={
+        304: {"description": "Interaction already held by the client (If-None-Match)"},
+        404: {"model": ErrorResponse, "description": "Interaction not found in the session"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    },
+    summary="Get LLM Interaction",
+    description="""
+    Retrieve one LLM interaction of a session with its full conversation.
+    
+    Recorded interactions never change: they are cacheable as immutable. The `ETag` is a hash of
+    the payload, so a request sending it as `If-None-Match` gets `304 Not Modified`
+    only for this session's copy of the interaction.
+    """
+)
+async def get_llm_interaction(
+    *,
+    request: Request,
+    session_id: str = Path(..., description="Unique session identifier"),
+    interaction_id: str = Path(..., description="LLM interaction identifier"),
+    history_service: Annotated[HistoryService, Depends(get_history_service)]
+) -> Response:
+    """Get the full conversation of one LLM interaction."""
+    try:
+        event = history_service.get_llm_interaction_event(session_id, interaction_id)
+        
+        if not event:
+            raise HTTPException(
+                status_code=404,
+                detail=f"LLM interaction {interaction_id} not found in session {session_id}"
+            )
+        return _etag_response(request, event, cache_control=INTERACTION_CACHE_CONTROL)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve LLM interaction: {str(e)}"
+        ) from e
+
+@router.get(
+    "/sessions/{session_id}/mcp-interactions/{communication_id}",
+    response_model=MCPTimelineEvent,
+    responses={
+        304: {"description": "Communication already held by the client (If-None-Match)"},
+        404: {"model": ErrorResponse, "description": "Communication not found in the session"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    },
+    summary="Get MCP Interaction",
+    description="""
+    Retrieve one MCP communication of a session with its tool arguments, result and
+    available tools.
+    
+    Recorded communications never change: they are cacheable as immutable. The `ETag` is a hash of
+    the payload, so a request sending it as `If-None-Match` gets `304 Not Modified`
+    only for this session's copy of the communication.
+    """
+)
+async def get_mcp_interaction(
+    *,
+    request: Request,
+    session_id: str = Path(..., description="Unique session identifier"),
+    communication_id: str = Path(..., description="MCP communication identifier"),
+    history_service: Annotated[HistoryService, Depends(get_history_service)]
+) -> Response:
+    """Get the full tool payloads of one MCP communication."""
+    try:
+        event = history_service.get_mcp_interaction_event(session_id, communication_id)
+        
+        if not event:
+            raise HTTPException(
+                status_code=404,
+                detail=f"MCP interaction {communication_id} not found in session {session_id}"
+            )
+        return _etag_response(request, event, cache_control=INTERACTION_CACHE_CONTROL)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve MCP interaction: {str(e)}"
+        ) from e
+
 @router.get(
     "/sessions/{session_id}/summary",
     response_model=SessionStats,
@@ -557,8 +768,12 @@ async def cancel_session(
     """
     from tarsy.config.settings import get_settings
     from tarsy.models.constants import AlertSessionStatus
-    from tarsy.services.events.event_helpers import publish_cancel_request, publish_session_cancelled
-    from tarsy.services.cancellation_tracker import mark_cancelled, clear as clear_cancelled
+    from tarsy.services.cancellation_tracker import clear as clear_cancelled
+    from tarsy.services.cancellation_tracker import mark_cancelled
+    from tarsy.services.events.event_helpers import (
+        publish_cancel_request,
+        publish_session_cancelled,
+    )
     
     # Step 1: Validate session exists
     session = history_service.get_session(session_id)
@@ -5,11 +5,20 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Request
 
 from tarsy.config.settings import get_settings
+from tarsy.integrations.llm.client_pool import get_provider_client_pool
+from tarsy.integrations.llm.rate_limiter import get_provider_rate_limiters
 from tarsy.models.llm_models import GoogleNativeTool
 from tarsy.models.mcp_api_models import MCPServerInfo, MCPServersResponse, MCPToolInfo
-from tarsy.models.system_models import SystemWarning
+from tarsy.models.system_models import (
+    LLMConnectionPoolStats,
+    LLMRateLimiterStats,
+    PayloadCompressionStats,
+    SystemWarning,
+    WebSocketConnectionStats,
+)
 from tarsy.services.system_warnings_service import get_warnings_service
 from tarsy.utils.logger import get_logger
+from tarsy.utils.payload_compression import get_compression_stats
 
 logger = get_logger(__name__)
 
@@ -31,6 +40,65 @@ async def get_system_warnings() -> List[SystemWarning]:
     return warnings_service.get_warnings()  # Pydantic handles serialization
 
 
+@router.get("/websocket-connections", response_model=List[WebSocketConnectionStats])
+async def get_websocket_connections() -> List[WebSocketConnectionStats]:
+    """
+    Get send queue depth and delivery lag of this pod's WebSocket connections.
+
+    Returns:
+        Per-connection stats, most lagging (oldest pending event) first
+    """
+    from tarsy.controllers.websocket_controller import connection_manager
+
+    stats = [
+        WebSocketConnectionStats(**connection_stats)
+        for connection_stats in connection_manager.get_connection_stats().values()
+    ]
+    return sorted(stats, key=lambda s: s.oldest_pending_ms, reverse=True)
+
+
+@router.get("/payload-compression", response_model=List[PayloadCompressionStats])
+async def get_payload_compression() -> List[PayloadCompressionStats]:
+    """
+    Get how well the history payloads written by this pod compressed.
+
+    Returns:
+        Per payload kind counts, raw and stored bytes and compression ratio
+    """
+    return [
+        PayloadCompressionStats(kind=kind, **stats)
+        for kind, stats in sorted(get_compression_stats().items())
+    ]
+
+
+@router.get("/llm-connection-pools", response_model=List[LLMConnectionPoolStats])
+async def get_llm_connection_pools() -> List[LLMConnectionPoolStats]:
+    """
+    Get connection reuse of this pod's shared LLM provider connection pools.
+
+    Returns:
+        Per pool request, new connection and reused connection counts
+    """
+    return [
+        LLMConnectionPoolStats(pool=pool, **stats)
+        for pool, stats in sorted(get_provider_client_pool().get_stats().items())
+    ]
+
+
+@router.get("/llm-rate-limits", response_model=List[LLMRateLimiterStats])
+async def get_llm_rate_limits() -> List[LLMRateLimiterStats]:
+    """
+    Get the shared LLM provider rate limiters of this pod.
+
+    Returns:
+        Per provider limits, queued calls and wait times
+    """
+    return [
+        LLMRateLimiterStats(**stats)
+        for _, stats in sorted(get_provider_rate_limiters().get_stats().items())
+    ]
+
+
 @router.get("/mcp-servers", response_model=MCPServersResponse)
 async def get_mcp_servers(_request: Request) -> MCPServersResponse:
     """
@@ -2,13 +2,13 @@
 
 import json
 import uuid
-from typing import Dict
+from typing import Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from tarsy.config.settings import get_settings
 from tarsy.database.init_db import get_async_session_factory
 from tarsy.repositories.event_repository import EventRepository
-from tarsy.services.events.base import AsyncCallback
 from tarsy.services.events.manager import get_event_system
 from tarsy.services.websocket_connection_manager import WebSocketConnectionManager
 from tarsy.utils.logger import get_logger
@@ -18,7 +18,11 @@ logger = get_logger(__name__)
 websocket_router = APIRouter(prefix="/api/v1", tags=["websocket"])
 
 # Global connection manager
-connection_manager = WebSocketConnectionManager()
+_settings = get_settings()
+connection_manager = WebSocketConnectionManager(
+    send_queue_size=_settings.websocket_send_queue_size,
+    overflow_policy=_settings.websocket_overflow_policy,
+)
 
 
 @websocket_router.websocket("/ws")
@@ -34,25 +38,29 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
     Event Flow Integration:
     1. Client subscribes to channel (e.g., "sessions")
-    2. WebSocket registers callback with EventListener for that channel
+    2. The connection manager registers ONE callback per channel with the
+       EventListener (on the channel's first subscriber, shared by all others)
     3. When DB event occurs (PostgreSQL NOTIFY or SQLite poll):
        - EventListener receives notification
-       - EventListener calls our registered callback
-       - Callback broadcasts event to all WebSocket clients on that channel
-    4. WebSocket clients receive event in real-time
+       - EventListener calls the channel's callback
+       - Callback serializes the event once and queues it for every
+         WebSocket client on that channel
+    4. Each client's writer task sends the event in real-time
+
+    Replies to the client are queued the same way, so the writer task is the
+    only one sending on the socket.
     """
     connection_id = str(uuid.uuid4())
 
     await connection_manager.connect(connection_id, websocket)
 
-    # Track event listener callbacks for this connection
-    # Maps channel -> callback function
-    subscribed_callbacks: Dict[str, AsyncCallback] = {}
+    # Channels this connection subscribed to (listener callbacks are per channel)
+    subscribed_channels: Set[str] = set()
 
     try:
         # Send connection confirmation
-        await websocket.send_json(
-            {"type": "connection.established", "connection_id": connection_id}
+        connection_manager.send_to_connection(
+            connection_id, {"type": "connection.established", "connection_id": connection_id}
         )
 
         while True:
@@ -65,7 +73,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
             if action == "subscribe" and channel:
                 # Skip if already subscribed
-                if channel in subscribed_callbacks:
+                if channel in subscribed_channels:
                     logger.debug(
                         f"Client {connection_id} already subscribed to '{channel}'"
                     )
@@ -74,52 +82,38 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                 # 1. Subscribe connection to channel (tracking)
                 connection_manager.subscribe(connection_id, channel)
 
-                # 2. Register callback with EventListener (THIS IS THE KEY INTEGRATION!)
+                # 2. Ensure the channel's fan-out callback is registered with EventListener
                 # When PostgreSQL NOTIFY or SQLite polling detects an event,
-                # EventListener will call this callback, which broadcasts via WebSocket
+                # EventListener calls it once and it queues the event for all subscribers
                 event_system = get_event_system()
                 event_listener = event_system.get_listener()
+                await connection_manager.attach_channel(channel, event_listener)
+                subscribed_channels.add(channel)
 
-                # Create callback that broadcasts to channel
-                # Use closure to capture channel value correctly
-                def make_callback(ch: str) -> AsyncCallback:
-                    async def callback(event: dict) -> None:
-                        # This is called by EventListener when DB event occurs
-                        await connection_manager.broadcast_to_channel(ch, event)
-
-                    return callback
-
-                callback = make_callback(channel)
-                await event_listener.subscribe(channel, callback)
-                subscribed_callbacks[channel] = callback
-
-                await websocket.send_json(
-                    {"type": "subscription.confirmed", "channel": channel}
+                connection_manager.send_to_connection(
+                    connection_id, {"type": "subscription.confirmed", "channel": channel}
                 )
                 logger.debug(
                     f"Client {connection_id} subscribed to '{channel}' "
-                    f"(registered with EventListener)"
+                    f"(fan-out registered with EventListener)"
                 )
 
             elif action == "unsubscribe" and channel:
                 # Unsubscribe from channel
                 connection_manager.unsubscribe(connection_id, channel)
 
-                # Remove EventListener callback
-                if channel in subscribed_callbacks:
+                # Remove the channel's EventListener callback if this was the last subscriber
+                if channel in subscribed_channels:
                     event_system = get_event_system()
                     event_listener = event_system.get_listener()
-                    await event_listener.unsubscribe(
-                        channel, subscribed_callbacks[channel]
-                    )
-                    del subscribed_callbacks[channel]
+                    await connection_manager.detach_channel(channel, event_listener)
+                    subscribed_channels.discard(channel)
                     logger.debug(
-                        f"Client {connection_id} unsubscribed from '{channel}' "
-                        f"(removed from EventListener)"
+                        f"Client {connection_id} unsubscribed from '{channel}'"
                     )
 
-                await websocket.send_json(
-                    {"type": "subscription.cancelled", "channel": channel}
+                connection_manager.send_to_connection(
+                    connection_id, {"type": "subscription.cancelled", "channel": channel}
                 )
 
             elif action == "catchup" and channel:
@@ -133,38 +127,37 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                         channel=channel, after_id=last_event_id, limit=100
                     )
 
-                    for event in missed_events:
-                        # Inject event id into payload so clients can track last_event_id
-                        enriched_payload = {**event.payload, "id": event.id}
-                        await websocket.send_json(enriched_payload)
-
-                    logger.debug(
-                        f"Sent {len(missed_events)} catchup events to {connection_id}"
-                    )
+                # Inject event id into payload so clients can track last_event_id;
+                # queued in one go so live events don't interleave with the catchup
+                connection_manager.send_to_connection(
+                    connection_id, *({**event.payload, "id": event.id} for event in missed_events)
+                )
+                logger.debug(
+                    f"Sent {len(missed_events)} catchup events to {connection_id}"
+                )
 
             elif action == "ping":
                 # Keepalive
-                await websocket.send_json({"type": "pong"})
+                connection_manager.send_to_connection(connection_id, {"type": "pong"})
 
     except WebSocketDisconnect:
         logger.debug(f"Client {connection_id} disconnected normally")
     except Exception as e:
         logger.error(f"WebSocket error for {connection_id}: {e}", exc_info=True)
     finally:
-        # Cleanup: Unsubscribe all callbacks from EventListener
-        # Use try/except to ensure disconnect() always runs even if event system fails
+        # Remove from connection manager (always runs)
+        connection_manager.disconnect(connection_id)
+
+        # Cleanup: Remove EventListener callbacks of channels left without subscribers
+        # Use try/except so event system failures don't escape the endpoint
         try:
             event_system = get_event_system()
             event_listener = event_system.get_listener()
-            for channel, callback in subscribed_callbacks.items():
-                await event_listener.unsubscribe(channel, callback)
-                logger.debug(f"Cleaned up EventListener callback for '{channel}'")
+            for channel in subscribed_channels:
+                await connection_manager.detach_channel(channel, event_listener)
         except Exception as e:
             logger.warning(
                 f"Failed to unsubscribe EventListener callbacks during cleanup "
                 f"for {connection_id}: {e}"
             )
 
-        # Remove from connection manager (always runs)
-        connection_manager.disconnect(connection_id)
-
@@ -6,7 +6,6 @@ using structured Pydantic models, ensuring data integrity and preventing
 contamination between hook context and actual results.
 """
 
-import asyncio
 import logging
 
 from tarsy.hooks.hook_context import BaseHook, _apply_llm_interaction_truncation
@@ -34,9 +33,7 @@ class LLMHistoryHook(BaseHook[LLMInteraction]):
             # Apply content truncation before database write if needed
             truncated_interaction = _apply_llm_interaction_truncation(interaction)
             
-            ok = await asyncio.to_thread(
-                self.history_service.store_llm_interaction, truncated_interaction
-            )
+            ok = await self.history_service.store_llm_interaction_async(truncated_interaction)
             if ok:
                 logger.debug(
                     f"Stored LLM interaction {interaction.interaction_id} to history"
@@ -44,12 +41,7 @@ class LLMHistoryHook(BaseHook[LLMInteraction]):
                 
                 # Update last interaction timestamp for orphan detection (non-blocking)
                 if interaction.session_id:
-                    rec = self.history_service.record_session_interaction
-                    # If async, await directly; if sync, offload to thread
-                    if asyncio.iscoroutinefunction(rec):
-                        await rec(interaction.session_id)
-                    else:
-                        await asyncio.to_thread(rec, interaction.session_id)
+                    await self.history_service.record_session_interaction_async(interaction.session_id)
             else:
                 logger.warning(
                     f"History service returned False for LLM interaction {interaction.interaction_id}"
@@ -79,9 +71,7 @@ class MCPHistoryHook(BaseHook[MCPInteraction]):
             interaction: Unified MCP interaction data
         """
         try:
-            ok = await asyncio.to_thread(
-                self.history_service.store_mcp_interaction, interaction
-            )
+            ok = await self.history_service.store_mcp_interaction_async(interaction)
             if ok:
                 logger.debug(
                     f"Stored MCP interaction {interaction.request_id} to history"
@@ -89,12 +79,7 @@ class MCPHistoryHook(BaseHook[MCPInteraction]):
                 
                 # Update last interaction timestamp for orphan detection (non-blocking)
                 if interaction.session_id:
-                    rec = self.history_service.record_session_interaction
-                    # If async, await directly; if sync, offload to thread
-                    if asyncio.iscoroutinefunction(rec):
-                        await rec(interaction.session_id)
-                    else:
-                        await asyncio.to_thread(rec, interaction.session_id)
+                    await self.history_service.record_session_interaction_async(interaction.session_id)
             else:
                 logger.warning(
                     f"History service returned False for MCP interaction {interaction.request_id}"
@@ -124,9 +109,7 @@ class MCPListHistoryHook(BaseHook[MCPInteraction]):
             interaction: Unified MCP tool list data
         """
         try:
-            ok = await asyncio.to_thread(
-                self.history_service.store_mcp_interaction, interaction
-            )
+            ok = await self.history_service.store_mcp_interaction_async(interaction)
             if ok:
                 logger.debug(
                     f"Stored MCP tool list {interaction.request_id} to history"
@@ -19,9 +19,11 @@ tool combination. The NEW SDK types (google.genai.types) are required.
 """
 
 import asyncio
+import operator
 import pprint
 import traceback
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from functools import reduce
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 import httpx
 import urllib3
@@ -31,7 +33,13 @@ from google.genai import (
 from langchain_anthropic import ChatAnthropic
 from langchain_core.callbacks import UsageMetadataCallbackHandler
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+)
+from langchain_core.messages.ai import add_ai_message_chunks
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_google_vertexai.model_garden import ChatAnthropicVertex
 from langchain_openai import ChatOpenAI
@@ -39,11 +47,18 @@ from langchain_xai import ChatXAI
 
 from tarsy.config.settings import Settings
 from tarsy.hooks.hook_context import llm_interaction_context
+from tarsy.integrations.llm.client_pool import get_provider_client_pool
 
 # Apply url_context patch for Gemini models
 # This enables url_context tool support which is not yet natively supported in LangChain
 from tarsy.integrations.llm.gemini_url_context_patch import apply_url_context_patch
 from tarsy.integrations.llm.native_tools import NativeToolsHelper
+from tarsy.integrations.llm.rate_limiter import (
+    estimate_tokens,
+    get_provider_rate_limiters,
+    is_rate_limit_error,
+)
+from tarsy.integrations.llm.react_stream import ReActStreamEvent, ReActStreamScanner
 from tarsy.integrations.llm.streaming import StreamingPublisher
 from tarsy.models.constants import LLMInteractionType, StreamingEventType
 from tarsy.models.llm_models import GoogleNativeTool, LLMProviderConfig, LLMProviderType
@@ -68,6 +83,11 @@ logger = get_module_logger(__name__)
 # Setup separate logger for LLM communications
 llm_comm_logger = get_module_logger("llm.communications")
 
+# Providers whose prompt cache is only used up to explicit cache_control breakpoints
+# (Claude, directly or via Vertex AI); OpenAI, xAI and Gemini cache prompt prefixes automatically
+CACHE_CONTROL_PROVIDERS = frozenset({LLMProviderType.ANTHROPIC, LLMProviderType.VERTEXAI})
+CACHE_CONTROL = {"type": "ephemeral"}
+
 # Constants for Google code execution response parts
 # These part types are returned by Google's native code execution tool
 # See: https://ai.google.dev/gemini-api/docs/code-execution
@@ -75,6 +95,20 @@ CODE_EXECUTION_PART_EXECUTABLE = 'executable_code'
 CODE_EXECUTION_PART_RESULT = 'code_execution_result'
 
 
+def _aggregate_chunks(chunks: List[Any]) -> Any:
+    """
+    Merge streamed chunks into one, as adding them up one by one would.
+
+    LangChain message chunks are merged in a single pass; adding a chunk to a
+    growing aggregate re-merges everything before it on every chunk.
+    """
+    if not chunks:
+        return None
+    if all(isinstance(chunk, AIMessageChunk) for chunk in chunks):
+        return add_ai_message_chunks(chunks[0], *chunks[1:])
+    return reduce(operator.add, chunks)
+
+
 # LLM Providers mapping using LangChain
 def _create_openai_client(temp, api_key, model, disable_ssl_verification=False, base_url=None):
     """Create ChatOpenAI client with optional SSL verification disable and custom base URL.
@@ -93,9 +127,12 @@ def _create_openai_client(temp, api_key, model, disable_ssl_verification=False,
     if base_url:
         client_kwargs["base_url"] = base_url
     
+    # Streaming calls share the process-wide OpenAI connection pool
+    client_kwargs["http_async_client"] = get_provider_client_pool().get_async_client(
+        LLMProviderType.OPENAI.value, verify=not disable_ssl_verification
+    )
     if disable_ssl_verification:
         client_kwargs["http_client"] = httpx.Client(verify=False)
-        client_kwargs["http_async_client"] = httpx.AsyncClient(verify=False)
     
     return ChatOpenAI(**client_kwargs)
 
@@ -118,7 +155,10 @@ def _create_xai_client(temp, api_key, model, disable_ssl_verification=False, bas
     }
     if base_url:
         client_kwargs["base_url"] = base_url
-    # Note: ChatXAI may not support custom HTTP clients - would need to verify
+    # Streaming calls share the process-wide xAI connection pool
+    client_kwargs["http_async_client"] = get_provider_client_pool().get_async_client(
+        LLMProviderType.XAI.value, verify=not disable_ssl_verification
+    )
     return ChatXAI(**client_kwargs)
 
 def _create_anthropic_client(temp, api_key, model, disable_ssl_verification=False, base_url=None):
@@ -130,7 +170,7 @@ def _create_anthropic_client(temp, api_key, model, disable_ssl_verification=Fals
     }
     if base_url:
         client_kwargs["base_url"] = base_url
-    # Note: ChatAnthropic may not support custom HTTP clients - would need to verify  
+    # Note: ChatAnthropic takes no custom HTTP client; it shares its own cached client per base URL
     return ChatAnthropic(**client_kwargs)
 
 def _create_vertexai_client(temp, project, model, disable_ssl_verification=False, base_url=None, location="us-east5"):
@@ -187,6 +227,10 @@ class LLMClient:
         self.available: bool = False
         # Use shared streaming publisher utility
         self._streaming_publisher = StreamingPublisher(settings)
+        # Requests/min and tokens/min of the provider, shared by all sessions of this pod
+        self._rate_limiter = get_provider_rate_limiters().get(
+            provider_name, config.requests_per_minute, config.tokens_per_minute
+        )
         # Store native tools for Google/Gemini models (GoogleNativeTool enum values)
         self.native_tools: Dict[str, Optional[google_genai_types.Tool]] = {
             GoogleNativeTool.GOOGLE_SEARCH.value: None,
@@ -375,17 +419,51 @@ class LLMClient:
         return tools
 
     def _convert_conversation_to_langchain(self, conversation: LLMConversation) -> List:
-        """Convert typed conversation to LangChain message objects."""
+        """
+        Convert typed conversation to LangChain message objects.
+        
+        For providers that need explicit prompt cache breakpoints, the messages
+        returned by _get_cache_breakpoints() are sent as text blocks carrying
+        cache_control, so the provider caches the prompt up to them.
+        """
+        cache_breakpoints = self._get_cache_breakpoints(conversation)
         langchain_messages = []
-        for msg in conversation.messages:
+        for index, msg in enumerate(conversation.messages):
+            content = msg.content
+            if index in cache_breakpoints and content:
+                content = [{"type": "text", "text": content, "cache_control": CACHE_CONTROL}]
             if msg.role == MessageRole.SYSTEM:
-                langchain_messages.append(SystemMessage(content=msg.content))
+                langchain_messages.append(SystemMessage(content=content))
             elif msg.role == MessageRole.USER:
-                langchain_messages.append(HumanMessage(content=msg.content))
+                langchain_messages.append(HumanMessage(content=content))
             elif msg.role == MessageRole.ASSISTANT:
-                langchain_messages.append(AIMessage(content=msg.content))
+                langchain_messages.append(AIMessage(content=content))
         return langchain_messages
     
+    def _get_cache_breakpoints(self, conversation: LLMConversation) -> Set[int]:
+        """
+        Get the indexes of the messages that end a cacheable prompt prefix.
+        
+        Breakpoints go after the static instructions (system message), after the
+        tool catalog and alert (first user message) and after the latest message.
+        Conversations only grow by appending, so each ReAct turn reads everything
+        up to the previous turn's last message from the cache.
+        
+        Args:
+            conversation: Conversation about to be sent
+            
+        Returns:
+            Message indexes to mark with cache_control (empty if not applicable)
+        """
+        if not self.config.prompt_caching or self.config.type not in CACHE_CONTROL_PROVIDERS:
+            return set()
+        messages = conversation.messages
+        breakpoints = {0, len(messages) - 1}
+        first_user = next((i for i, msg in enumerate(messages) if msg.role == MessageRole.USER), None)
+        if first_user is not None:
+            breakpoints.add(first_user)
+        return breakpoints
+    
     async def generate_response(
         self,
         conversation: LLMConversation,
@@ -405,9 +483,13 @@ class LLMClient:
         Uses streaming API (.astream) in all environments for consistency.
         Event publishing automatically disabled in SQLite/dev mode via publish_transient.
         
+        Every attempt first waits for the provider's shared rate limiter (requests/min,
+        tokens/min, queued fairly across sessions).
+        
         Includes retry logic:
         - Timeout protection (default: 120s, increased for code execution scenarios)
-        - Rate limit retry with exponential backoff
+        - Rate limit retry: the provider pauses for the retry delay (or exponential backoff)
+          for all sessions, and the retry queues in the rate limiter
         - Timeout retry with increasing delays
         - Empty response handling
         
@@ -469,23 +551,23 @@ class LLMClient:
 
             # Retry loop for resilience
             for attempt in range(max_retries + 1):
+                # Tokens reserved for this attempt are settled whatever its outcome;
+                # a failed attempt returns its whole reservation
+                rate_limit_grant = None
+                used_tokens: Optional[int] = 0
                 try:
+                    # Wait for the provider budget (shared with all sessions of this pod)
+                    rate_limit_grant = await self._rate_limiter.acquire(
+                        session_id, estimate_tokens(conversation, max_tokens)
+                    )
+                    
                     # Convert typed conversation to LangChain format  
                     langchain_messages = self._convert_conversation_to_langchain(conversation)
-                    accumulated_content = ""
-                    
-                    # Streaming state (for thoughts, final answers, and summarizations)
-                    is_streaming_thought = False
-                    is_streaming_final_answer = False
-                    is_streaming_summarization = False
-                    token_count_since_last_send = 0
-                    THOUGHT_CHUNK_SIZE = 1  # Faster streaming for plain text thoughts
-                    FINAL_ANSWER_CHUNK_SIZE = 3  # Reduced but still stable for markdown
-                    SUMMARIZATION_CHUNK_SIZE = 1  # Faster streaming for plain text summaries
-                    
-                    # Check if we should stream as plain text summarization
-                    if interaction_type == LLMInteractionType.SUMMARIZATION.value:
-                        is_streaming_summarization = True
+                    # Tracks ReAct sections incrementally and decides which chunks to publish
+                    stream_scanner = ReActStreamScanner(
+                        summarization=interaction_type == LLMInteractionType.SUMMARIZATION.value
+                    )
+                    if stream_scanner.streaming is StreamingEventType.SUMMARIZATION:
                         logger.debug(f"Streaming plain text summarization for {session_id}")
                     
                     # Stream tokens with timeout protection
@@ -531,198 +613,37 @@ class LLMClient:
                                 logger.error(f"Failed to bind native tools: {e}, continuing without tools")
                                 llm_with_tools = self.llm_client
                     
-                    # Aggregate chunks for usage metadata (OpenAI stream_usage=True approach)
-                    aggregate_chunk = None
+                    # Collect chunks for usage metadata (OpenAI stream_usage=True approach);
+                    # they are merged once after the stream instead of on every chunk
+                    chunks = []
                     
                     # Wrap streaming with timeout protection (Python 3.11+)
                     async with asyncio.timeout(timeout_seconds):
                         async for chunk in llm_with_tools.astream(langchain_messages, config=config):
-                            # Aggregate chunks by adding them together
-                            # This properly accumulates usage_metadata across all chunks
-                            aggregate_chunk = chunk if aggregate_chunk is None else aggregate_chunk + chunk
+                            chunks.append(chunk)
                             
                             # Extract token content, filtering out code execution parts if enabled
                             # This preserves ReAct format by only accumulating text content
                             token = self._extract_token_content(chunk, filter_code_execution=code_execution_enabled)
-                            accumulated_content += token
-                            
-                            # Detect start of "Thought:" streaming (disabled during summarization)
-                            if (not is_streaming_summarization) and (not is_streaming_thought) and (not is_streaming_final_answer):
-                                if "Thought:" in accumulated_content and "Final Answer:" not in accumulated_content:
-                                    is_streaming_thought = True
-                                    token_count_since_last_send = 0
-                                    logger.debug(f"Started streaming thought for {session_id}")
                             
-                            # Check if we should STOP streaming thought
-                            if is_streaming_thought and ("Action:" in accumulated_content or "Final Answer:" in accumulated_content):
-                                # Extract clean thought content (everything between "Thought:" and stop marker)
-                                thought_start_idx = accumulated_content.find("Thought:")
-                                stop_idx = accumulated_content.find("Action:") if "Action:" in accumulated_content else accumulated_content.find("Final Answer:")
-                                clean_thought = accumulated_content[thought_start_idx + len("Thought:"):stop_idx].strip()
-                                
-                                # Send final complete thought
-                                if clean_thought:
-                                    await self._streaming_publisher.publish_chunk(
-                                        session_id, stage_execution_id,
-                                        StreamingEventType.THOUGHT, clean_thought,
-                                        is_complete=True,
-                                        llm_interaction_id=ctx.interaction.interaction_id,
-                                        parallel_metadata=parallel_metadata
-                                    )
-                                else:
-                                    # Send completion marker
-                                    await self._streaming_publisher.publish_chunk(
-                                        session_id, stage_execution_id,
-                                        StreamingEventType.THOUGHT, "",
-                                        is_complete=True,
-                                        llm_interaction_id=ctx.interaction.interaction_id,
-                                        parallel_metadata=parallel_metadata
-                                    )
-                                is_streaming_thought = False
-                                token_count_since_last_send = 0
-                                logger.debug(f"Stopped streaming thought for {session_id}")
-                                
-                                # If "Final Answer:" detected, start streaming it
-                                if "Final Answer:" in accumulated_content:
-                                    is_streaming_final_answer = True
-                                    token_count_since_last_send = 0
-                                    logger.debug(f"Started streaming final answer for {session_id}")
-                                
-                                continue  # Skip token accumulation for this iteration
-                            
-                            # Send periodic updates with ENTIRE content (not just new tokens)
-                            if is_streaming_thought or is_streaming_final_answer or is_streaming_summarization:
-                                token_count_since_last_send += 1
-                                
-                                # Determine chunk size based on what we're streaming
-                                if is_streaming_thought:
-                                    current_chunk_size = THOUGHT_CHUNK_SIZE
-                                elif is_streaming_final_answer:
-                                    current_chunk_size = FINAL_ANSWER_CHUNK_SIZE
-                                else:  # is_streaming_summarization
-                                    current_chunk_size = SUMMARIZATION_CHUNK_SIZE
-                                
-                                # Send entire content every N tokens
-                                if token_count_since_last_send >= current_chunk_size:
-                                    if is_streaming_thought:
-                                        thought_start_idx = accumulated_content.find("Thought:")
-                                        current_thought = accumulated_content[thought_start_idx + len("Thought:"):].lstrip()
-                                        
-                                        # Check if Action: or Final Answer: appeared (strip them from streaming)
-                                        # This handles cases where LLM doesn't put them on new lines
-                                        if "Action:" in current_thought:
-                                            current_thought = current_thought[:current_thought.find("Action:")].strip()
-                                        elif "Final Answer:" in current_thought:
-                                            current_thought = current_thought[:current_thought.find("Final Answer:")].strip()
-                                        
-                                        if current_thought:
-                                            await self._streaming_publisher.publish_chunk(
-                                                session_id, stage_execution_id,
-                                                StreamingEventType.THOUGHT, current_thought,
-                                                is_complete=False,
-                                                llm_interaction_id=ctx.interaction.interaction_id,
-                                                parallel_metadata=parallel_metadata
-                                            )
-                                    
-                                    elif is_streaming_final_answer:
-                                        final_answer_start_idx = accumulated_content.find("Final Answer:")
-                                        current_final_answer = accumulated_content[final_answer_start_idx + len("Final Answer:"):].lstrip()
-                                        
-                                        if current_final_answer:
-                                            await self._streaming_publisher.publish_chunk(
-                                                session_id, stage_execution_id,
-                                                StreamingEventType.FINAL_ANSWER, current_final_answer,
-                                                is_complete=False,
-                                                llm_interaction_id=ctx.interaction.interaction_id,
-                                                parallel_metadata=parallel_metadata
-                                            )
-                                    
-                                    elif is_streaming_summarization:
-                                        # Stream entire accumulated content as plain text
-                                        if accumulated_content.strip():
-                                            await self._streaming_publisher.publish_chunk(
-                                                session_id, stage_execution_id,
-                                                StreamingEventType.SUMMARIZATION, accumulated_content.strip(),
-                                                is_complete=False,
-                                                mcp_event_id=mcp_event_id,
-                                                parallel_metadata=parallel_metadata
-                                            )
-                                    
-                                    token_count_since_last_send = 0
+                            # Publish thought / final answer / summarization snapshots (ENTIRE content, not deltas)
+                            for event in stream_scanner.feed(token):
+                                await self._publish_stream_event(
+                                    event, session_id, stage_execution_id, ctx.interaction.interaction_id,
+                                    mcp_event_id, parallel_metadata
+                                )
                     
                     # Send final complete content if streaming is still active (after stream completes)
-                    if is_streaming_thought:
-                        thought_start_idx = accumulated_content.find("Thought:")
-                        final_thought = accumulated_content[thought_start_idx + len("Thought:"):].strip()
-                        
-                        # Strip any trailing Action: or Final Answer: (in case LLM didn't put them on new lines)
-                        if "Action:" in final_thought:
-                            final_thought = final_thought[:final_thought.find("Action:")].strip()
-                        elif "Final Answer:" in final_thought:
-                            final_thought = final_thought[:final_thought.find("Final Answer:")].strip()
-                        
-                        if final_thought:
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.THOUGHT, final_thought,
-                                is_complete=True,
-                                llm_interaction_id=ctx.interaction.interaction_id,
-                                parallel_metadata=parallel_metadata
-                            )
-                        else:
-                            # Send completion marker
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.THOUGHT, "",
-                                is_complete=True,
-                                llm_interaction_id=ctx.interaction.interaction_id,
-                                parallel_metadata=parallel_metadata
-                            )
+                    for event in stream_scanner.finish():
+                        await self._publish_stream_event(
+                            event, session_id, stage_execution_id, ctx.interaction.interaction_id,
+                            mcp_event_id, parallel_metadata
+                        )
                     
-                    # Send final complete final answer if streaming is still active
-                    if is_streaming_final_answer:
-                        final_answer_start_idx = accumulated_content.find("Final Answer:")
-                        final_answer = accumulated_content[final_answer_start_idx + len("Final Answer:"):].strip()
-                        
-                        if final_answer:
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.FINAL_ANSWER, final_answer,
-                                is_complete=True,
-                                llm_interaction_id=ctx.interaction.interaction_id,
-                                parallel_metadata=parallel_metadata
-                            )
-                        else:
-                            # Send completion marker
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.FINAL_ANSWER, "",
-                                is_complete=True,
-                                llm_interaction_id=ctx.interaction.interaction_id,
-                                parallel_metadata=parallel_metadata
-                            )
-                    
-                    # Send final complete summarization if streaming is still active
-                    if is_streaming_summarization:
-                        final_summarization = accumulated_content.strip()
-                        
-                        if final_summarization:
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.SUMMARIZATION, final_summarization,
-                                is_complete=True,
-                                mcp_event_id=mcp_event_id,
-                                parallel_metadata=parallel_metadata
-                            )
-                        else:
-                            # Send completion marker
-                            await self._streaming_publisher.publish_chunk(
-                                session_id, stage_execution_id,
-                                StreamingEventType.SUMMARIZATION, "",
-                                is_complete=True,
-                                mcp_event_id=mcp_event_id,
-                                parallel_metadata=parallel_metadata
-                            )
+                    accumulated_content = stream_scanner.content
+                    # Aggregate chunks by adding them together
+                    # This properly accumulates usage_metadata across all chunks
+                    aggregate_chunk = _aggregate_chunks(chunks)
                     
                     # Check for empty response and retry if needed
                     if not accumulated_content or accumulated_content.strip() == "":
@@ -743,6 +664,7 @@ class LLMClient:
                     
                     # Store usage metadata (from aggregated chunks or callback)
                     self._store_usage_metadata(ctx, callback, chunk_usage)
+                    used_tokens = ctx.interaction.total_tokens
                     
                     # Extract complete response metadata from aggregated chunk
                     if aggregate_chunk and hasattr(aggregate_chunk, 'response_metadata'):
@@ -802,20 +724,23 @@ class LLMClient:
                 
                 except Exception as e:
                     # Check if this is a rate limit error
-                    error_str = str(e).lower()
-                    is_rate_limit = any(indicator in error_str for indicator in [
-                        "429", "rate limit", "quota", "too many requests", "rate_limit_exceeded"
-                    ])
+                    is_rate_limit = is_rate_limit_error(e)
                     
-                    if is_rate_limit and attempt < max_retries:
+                    if is_rate_limit:
                         # Extract retry delay from error if available
                         retry_delay = self._extract_retry_delay(str(e))
                         if retry_delay is None:
                             # Exponential backoff: 2^attempt seconds (1s, 2s, 4s)
                             retry_delay = (2 ** attempt)
-                        
-                        logger.warning(f"Rate limit hit (attempt {attempt + 1}/{max_retries + 1}), retrying in {retry_delay}s")
-                        await asyncio.sleep(retry_delay)
+                        # Pause the provider for every session, not just this one
+                        resume_in = self._rate_limiter.record_rate_limit(retry_delay)
+                    
+                    if is_rate_limit and attempt < max_retries:
+                        # The retry waits in the rate limiter queue until the provider resumes
+                        logger.warning(
+                            f"Rate limit hit (attempt {attempt + 1}/{max_retries + 1}), "
+                            f"{self.provider_name} paused for {resume_in:.0f}s"
+                        )
                         continue  # Retry
                     else:
                         # Log detailed error for non-rate-limit errors or max retries reached
@@ -831,6 +756,10 @@ class LLMClient:
                             enhanced_message += f" (max retries {max_retries + 1} exhausted)"
                         
                         raise Exception(enhanced_message) from e
+                
+                finally:
+                    if rate_limit_grant is not None:
+                        self._rate_limiter.settle(rate_limit_grant, used_tokens)
 
     def _contains_final_answer(self, conversation: LLMConversation) -> bool:
         """
@@ -862,6 +791,33 @@ class LLMClient:
         parsed = ReActParser.parse_response(last_msg.content)
         return parsed.is_final_answer
     
+    async def _publish_stream_event(
+        self,
+        event: ReActStreamEvent,
+        session_id: str,
+        stage_execution_id: Optional[str],
+        llm_interaction_id: str,
+        mcp_event_id: Optional[str],
+        parallel_metadata: Optional['ParallelExecutionMetadata']
+    ) -> None:
+        """Publish a streaming chunk; summarizations belong to their MCP event, ReAct sections to the interaction."""
+        if event.stream_type == StreamingEventType.SUMMARIZATION:
+            await self._streaming_publisher.publish_chunk(
+                session_id, stage_execution_id,
+                event.stream_type, event.content,
+                is_complete=event.is_complete,
+                mcp_event_id=mcp_event_id,
+                parallel_metadata=parallel_metadata
+            )
+        else:
+            await self._streaming_publisher.publish_chunk(
+                session_id, stage_execution_id,
+                event.stream_type, event.content,
+                is_complete=event.is_complete,
+                llm_interaction_id=llm_interaction_id,
+                parallel_metadata=parallel_metadata
+            )
+    
     def get_max_tool_result_tokens(self) -> int:
         """Return the maximum tool result tokens for the current provider."""
         return self.provider_config.max_tool_result_tokens  # Already an int with BaseModel validation
@@ -972,19 +928,34 @@ class LLMClient:
                 logger.warning(f"Invalid token usage data types: {e}")
                 return
             
+            # Input tokens served from the provider's prompt cache (OpenAI, xAI, Gemini, Anthropic)
+            cached_input_tokens = self._get_cached_input_tokens(usage_metadata)
+            
             # Store token data (use None instead of 0 for cleaner database storage)
             ctx.interaction.input_tokens = input_tokens if input_tokens > 0 else None
             ctx.interaction.output_tokens = output_tokens if output_tokens > 0 else None
             ctx.interaction.total_tokens = total_tokens if total_tokens > 0 else None
+            ctx.interaction.cached_input_tokens = cached_input_tokens if cached_input_tokens > 0 else None
             
             logger.debug(
                 f"Stored token usage: input={input_tokens}, "
-                f"output={output_tokens}, total={total_tokens}"
+                f"output={output_tokens}, total={total_tokens}, cached={cached_input_tokens}"
             )
         else:
             # Some providers may not support token usage metadata
             logger.debug(f"No token usage metadata available for {self.provider_name}")
     
+    @staticmethod
+    def _get_cached_input_tokens(usage_metadata: Dict[str, Any]) -> int:
+        """Get the input tokens read from the prompt cache from LangChain usage metadata (0 if not reported)."""
+        details = usage_metadata.get('input_token_details')
+        if not isinstance(details, dict):
+            return 0
+        try:
+            return int(details.get('cache_read') or 0)
+        except (ValueError, TypeError):
+            return 0
+    
     def _finalize_conversation(
         self,
         ctx: Any,
@@ -0,0 +1,193 @@
+"""
+Process-wide HTTP connection pools for LLM provider clients.
+
+Every session and parallel agent talking to the same provider shares one
+httpx.AsyncClient per provider type, so TLS connections are kept alive and
+reused across LLM turns instead of being opened per client or per call. Each
+pool caps its open connections, tunes keep-alive, speaks HTTP/2 when the
+optional h2 package is installed, and counts how many requests were served by
+an already open connection.
+
+Provider SDKs that accept an httpx client use these pools: OpenAI and xAI
+(LangChain) and the native Gemini SDK. Anthropic's LangChain client shares its
+own cached httpx client per base URL, and LangChain's Google and Vertex AI
+clients use gRPC channels.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from tarsy.utils.logger import get_module_logger
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = get_module_logger(__name__)
+
+# Used only when the SDK does not set a timeout on the request itself
+DEFAULT_REQUEST_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+# httpcore trace event emitted once for every newly opened connection
+_CONNECTION_OPENED_EVENT = "connection.connect_tcp.complete"
+
+
+@dataclass
+class _PoolCounters:
+    """Requests sent through a pool and connections it had to open for them."""
+
+    requests: int = 0
+    new_connections: int = 0
+
+
+class _CountingTransport(httpx.AsyncHTTPTransport):
+    """Async transport that counts requests and newly opened connections."""
+
+    def __init__(self, counters: _PoolCounters, lock: threading.Lock, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._counters = counters
+        self._lock = lock
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == _CONNECTION_OPENED_EVENT:
+                with self._lock:
+                    self._counters.new_connections += 1
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        with self._lock:
+            self._counters.requests += 1
+        return await super().handle_async_request(request)
+
+
+class ProviderClientPool:
+    """Shared httpx clients for LLM providers, one per provider type and SSL mode."""
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        http2: bool = True,
+    ):
+        """
+        Initialize the pool registry.
+
+        Args:
+            max_connections: Maximum open connections per provider
+            max_keepalive_connections: Idle connections kept open per provider
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Use HTTP/2 when the h2 package is installed
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("h2 package not installed - LLM provider connections use HTTP/1.1 keep-alive")
+        self._clients: Dict[Tuple[str, bool], httpx.AsyncClient] = {}
+        self._counters: Dict[Tuple[str, bool], _PoolCounters] = {}
+        self._lock = threading.Lock()
+
+    def get_async_client(self, provider: str, verify: bool = True) -> httpx.AsyncClient:
+        """
+        Get the shared async HTTP client of a provider, creating it on first use.
+
+        Args:
+            provider: Provider type (e.g. "openai", "google")
+            verify: Verify SSL certificates; unverified clients get their own pool
+
+        Returns:
+            httpx.AsyncClient shared by all callers for this provider
+        """
+        key = (provider, verify)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                counters = self._counters.setdefault(key, _PoolCounters())
+                transport = _CountingTransport(
+                    counters, self._lock, verify=verify, http2=self.http2, limits=self.limits
+                )
+                client = httpx.AsyncClient(transport=transport, timeout=DEFAULT_REQUEST_TIMEOUT)
+                self._clients[key] = client
+                logger.debug(
+                    f"Created {provider} connection pool (max {self.limits.max_connections} connections, "
+                    f"http2={self.http2}, verify={verify})"
+                )
+            return client
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get connection reuse of every provider pool.
+
+        Returns:
+            Pool name -> requests, new_connections, reused_connections and reuse_rate
+        """
+        with self._lock:
+            counters = {key: (c.requests, c.new_connections) for key, c in self._counters.items()}
+        stats: Dict[str, Dict[str, Any]] = {}
+        for (provider, verify), (requests, new_connections) in counters.items():
+            reused = max(requests - new_connections, 0)
+            stats[provider if verify else f"{provider} (ssl verification disabled)"] = {
+                "provider": provider,
+                "http2": self.http2,
+                "max_connections": self.limits.max_connections,
+                "requests": requests,
+                "new_connections": new_connections,
+                "reused_connections": reused,
+                "reuse_rate": reused / requests if requests else 0.0,
+            }
+        return stats
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing LLM provider connection pool: {e}")
+
+
+_provider_client_pool: Optional[ProviderClientPool] = None
+_provider_client_pool_lock = threading.Lock()
+
+
+def get_provider_client_pool() -> ProviderClientPool:
+    """Get the process-wide provider client pool, configured from settings on first use."""
+    global _provider_client_pool
+    with _provider_client_pool_lock:
+        if _provider_client_pool is None:
+            from tarsy.config.settings import get_settings
+
+            settings = get_settings()
+            _provider_client_pool = ProviderClientPool(
+                max_connections=settings.llm_max_connections_per_provider,
+                max_keepalive_connections=settings.llm_max_keepalive_connections_per_provider,
+                keepalive_expiry=settings.llm_keepalive_expiry_seconds,
+                http2=settings.llm_http2_enabled,
+            )
+        return _provider_client_pool
+
+
+async def close_provider_client_pool() -> None:
+    """Close the process-wide provider client pool (on application shutdown)."""
+    global _provider_client_pool
+    with _provider_client_pool_lock:
+        pool, _provider_client_pool = _provider_client_pool, None
+    if pool is not None:
+        await pool.aclose()
+        logger.info("LLM provider connection pools closed")
@@ -21,7 +21,13 @@ from google.genai import types as google_genai_types
 
 from tarsy.config.settings import get_settings
 from tarsy.hooks.hook_context import llm_interaction_context
+from tarsy.integrations.llm.client_pool import get_provider_client_pool
 from tarsy.integrations.llm.native_tools import NativeToolsHelper
+from tarsy.integrations.llm.rate_limiter import (
+    estimate_tokens,
+    get_provider_rate_limiters,
+    is_rate_limit_error,
+)
 from tarsy.integrations.llm.streaming import StreamingPublisher
 from tarsy.models.constants import LLMInteractionType, StreamingEventType
 from tarsy.models.llm_models import LLMProviderConfig, LLMProviderType
@@ -112,9 +118,32 @@ class GeminiNativeThinkingClient:
         self.settings = get_settings()
         # Use shared streaming publisher utility
         self._streaming_publisher = StreamingPublisher(self.settings)
+        # Native Google client, created on first use and reused for every call
+        self._native_client: Optional[genai.Client] = None
+        # Same shared rate limiter as the provider's LLMClient
+        self._rate_limiter = get_provider_rate_limiters().get(
+            self.provider_name, config.requests_per_minute, config.tokens_per_minute
+        )
         
         logger.info(f"Initialized GeminiNativeThinkingClient for model {self.model}")
     
+    def _get_native_client(self) -> genai.Client:
+        """
+        Get the native Google client, creating it on first use.
+        
+        The client sends its requests through the process-wide Google connection
+        pool, so connections stay open across LLM turns and sessions.
+        """
+        if self._native_client is None:
+            http_client = get_provider_client_pool().get_async_client(
+                LLMProviderType.GOOGLE.value, verify=not self.config.disable_ssl_verification
+            )
+            self._native_client = genai.Client(
+                api_key=self.config.api_key,
+                http_options=google_genai_types.HttpOptions(httpx_async_client=http_client)
+            )
+        return self._native_client
+    
     def _get_thinking_config(self, request_id: str) -> google_genai_types.ThinkingConfig:
         """
         Get model-specific thinking configuration.
@@ -320,10 +349,10 @@ class GeminiNativeThinkingClient:
         if native_tools_override is not None:
             logger.info(f"[{request_id}] Applied session-level native tools override")
         
-        # Create native Google client once (before retry loop)
+        # Get the reusable native Google client (before retry loop)
         # Any exceptions from client creation are surfaced immediately
         try:
-            native_client = genai.Client(api_key=self.config.api_key)
+            native_client = self._get_native_client()
         except Exception as e:
             logger.error(f"[{request_id}] Failed to create native Google client: {e}")
             raise
@@ -406,7 +435,15 @@ class GeminiNativeThinkingClient:
         # Retry logic for empty responses (matching LLMClient behavior)
         async with llm_interaction_context(session_id, request_data, stage_execution_id, native_tools_config) as ctx:
             for attempt in range(max_retries + 1):
+                # Tokens reserved for this attempt are settled whatever its outcome;
+                # a failed attempt returns its whole reservation
+                rate_limit_grant = None
+                used_tokens: Optional[int] = 0
                 try:
+                    # Wait for the provider budget (shared with all sessions of this pod)
+                    rate_limit_grant = await self._rate_limiter.acquire(
+                        session_id, estimate_tokens(conversation, max_tokens)
+                    )
                     
                     # Make the API call with timeout using streaming
                     accumulated_content = ""
@@ -526,6 +563,8 @@ class GeminiNativeThinkingClient:
                                 ctx.interaction.input_tokens = getattr(usage, 'prompt_token_count', None)
                                 ctx.interaction.output_tokens = getattr(usage, 'candidates_token_count', None)
                                 ctx.interaction.total_tokens = getattr(usage, 'total_token_count', None)
+                                # Prompt prefix tokens served by Gemini's implicit context cache
+                                ctx.interaction.cached_input_tokens = getattr(usage, 'cached_content_token_count', None) or None
                         
                         # Determine if this is a final response (no tool calls)
                         # Must check this before sending final chunks so we use correct event type
@@ -609,6 +648,7 @@ class GeminiNativeThinkingClient:
                         )
                     
                     ctx.interaction.native_tools_config = native_tools_config
+                    used_tokens = ctx.interaction.total_tokens
                     
                     await ctx.complete_success({})
                     
@@ -635,5 +675,11 @@ class GeminiNativeThinkingClient:
                 except Exception as e:
                     # Don't retry on other exceptions - let them propagate
                     logger.error(f"[{request_id}] Native thinking failed: {e}")
+                    if is_rate_limit_error(e):
+                        # Pause the provider for every session (first backoff step of LLMClient)
+                        self._rate_limiter.record_rate_limit(1)
                     raise
+                finally:
+                    if rate_limit_grant is not None:
+                        self._rate_limiter.settle(rate_limit_grant, used_tokens)
 
@@ -0,0 +1,436 @@
+"""
+Process-wide rate limiting of LLM calls per provider.
+
+Every session and parallel agent calling the same provider shares one
+ProviderRateLimiter. It holds token buckets for the provider's requests per
+minute and tokens per minute (from llm_providers.yaml), queues calls that would
+exceed them and serves the queue round-robin across sessions, so a session
+running many parallel agents cannot starve the others. A rate limit error from
+the provider pauses the whole provider for the retry delay, instead of every
+session backing off on its own and retrying in lockstep.
+
+Token use is reserved up front from the conversation size plus the output
+budget and settled with the usage the provider reports once the call finishes.
+
+Across pods, each pod can limit itself to a share of every provider budget
+(see LLMRateLimitCoordinator), so the pods together stay under the provider's
+limits.
+
+Agent iterations are timed with llm_iteration_timeout(), whose deadline stands
+still while the iteration's calls are queued here, so waiting for the shared
+budget during an alert storm never turns into iteration timeouts.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional
+
+from tarsy.models.unified_interactions import LLMConversation
+from tarsy.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Rough token estimate for reservations (settled with the reported usage later)
+CHARS_PER_TOKEN = 4
+# Output budget reserved when the call sets no max_tokens
+DEFAULT_OUTPUT_TOKENS = 1024
+# Recent queue waits kept for the wait-time percentiles
+WAIT_SAMPLES = 1000
+# Substrings of provider errors rejecting a call because of a rate limit or quota
+RATE_LIMIT_ERROR_INDICATORS = ("429", "rate limit", "quota", "too many requests", "rate_limit_exceeded")
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether a provider error is a rate limit / quota rejection."""
+    error_str = str(error).lower()
+    return any(indicator in error_str for indicator in RATE_LIMIT_ERROR_INDICATORS)
+
+
+def estimate_tokens(conversation: LLMConversation, max_tokens: Optional[int] = None) -> int:
+    """
+    Estimate the tokens an LLM call will use for its reservation.
+
+    Args:
+        conversation: Conversation about to be sent
+        max_tokens: Output token limit of the call, if any
+
+    Returns:
+        Estimated input tokens plus the output budget
+    """
+    chars = sum(len(msg.content) for msg in conversation.messages)
+    return chars // CHARS_PER_TOKEN + (max_tokens or DEFAULT_OUTPUT_TOKENS)
+
+
+class _TokenBucket:
+    """Token bucket holding up to a minute of budget, refilled continuously."""
+
+    def __init__(self, per_minute: int, now: float):
+        self.per_minute = per_minute
+        self.share = 1.0
+        self.level = float(per_minute)
+        self._updated = now
+
+    @property
+    def capacity(self) -> float:
+        return self.per_minute * self.share
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.capacity / 60)
+        self._updated = now
+
+    def wait_time(self, amount: int, now: float) -> float:
+        """Seconds until `amount` can be taken (calls larger than the bucket wait for a full bucket)."""
+        self.refill(now)
+        needed = min(amount, self.capacity)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) * 60 / self.capacity
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    def give_back(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class _IterationDeadline:
+    """Timeout of an agent iteration, stopped while any of its LLM calls is queued."""
+
+    def __init__(self, timeout: asyncio.Timeout) -> None:
+        self._timeout = timeout
+        self._queued = 0
+        self._remaining: Optional[float] = None
+
+    def pause(self) -> None:
+        self._queued += 1
+        when = self._timeout.when()
+        if self._queued == 1 and when is not None and not self._timeout.expired():
+            self._remaining = when - asyncio.get_running_loop().time()
+            self._timeout.reschedule(None)
+
+    def resume(self) -> None:
+        self._queued -= 1
+        if self._queued == 0 and self._remaining is not None:
+            if not self._timeout.expired():
+                self._timeout.reschedule(asyncio.get_running_loop().time() + self._remaining)
+            self._remaining = None
+
+
+_iteration_deadline: ContextVar[Optional[_IterationDeadline]] = ContextVar("llm_iteration_deadline", default=None)
+
+
+@asynccontextmanager
+async def llm_iteration_timeout(seconds: float) -> AsyncIterator[None]:
+    """
+    Like asyncio.timeout(), but time LLM calls spend queued in a ProviderRateLimiter is not counted.
+
+    Args:
+        seconds: Time the iteration may take besides waiting for the provider budget
+
+    Raises:
+        TimeoutError: If the iteration takes longer
+    """
+    async with asyncio.timeout(seconds) as timeout:
+        token = _iteration_deadline.set(_IterationDeadline(timeout))
+        try:
+            yield
+        finally:
+            _iteration_deadline.reset(token)
+
+
+@dataclass
+class RateLimitGrant:
+    """Permission to send one LLM call, with the tokens reserved for it."""
+
+    session_id: str
+    tokens: int
+    wait_seconds: float
+
+
+@dataclass(eq=False)
+class _Waiter:
+    session_id: str
+    tokens: int
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class ProviderRateLimiter:
+    """Requests/min and tokens/min limits of one provider, shared by all sessions of this pod."""
+
+    def __init__(
+        self,
+        provider: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            provider: Provider name (key in llm_providers.yaml)
+            requests_per_minute: Requests per minute allowed by the provider (None = unlimited)
+            tokens_per_minute: Tokens per minute allowed by the provider (None = unlimited)
+            clock: Monotonic clock in seconds
+        """
+        self.provider = provider
+        self._clock = clock
+        self._requests: Optional[_TokenBucket] = None
+        self._tokens: Optional[_TokenBucket] = None
+        self._share = 1.0
+        self.configure(requests_per_minute, tokens_per_minute)
+
+        self._paused_until = 0.0
+        # Waiting calls: one FIFO per session, sessions served round-robin
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+
+        self._granted = 0
+        self._delayed = 0
+        self._rate_limit_errors = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._recent_waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+
+    def configure(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int]) -> None:
+        """Set the provider limits, keeping the current budget of limits that did not change."""
+        now = self._clock()
+        self._requests = self._bucket(self._requests, requests_per_minute, now)
+        self._tokens = self._bucket(self._tokens, tokens_per_minute, now)
+
+    def _bucket(self, bucket: Optional[_TokenBucket], per_minute: Optional[int], now: float) -> Optional[_TokenBucket]:
+        if not per_minute:
+            return None
+        if bucket is not None and bucket.per_minute == per_minute:
+            return bucket
+        bucket = _TokenBucket(per_minute, now)
+        bucket.share = self._share
+        bucket.level = bucket.capacity
+        return bucket
+
+    def set_share(self, share: float) -> None:
+        """
+        Limit this pod to a share of the provider budget.
+
+        Args:
+            share: Fraction of requests/min and tokens/min this pod may use (0-1]
+        """
+        self._share = min(max(share, 0.01), 1.0)
+        now = self._clock()
+        for bucket in (self._requests, self._tokens):
+            if bucket is not None:
+                bucket.refill(now)
+                bucket.share = self._share
+                bucket.level = min(bucket.level, bucket.capacity)
+
+    async def acquire(self, session_id: str, tokens: int) -> RateLimitGrant:
+        """
+        Wait until the provider budget allows another call of this session.
+
+        Calls proceed immediately while nothing is queued and the budget allows;
+        otherwise they queue and are granted one at a time, round-robin across
+        sessions, as the budget refills.
+
+        Args:
+            session_id: Session making the call
+            tokens: Estimated tokens of the call (see estimate_tokens)
+
+        Returns:
+            RateLimitGrant to settle once the actual token usage is known
+        """
+        if not self._queues and self._delay(tokens) <= 0:
+            self._take(tokens)
+            return self._grant(session_id, tokens, 0.0)
+
+        waiter = _Waiter(session_id, tokens)
+        self._queues.setdefault(session_id, deque()).append(waiter)
+        started = self._clock()
+        deadline = _iteration_deadline.get()
+        if deadline is not None:
+            deadline.pause()
+        try:
+            self._wake_next()
+            # Only the waiter at the head of the queue waits for the budget
+            await waiter.ready.wait()
+            while (delay := self._delay(tokens)) > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self._remove(waiter, granted=False)
+            self._wake_next()
+            raise
+        finally:
+            if deadline is not None:
+                deadline.resume()
+
+        self._remove(waiter, granted=True)
+        self._take(tokens)
+        self._wake_next()
+        return self._grant(session_id, tokens, self._clock() - started)
+
+    def settle(self, grant: RateLimitGrant, used_tokens: Optional[int]) -> None:
+        """
+        Correct a call's token reservation with the usage the provider reported.
+
+        Args:
+            grant: Grant returned by acquire()
+            used_tokens: Total tokens the call used (None keeps the reservation)
+        """
+        if self._tokens is None or used_tokens is None:
+            return
+        difference = grant.tokens - used_tokens
+        if difference > 0:
+            self._tokens.give_back(difference)
+        else:
+            self._tokens.take(-difference)
+
+    def record_rate_limit(self, retry_after: float) -> float:
+        """
+        Pause all calls to the provider after it rejected a call as rate limited.
+
+        Args:
+            retry_after: Seconds the provider asked to wait (or the backoff delay)
+
+        Returns:
+            Seconds until calls to the provider resume
+        """
+        now = self._clock()
+        self._rate_limit_errors += 1
+        self._paused_until = max(self._paused_until, now + retry_after)
+        return self._paused_until - now
+
+    def _delay(self, tokens: int) -> float:
+        now = self._clock()
+        delay = max(self._paused_until - now, 0.0)
+        if self._requests is not None:
+            delay = max(delay, self._requests.wait_time(1, now))
+        if self._tokens is not None:
+            delay = max(delay, self._tokens.wait_time(tokens, now))
+        return delay
+
+    def _take(self, tokens: int) -> None:
+        if self._requests is not None:
+            self._requests.take(1)
+        if self._tokens is not None:
+            self._tokens.take(tokens)
+
+    def _wake_next(self) -> None:
+        """Let the waiter at the head of the round-robin queue wait for the budget."""
+        if self._queues:
+            next(iter(self._queues.values()))[0].ready.set()
+
+    def _remove(self, waiter: _Waiter, granted: bool) -> None:
+        queue = self._queues.get(waiter.session_id)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if not queue:
+            del self._queues[waiter.session_id]
+        elif granted:
+            # The session's next call waits for the other sessions' turns
+            self._queues.move_to_end(waiter.session_id)
+
+    def _grant(self, session_id: str, tokens: int, wait_seconds: float) -> RateLimitGrant:
+        self._granted += 1
+        if wait_seconds > 0:
+            self._delayed += 1
+            self._total_wait += wait_seconds
+            self._max_wait = max(self._max_wait, wait_seconds)
+            if wait_seconds >= 1:
+                logger.info(f"LLM call of session {session_id} waited {wait_seconds:.1f}s for {self.provider} rate limits")
+        self._recent_waits.append(wait_seconds)
+        return RateLimitGrant(session_id=session_id, tokens=tokens, wait_seconds=wait_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the limits, queue and wait times of the provider.
+
+        Returns:
+            Dict with effective limits, share, queued calls/sessions, granted and
+            delayed calls, rate limit errors and wait-time statistics in ms
+        """
+        waits = sorted(self._recent_waits)
+
+        def percentile(pct: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[max(math.ceil(pct / 100 * len(waits)) - 1, 0)] * 1000
+
+        return {
+            "provider": self.provider,
+            "requests_per_minute": int(self._requests.capacity) if self._requests else None,
+            "tokens_per_minute": int(self._tokens.capacity) if self._tokens else None,
+            "share": self._share,
+            "queued_calls": sum(len(queue) for queue in self._queues.values()),
+            "queued_sessions": len(self._queues),
+            "granted_calls": self._granted,
+            "delayed_calls": self._delayed,
+            "rate_limit_errors": self._rate_limit_errors,
+            "paused_seconds": max(self._paused_until - self._clock(), 0.0),
+            "wait_avg_ms": self._total_wait / self._granted * 1000 if self._granted else 0.0,
+            "wait_p50_ms": percentile(50),
+            "wait_p95_ms": percentile(95),
+            "wait_max_ms": self._max_wait * 1000,
+        }
+
+
+class ProviderRateLimiters:
+    """Registry of the rate limiters of all providers of this pod."""
+
+    def __init__(self):
+        self._limiters: Dict[str, ProviderRateLimiter] = {}
+        self._share = 1.0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        provider: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ) -> ProviderRateLimiter:
+        """
+        Get the shared limiter of a provider, creating or reconfiguring it.
+
+        Args:
+            provider: Provider name (key in llm_providers.yaml)
+            requests_per_minute: Requests per minute allowed by the provider (None = unlimited)
+            tokens_per_minute: Tokens per minute allowed by the provider (None = unlimited)
+
+        Returns:
+            ProviderRateLimiter shared by every client of the provider
+        """
+        with self._lock:
+            limiter = self._limiters.get(provider)
+            if limiter is None:
+                limiter = ProviderRateLimiter(provider, requests_per_minute, tokens_per_minute)
+                limiter.set_share(self._share)
+                self._limiters[provider] = limiter
+            else:
+                limiter.configure(requests_per_minute, tokens_per_minute)
+            return limiter
+
+    def set_share(self, share: float) -> None:
+        """Limit this pod to a share of every provider budget (see ProviderRateLimiter.set_share)."""
+        with self._lock:
+            self._share = share
+            limiters = list(self._limiters.values())
+        for limiter in limiters:
+            limiter.set_share(share)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the stats of every provider limiter, keyed by provider name."""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.provider: limiter.get_stats() for limiter in limiters}
+
+
+_provider_rate_limiters = ProviderRateLimiters()
+
+
+def get_provider_rate_limiters() -> ProviderRateLimiters:
+    """Get the process-wide provider rate limiter registry."""
+    return _provider_rate_limiters
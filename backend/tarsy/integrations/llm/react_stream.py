@@ -0,0 +1,161 @@
+"""
+Incremental ReAct marker scanning for streamed LLM responses.
+
+LLMClient streams the "Thought:" and "Final Answer:" sections of a ReAct
+response (and whole summarizations) to the dashboard while tokens arrive.
+ReActStreamScanner keeps the response in a list buffer and finds the ReAct
+markers by looking only at each new token plus a short lookbehind window, so a
+token costs time proportional to its own length instead of to everything
+received so far. Snapshot strings are only built when a chunk is published.
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+from tarsy.models.constants import StreamingEventType
+
+THOUGHT_MARKER = "Thought:"
+ACTION_MARKER = "Action:"
+FINAL_ANSWER_MARKER = "Final Answer:"
+REACT_MARKERS = (THOUGHT_MARKER, ACTION_MARKER, FINAL_ANSWER_MARKER)
+
+# A marker split across tokens starts at most this many characters before the new token
+LOOKBEHIND_CHARS = max(len(marker) for marker in REACT_MARKERS) - 1
+
+# Tokens between published snapshots, per stream type
+STREAM_CHUNK_SIZES = {
+    StreamingEventType.THOUGHT: 1,  # Faster streaming for plain text thoughts
+    StreamingEventType.FINAL_ANSWER: 3,  # Reduced but still stable for markdown
+    StreamingEventType.SUMMARIZATION: 1,  # Faster streaming for plain text summaries
+}
+
+
+class ReActStreamEvent(NamedTuple):
+    """A streaming chunk to publish: the entire section so far, not a delta."""
+
+    stream_type: StreamingEventType
+    content: str
+    is_complete: bool
+
+
+class ReActStreamScanner:
+    """
+    Tracks which ReAct section a streamed response is in, one token at a time.
+
+    - The thought streams from the first "Thought:" until "Action:" or
+      "Final Answer:" appears, and completes once with the text in between.
+    - When it stops at "Final Answer:", the final answer streams until the end.
+    - Summarizations stream the whole response as plain text.
+
+    Only the first occurrence of each marker matters, so its position is
+    recorded once and never searched for again.
+    """
+
+    def __init__(self, summarization: bool = False):
+        """
+        Initialize the scanner.
+
+        Args:
+            summarization: Stream the whole response as a SUMMARIZATION
+                instead of looking for ReAct sections
+        """
+        self._parts: List[str] = []
+        self._length = 0
+        self._tail = ""
+        self._marker_at: Dict[str, int] = {}
+        self._streaming: Optional[StreamingEventType] = (
+            StreamingEventType.SUMMARIZATION if summarization else None
+        )
+        self._thought_completed = False
+        self._tokens_since_send = 0
+
+    @property
+    def content(self) -> str:
+        """The response received so far."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    @property
+    def streaming(self) -> Optional[StreamingEventType]:
+        """The section currently being streamed, if any."""
+        return self._streaming
+
+    def feed(self, token: str) -> List[ReActStreamEvent]:
+        """
+        Add a token and return the chunks to publish for it.
+
+        Args:
+            token: Text content of the next streamed chunk (may be empty)
+
+        Returns:
+            Chunks to publish, in order (usually zero or one)
+        """
+        self._append(token)
+
+        if (
+            self._streaming is None
+            and not self._thought_completed
+            and THOUGHT_MARKER in self._marker_at
+            and FINAL_ANSWER_MARKER not in self._marker_at
+        ):
+            self._streaming = StreamingEventType.THOUGHT
+            self._tokens_since_send = 0
+
+        if self._streaming is StreamingEventType.THOUGHT and (
+            ACTION_MARKER in self._marker_at or FINAL_ANSWER_MARKER in self._marker_at
+        ):
+            # Everything between "Thought:" and the marker that ended it
+            stop_at = self._marker_at.get(ACTION_MARKER, self._marker_at.get(FINAL_ANSWER_MARKER))
+            thought = self.content[self._marker_at[THOUGHT_MARKER] + len(THOUGHT_MARKER):stop_at].strip()
+            self._thought_completed = True
+            self._streaming = (
+                StreamingEventType.FINAL_ANSWER if FINAL_ANSWER_MARKER in self._marker_at else None
+            )
+            self._tokens_since_send = 0
+            return [ReActStreamEvent(StreamingEventType.THOUGHT, thought, True)]
+
+        if self._streaming is None:
+            return []
+
+        self._tokens_since_send += 1
+        if self._tokens_since_send < STREAM_CHUNK_SIZES[self._streaming]:
+            return []
+        self._tokens_since_send = 0
+        snapshot = self._section().lstrip()
+        if self._streaming is StreamingEventType.SUMMARIZATION:
+            snapshot = snapshot.rstrip()
+        return [ReActStreamEvent(self._streaming, snapshot, False)] if snapshot else []
+
+    def finish(self) -> List[ReActStreamEvent]:
+        """
+        Return the completion chunk of the section still streaming at the end of the response.
+
+        The chunk carries the complete section, or "" as a bare completion marker.
+        """
+        if self._streaming is None:
+            return []
+        event = ReActStreamEvent(self._streaming, self._section().strip(), True)
+        self._streaming = None
+        return [event]
+
+    def _append(self, token: str) -> None:
+        """Buffer a token and record the first position of any marker it completes."""
+        window = self._tail + token
+        window_start = self._length - len(self._tail)
+        for marker in REACT_MARKERS:
+            if marker not in self._marker_at:
+                index = window.find(marker)
+                if index >= 0:
+                    self._marker_at[marker] = window_start + index
+        if token:
+            self._parts.append(token)
+            self._length += len(token)
+        self._tail = window[-LOOKBEHIND_CHARS:]
+
+    def _section(self) -> str:
+        """Text of the section being streamed, from just after its marker."""
+        if self._streaming is StreamingEventType.THOUGHT:
+            return self.content[self._marker_at[THOUGHT_MARKER] + len(THOUGHT_MARKER):]
+        if self._streaming is StreamingEventType.FINAL_ANSWER:
+            return self.content[self._marker_at[FINAL_ANSWER_MARKER] + len(FINAL_ANSWER_MARKER):]
+        return self.content
@@ -26,6 +26,8 @@ class StreamingPublisher:
     
     Features:
     - Checks streaming config flag before publishing
+    - Hands chunks to the event system's StreamingTransport (coalesced deltas)
+      when it runs, otherwise publishes each chunk in its own transaction
     - Warns about SQLite limitations (requires PostgreSQL for real-time)
     - Logs warning only once per instance to avoid spam
     - Gracefully handles publishing failures without breaking LLM calls
@@ -75,9 +77,32 @@ class StreamingPublisher:
         try:
             from tarsy.database.init_db import get_async_session_factory
             from tarsy.models.event_models import LLMStreamChunkEvent
+            from tarsy.services.events.manager import get_streaming_transport
             from tarsy.services.events.publisher import publish_transient_event
             from tarsy.utils.timestamp import now_us
             
+            # Unpack parallel metadata for JSON serialization
+            event = LLMStreamChunkEvent(
+                session_id=session_id,
+                stage_execution_id=stage_execution_id,
+                chunk=chunk,
+                stream_type=stream_type.value,
+                is_complete=is_complete,
+                mcp_event_id=mcp_event_id,
+                llm_interaction_id=llm_interaction_id,
+                # Unpack parallel execution metadata (event model uses individual fields for JSON serialization)
+                parent_stage_execution_id=parallel_metadata.parent_stage_execution_id if parallel_metadata else None,
+                parallel_index=parallel_metadata.parallel_index if parallel_metadata else None,
+                agent_name=parallel_metadata.agent_name if parallel_metadata else None,
+                timestamp_us=now_us()
+            )
+            
+            # Preferred path: coalesced deltas over the transport's own connection
+            streaming_transport = get_streaming_transport()
+            if streaming_transport is not None:
+                streaming_transport.submit(event)
+                return
+            
             async_session_factory = get_async_session_factory()
             async with async_session_factory() as session:
                 # Check database dialect to warn about SQLite limitations
@@ -93,22 +118,6 @@ class StreamingPublisher:
                         )
                         self._sqlite_warning_logged = True
                 
-                # Unpack parallel metadata for JSON serialization
-                event = LLMStreamChunkEvent(
-                    session_id=session_id,
-                    stage_execution_id=stage_execution_id,
-                    chunk=chunk,
-                    stream_type=stream_type.value,
-                    is_complete=is_complete,
-                    mcp_event_id=mcp_event_id,
-                    llm_interaction_id=llm_interaction_id,
-                    # Unpack parallel execution metadata (event model uses individual fields for JSON serialization)
-                    parent_stage_execution_id=parallel_metadata.parent_stage_execution_id if parallel_metadata else None,
-                    parallel_index=parallel_metadata.parallel_index if parallel_metadata else None,
-                    agent_name=parallel_metadata.agent_name if parallel_metadata else None,
-                    timestamp_us=now_us()
-                )
-                
                 await publish_transient_event(
                     session=session,
                     channel=f"session:{session_id}",
@@ -24,6 +24,7 @@ from tarsy.integrations.mcp.recovery_config import (
     HTTP_STATUS_UPSTREAM_ERROR,
 )
 from tarsy.integrations.mcp.recovery_types import RecoveryAction, RecoveryDecision
+from tarsy.integrations.mcp.tool_catalog import MCPToolCatalogCache, serialize_tools
 from tarsy.integrations.mcp.transport.factory import MCPTransport, MCPTransportFactory
 from tarsy.models.agent_config import MCPServerConfigModel
 from tarsy.models.mcp_transport_config import TRANSPORT_STDIO
@@ -34,6 +35,7 @@ from tarsy.utils.logger import get_module_logger
 from tarsy.utils.token_counter import TokenCounter
 
 if TYPE_CHECKING:
+    from tarsy.integrations.mcp.session_pool import MCPSessionPool, PooledMCPConnection
     from tarsy.integrations.mcp.summarizer import MCPResultSummarizer
     from tarsy.models.mcp_selection_models import MCPSelectionConfig
     from tarsy.models.unified_interactions import LLMConversation
@@ -49,7 +51,9 @@ class MCPClient:
     """MCP client using the official MCP SDK."""
 
     def __init__(self, settings: Settings, mcp_registry: Optional[MCPServerRegistry] = None, 
-                 summarizer: Optional['MCPResultSummarizer'] = None):
+                 summarizer: Optional['MCPResultSummarizer'] = None,
+                 session_pool: Optional['MCPSessionPool'] = None,
+                 tool_catalog: Optional[MCPToolCatalogCache] = None):
         self.settings = settings
         self.mcp_registry = mcp_registry or MCPServerRegistry()
         self.data_masking_service = DataMaskingService(self.mcp_registry)
@@ -61,6 +65,11 @@ class MCPClient:
         self._initialized = False
         self.failed_servers: Dict[str, str] = {}  # server_id -> error_message
         self._reinit_locks: Dict[str, asyncio.Lock] = {}  # Per-server locks for reinitialization
+        # Optional per-pod connection pool; sessions of non-isolated servers are leased from it
+        self.session_pool = session_pool
+        self._leases: Dict[str, 'PooledMCPConnection'] = {}  # server_id -> leased pooled connection
+        # Optional per-pod tool catalog cache; fresh entries are served without calling the server
+        self.tool_catalog = tool_catalog
 
     def _classify_mcp_failure(self, exc: BaseException) -> RecoveryDecision:
         """
@@ -125,6 +134,7 @@ class MCPClient:
 
         old_transport = self.transports.get(server_id)
         self.sessions.pop(server_id, None)
+        self._invalidate_tool_catalog(server_id)
         self.transports.pop(server_id, None)
 
         if old_transport is not None:
@@ -372,6 +382,9 @@ class MCPClient:
         Raises:
             Exception: If session creation fails
         """
+        if self.session_pool is not None and not getattr(server_config, "isolated_sessions", False):
+            return await self._lease_session(server_id, server_config)
+        
         transport = None
         try:
             # Get already-parsed transport configuration
@@ -424,6 +437,24 @@ class MCPClient:
             
             raise
     
+    async def _lease_session(self, server_id: str, server_config: MCPServerConfigModel) -> ClientSession:
+        """Lease a session for a server from the connection pool, replacing any current lease.
+        
+        A current lease is only replaced when its session is dead (recovery, health
+        monitor), so it is discarded rather than returned to the pool.
+        """
+        old_lease = self._leases.pop(server_id, None)
+        if old_lease is not None:
+            await self.session_pool.release(old_lease, reusable=False)
+        
+        try:
+            lease = await self.session_pool.acquire(server_id, server_config)
+        except Exception as e:
+            logger.error(f"Failed to lease session for {server_id}: {extract_error_details(e)}")
+            raise
+        self._leases[server_id] = lease
+        return lease.session
+    
     async def list_tools_simple(
         self,
         server_name: Optional[str] = None,
@@ -450,14 +481,9 @@ class MCPClient:
             # List tools from specific server
             if server_name in self.sessions:
                 try:
-                    tools_result = await self._call_with_timeout_and_recovery(
-                        server_name,
-                        "list_tools_simple",
-                        lambda sess: sess.list_tools(),
-                        DEFAULT_RECOVERY_CONFIG.OPERATION_TIMEOUT_SECONDS,
-                    )
-                    all_tools[server_name] = tools_result.tools
-                    logger.debug(f"Listed {len(tools_result.tools)} tools from {server_name}")
+                    tools = await self._list_server_tools(server_name, "list_tools_simple")
+                    all_tools[server_name] = tools
+                    logger.debug(f"Listed {len(tools)} tools from {server_name}")
                 except Exception as e:
                     logger.warning(f"Failed to list tools from {server_name}: {e}")
                     all_tools[server_name] = []
@@ -470,14 +496,9 @@ class MCPClient:
                         all_tools[name] = []
                         continue
 
-                    tools_result = await self._call_with_timeout_and_recovery(
-                        name,
-                        "list_tools_simple",
-                        lambda sess: sess.list_tools(),
-                        DEFAULT_RECOVERY_CONFIG.OPERATION_TIMEOUT_SECONDS,
-                    )
-                    all_tools[name] = tools_result.tools
-                    logger.debug(f"Listed {len(tools_result.tools)} tools from {name}")
+                    tools = await self._list_server_tools(name, "list_tools_simple")
+                    all_tools[name] = tools
+                    logger.debug(f"Listed {len(tools)} tools from {name}")
                 except Exception as e:
                     logger.warning(f"Failed to list tools from {name}: {e}")
                     all_tools[name] = []
@@ -517,19 +538,15 @@ class MCPClient:
 
                 timeout_seconds = DEFAULT_RECOVERY_CONFIG.OPERATION_TIMEOUT_SECONDS
                 try:
-                    tools_result = await self._call_with_timeout_and_recovery(
-                        server_name,
-                        "list_tools",
-                        lambda sess: sess.list_tools(),
-                        timeout_seconds,
-                        request_id=request_id,
+                    tools = await self._list_server_tools(
+                        server_name, "list_tools", timeout_seconds, request_id=request_id
                     )
 
                     # Keep the official Tool objects with full schema information
-                    all_tools[server_name] = tools_result.tools
+                    all_tools[server_name] = tools
 
                     # Log the successful response
-                    self._log_mcp_list_tools_response(server_name, tools_result.tools, request_id)
+                    self._log_mcp_list_tools_response(server_name, tools, request_id)
 
                 except asyncio.TimeoutError:
                     error_msg = f"List tools timed out after {timeout_seconds}s"
@@ -554,18 +571,14 @@ class MCPClient:
                             all_tools[name] = []
                             continue
 
-                        tools_result = await self._call_with_timeout_and_recovery(
-                            name,
-                            "list_tools",
-                            lambda sess: sess.list_tools(),
-                            timeout_seconds,
-                            request_id=request_id,
+                        tools = await self._list_server_tools(
+                            name, "list_tools", timeout_seconds, request_id=request_id
                         )
                         # Keep the official Tool objects with full schema information
-                        all_tools[name] = tools_result.tools
+                        all_tools[name] = tools
                         
                         # Log the successful response for this server
-                        self._log_mcp_list_tools_response(name, tools_result.tools, request_id)
+                        self._log_mcp_list_tools_response(name, tools, request_id)
                     
                     except asyncio.TimeoutError:
                         # No retry - let LLM handle it
@@ -584,19 +597,11 @@ class MCPClient:
                         all_tools[name] = []
             
             # Convert Tool objects to dictionaries for JSON serialization in hook context
-            serializable_tools: Dict[str, List[Dict[str, Any]]] = {}
-            for srv_name, tools in all_tools.items():
-                if tools:
-                    serializable_tools[srv_name] = [
-                        {
-                            "name": tool.name,
-                            "description": tool.description or "",
-                            "inputSchema": tool.inputSchema or {}
-                        }
-                        for tool in tools
-                    ]
-                else:
-                    serializable_tools[srv_name] = []
+            # (history stores them once per distinct catalog, see MCPToolCatalog)
+            serializable_tools: Dict[str, List[Dict[str, Any]]] = {
+                srv_name: serialize_tools(tools)
+                for srv_name, tools in all_tools.items()
+            }
             
             # Update the interaction with result data
             ctx.interaction.available_tools = serializable_tools
@@ -606,6 +611,36 @@ class MCPClient:
             
             return all_tools
     
+    async def _list_server_tools(
+        self,
+        server_id: str,
+        operation: str,
+        timeout_seconds: float = DEFAULT_RECOVERY_CONFIG.OPERATION_TIMEOUT_SECONDS,
+        request_id: Optional[str] = None,
+    ) -> List[Tool]:
+        """List a server's tools, serving them from the tool catalog cache while fresh."""
+        if self.tool_catalog is not None:
+            entry = self.tool_catalog.get(server_id)
+            if entry is not None:
+                logger.debug(f"Serving {len(entry.tools)} cached tools for {server_id}")
+                return entry.tools
+
+        tools_result = await self._call_with_timeout_and_recovery(
+            server_id,
+            operation,
+            lambda sess: sess.list_tools(),
+            timeout_seconds,
+            request_id=request_id,
+        )
+        if self.tool_catalog is not None:
+            self.tool_catalog.put(server_id, tools_result.tools)
+        return tools_result.tools
+    
+    def _invalidate_tool_catalog(self, server_id: str) -> None:
+        """Force a refetch of a server's tools after its session was replaced."""
+        if self.tool_catalog is not None:
+            self.tool_catalog.invalidate(server_id)
+    
     async def try_initialize_server(self, server_id: str) -> bool:
         """
         Attempt to initialize a server that failed during startup.
@@ -634,6 +669,7 @@ class MCPClient:
                     timeout=10.0  # Quick timeout for health monitor
                 )
                 self.sessions[server_id] = session
+                self._invalidate_tool_catalog(server_id)
                 
                 # Remove from failed servers tracking
                 if server_id in self.failed_servers:
@@ -1205,6 +1241,14 @@ class MCPClient:
 
     async def close(self) -> None:
         """Close all MCP client connections and transports."""
+        # Return leased connections to the pool
+        for server_id, lease in list(self._leases.items()):
+            try:
+                await self.session_pool.release(lease)
+            except Exception as e:
+                logger.error(f"Error releasing pooled session for {server_id}: {extract_error_details(e)}")
+        self._leases.clear()
+        
         # Close all transports
         for server_id, transport in self.transports.items():
             try:
@@ -0,0 +1,354 @@
+"""
+Per-pod pool of MCP server connections shared by session-scoped MCP clients.
+
+Opening an MCP connection runs the transport setup and the MCP handshake
+(and spawns a subprocess for stdio servers), so doing it for every alert
+session dominates session startup. The pool keeps connections open between
+sessions and leases them exclusively to one MCPClient at a time:
+
+- Leasing: a connection is used by a single client until it is released,
+  so concurrently running sessions never share server-side session state
+- Health-checked reuse: idle connections are pinged before being leased
+  again; dead ones are closed and replaced
+- Per-server limit: at most ``max_sessions_per_server`` connections per
+  server are kept; leases beyond it get a dedicated connection that is
+  closed on release
+- Idle eviction: connections unused for ``idle_timeout_seconds`` are closed
+
+Each connection is opened and closed by its own owner task. The MCP SDK
+transports are AnyIO context managers that must exit in the task they were
+entered in, and pooled connections outlive the client that opened them.
+"""
+
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from typing import Dict, List, Optional
+
+from mcp import ClientSession
+
+from tarsy.integrations.mcp.transport.factory import MCPTransportFactory
+from tarsy.models.agent_config import MCPServerConfigModel
+from tarsy.models.mcp_transport_config import TRANSPORT_STDIO
+from tarsy.utils.error_details import extract_error_details
+from tarsy.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Upper bound for tearing down a connection (transport close runs in the owner task)
+CONNECTION_CLOSE_TIMEOUT_SECONDS = 10.0
+
+
+class PooledMCPConnection:
+    """An MCP server connection owned by a dedicated task."""
+
+    def __init__(self, server_id: str, pooled: bool = True):
+        """
+        Initialize a pooled connection (not opened yet).
+
+        Args:
+            server_id: ID of the MCP server
+            pooled: Whether the connection returns to the pool on release
+                (False for connections opened beyond the per-server limit)
+        """
+        self.server_id = server_id
+        self.pooled = pooled
+        self.session: Optional[ClientSession] = None
+        self.last_used_at = time.monotonic()
+        self._owner_task: Optional[asyncio.Task] = None
+        self._close_requested = asyncio.Event()
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the connection is open (its owner task is still running)."""
+        return (
+            self.session is not None
+            and self._owner_task is not None
+            and not self._owner_task.done()
+        )
+
+    async def open(self, server_config: MCPServerConfigModel, timeout: float) -> ClientSession:
+        """
+        Open the connection in its owner task and wait for the MCP handshake.
+
+        Args:
+            server_config: Server configuration
+            timeout: Seconds to wait for the session to be initialized
+
+        Returns:
+            Initialized ClientSession
+
+        Raises:
+            Exception: If the session cannot be created
+            asyncio.TimeoutError: If the session is not ready within timeout
+        """
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._owner_task = asyncio.create_task(
+            self._own(server_config, ready),
+            name=f"mcp-connection-{self.server_id}",
+        )
+        try:
+            self.session = await asyncio.wait_for(asyncio.shield(ready), timeout=timeout)
+        except BaseException:
+            # Abandon the handshake: the owner task tears down whatever it opened
+            ready.cancel()
+            self._close_requested.set()
+            if not self._owner_task.done():
+                self._owner_task.cancel()
+            raise
+        self.last_used_at = time.monotonic()
+        return self.session
+
+    async def _own(self, server_config: MCPServerConfigModel, ready: asyncio.Future) -> None:
+        """Owner task: create the transport, hold it open until closed, then tear it down."""
+        transport_config = server_config.transport
+        exit_stack = AsyncExitStack()
+        transport = None
+        try:
+            transport = MCPTransportFactory.create_transport(
+                self.server_id,
+                transport_config,
+                exit_stack if transport_config.type == TRANSPORT_STDIO else None,
+            )
+            session = await transport.create_session()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(
+                    e if isinstance(e, Exception)
+                    else Exception(f"MCP session creation for '{self.server_id}' was cancelled")
+                )
+            await self._close_transport(transport, exit_stack)
+            return
+
+        if not ready.done():
+            ready.set_result(session)
+        try:
+            await self._close_requested.wait()
+        finally:
+            await self._close_transport(transport, exit_stack)
+
+    async def _close_transport(self, transport, exit_stack: AsyncExitStack) -> None:
+        """Best-effort transport teardown; never propagates errors out of the owner task."""
+        try:
+            if transport is not None:
+                await transport.close()
+            await exit_stack.aclose()
+        except BaseException as e:
+            logger.debug(
+                "Suppressing MCP transport close error for %s: %s",
+                self.server_id,
+                type(e).__name__,
+                exc_info=True,
+            )
+
+    async def ping(self, timeout: float) -> bool:
+        """
+        Check that the connection still answers MCP pings.
+
+        Args:
+            timeout: Seconds to wait for the ping response
+
+        Returns:
+            True if the server responded, False otherwise
+        """
+        if not self.is_open:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=timeout)
+            return True
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            logger.debug(f"Pooled MCP connection for {self.server_id} failed health check: {type(e).__name__}")
+            return False
+
+    async def close(self) -> None:
+        """Close the connection by stopping its owner task."""
+        self.session = None
+        self._close_requested.set()
+        task = self._owner_task
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=CONNECTION_CLOSE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out closing MCP connection for {self.server_id}, cancelling its owner task")
+            task.cancel()
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            logger.debug(f"MCP connection owner task for {self.server_id} ended with {type(e).__name__}")
+
+
+class MCPSessionPool:
+    """Pool of MCP server connections keyed by server_id."""
+
+    def __init__(
+        self,
+        max_sessions_per_server: int = 4,
+        idle_timeout_seconds: float = 300.0,
+        health_check_timeout_seconds: float = 5.0,
+        connect_timeout_seconds: float = 30.0,
+    ):
+        """
+        Initialize the MCP session pool.
+
+        Args:
+            max_sessions_per_server: Maximum pooled connections kept per server
+            idle_timeout_seconds: Idle time after which a pooled connection is closed
+            health_check_timeout_seconds: Ping timeout when reusing an idle connection
+            connect_timeout_seconds: Timeout for opening a new connection
+        """
+        self.max_sessions_per_server = max_sessions_per_server
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.health_check_timeout_seconds = health_check_timeout_seconds
+        self.connect_timeout_seconds = connect_timeout_seconds
+        # server_id -> idle connections, most recently used last
+        self._idle: Dict[str, List[PooledMCPConnection]] = {}
+        # server_id -> pooled connections (idle + leased) counted against the limit
+        self._pooled_counts: Dict[str, int] = {}
+        self._closed = False
+        # Started on first use: the pool may be created outside a running event loop
+        self._eviction_task: Optional[asyncio.Task] = None
+
+    async def acquire(
+        self,
+        server_id: str,
+        server_config: MCPServerConfigModel,
+        connect_timeout: Optional[float] = None,
+    ) -> PooledMCPConnection:
+        """
+        Lease a connection to a server, reusing a healthy idle one when available.
+
+        Args:
+            server_id: ID of the MCP server
+            server_config: Server configuration (used when a new connection is opened)
+            connect_timeout: Optional override of the connect timeout
+
+        Returns:
+            Leased connection; hand it back with release()
+
+        Raises:
+            Exception: If a new connection cannot be opened
+        """
+        if self._closed:
+            raise RuntimeError("MCP session pool is closed")
+
+        self._ensure_eviction_task()
+        await self.evict_idle()
+
+        idle = self._idle.get(server_id, [])
+        while idle:
+            connection = idle.pop()
+            if await connection.ping(self.health_check_timeout_seconds):
+                logger.debug(f"Reusing pooled MCP connection for {server_id}")
+                return connection
+            logger.info(f"Discarding unhealthy pooled MCP connection for {server_id}")
+            await self._discard(connection)
+
+        # Reserve a pool slot before awaiting so concurrent acquires respect the limit
+        pooled = self._pooled_counts.get(server_id, 0) < self.max_sessions_per_server
+        if pooled:
+            self._pooled_counts[server_id] = self._pooled_counts.get(server_id, 0) + 1
+        connection = PooledMCPConnection(server_id, pooled=pooled)
+        try:
+            await connection.open(server_config, connect_timeout or self.connect_timeout_seconds)
+        except BaseException:
+            self._release_slot(connection)
+            raise
+        logger.info(
+            f"Opened {'pooled' if pooled else 'dedicated'} MCP connection for {server_id}"
+        )
+        return connection
+
+    async def release(self, connection: PooledMCPConnection, reusable: bool = True) -> None:
+        """
+        Return a leased connection.
+
+        Args:
+            connection: Connection obtained from acquire()
+            reusable: False if the connection is known to be broken
+        """
+        if not reusable or not connection.pooled or self._closed or not connection.is_open:
+            await self._discard(connection)
+            return
+        connection.last_used_at = time.monotonic()
+        self._idle.setdefault(connection.server_id, []).append(connection)
+
+    async def evict_idle(self) -> int:
+        """
+        Close pooled connections idle for longer than idle_timeout_seconds.
+
+        Returns:
+            Number of connections closed
+        """
+        deadline = time.monotonic() - self.idle_timeout_seconds
+        expired: List[PooledMCPConnection] = []
+        for server_id, idle in self._idle.items():
+            keep = [c for c in idle if c.last_used_at >= deadline]
+            expired.extend(c for c in idle if c.last_used_at < deadline)
+            self._idle[server_id] = keep
+        for connection in expired:
+            logger.debug(f"Evicting idle MCP connection for {connection.server_id}")
+            await self._discard(connection)
+        return len(expired)
+
+    def _ensure_eviction_task(self) -> None:
+        """Start the background idle eviction loop if it is not running."""
+        if self._eviction_task is None or self._eviction_task.done():
+            self._eviction_task = asyncio.create_task(self._eviction_loop(), name="mcp-session-pool-eviction")
+
+    async def _eviction_loop(self) -> None:
+        """Periodically close idle connections so quiet pods do not hold them forever."""
+        interval = max(self.idle_timeout_seconds / 2, 1.0)
+        while not self._closed:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning(f"MCP session pool idle eviction failed: {extract_error_details(e)}")
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get pool occupancy per server.
+
+        Returns:
+            Dict[server_id, {"pooled": connections counted against the limit, "idle": idle connections}]
+        """
+        server_ids = set(self._pooled_counts) | set(self._idle)
+        return {
+            server_id: {
+                "pooled": self._pooled_counts.get(server_id, 0),
+                "idle": len(self._idle.get(server_id, [])),
+            }
+            for server_id in server_ids
+        }
+
+    async def close(self) -> None:
+        """Close all idle connections; leased ones are closed when released."""
+        self._closed = True
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            self._eviction_task = None
+        idle = [c for connections in self._idle.values() for c in connections]
+        self._idle.clear()
+        for connection in idle:
+            await self._discard(connection)
+
+    async def _discard(self, connection: PooledMCPConnection) -> None:
+        """Close a connection and free its pool slot."""
+        self._release_slot(connection)
+        try:
+            await connection.close()
+        except Exception as e:
+            logger.warning(
+                f"Error closing MCP connection for {connection.server_id}: {extract_error_details(e)}"
+            )
+
+    def _release_slot(self, connection: PooledMCPConnection) -> None:
+        """Free the pool slot held by a connection (idempotent)."""
+        if connection.pooled:
+            connection.pooled = False
+            self._pooled_counts[connection.server_id] = max(
+                self._pooled_counts.get(connection.server_id, 1) - 1, 0
+            )
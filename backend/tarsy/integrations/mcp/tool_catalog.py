@@ -0,0 +1,129 @@
+"""
+Per-pod cache of MCP server tool catalogs.
+
+Every stage of every session lists the tools of its MCP servers, and the
+health monitor lists them again every check interval. Tool lists change only
+when a server is redeployed, so a single cache shared by the session-scoped
+clients, the health check client and the system controller serves them from
+memory:
+
+- TTL: entries older than ``ttl_seconds`` are refetched by the next lister
+- Invalidation: entries are marked stale when a server session is
+  reconnected, since a restarted server may expose a different tool set
+- Change detection: each catalog carries a hash of its serialized tools;
+  a hash change on refresh is logged so schema drift is visible
+
+Stale entries are kept as the last known catalog for read-only consumers
+(the MCP servers endpoint) while a server is unreachable.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from mcp.types import Tool
+
+from tarsy.models.unified_interactions import MCPToolCatalog
+from tarsy.utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+
+def serialize_tools(tools: List[Tool]) -> List[Dict[str, Any]]:
+    """Convert Tool objects to the JSON form stored with tool_list interactions."""
+    return [
+        {
+            "name": tool.name,
+            "description": tool.description or "",
+            "inputSchema": tool.inputSchema or {},
+        }
+        for tool in tools
+    ]
+
+
+@dataclass
+class ToolCatalogEntry:
+    """Cached tool list of a single MCP server."""
+
+    server_id: str
+    tools: List[Tool]
+    catalog_hash: str
+    fetched_at: float  # time.monotonic() of the fetch, -inf once invalidated
+
+
+class MCPToolCatalogCache:
+    """TTL cache of tool lists keyed by MCP server ID."""
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        """
+        Initialize the tool catalog cache.
+
+        Args:
+            ttl_seconds: Age after which a cached tool list is refetched
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, ToolCatalogEntry] = {}
+
+    def get(self, server_id: str) -> Optional[ToolCatalogEntry]:
+        """
+        Get a server's catalog if it is still fresh.
+
+        Args:
+            server_id: ID of the MCP server
+
+        Returns:
+            Fresh catalog entry, or None if missing, expired or invalidated
+        """
+        entry = self._entries.get(server_id)
+        if entry is None or time.monotonic() - entry.fetched_at > self.ttl_seconds:
+            return None
+        return entry
+
+    def put(self, server_id: str, tools: List[Tool]) -> ToolCatalogEntry:
+        """
+        Store a freshly listed tool catalog.
+
+        Args:
+            server_id: ID of the MCP server
+            tools: Tools returned by the server
+
+        Returns:
+            The stored catalog entry
+        """
+        catalog_hash = MCPToolCatalog.compute_hash(serialize_tools(tools))
+        previous = self._entries.get(server_id)
+        if previous is not None and previous.catalog_hash != catalog_hash:
+            logger.info(
+                f"Tool catalog of MCP server {server_id} changed "
+                f"({len(previous.tools)} -> {len(tools)} tools, hash {catalog_hash[:12]})"
+            )
+        entry = ToolCatalogEntry(
+            server_id=server_id,
+            tools=list(tools),
+            catalog_hash=catalog_hash,
+            fetched_at=time.monotonic(),
+        )
+        self._entries[server_id] = entry
+        return entry
+
+    def invalidate(self, server_id: str) -> None:
+        """
+        Force the next lister to refetch a server's tools.
+
+        The entry is kept as the last known catalog for get_last_known().
+
+        Args:
+            server_id: ID of the MCP server
+        """
+        entry = self._entries.get(server_id)
+        if entry is not None:
+            entry.fetched_at = float("-inf")
+
+    def get_last_known(self) -> Dict[str, List[Tool]]:
+        """
+        Get the last successfully listed tools of every server, fresh or not.
+
+        Returns:
+            Dictionary mapping server IDs to copies of their tool lists
+        """
+        return {server_id: list(entry.tools) for server_id, entry in self._entries.items()}
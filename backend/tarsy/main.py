@@ -20,7 +20,6 @@ from fastapi.responses import JSONResponse
 
 from tarsy.config.settings import get_settings
 from tarsy.controllers.alert_controller import router as alert_router
-from tarsy.models.constants import AlertSessionStatus
 from tarsy.controllers.chat_controller import router as chat_router
 from tarsy.controllers.history_controller import router as history_router
 from tarsy.controllers.websocket_controller import websocket_router
@@ -31,6 +30,8 @@ from tarsy.database.init_db import (
     initialize_async_database,
     initialize_database,
 )
+from tarsy.integrations.llm.client_pool import close_provider_client_pool
+from tarsy.models.constants import AlertSessionStatus
 from tarsy.models.processing_context import ChainContext
 from tarsy.services.alert_service import AlertService
 from tarsy.utils.logger import get_module_logger, setup_logging
@@ -39,6 +40,7 @@ if TYPE_CHECKING:
     from tarsy.repositories.base_repository import DatabaseManager
     from tarsy.services.events.manager import EventSystemManager
     from tarsy.services.history_cleanup_service import HistoryCleanupService
+    from tarsy.services.llm_rate_limit_coordinator import LLMRateLimitCoordinator
     from tarsy.services.mcp_health_monitor import MCPHealthMonitor
     from tarsy.services.session_claim_worker import SessionClaimWorker
 
@@ -64,6 +66,7 @@ alert_service: Optional[AlertService] = None
 session_claim_worker: Optional["SessionClaimWorker"] = None
 event_system_manager: Optional["EventSystemManager"] = None
 history_cleanup_service: Optional["HistoryCleanupService"] = None
+llm_rate_limit_coordinator: Optional["LLMRateLimitCoordinator"] = None
 mcp_health_monitor: Optional["MCPHealthMonitor"] = None  # MCPHealthMonitor for server health monitoring
 db_manager: Optional["DatabaseManager"] = None  # DatabaseManager for history cleanup service
 
@@ -183,7 +186,7 @@ async def mark_active_tasks_as_interrupted(reason: str) -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
-    global alert_service, session_claim_worker, event_system_manager, history_cleanup_service, mcp_health_monitor, db_manager, active_tasks_lock, shutdown_in_progress
+    global alert_service, session_claim_worker, event_system_manager, history_cleanup_service, llm_rate_limit_coordinator, mcp_health_monitor, db_manager, active_tasks_lock, shutdown_in_progress
     
     # Initialize services
     settings = get_settings()
@@ -239,7 +242,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         mcp_health_monitor = MCPHealthMonitor(
             mcp_client=alert_service.health_check_mcp_client,
             warnings_service=get_warnings_service(),
-            check_interval=15.0  # Check every 15 seconds
+            check_interval=15.0,  # Check every 15 seconds
+            tool_catalog=alert_service.mcp_client_factory.tool_catalog,
         )
         await mcp_health_monitor.start()
         
@@ -263,6 +267,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await hook_registry.initialize_hooks(history_service=history_service)
     logger.info("Typed hook system initialized successfully")
     
+    # Buffer interaction history writes (flushed at stage boundaries and on shutdown)
+    try:
+        await history_service.start_write_buffer()
+    except Exception as e:
+        logger.error(f"Failed to start history write buffer, writing interactions directly: {e}")
+    
     # Initialize event system (async database engine and event manager)
     try:
         from tarsy.services.events.manager import EventSystemManager, set_event_system
@@ -275,7 +285,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             database_url=settings.database_url,
             db_session_factory=get_async_session_factory(),
             event_retention_hours=settings.event_retention_hours,
-            event_cleanup_interval_hours=settings.event_cleanup_interval_hours
+            event_cleanup_interval_hours=settings.event_cleanup_interval_hours,
+            publish_batching_enabled=settings.event_publish_batching_enabled,
+            publish_max_latency_ms=settings.event_publish_max_latency_ms,
+            publish_max_batch_size=settings.event_publish_max_batch_size,
+            publish_max_pending=settings.event_publish_max_pending,
+            llm_streaming_enabled=settings.enable_llm_streaming,
+            llm_streaming_coalesce_ms=settings.llm_streaming_coalesce_ms,
         )
         await event_system_manager.start()
         set_event_system(event_system_manager)
@@ -312,6 +328,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             db_session_factory=db_manager.get_session,
             retention_days=settings.history_retention_days,
             retention_cleanup_interval_hours=settings.history_cleanup_interval_hours,
+            retention_batch_size=settings.history_retention_batch_size,
+            retention_batch_pause_ms=settings.history_retention_batch_pause_ms,
             orphaned_timeout_minutes=settings.orphaned_session_timeout_minutes,
             orphaned_check_interval_minutes=settings.orphaned_session_check_interval_minutes,
         )
@@ -334,13 +352,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             max_global_concurrent=settings.max_concurrent_alerts,
             claim_interval=settings.queue_claim_interval_seconds,
             process_callback=process_alert_background,
-            pod_id=get_pod_id()
+            pod_id=get_pod_id(),
+            queue_config=alert_service.parsed_config.queue
         )
         await session_claim_worker.start()
         logger.info(
             f"SessionClaimWorker started (global limit: {settings.max_concurrent_alerts}, "
             f"queue_limit: {settings.max_queue_size or 'unlimited'})"
         )
+        
+        # Wake the claim worker on queue notifications from any pod (polling remains the fallback)
+        if settings.queue_claim_notifications_enabled:
+            from tarsy.services.events.channels import EventChannel
+            await event_system_manager.register_channel_handler(
+                EventChannel.QUEUE,
+                session_claim_worker.handle_queue_event
+            )
+            logger.info("Registered queue notification handler for SessionClaimWorker")
     except Exception as e:
         logger.critical(
             f"Failed to initialize SessionClaimWorker: {e}. "
@@ -349,6 +377,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         import sys
         sys.exit(1)
     
+    # Split LLM provider rate limits across pods sharing one provider quota
+    if settings.llm_rate_limit_coordination_enabled:
+        try:
+            from tarsy.services.llm_rate_limit_coordinator import (
+                LLMRateLimitCoordinator,
+            )
+            
+            llm_rate_limit_coordinator = LLMRateLimitCoordinator(
+                history_service=history_service,
+                pod_id=get_pod_id(),
+                interval_seconds=settings.llm_rate_limit_coordination_interval_seconds,
+            )
+            await llm_rate_limit_coordinator.start()
+        except Exception as e:
+            # Each pod falls back to the full provider limits
+            logger.error(f"Failed to start LLM rate limit coordinator: {e}", exc_info=True)
+            llm_rate_limit_coordinator = None
+    
     # Set up app state with callbacks to avoid circular imports
     # The controllers will access these callbacks instead of importing the functions directly
     app.state.process_alert_callback = process_alert_background
@@ -457,6 +503,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error(f"Error closing database manager: {e}", exc_info=True)
     
+    # Write buffered interaction history and close the history service's async database engine
+    try:
+        await history_service.close()
+    except Exception as e:
+        logger.error(f"Error closing history service: {e}", exc_info=True)
+    
     # Shutdown event system
     if event_system_manager is not None:
         try:
@@ -468,6 +520,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     if alert_service is not None:
         await alert_service.close()
+    
+    if llm_rate_limit_coordinator is not None:
+        try:
+            await llm_rate_limit_coordinator.stop()
+        except Exception as e:
+            logger.error(f"Error stopping LLM rate limit coordinator: {e}", exc_info=True)
+    
+    # Close the shared LLM provider connection pools
+    try:
+        await close_provider_client_pool()
+    except Exception as e:
+        logger.error(f"Error closing LLM provider connection pools: {e}", exc_info=True)
     logger.info("Tarsy shutdown complete")
 
 
@@ -790,7 +854,10 @@ async def mark_session_cancelled_or_timed_out(
     """
     from tarsy.models.constants import AlertSessionStatus
     from tarsy.services.cancellation_tracker import is_user_cancel
-    from tarsy.services.events.event_helpers import publish_session_cancelled, publish_session_timed_out
+    from tarsy.services.events.event_helpers import (
+        publish_session_cancelled,
+        publish_session_timed_out,
+    )
     from tarsy.services.history_service import get_history_service
     
     history_service = get_history_service()
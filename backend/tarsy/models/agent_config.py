@@ -247,6 +247,17 @@ class MCPServerConfigModel(BaseModel):
         default_factory=lambda: SummarizationConfig(),
         description="Summarization configuration for large results",
     )
+    isolated_sessions: bool = Field(
+        default=False,
+        description="Open a dedicated connection for every alert session instead of leasing one "
+                    "from the per-pod connection pool (for servers keeping per-session state)",
+    )
+    max_concurrent_tool_calls: int = Field(
+        default=4,
+        description="Tool calls an agent runs on this server at the same time when the LLM "
+                    "requests several in one iteration",
+        ge=1,
+    )
     
     @model_validator(mode="after")
     def warn_deprecated_fields(self) -> "MCPServerConfigModel":
@@ -506,6 +517,65 @@ class ChainConfigModel(BaseModel):
     )
 
 
+# =============================================================================
+# QUEUE SCHEDULING CONFIGURATION MODELS
+# =============================================================================
+
+
+class AlertTypeQueueConfig(BaseModel):
+    """Queue scheduling settings for a single alert type."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    weight: float = Field(
+        default=1.0,
+        description="Fair-share weight relative to other alert types (higher = larger share of free slots)",
+        gt=0,
+    )
+    max_concurrent: Optional[int] = Field(
+        default=None,
+        description="Maximum sessions of this alert type processed concurrently across all pods (unlimited if not set)",
+        ge=1,
+    )
+
+
+class QueueConfig(BaseModel):
+    """Scheduling policy for claiming PENDING sessions from the global queue.
+
+    Sessions are claimed by priority first; within a priority, free slots are
+    shared across alert types proportionally to their weights so a storm of one
+    alert type cannot starve the others.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    default_weight: float = Field(
+        default=1.0,
+        description="Fair-share weight for alert types not listed in alert_types",
+        gt=0,
+    )
+    alert_types: Dict[str, AlertTypeQueueConfig] = Field(
+        default_factory=dict,
+        description="Per-alert-type weights and concurrency caps mapped by alert type",
+    )
+
+    def weights(self) -> Dict[str, float]:
+        """Alert types whose weight differs from default_weight."""
+        return {
+            alert_type: config.weight
+            for alert_type, config in self.alert_types.items()
+            if config.weight != self.default_weight
+        }
+
+    def concurrency_caps(self) -> Dict[str, int]:
+        """Alert types with a concurrency cap."""
+        return {
+            alert_type: config.max_concurrent
+            for alert_type, config in self.alert_types.items()
+            if config.max_concurrent is not None
+        }
+
+
 class CombinedConfigModel(BaseModel):
     """Root configuration model for the entire config file.
 
@@ -529,6 +599,10 @@ class CombinedConfigModel(BaseModel):
         default=None,
         description="Default alert type to use if no alert type is specified in the alert processing request (falls back to DEFAULT_ALERT_TYPE constant if not specified)",
     )
+    queue: QueueConfig = Field(
+        default_factory=QueueConfig,
+        description="Global alert queue scheduling policy (priorities, fair-share weights, per-alert-type caps)",
+    )
 
     @model_validator(mode="after")
     def validate_configurable_agent_references(self) -> "CombinedConfigModel":
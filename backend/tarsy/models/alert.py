@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from tarsy.models.constants import AlertPriority
 from tarsy.models.mcp_selection_models import MCPSelectionConfig
 
 
@@ -51,6 +52,10 @@ class Alert(BaseModel):
         None,
         description="Optional MCP server/tool selection to override default agent configuration"
     )
+    priority: Optional[AlertPriority] = Field(
+        None,
+        description="Queue priority (0=low, 1=normal, 2=high, 3=critical); derived from data.severity if not provided"
+    )
     
     @classmethod
     def get_required_fields(cls) -> List[str]:
@@ -109,6 +114,14 @@ class ProcessingAlert(BaseModel):
         None,
         description="Slack message fingerprint for Slack message threading"
     )
+    priority: AlertPriority = Field(
+        default=AlertPriority.NORMAL,
+        description="Queue priority used by the session claim scheduler"
+    )
+    fingerprint: Optional[str] = Field(
+        None,
+        description="Deduplication fingerprint (set at submission when deduplication is enabled)"
+    )
     # === Client's Pristine Data ===
     alert_data: Dict[str, Any] = Field(
         default_factory=dict,
@@ -127,7 +140,7 @@ class ProcessingAlert(BaseModel):
         Transform API Alert to ProcessingAlert.
         
         Applies minimal manipulation:
-        1. Extract/generate metadata (severity, timestamp, environment)
+        1. Extract/generate metadata (severity, priority, timestamp, environment)
         2. Keep client's data pristine (no merging, no modifications)
         3. Use default_alert_type if alert.alert_type is not provided
         
@@ -157,6 +170,9 @@ class ProcessingAlert(BaseModel):
         # Use provided alert_type or fall back to default
         alert_type = alert.alert_type if alert.alert_type else default_alert_type
         
+        # Explicit priority wins over the one derived from severity
+        priority = alert.priority if alert.priority is not None else AlertPriority.from_severity(severity)
+        
         return cls(
             alert_type=alert_type,
             severity=severity,
@@ -164,6 +180,7 @@ class ProcessingAlert(BaseModel):
             environment=environment,
             runbook_url=alert.runbook,
             slack_message_fingerprint=alert.slack_message_fingerprint,
+            priority=priority,
             alert_data=alert.data,  # ← PRISTINE!
             mcp=alert.mcp  # Pass through MCP selection config
         )
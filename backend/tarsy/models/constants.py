@@ -79,6 +79,40 @@ class StageStatus(Enum):
         return [cls.FAILED, cls.CANCELLED, cls.TIMED_OUT]
 
 
+class AlertPriority(int, Enum):
+    """Queue priority of an alert session (higher values are claimed first)."""
+    
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+    CRITICAL = 3
+    
+    @classmethod
+    def from_severity(cls, severity: object) -> 'AlertPriority':
+        """
+        Derive a queue priority from a client-provided alert severity.
+        
+        Unknown or missing severities map to NORMAL.
+        """
+        if not isinstance(severity, str):
+            return cls.NORMAL
+        return _SEVERITY_PRIORITIES.get(severity.strip().lower(), cls.NORMAL)
+
+
+_SEVERITY_PRIORITIES = {
+    "critical": AlertPriority.CRITICAL,
+    "emergency": AlertPriority.CRITICAL,
+    "high": AlertPriority.HIGH,
+    "error": AlertPriority.HIGH,
+    "major": AlertPriority.HIGH,
+    "warning": AlertPriority.NORMAL,
+    "medium": AlertPriority.NORMAL,
+    "info": AlertPriority.LOW,
+    "low": AlertPriority.LOW,
+    "minor": AlertPriority.LOW,
+}
+
+
 class CancellationReason(str, Enum):
     """Standardized reasons for task/stage cancellation."""
 
@@ -123,6 +157,58 @@ class SuccessPolicy(str, Enum):
 FailurePolicy = SuccessPolicy
 
 
+class WebSocketOverflowPolicy(str, Enum):
+    """What gives way when a WebSocket connection's send queue is full."""
+
+    # Persisted events are never dropped: when only they fill the queue, every
+    # policy closes the connection and the client catches up from the event table
+    DROP_TRANSIENT = "drop_transient"  # Drop the oldest pending stream chunk
+    COALESCE = "coalesce"  # Merge the newer chunk into the pending chunk of the same stream
+    DISCONNECT = "disconnect"  # Close the connection; the client reconnects and catches up
+
+    @classmethod
+    def values(cls) -> List[str]:
+        """All overflow policy values as strings."""
+        return [policy.value for policy in cls]
+
+
+class HistoryAsyncDbMode(str, Enum):
+    """When async history operations run on the async database engine."""
+
+    AUTO = "auto"  # PostgreSQL only; SQLite keeps executor threads
+    ALWAYS = "always"  # Also for SQLite files (aiosqlite)
+    NEVER = "never"  # Always run sync sessions on executor threads
+
+    @classmethod
+    def values(cls) -> List[str]:
+        """All modes as strings."""
+        return [mode.value for mode in cls]
+
+
+class HistoryWriteDurability(str, Enum):
+    """When interaction history (LLM/MCP interactions, session activity) is committed."""
+
+    IMMEDIATE = "immediate"  # Each interaction is committed before its hook returns
+    STAGE = "stage"  # Write-behind batches; flushed at stage boundaries and on shutdown
+
+    @classmethod
+    def values(cls) -> List[str]:
+        """All durability modes as strings."""
+        return [mode.value for mode in cls]
+
+
+class SessionCountMode(str, Enum):
+    """How the session list computes its total item count."""
+
+    EXACT = "exact"  # COUNT(*) with the list's filters on every request
+    APPROXIMATE = "approximate"  # Planner estimate (unfiltered, PostgreSQL) or a briefly cached count
+
+    @classmethod
+    def values(cls) -> List[str]:
+        """All count modes as strings."""
+        return [mode.value for mode in cls]
+
+
 class ProgressPhase(str, Enum):
     """Progress phases for session processing status updates.
     
@@ -10,11 +10,22 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    DDL,
+    JSON,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import BIGINT
 from sqlmodel import Column, Field, Index, SQLModel
 
-from tarsy.models.constants import AlertSessionStatus
+from tarsy.models.constants import AlertPriority, AlertSessionStatus
 from tarsy.utils.timestamp import now_us
 
 if TYPE_CHECKING:
@@ -41,9 +52,27 @@ class AlertSession(SQLModel, table=True):
         # Composite index for most common query pattern: filter by status + order by timestamp
         Index('ix_alert_sessions_status_started_at', 'status', 'started_at_us'),
         
+        # Keyset pagination of the session list: (started_at_us, session_id) positions
+        Index('ix_alert_sessions_started_at_session', 'started_at_us', 'session_id'),
+        
         # Composite index for efficient orphan detection
         Index('ix_alert_sessions_status_last_interaction', 'status', 'last_interaction_at'),
         
+        # Composite index for the fair-share claim query: PENDING sessions per alert type
+        # in priority order (oldest first within a priority)
+        Index('ix_alert_sessions_queue_order', 'status', 'alert_type', 'priority', 'started_at_us'),
+        
+        # Composite index for submission-time deduplication (latest session per fingerprint)
+        Index('ix_alert_sessions_fingerprint_started_at', 'alert_fingerprint', 'started_at_us'),
+        
+        # At most one queued/running/paused session per fingerprint, so concurrent re-fires
+        # (on any pod) cannot both start a session
+        Index(
+            'uq_alert_sessions_in_flight_fingerprint', 'alert_fingerprint', unique=True,
+            postgresql_where=text("status IN ('pending', 'in_progress', 'paused')"),
+            sqlite_where=text("status IN ('pending', 'in_progress', 'paused')"),
+        ),
+        
         # Note: PostgreSQL-specific JSON indexes removed for database compatibility
         # In production with PostgreSQL, consider adding:
         # - GIN index on alert_data: Index('ix_alert_data_gin', 'alert_data', postgresql_using='gin')
@@ -75,6 +104,11 @@ class AlertSession(SQLModel, table=True):
         description=f"Current processing status ({', '.join(AlertSessionStatus.values())})"
     )
     
+    priority: int = Field(
+        default=AlertPriority.NORMAL.value,
+        description="Queue priority (higher values are claimed first)"
+    )
+    
     started_at_us: int = Field(
         default_factory=now_us,
         sa_column=Column[Any](BIGINT, index=True),
@@ -158,6 +192,16 @@ class AlertSession(SQLModel, table=True):
         default=None,
         description="Slack message fingerprint for Slack message threading"
     )
+    
+    alert_fingerprint: Optional[str] = Field(
+        default=None,
+        description="Deduplication fingerprint of the alert (alert type + configured key fields)"
+    )
+    
+    duplicate_count: int = Field(
+        default=0,
+        description="Number of re-fired duplicate alerts coalesced into this session"
+    )
     # Note: Relationships removed to avoid circular import issues with unified models
     # Use queries with session_id foreign key for data access instead
     
@@ -178,6 +222,177 @@ class AlertSession(SQLModel, table=True):
         return ChainConfigModel(**self.chain_definition)
 
 
+class SessionLease(SQLModel, table=True):
+    """
+    Global concurrency slot held by a pod for a session claimed from the queue.
+    
+    One row per IN_PROGRESS session dispatched by a SessionClaimWorker, so the
+    table never grows beyond max_concurrent_alerts rows. Admission checks count
+    this table (globally and per alert type) instead of scanning alert_sessions. Leases are released when the
+    session task finishes and reconciled against alert_sessions by the
+    orphan-cleanup path.
+    """
+    
+    __tablename__ = "session_leases"
+    
+    __table_args__ = (
+        Index('ix_session_leases_pod_id', 'pod_id'),
+    )
+    
+    session_id: str = Field(
+        sa_column=Column[Any](
+            String,
+            ForeignKey("alert_sessions.session_id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        description="Session holding the slot"
+    )
+    
+    pod_id: str = Field(
+        description="Pod processing the session"
+    )
+    
+    alert_type: Optional[str] = Field(
+        default=None,
+        description="Alert type of the session (for per-alert-type concurrency caps)"
+    )
+    
+    acquired_at_us: int = Field(
+        default_factory=now_us,
+        sa_column=Column[Any](BIGINT),
+        description="When the slot was acquired (microseconds since epoch UTC)"
+    )
+
+
+class PodHeartbeat(SQLModel, table=True):
+    """
+    Liveness record of a pod, refreshed by its LLMRateLimitCoordinator.
+    
+    Lets the coordinator split provider rate limits across every live pod,
+    including pods that hold no session leases. Rows of pods that stopped
+    refreshing are deleted by the other pods.
+    """
+    
+    __tablename__ = "pod_heartbeats"
+    
+    pod_id: str = Field(
+        primary_key=True,
+        description="Pod identifier"
+    )
+    
+    last_seen_at_us: int = Field(
+        default_factory=now_us,
+        sa_column=Column[Any](BIGINT),
+        description="When the pod last refreshed its heartbeat (microseconds since epoch UTC)"
+    )
+
+
+class SessionStats(SQLModel, table=True):
+    """
+    Per-session rollup of the counts and token sums shown in the session list.
+    
+    Maintained incrementally by HistoryRepository whenever interactions, chat
+    messages and stage executions are written, so listing sessions reads one
+    row per session instead of aggregating the interaction tables. A row is
+    created on the first write that touches a session; sessions without one
+    have no interactions. HistoryRepository.verify_session_stats recomputes
+    rows from the source tables to detect and repair drift.
+    """
+    
+    __tablename__ = "session_stats"
+    
+    __table_args__ = (
+        Index('ix_session_stats_total_tokens', 'total_tokens'),
+    )
+    
+    session_id: str = Field(
+        sa_column=Column[Any](
+            String,
+            ForeignKey("alert_sessions.session_id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        description="Session the rollup belongs to"
+    )
+    
+    llm_interaction_count: int = Field(default=0, description="Number of LLM interactions")
+    mcp_communication_count: int = Field(default=0, description="Number of MCP communications")
+    input_tokens: Optional[int] = Field(default=None, description="Sum of LLM input tokens (None if never reported)")
+    output_tokens: Optional[int] = Field(default=None, description="Sum of LLM output tokens (None if never reported)")
+    total_tokens: Optional[int] = Field(default=None, description="Sum of LLM total tokens (None if never reported)")
+    chat_message_count: int = Field(default=0, description="Number of follow-up chat user messages")
+    has_parallel_stages: bool = Field(default=False, description="Whether any stage ran parallel executions")
+
+
+class SessionSearch(SQLModel, table=True):
+    """
+    Full-text search document of an alert session.
+    
+    HistoryRepository writes the document (alert type, agent type, alert data,
+    session metadata, error message and final analysis) when a session is
+    created and refreshes it when the session is finalized. The index over it
+    is database-specific and created with the table (see SESSION_SEARCH_DDL):
+    a generated tsvector column with a GIN index on PostgreSQL, and an
+    external-content FTS5 table kept in sync by triggers on SQLite.
+    """
+    
+    __tablename__ = "session_search"
+    
+    id: Optional[int] = Field(
+        default=None,
+        primary_key=True,
+        description="Row ID (the SQLite FTS5 index refers to rows by it)"
+    )
+    
+    session_id: str = Field(
+        sa_column=Column[Any](
+            String,
+            ForeignKey("alert_sessions.session_id", ondelete="CASCADE"),
+            unique=True,
+            nullable=False
+        ),
+        description="Session the document belongs to"
+    )
+    
+    document: str = Field(
+        sa_column=Column[Any](Text, nullable=False),
+        description="Searchable text of the session"
+    )
+
+
+# Search index objects SQLModel cannot declare, by dialect. They are created with the
+# session_search table (create_all, including the baseline migration); the session_search
+# migration creates them for existing databases.
+SESSION_SEARCH_DDL = {
+    "postgresql": (
+        "ALTER TABLE session_search ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', document)) STORED",
+        "CREATE INDEX ix_session_search_vector ON session_search USING GIN (search_vector)",
+    ),
+    "sqlite": (
+        "CREATE VIRTUAL TABLE session_search_fts USING fts5("
+        "document, content='session_search', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        "CREATE TRIGGER session_search_ai AFTER INSERT ON session_search BEGIN "
+        "INSERT INTO session_search_fts(rowid, document) VALUES (new.id, new.document); END",
+        "CREATE TRIGGER session_search_ad AFTER DELETE ON session_search BEGIN "
+        "INSERT INTO session_search_fts(session_search_fts, rowid, document) "
+        "VALUES ('delete', old.id, old.document); END",
+        "CREATE TRIGGER session_search_au AFTER UPDATE ON session_search BEGIN "
+        "INSERT INTO session_search_fts(session_search_fts, rowid, document) "
+        "VALUES ('delete', old.id, old.document); "
+        "INSERT INTO session_search_fts(rowid, document) VALUES (new.id, new.document); END",
+    ),
+}
+
+for _dialect, _statements in SESSION_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(SessionSearch.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(
+    SessionSearch.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS session_search_fts").execute_if(dialect="sqlite"),
+)
+
+
 class StageExecution(SQLModel, table=True):
     """
     Represents the execution of a single stage within a chain processing session.
@@ -245,7 +460,7 @@ class StageExecution(SQLModel, table=True):
     # Parallel execution tracking
     parent_stage_execution_id: Optional[str] = Field(
         default=None,
-        sa_column=Column[Any](String, ForeignKey("stage_executions.execution_id")),
+        sa_column=Column[Any](String, ForeignKey("stage_executions.execution_id"), index=True),
         description="Parent stage execution ID for parallel execution grouping"
     )
     parallel_index: int = Field(
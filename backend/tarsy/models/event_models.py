@@ -109,6 +109,14 @@ class ChatCancelRequestedEvent(BaseEvent):
     stage_execution_id: str = Field(description="Stage execution identifier for the chat response")
 
 
+class SessionEnqueuedEvent(BaseEvent):
+    """Session added to the PENDING queue (backend-to-backend communication)."""
+
+    type: Literal["session.enqueued"] = "session.enqueued"
+    session_id: str = Field(description="Session identifier")
+    alert_type: str = Field(description="Type of alert being processed")
+
+
 class SessionCancelledEvent(BaseEvent):
     """Session cancelled successfully."""
 
@@ -237,7 +245,9 @@ class LLMStreamChunkEvent(BaseEvent):
     stage_execution_id: Optional[str] = Field(
         default=None, description="Stage execution identifier (child execution ID for parallel stages)"
     )
-    chunk: str = Field(description="Content chunk (accumulated tokens)")
+    chunk: str = Field(
+        description="Accumulated content, or the content from `offset` on when delta-encoded"
+    )
     stream_type: str = Field(description="Type of content being streamed: 'thought', 'final_answer', 'summarization', or 'native_thinking'")
     is_complete: bool = Field(default=False, description="True if this is the final chunk")
     mcp_event_id: Optional[str] = Field(
@@ -256,6 +266,16 @@ class LLMStreamChunkEvent(BaseEvent):
     agent_name: Optional[str] = Field(
         default=None, description="Agent name for this execution"
     )
+    # Delta encoding (set by StreamingTransport; None means `chunk` is the full content)
+    offset: Optional[int] = Field(
+        default=None, description="Position in the stream content where `chunk` starts"
+    )
+    seq: Optional[int] = Field(
+        default=None, description="Sequence number of this message within its stream"
+    )
+    base_seq: Optional[int] = Field(
+        default=None, description="Sequence number of the message this delta applies on top of"
+    )
 
 
 # ===== Chat Events (channel: 'session:{session_id}') =====
@@ -8,9 +8,11 @@ for session timelines, interaction details, and API responses.
 
 from __future__ import annotations  # Deferred evaluation for forward references
 
+import base64
+import json
 from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, computed_field, model_validator
+from pydantic import BaseModel, Field, ValidationError, computed_field, model_validator
 
 # Import existing enums and models
 from tarsy.models.constants import AlertSessionStatus, ParallelType, StageStatus
@@ -27,6 +29,40 @@ class PaginationInfo(BaseModel):
     page_size: int
     total_pages: int
     total_items: int
+    total_is_estimate: bool = Field(default=False, description="total_items is a planner estimate or a cached count")
+    next_cursor: Optional[str] = Field(default=None, description="Opaque cursor of the next page, null on the last page")
+
+
+class SessionCursor(BaseModel):
+    """
+    Keyset position in the session list: the sort of the listing and the
+    sort value and session ID of the last session on a page.
+    
+    Encoded as an opaque URL-safe string for the API.
+    """
+    sort_by: str
+    sort_order: Literal['asc', 'desc']
+    value: Optional[Union[int, str]] = None
+    session_id: str
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe string."""
+        payload = json.dumps(self.model_dump(), separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, cursor: str) -> SessionCursor:
+        """
+        Decode a cursor produced by encode().
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            return cls.model_validate(json.loads(payload))
+        except (ValueError, ValidationError) as e:
+            raise ValueError(f"Invalid session cursor: {cursor!r}") from e
 
 
 class TimeRangeOption(BaseModel):
@@ -113,23 +149,45 @@ TimelineEvent = Union[LLMTimelineEvent, MCPTimelineEvent]
 # =============================================================================
 
 class LLMInteractionSummary(BaseModel):
-    """Simplified LLM interaction for summary lists"""
+    """Simplified LLM interaction for summary lists and session timelines (no conversation)"""
+    type: Literal["llm"] = "llm"
     interaction_id: str
     timestamp_us: int
     step_description: str
     model_name: str
     duration_ms: Optional[int] = None
+    stage_execution_id: Optional[str] = None
+    provider: Optional[str] = None
+    interaction_type: Optional[str] = None
+    success: bool = True
+    error_message: Optional[str] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    cached_input_tokens: Optional[int] = None
+    mcp_event_id: Optional[str] = None
+    response_preview: Optional[str] = None  # Start of the last conversation message
 
 
 class MCPCommunicationSummary(BaseModel):
-    """Simplified MCP communication for summary lists"""
+    """Simplified MCP communication for summary lists and session timelines (no tool payloads)"""
+    type: Literal["mcp"] = "mcp"
     communication_id: str
     timestamp_us: int
     step_description: str
     server_name: str
-    tool_name: str
+    tool_name: Optional[str] = None  # Only set for tool_call communications
     success: bool
     duration_ms: Optional[int] = None
+    stage_execution_id: Optional[str] = None
+    communication_type: Optional[str] = None
+    error_message: Optional[str] = None
+    arguments_preview: Optional[str] = None  # Start of the tool arguments JSON
+    result_preview: Optional[str] = None  # Start of the tool result JSON
+
+
+# Union type for timeline entries
+InteractionSummary = Union[LLMInteractionSummary, MCPCommunicationSummary]
 
 
 # =============================================================================
@@ -179,6 +237,7 @@ class LLMConversationHistory(BaseModel):
     input_tokens: Optional[int] = Field(default=None, description="Input/prompt tokens used")
     output_tokens: Optional[int] = Field(default=None, description="Output/completion tokens used")
     total_tokens: Optional[int] = Field(default=None, description="Total tokens used")
+    cached_input_tokens: Optional[int] = Field(default=None, description="Input tokens read from the provider's prompt cache")
     messages: List[ConversationMessage] = Field(description="Flat list of conversation messages in order")
 
 
@@ -229,6 +288,9 @@ class SessionOverview(BaseModel):
     
     chat_message_count: Optional[int] = None  # Number of user messages in follow-up chat (if chat exists)
     
+    # Search results only: HTML-escaped excerpt of the match, with matched words in <mark></mark>
+    search_snippet: Optional[str] = None
+    
     # Calculated properties
     @computed_field
     @property
@@ -452,6 +514,94 @@ class DetailedSession(BaseModel):
         return None
 
 
+# =============================================================================
+# SESSION TIMELINE MODELS
+# =============================================================================
+
+class TimelineStage(BaseModel):
+    """Stage of a session timeline - interaction summaries instead of full interactions"""
+    execution_id: str
+    session_id: str
+    stage_id: str
+    stage_index: int
+    stage_name: str
+    agent: str
+    iteration_strategy: Optional[str] = None
+    status: StageStatus
+    started_at_us: Optional[int] = None
+    completed_at_us: Optional[int] = None
+    duration_ms: Optional[int] = None
+    error_message: Optional[str] = None
+    
+    # Chat context (if this stage is a chat response)
+    chat_id: Optional[str] = None
+    chat_user_message_id: Optional[str] = None
+    chat_user_message: Optional[ChatUserMessageData] = None
+    
+    # Parallel execution tracking
+    parent_stage_execution_id: Optional[str] = None
+    parallel_index: int = 0
+    parallel_type: str = ParallelType.SINGLE.value
+    parallel_executions: Optional[List['TimelineStage']] = None  # Nested children for parallel stages
+    
+    # Interactions of this stage in chronological order (payloads are fetched per interaction)
+    interactions: List[InteractionSummary] = Field(default_factory=list)
+    
+    # Summary counts and token usage of this stage
+    llm_interaction_count: int = 0
+    mcp_communication_count: int = 0
+    total_interactions: int = 0
+    stage_input_tokens: Optional[int] = None
+    stage_output_tokens: Optional[int] = None
+    stage_total_tokens: Optional[int] = None
+
+
+class SessionTimeline(BaseModel):
+    """Lightweight session timeline - for the session page, with payloads fetched on demand"""
+    session_id: str
+    alert_type: Optional[str] = None
+    agent_type: str
+    status: AlertSessionStatus
+    author: Optional[str] = None
+    runbook_url: Optional[str] = None
+    started_at_us: int
+    completed_at_us: Optional[int] = None
+    error_message: Optional[str] = None
+    pause_metadata: Optional[Dict[str, Any]] = None
+    
+    # Chain execution progress
+    chain_id: str
+    current_stage_index: Optional[int] = None
+    current_stage_id: Optional[str] = None
+    
+    # MCP configuration override
+    mcp_selection: Optional[MCPSelectionConfig] = None
+    
+    # Slack integration
+    slack_message_fingerprint: Optional[str] = None
+    
+    # Interaction counts and token usage
+    total_interactions: int = 0
+    llm_interaction_count: int = 0
+    mcp_communication_count: int = 0
+    session_input_tokens: Optional[int] = None
+    session_output_tokens: Optional[int] = None
+    session_total_tokens: Optional[int] = None
+    
+    stages: List[TimelineStage] = Field(default_factory=list)
+    
+    # Session-level interactions (not associated with any specific stage)
+    session_level_interactions: List[InteractionSummary] = Field(default_factory=list)
+    
+    @computed_field
+    @property
+    def duration_ms(self) -> Optional[int]:
+        """Calculate session duration from start and completion times"""
+        if self.started_at_us and self.completed_at_us:
+            return (self.completed_at_us - self.started_at_us) // 1000
+        return None
+
+
 class SessionStats(BaseModel):
     """Lightweight statistics and metrics - for headers and quick stats"""
     # Basic counts
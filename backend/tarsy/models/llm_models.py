@@ -84,6 +84,21 @@ class LLMProviderConfig(BaseModel):
         gt=0,
         description="Maximum tokens for tool results truncation"
     )
+    requests_per_minute: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Requests per minute allowed by the provider (shared rate limit of all sessions; unlimited if not set)"
+    )
+    tokens_per_minute: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Tokens per minute allowed by the provider (shared rate limit of all sessions; unlimited if not set)"
+    )
+    prompt_caching: bool = Field(
+        default=True,
+        description="Mark the stable conversation prefix with cache_control breakpoints for "
+                    "provider-side prompt caching (anthropic and vertexai; other providers cache automatically)"
+    )
     native_tools: Optional[Dict[str, bool]] = Field(
         default=None,
         description="Native tool configuration for Google/Gemini models (GoogleNativeTool enum values). "
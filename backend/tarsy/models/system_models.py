@@ -1,6 +1,6 @@
 """System-level models for warnings, health, and status."""
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -43,3 +43,61 @@ class SystemWarning(BaseModel):
                 "timestamp": 1706616000000000,
             }
         }
+
+
+class WebSocketConnectionStats(BaseModel):
+    """Send queue state and delivery lag of one WebSocket connection."""
+
+    connection_id: str = Field(..., description="Connection identifier")
+    channels: List[str] = Field(default_factory=list, description="Subscribed channels")
+    queue_depth: int = Field(..., description="Events waiting to be sent")
+    sent: int = Field(..., description="Events sent to the client")
+    dropped: int = Field(..., description="Events dropped by the overflow policy")
+    coalesced: int = Field(..., description="Stream chunks replaced by a newer chunk while pending")
+    oldest_pending_ms: float = Field(..., description="Age of the oldest pending event (ms)")
+    last_lag_ms: float = Field(..., description="Queue-to-socket delay of the last sent event (ms)")
+    max_lag_ms: float = Field(..., description="Largest queue-to-socket delay observed (ms)")
+    evicted: bool = Field(False, description="True if closed as a slow consumer")
+
+
+class PayloadCompressionStats(BaseModel):
+    """History payloads of one kind written by this pod and how well they compressed."""
+
+    kind: str = Field(..., description="Payload kind (tool_result, tool_catalog, llm_message)")
+    payloads: int = Field(..., description="Payloads written")
+    compressed_payloads: int = Field(..., description="Payloads stored compressed")
+    raw_bytes: int = Field(..., description="Uncompressed size of the payloads")
+    stored_bytes: int = Field(..., description="Stored size of the payloads")
+    compression_ratio: float = Field(..., description="raw_bytes / stored_bytes")
+
+
+class LLMConnectionPoolStats(BaseModel):
+    """Connection reuse of one shared LLM provider connection pool of this pod."""
+
+    pool: str = Field(..., description="Pool name (provider, marked when SSL verification is disabled)")
+    provider: str = Field(..., description="LLM provider type")
+    http2: bool = Field(..., description="True if the pool negotiates HTTP/2")
+    max_connections: int = Field(..., description="Maximum open connections to the provider")
+    requests: int = Field(..., description="Requests sent through the pool")
+    new_connections: int = Field(..., description="Connections opened for those requests")
+    reused_connections: int = Field(..., description="Requests served by an already open connection")
+    reuse_rate: float = Field(..., description="reused_connections / requests")
+
+
+class LLMRateLimiterStats(BaseModel):
+    """Rate limits, queue and wait times of one LLM provider on this pod."""
+
+    provider: str = Field(..., description="LLM provider name")
+    requests_per_minute: Optional[int] = Field(None, description="Requests per minute this pod may send (None = unlimited)")
+    tokens_per_minute: Optional[int] = Field(None, description="Tokens per minute this pod may use (None = unlimited)")
+    share: float = Field(..., description="Share of the provider limits used by this pod")
+    queued_calls: int = Field(..., description="LLM calls waiting for the provider budget")
+    queued_sessions: int = Field(..., description="Sessions with waiting LLM calls")
+    granted_calls: int = Field(..., description="LLM calls let through")
+    delayed_calls: int = Field(..., description="LLM calls that had to wait")
+    rate_limit_errors: int = Field(..., description="Calls rejected by the provider as rate limited")
+    paused_seconds: float = Field(..., description="Seconds until calls resume after a rate limit error")
+    wait_avg_ms: float = Field(..., description="Average wait per call")
+    wait_p50_ms: float = Field(..., description="Median wait of recent calls")
+    wait_p95_ms: float = Field(..., description="95th percentile wait of recent calls")
+    wait_max_ms: float = Field(..., description="Longest wait")
@@ -6,14 +6,16 @@ processing AND SQLAlchemy models for database storage, eliminating the need for
 separate runtime/database model hierarchies and manual conversions.
 """
 
+import hashlib
+import json
 import uuid
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import field_validator, model_validator
-from sqlalchemy import JSON, ForeignKey, String, TypeDecorator
+from sqlalchemy import JSON, ForeignKey, LargeBinary, String, TypeDecorator
 from sqlalchemy.dialects.postgresql import BIGINT, JSONB
-from sqlmodel import Column, Field, Index, SQLModel
+from sqlmodel import Column, Field, SQLModel
 
 from tarsy.models.constants import LLMInteractionType
 from tarsy.utils.timestamp import now_us
@@ -101,13 +103,6 @@ class LLMInteraction(SQLModel, table=True):
     
     __tablename__ = "llm_interactions"
     
-    # Enhanced table configuration with specialized indexes
-    __table_args__ = (
-        # PostgreSQL-specific GIN index for efficient JSONB conversation queries
-        Index('ix_llm_interactions_conversation', 'conversation', 
-              postgresql_using='gin', postgresql_ops={'conversation': 'jsonb_path_ops'}),
-    )
-    
     interaction_id: str = Field(
         default_factory=lambda: str(uuid.uuid4()),
         primary_key=True,
@@ -141,11 +136,21 @@ class LLMInteraction(SQLModel, table=True):
         sa_column=Column(PydanticJSONType),
         description="Complete conversation object with messages and metadata"
     )
+    message_hashes: Optional[List[str]] = Field(
+        default=None,
+        sa_column=Column(JSON(none_as_null=True)),
+        exclude=True,
+        description="Ordered hashes of the conversation's messages in llm_conversation_messages "
+                    "(the repository stores conversations this way and rehydrates them on read)"
+    )
     
     # Token usage tracking fields
     input_tokens: Optional[int] = Field(None, ge=0, description="Input/prompt tokens")
     output_tokens: Optional[int] = Field(None, ge=0, description="Output/completion tokens")  
     total_tokens: Optional[int] = Field(None, ge=0, description="Total tokens used")
+    cached_input_tokens: Optional[int] = Field(
+        None, ge=0, description="Input tokens read from the provider's prompt cache (part of input_tokens)"
+    )
     
     # Response metadata from aggregated streaming chunks
     response_metadata: Optional[dict] = Field(
@@ -260,10 +265,22 @@ class MCPInteraction(SQLModel, table=True):
         sa_column=Column(JSON),
         description="Tool result (for tool_call type)"
     )
+    tool_result_compressed: Optional[bytes] = Field(
+        default=None,
+        sa_column=Column(LargeBinary, nullable=True),
+        exclude=True,
+        description="zlib-compressed JSON of a large tool result, stored instead of tool_result "
+                    "(the repository compresses on write and decompresses on read)"
+    )
     available_tools: Optional[dict] = Field(
         default=None,
         sa_column=Column(JSON),
-        description="Available tools (for tool_list type)"
+        description="Available tools (for tool_list type, legacy rows only)"
+    )
+    tool_catalog_hashes: Optional[dict] = Field(
+        default=None,
+        sa_column=Column(JSON),
+        description="Server name -> hash of its mcp_tool_catalogs row (for tool_list type)"
     )
     
     # Runtime-specific fields (not persisted to DB when None)
@@ -282,4 +299,91 @@ class MCPInteraction(SQLModel, table=True):
         elif self.tool_name:
             return f"Execute {self.tool_name} via {self.server_name}"
         else:
-            return f"MCP communication with {self.server_name}"
\ No newline at end of file
+            return f"MCP communication with {self.server_name}"
+
+
+class MCPToolCatalog(SQLModel, table=True):
+    """
+    Content-addressed tool list of an MCP server.
+    
+    Tool schemas rarely change but are listed once per stage, so tool_list
+    interactions reference catalogs by hash instead of storing a copy of
+    every schema. Rows are immutable and shared across sessions.
+    """
+    
+    __tablename__ = "mcp_tool_catalogs"
+    
+    catalog_hash: str = Field(
+        primary_key=True,
+        description="SHA-256 of the canonical JSON of the tool list"
+    )
+    server_name: str = Field(description="MCP server the catalog was first stored for")
+    tools: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        sa_column=Column(JSON),
+        description="Serialized tools (name, description, inputSchema)"
+    )
+    tools_compressed: Optional[bytes] = Field(
+        default=None,
+        sa_column=Column(LargeBinary, nullable=True),
+        exclude=True,
+        description="zlib-compressed JSON of a large tool list, stored instead of tools"
+    )
+    created_at_us: int = Field(
+        default_factory=now_us,
+        sa_column=Column(BIGINT),
+        description="When the catalog was first stored (microseconds since epoch UTC)"
+    )
+    
+    @staticmethod
+    def compute_hash(tools: List[Dict[str, Any]]) -> str:
+        """Hash a serialized tool list independently of tool order and key order."""
+        canonical = json.dumps(
+            sorted(tools, key=lambda tool: tool.get("name", "")),
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMConversationMessage(SQLModel, table=True):
+    """
+    Content-addressed message of a session's LLM conversations.
+    
+    Each ReAct iteration resends the whole conversation so far, so LLM
+    interactions reference their messages by hash instead of storing a copy
+    of every earlier message. Rows are immutable, scoped to their session and
+    removed with it.
+    """
+    
+    __tablename__ = "llm_conversation_messages"
+    
+    session_id: str = Field(
+        sa_column=Column(
+            String, ForeignKey("alert_sessions.session_id", ondelete="CASCADE"), primary_key=True
+        ),
+        description="Session the message belongs to"
+    )
+    message_hash: str = Field(
+        sa_column=Column(String, primary_key=True),
+        description="SHA-256 of the message role and content"
+    )
+    role: str = Field(description="Message role (system, user, assistant)")
+    content: str = Field(sa_column=Column(String, nullable=False), description="Message content")
+    content_compressed: Optional[bytes] = Field(
+        default=None,
+        sa_column=Column(LargeBinary, nullable=True),
+        exclude=True,
+        description="zlib-compressed content of a large message (content is then empty)"
+    )
+    created_at_us: int = Field(
+        default_factory=now_us,
+        sa_column=Column(BIGINT),
+        description="When the message was first stored (microseconds since epoch UTC)"
+    )
+    
+    @staticmethod
+    def compute_hash(role: str, content: str) -> str:
+        """Hash a message's role and content."""
+        return hashlib.sha256(f"{role}\x00{content}".encode("utf-8")).hexdigest()
@@ -1,15 +1,32 @@
 """Event repository for database operations."""
 
 import logging
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tarsy.models.db_models import Event
 
 logger = logging.getLogger(__name__)
 
+# On PostgreSQL the events table is range-partitioned by created_at: one partition
+# per hour named events_pYYYYMMDDHH, and a default partition for rows outside them
+EVENT_PARTITION_INTERVAL = timedelta(hours=1)
+EVENT_DEFAULT_PARTITION = "events_default"
+EVENT_PARTITION_NAME = re.compile(r"^events_p(\d{10})$")
+
+
+def event_partition_start(moment: datetime) -> datetime:
+    """Start of the events partition holding a (timezone-naive, UTC) timestamp."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def event_partition_name(start: datetime) -> str:
+    """Name of the events partition starting at `start`."""
+    return f"events_p{start:%Y%m%d%H}"
+
 
 class EventRepository:
     """
@@ -59,6 +76,31 @@ class EventRepository:
             logger.error(f"Failed to create event on '{channel}': {e}")
             raise
 
+    async def create_events(self, events: list[tuple[str, dict]]) -> list[int]:
+        """
+        Persist several events with one multi-row INSERT (without committing).
+
+        Args:
+            events: (channel, payload) pairs in publishing order
+
+        Returns:
+            Generated event IDs, in the same order as `events`
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not events:
+            return []
+        statement = insert(Event).returning(Event.id, sort_by_parameter_order=True)
+        result = await self.session.execute(
+            statement, [{"channel": channel, "payload": payload} for channel, payload in events]
+        )
+        event_ids = list(result.scalars().all())
+
+        logger.debug(f"Created {len(event_ids)} event(s) (ids {event_ids[0]}-{event_ids[-1]})")
+
+        return event_ids
+
     async def get_events_after(
         self, channel: str, after_id: int, limit: int = 100
     ) -> list[Event]:
@@ -124,3 +166,162 @@ class EventRepository:
             logger.error(f"Failed to delete events before {before_time}: {e}")
             raise
 
+    async def is_partitioned(self) -> bool:
+        """
+        Check whether the events table is partitioned (PostgreSQL only).
+
+        Returns:
+            True if events is a range-partitioned table
+        """
+        connection = await self.session.connection()
+        if connection.dialect.name != "postgresql":
+            return False
+        result = await self.session.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass('events')")
+        )
+        return result.scalar() == "p"
+
+    async def get_event_partitions(self) -> dict[str, datetime]:
+        """
+        Get the hourly partitions of the events table.
+
+        Returns:
+            Partition start times by partition name (the default partition excluded)
+        """
+        result = await self.session.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass('events')"
+        ))
+        partitions = {}
+        for name in result.scalars().all():
+            match = EVENT_PARTITION_NAME.match(name)
+            if match:
+                partitions[name] = datetime.strptime(match.group(1), "%Y%m%d%H")
+        return partitions
+
+    async def create_event_partitions(self, start: datetime, end: datetime) -> list[str]:
+        """
+        Create the missing hourly partitions covering [start, end).
+
+        Each partition is created in a savepoint: a partition another pod created
+        concurrently, or one whose range already has rows in the default
+        partition, is skipped with a warning.
+
+        Args:
+            start: Start of the period to cover (timezone-naive, UTC)
+            end: End of the period to cover (timezone-naive, UTC)
+
+        Returns:
+            Names of the partitions created
+        """
+        existing = await self.get_event_partitions()
+        created = []
+        partition_start = event_partition_start(start)
+        while partition_start < end:
+            partition_end = partition_start + EVENT_PARTITION_INTERVAL
+            name = event_partition_name(partition_start)
+            if name not in existing:
+                try:
+                    async with self.session.begin_nested():
+                        await self.session.execute(text(
+                            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF events "
+                            f"FOR VALUES FROM ('{partition_start.isoformat(' ')}') "
+                            f"TO ('{partition_end.isoformat(' ')}')"
+                        ))
+                    created.append(name)
+                except Exception as e:
+                    logger.warning(f"Could not create event partition {name}: {e}")
+            partition_start = partition_end
+
+        if created:
+            logger.debug(f"Created event partition(s) {', '.join(created)}")
+
+        return created
+
+    async def is_event_partition(self, name: str) -> bool:
+        """
+        Check whether a table is currently attached as a partition of events.
+
+        Args:
+            name: Partition table name
+
+        Returns:
+            True if the table exists and is a partition of events
+        """
+        result = await self.session.execute(
+            text(
+                "SELECT 1 FROM pg_inherits "
+                "WHERE inhrelid = to_regclass(:name) AND inhparent = to_regclass('events')"
+            ),
+            {"name": name},
+        )
+        return result.scalar() is not None
+
+    async def drop_event_partitions_before(self, before_time: datetime) -> list[str]:
+        """
+        Detach and drop the partitions whose whole range is before a time.
+
+        Dropping a partition removes its events without the dead rows and
+        vacuum work of a DELETE. Each partition is dropped in a savepoint: a
+        partition another pod detached or dropped concurrently counts as
+        dropped, and one that cannot be detached is skipped with a warning
+        (the next run retries it).
+
+        Args:
+            before_time: Drop partitions ending at or before this timestamp
+
+        Returns:
+            Names of the partitions dropped
+
+        Raises:
+            SQLAlchemyError: If listing the partitions fails
+        """
+        expired = sorted(
+            name for name, start in (await self.get_event_partitions()).items()
+            if start + EVENT_PARTITION_INTERVAL <= before_time
+        )
+        dropped = []
+        for name in expired:
+            try:
+                async with self.session.begin_nested():
+                    await self.session.execute(text(f"ALTER TABLE events DETACH PARTITION {name}"))
+                    await self.session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            except Exception as e:
+                if await self.is_event_partition(name):
+                    logger.warning(f"Could not drop event partition {name}: {e}")
+                    continue
+                # Detached (or dropped) by a concurrent cleanup run
+                async with self.session.begin_nested():
+                    await self.session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            dropped.append(name)
+
+        if dropped:
+            logger.debug(f"Dropped event partition(s) {', '.join(dropped)}")
+
+        return dropped
+
+    async def delete_default_partition_events_before(self, before_time: datetime) -> int:
+        """
+        Delete old events that landed in the default partition (outside hourly partitions).
+
+        Args:
+            before_time: Delete events created before this timestamp
+
+        Returns:
+            Number of events deleted
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            result = await self.session.execute(
+                text(f"DELETE FROM {EVENT_DEFAULT_PARTITION} WHERE created_at < :before_time"),
+                {"before_time": before_time},
+            )
+            return result.rowcount
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to delete default partition events before {before_time}: {e}")
+            raise
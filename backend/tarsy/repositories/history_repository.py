@@ -6,29 +6,88 @@ supporting comprehensive audit trails, chronological timeline reconstruction,
 and advanced querying capabilities using Unix timestamps for optimal performance.
 """
 
+import html
+import json
+import re
+import time
 from collections import defaultdict
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from sqlmodel import Session, and_, asc, case, desc, func, or_, select
+from sqlalchemy import (
+    Float,
+    Integer,
+    LargeBinary,
+    Select,
+    String,
+    cast,
+    column,
+    exists,
+    false,
+    literal,
+    literal_column,
+    null,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, and_, asc, case, delete, desc, func, or_, select, update
 
-from tarsy.models.constants import AlertSessionStatus, ParallelType, StageStatus
-from tarsy.models.db_models import AlertSession, Chat, ChatUserMessage, StageExecution
+from tarsy.models.agent_config import QueueConfig
+from tarsy.models.constants import (
+    AlertSessionStatus,
+    ParallelType,
+    SessionCountMode,
+    StageStatus,
+)
+from tarsy.models.db_models import (
+    AlertSession,
+    Chat,
+    ChatUserMessage,
+    PodHeartbeat,
+    SessionLease,
+    SessionSearch,
+    SessionStats,
+    StageExecution,
+)
 from tarsy.models.history_models import (
     ChatUserMessageData,
     DetailedSession,
     DetailedStage,
     FilterOptions,
+    LLMInteractionSummary,
     LLMTimelineEvent,
+    MCPCommunicationSummary,
     MCPEventDetails,
     MCPTimelineEvent,
     PaginatedSessions,
     PaginationInfo,
+    SessionCursor,
     SessionOverview,
+    SessionTimeline,
+    TimelineStage,
     TimeRangeOption,
 )
-from tarsy.models.unified_interactions import LLMInteraction, MCPInteraction
+from tarsy.models.unified_interactions import (
+    LLMConversation,
+    LLMConversationMessage,
+    LLMInteraction,
+    LLMMessage,
+    MCPInteraction,
+    MCPToolCatalog,
+)
 from tarsy.repositories.base_repository import BaseRepository
 from tarsy.utils.logger import get_logger
+from tarsy.utils.payload_compression import (
+    PREVIEW_COMPRESSED_BYTES,
+    compress_payload,
+    decompress_payload,
+    decompress_payload_prefix,
+)
 from tarsy.utils.timestamp import now_us
 
 logger = get_logger(__name__)
@@ -36,6 +95,45 @@ logger = get_logger(__name__)
 # Constant for session-level interactions (not associated with any specific stage)
 SESSION_LEVEL_STAGE_ID = 'unknown'
 
+# PostgreSQL advisory lock key serializing capacity-capped claims across pods
+QUEUE_CAPACITY_LOCK_KEY = 0x7A125E51
+
+# PostgreSQL advisory lock namespace serializing session creation per alert fingerprint
+# (two-key locks: namespace + hashtext(fingerprint))
+ALERT_FINGERPRINT_LOCK_NAMESPACE = 0x5EDA1E47
+
+# Session statuses that absorb duplicates regardless of age; at most one such
+# session per fingerprint (unique index uq_alert_sessions_in_flight_fingerprint)
+IN_FLIGHT_DEDUP_STATUSES = [
+    AlertSessionStatus.PENDING.value,
+    AlertSessionStatus.IN_PROGRESS.value,
+    AlertSessionStatus.PAUSED.value,
+]
+
+# Message hashes per IN (...) query when rehydrating conversations
+MESSAGE_HASH_BATCH_SIZE = 500
+
+# Characters of message and tool payload previews in session timelines
+TIMELINE_PREVIEW_CHARS = 200
+
+# Expired sessions deleted per retention transaction (when the caller does not set one)
+RETENTION_BATCH_SIZE = 500
+
+# SessionStats counters added up per write, and token sums that stay NULL until reported
+SESSION_STATS_COUNTERS = ("llm_interaction_count", "mcp_communication_count", "chat_message_count")
+SESSION_STATS_TOKENS = ("input_tokens", "output_tokens", "total_tokens")
+
+# Session list sort keys whose values can be NULL (sorted last, and handled by keyset cursors)
+NULLABLE_SESSION_SORT_KEYS = frozenset({'alert_type', 'author', 'completed_at_us', 'session_total_tokens'})
+
+# Session search: indexed text per session (the rest of very large alert payloads is not
+# indexed), the SQLite FTS5 index over session_search, and private-use characters marking
+# matches in snippets until they are HTML-escaped
+SESSION_SEARCH_MAX_CHARS = 200_000
+SESSION_SEARCH_FTS = table("session_search_fts", column("rowid", Integer), column("rank", Float))
+SNIPPET_START, SNIPPET_END = "\ue000", "\ue001"
+CAMEL_CASE_WORD = re.compile(r"\b[A-Za-z0-9]*[a-z0-9][A-Z][A-Za-z0-9]*\b")
+
 
 class HistoryRepository:
     """
@@ -84,8 +182,12 @@ class HistoryRepository:
                 )
                 return existing_session
             
+            # The search document is committed together with the session
+            self.session.add(alert_session)
+            self._write_session_search(alert_session)
             return self.alert_session_repo.create(alert_session)
         except Exception as e:
+            self.session.rollback()
             logger.error(f"Failed to create alert session {alert_session.session_id}: {str(e)}")
             return None
     
@@ -105,6 +207,9 @@ class HistoryRepository:
         """
         Update an existing alert session.
         
+        Finalized sessions (terminal status) also get their search document
+        refreshed with the error message and final analysis.
+        
         Args:
             alert_session: AlertSession instance to update
             
@@ -112,12 +217,132 @@ class HistoryRepository:
             True if update was successful, False otherwise
         """
         try:
+            if alert_session.status in AlertSessionStatus.terminal_values():
+                self.session.add(alert_session)
+                self._write_session_search(alert_session)
             self.alert_session_repo.update(alert_session)
             return True
         except Exception as e:
+            self.session.rollback()
             logger.error(f"Failed to update alert session {alert_session.session_id}: {str(e)}")
             return False
     
+    @staticmethod
+    def _session_search_document(alert_session: AlertSession) -> str:
+        """
+        Searchable text of a session.
+        
+        Alert and agent type, every value in the alert data and session metadata,
+        error message and final analysis. CamelCase words (e.g. NamespaceTerminating)
+        are indexed once more split into their parts, so each part can be searched.
+        """
+        parts: List[str] = []
+        
+        def add(value: Any) -> None:
+            if isinstance(value, dict):
+                for item in value.values():
+                    add(item)
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    add(item)
+            elif isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                value = str(value)
+                parts.append(value)
+                parts.extend(
+                    re.sub(r"(?<=[a-z0-9])(?=[A-Z])", " ", word) for word in CAMEL_CASE_WORD.findall(value)
+                )
+        
+        for value in (
+            alert_session.alert_type,
+            alert_session.agent_type,
+            alert_session.alert_data,
+            alert_session.session_metadata,
+            alert_session.error_message,
+            alert_session.final_analysis,
+            alert_session.final_analysis_summary,
+        ):
+            if value:
+                add(value)
+        return "\n".join(parts)[:SESSION_SEARCH_MAX_CHARS]
+    
+    def _write_session_search(self, alert_session: AlertSession) -> None:
+        """Create or refresh a session's search document (committed with the caller's write)."""
+        row = {
+            "session_id": alert_session.session_id,
+            "document": self._session_search_document(alert_session),
+        }
+        dialect = self.session.bind.dialect.name
+        if dialect not in ('postgresql', 'sqlite'):
+            existing = self.session.exec(
+                select(SessionSearch).where(SessionSearch.session_id == alert_session.session_id)
+            ).first()
+            if existing is None:
+                self.session.add(SessionSearch(**row))
+            else:
+                existing.document = row["document"]
+            return
+        statement = (postgresql_insert if dialect == 'postgresql' else sqlite_insert)(SessionSearch).values(row)
+        self.session.exec(statement.on_conflict_do_update(
+            index_elements=["session_id"], set_={"document": statement.excluded.document}
+        ))
+    
+    def _session_search_matches(self, search: str) -> Tuple[Any, Any]:
+        """
+        Sessions matching a search, ranked, as a (session_id, position, rank) subquery.
+        
+        Every search term must match a word of the session's document, or the
+        start of one; terms joining words with punctuation (high-cpu-pod-1,
+        10.0.0.7) match them as a phrase, the last word as a prefix. Lower ranks
+        are better matches (FTS5 bm25 on SQLite, negated ts_rank_cd on
+        PostgreSQL); position orders documents by creation.
+        
+        Returns:
+            The subquery, and the full-text query with its match condition (for snippets)
+        """
+        terms = [words for words in (re.findall(r"\w+", term) for term in search.lower().split()) if words]
+        if self.session.bind.dialect.name == 'postgresql':
+            query = func.to_tsquery('simple', " & ".join(
+                " <-> ".join(words[:-1] + [f"{words[-1]}:*"]) for words in terms
+            ))
+            vector = literal_column("session_search.search_vector")
+            match = vector.op("@@")(query)
+            rank = -func.ts_rank_cd(vector, query)
+            matches = select(SessionSearch.session_id, SessionSearch.id.label("position"), rank.label("rank"))
+        else:
+            query = " ".join(f'"{" ".join(words)}"*' for words in terms)
+            match = literal_column("session_search_fts").op("MATCH")(query)
+            matches = select(
+                SessionSearch.session_id, SessionSearch.id.label("position"), SESSION_SEARCH_FTS.c.rank.label("rank")
+            ).join(
+                SESSION_SEARCH_FTS, SESSION_SEARCH_FTS.c.rowid == SessionSearch.id
+            )
+        # Nothing to look for (e.g. only punctuation) matches nothing
+        match = match if terms else false()
+        return matches.where(match).subquery("search_matches"), (query, match)
+    
+    def _session_search_snippets(self, search_match: Tuple[Any, Any], session_ids: List[str]) -> Dict[str, str]:
+        """HTML-escaped excerpts of the sessions' documents with the matches in <mark></mark>."""
+        if not session_ids:
+            return {}
+        query, match = search_match
+        if self.session.bind.dialect.name == 'postgresql':
+            snippet = func.ts_headline(
+                'simple', SessionSearch.document, query,
+                f"StartSel={SNIPPET_START}, StopSel={SNIPPET_END}, MaxFragments=2, MaxWords=20, MinWords=5",
+            )
+            statement = select(SessionSearch.session_id, snippet)
+        else:
+            snippet = func.snippet(literal_column("session_search_fts"), 0, SNIPPET_START, SNIPPET_END, "…", 16)
+            statement = select(SessionSearch.session_id, snippet).join(
+                SESSION_SEARCH_FTS, SESSION_SEARCH_FTS.c.rowid == SessionSearch.id
+            )
+        rows = self.session.exec(statement.where(match, SessionSearch.session_id.in_(session_ids))).all()
+        return {
+            session_id: html.escape(snippet).replace(SNIPPET_START, "<mark>").replace(SNIPPET_END, "</mark>")
+            for session_id, snippet in rows
+            if snippet
+        }
+    
     def get_stage_interaction_counts(self, execution_ids: List[str]) -> Dict[str, Dict[str, int]]:
         """
         Get interaction counts grouped by stage execution ID using SQL aggregation.
@@ -174,13 +399,134 @@ class HistoryRepository:
         """
         Create a new LLM interaction record.
         
+        Conversation messages are stored once per session in
+        llm_conversation_messages and referenced by hash from the record, so
+        later iterations only add the messages that are new. The passed
+        instance is left unchanged.
+        
         Args:
             llm_interaction: LLMInteraction instance to create
             
         Returns:
             The created LLMInteraction with database-generated fields
         """
-        return self.llm_interaction_repo.create(llm_interaction)
+        self._add_session_stats(self._session_stats_deltas(llm_interactions=[llm_interaction]))
+        record = self._prepare_llm_record(llm_interaction)
+        if record is llm_interaction:
+            return self.llm_interaction_repo.create(llm_interaction)
+        created = self.llm_interaction_repo.create(record)
+        set_committed_value(created, "conversation", llm_interaction.conversation)
+        return created
+    
+    def _prepare_llm_record(self, llm_interaction: LLMInteraction) -> LLMInteraction:
+        """Store the conversation's new messages and return the record to insert (not committed)."""
+        conversation = llm_interaction.conversation
+        if not conversation or not conversation.messages:
+            return llm_interaction
+        
+        record = LLMInteraction(**{
+            name: getattr(llm_interaction, name)
+            for name in LLMInteraction.model_fields
+            if name != "conversation"
+        })
+        record.message_hashes = self._store_conversation_messages(llm_interaction.session_id, conversation)
+        return record
+    
+    def _store_conversation_messages(self, session_id: str, conversation: LLMConversation) -> List[str]:
+        """
+        Add message rows not stored yet for the session (committed with the caller's record).
+        
+        Args:
+            session_id: Session the conversation belongs to
+            conversation: Conversation to store
+            
+        Returns:
+            Ordered message hashes of the conversation
+        """
+        hashes: List[str] = []
+        messages: Dict[str, LLMMessage] = {}
+        for message in conversation.messages:
+            message_hash = LLMConversationMessage.compute_hash(message.role.value, message.content)
+            hashes.append(message_hash)
+            messages.setdefault(message_hash, message)
+        
+        existing = set(self.session.exec(
+            select(LLMConversationMessage.message_hash).where(
+                LLMConversationMessage.session_id == session_id,
+                LLMConversationMessage.message_hash.in_(list(messages)),
+            )
+        ).all())
+        created_at_us = now_us()
+        rows = []
+        for message_hash, message in messages.items():
+            if message_hash in existing:
+                continue
+            # Large messages (mostly tool observations) are stored compressed
+            compressed = compress_payload(message.content, "llm_message")
+            rows.append({
+                "session_id": session_id,
+                "message_hash": message_hash,
+                "role": message.role.value,
+                "content": message.content if compressed is None else "",
+                "content_compressed": compressed,
+                "created_at_us": created_at_us,
+            })
+        if rows:
+            # Parallel agents of a session may store the same message concurrently
+            self._insert_ignoring_conflicts(LLMConversationMessage, rows)
+        return hashes
+    
+    def _rehydrate_conversations(self, interactions: List[LLMInteraction]) -> List[LLMInteraction]:
+        """
+        Load the conversations of interactions stored as message hashes.
+        
+        Rows written before messages were stored by hash keep their inline
+        conversation and are returned as they are.
+        
+        Args:
+            interactions: Interactions loaded by this session
+            
+        Returns:
+            The same interactions, with conversation populated
+        """
+        pending = [i for i in interactions if i.conversation is None and i.message_hashes]
+        if not pending:
+            return interactions
+        
+        hashes_by_session: Dict[str, set] = defaultdict(set)
+        for interaction in pending:
+            hashes_by_session[interaction.session_id].update(interaction.message_hashes)
+        
+        contents: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for session_id, hashes in hashes_by_session.items():
+            hashes = list(hashes)
+            for start in range(0, len(hashes), MESSAGE_HASH_BATCH_SIZE):
+                statement = select(LLMConversationMessage).where(
+                    LLMConversationMessage.session_id == session_id,
+                    LLMConversationMessage.message_hash.in_(hashes[start:start + MESSAGE_HASH_BATCH_SIZE]),
+                )
+                for row in self.session.exec(statement).all():
+                    content = row.content
+                    if row.content_compressed is not None:
+                        content = decompress_payload(row.content_compressed)
+                    contents[(session_id, row.message_hash)] = (row.role, content)
+        
+        for interaction in pending:
+            try:
+                messages = [
+                    # Separate instances per conversation so callers may edit them
+                    LLMMessage(role=role, content=content)
+                    for role, content in (
+                        contents[(interaction.session_id, message_hash)]
+                        for message_hash in interaction.message_hashes
+                    )
+                ]
+            except KeyError:
+                logger.warning(f"Conversation messages missing for LLM interaction {interaction.interaction_id}")
+                continue
+            # Loaded state, so the conversation is never written back inline
+            set_committed_value(interaction, "conversation", LLMConversation(messages=messages))
+        return interactions
     
     def has_llm_interactions(self, session_id: str) -> bool:
         """
@@ -240,7 +586,7 @@ class HistoryRepository:
             
             statement = statement.order_by(asc(LLMInteraction.timestamp_us))
             
-            return self.session.exec(statement).all()
+            return self._rehydrate_conversations(self.session.exec(statement).all())
         except Exception as e:
             logger.error(
                 f"Failed to get LLM interactions for session {session_id}: {str(e)}"
@@ -262,7 +608,7 @@ class HistoryRepository:
                 LLMInteraction.stage_execution_id == stage_execution_id
             ).order_by(asc(LLMInteraction.timestamp_us))
             
-            return self.session.exec(statement).all()
+            return self._rehydrate_conversations(self.session.exec(statement).all())
         except Exception as e:
             logger.error(f"Failed to get LLM interactions for stage {stage_execution_id}: {str(e)}")
             raise
@@ -273,13 +619,240 @@ class HistoryRepository:
         """
         Create a new MCP communication record.
         
+        Tool lists of tool_list communications are stored once per distinct
+        catalog in mcp_tool_catalogs and referenced by hash from the record.
+        
         Args:
             mcp_communication: MCPInteraction instance to create
             
         Returns:
             The created MCPInteraction with database-generated fields
         """
-        return self.mcp_communication_repo.create(mcp_communication)
+        self._add_session_stats(self._session_stats_deltas(mcp_communications=[mcp_communication]))
+        record = self._prepare_mcp_record(mcp_communication)
+        if record is mcp_communication:
+            return self.mcp_communication_repo.create(mcp_communication)
+        created = self.mcp_communication_repo.create(record)
+        set_committed_value(created, "tool_result", mcp_communication.tool_result)
+        return created
+    
+    def _prepare_mcp_record(self, mcp_communication: MCPInteraction) -> MCPInteraction:
+        """
+        Store the communication's tool lists as catalogs and return the record to insert (not committed).
+        
+        Tool lists referenced by catalog hash and large tool results compressed
+        go into a copy of the communication, so the passed instance is left
+        unchanged and can be written again if the transaction rolls back.
+        """
+        stored: Dict[str, Any] = {}
+        if mcp_communication.available_tools:
+            stored["tool_catalog_hashes"] = self._store_tool_catalogs(mcp_communication.available_tools)
+            stored["available_tools"] = None
+        if mcp_communication.tool_result:
+            compressed = compress_payload(json.dumps(mcp_communication.tool_result), "tool_result")
+            if compressed is not None:
+                stored["tool_result"] = None
+                stored["tool_result_compressed"] = compressed
+        if not stored:
+            return mcp_communication
+        
+        # Cleared JSON fields are left out (not set to None) so they stay SQL NULL
+        record = MCPInteraction(**{
+            name: getattr(mcp_communication, name)
+            for name in MCPInteraction.model_fields
+            if name not in stored
+        })
+        for name, value in stored.items():
+            if value is not None:
+                setattr(record, name, value)
+        return record
+    
+    @staticmethod
+    def _decompress_tool_results(communications: List[MCPInteraction]) -> List[MCPInteraction]:
+        """Load the tool results of communications stored compressed."""
+        for communication in communications:
+            if communication.tool_result is None and communication.tool_result_compressed is not None:
+                # Loaded state, so the result is never written back inline
+                set_committed_value(
+                    communication, "tool_result", json.loads(decompress_payload(communication.tool_result_compressed))
+                )
+        return communications
+    
+    def create_interactions(
+        self,
+        llm_interactions: List[LLMInteraction],
+        mcp_communications: List[MCPInteraction],
+        touched_session_ids: List[str],
+    ) -> None:
+        """
+        Insert a batch of interactions and record session activity in one transaction.
+        
+        Rows are inserted with one multi-row INSERT per table, and
+        last_interaction_at of every touched session is set with a single
+        UPDATE. The passed LLM interactions are left unchanged.
+        
+        Args:
+            llm_interactions: LLM interactions to create
+            mcp_communications: MCP communications to create
+            touched_session_ids: Sessions whose last_interaction_at is set to now
+        """
+        try:
+            self._add_session_stats(self._session_stats_deltas(llm_interactions, mcp_communications))
+            self.session.add_all([self._prepare_llm_record(interaction) for interaction in llm_interactions])
+            self.session.add_all([self._prepare_mcp_record(communication) for communication in mcp_communications])
+            if touched_session_ids:
+                self.session.exec(
+                    update(AlertSession)
+                    .where(AlertSession.session_id.in_(touched_session_ids))
+                    .values(last_interaction_at=now_us())
+                )
+            self.session.commit()
+        except Exception as e:
+            logger.error(
+                f"Failed to create batch of {len(llm_interactions)} LLM and "
+                f"{len(mcp_communications)} MCP interaction(s): {str(e)}"
+            )
+            self.session.rollback()
+            raise
+    
+    def _store_tool_catalogs(self, available_tools: Dict[str, List[dict]]) -> Dict[str, str]:
+        """
+        Add catalog rows for tool lists not stored yet (committed with the caller's record).
+        
+        Args:
+            available_tools: Server name -> serialized tools
+            
+        Returns:
+            Server name -> catalog hash
+        """
+        hashes: Dict[str, str] = {}
+        catalogs: Dict[str, Tuple[str, List[dict]]] = {}
+        for server_name, tools in available_tools.items():
+            catalog_hash = MCPToolCatalog.compute_hash(tools)
+            hashes[server_name] = catalog_hash
+            catalogs.setdefault(catalog_hash, (server_name, tools))
+        
+        existing = set(self.session.exec(
+            select(MCPToolCatalog.catalog_hash).where(MCPToolCatalog.catalog_hash.in_(list(catalogs)))
+        ).all())
+        rows = []
+        for catalog_hash, (server_name, tools) in catalogs.items():
+            if catalog_hash in existing:
+                continue
+            compressed = compress_payload(json.dumps(tools), "tool_catalog")
+            rows.append({
+                "catalog_hash": catalog_hash,
+                "server_name": server_name,
+                "tools": tools if compressed is None else None,
+                "tools_compressed": compressed,
+                "created_at_us": now_us(),
+            })
+        if rows:
+            # Another pod may store the same catalog concurrently
+            self._insert_ignoring_conflicts(MCPToolCatalog, rows)
+        return hashes
+    
+    @staticmethod
+    def _empty_session_stats(session_id: str) -> Dict[str, Any]:
+        return {
+            "session_id": session_id,
+            **dict.fromkeys(SESSION_STATS_COUNTERS, 0),
+            **dict.fromkeys(SESSION_STATS_TOKENS),
+            "has_parallel_stages": False,
+        }
+    
+    def _session_stats_deltas(
+        self,
+        llm_interactions: Iterable[LLMInteraction] = (),
+        mcp_communications: Iterable[MCPInteraction] = (),
+    ) -> List[Dict[str, Any]]:
+        """Sum what a batch of interactions adds to each session's rollup."""
+        deltas: Dict[str, Dict[str, Any]] = {}
+        for interaction in llm_interactions:
+            delta = deltas.setdefault(interaction.session_id, self._empty_session_stats(interaction.session_id))
+            delta["llm_interaction_count"] += 1
+            for name in SESSION_STATS_TOKENS:
+                value = getattr(interaction, name)
+                if value is not None:
+                    delta[name] = (delta[name] or 0) + value
+        for communication in mcp_communications:
+            delta = deltas.setdefault(communication.session_id, self._empty_session_stats(communication.session_id))
+            delta["mcp_communication_count"] += 1
+        return list(deltas.values())
+    
+    def _add_session_stats(self, deltas: List[Dict[str, Any]]) -> None:
+        """
+        Add deltas to sessions' SessionStats rows (committed with the caller's write).
+        
+        Uses one atomic upsert, so concurrent writers (parallel agents, other
+        pods) never lose increments.
+        
+        Args:
+            deltas: Rows from _empty_session_stats with the amounts to add
+        """
+        deltas = [delta for delta in deltas if delta["session_id"]]
+        if not deltas:
+            return
+        table = SessionStats.__table__
+        dialect = self.session.bind.dialect.name
+        if dialect not in ('postgresql', 'sqlite'):
+            for delta in deltas:
+                self._add_session_stats_row(delta)
+            return
+        
+        statement = (postgresql_insert if dialect == 'postgresql' else sqlite_insert)(table).values(deltas)
+        excluded = statement.excluded
+        updates: Dict[str, Any] = {name: table.c[name] + excluded[name] for name in SESSION_STATS_COUNTERS}
+        for name in SESSION_STATS_TOKENS:
+            updates[name] = case(
+                (excluded[name].is_(None), table.c[name]),
+                else_=func.coalesce(table.c[name], 0) + excluded[name],
+            )
+        updates["has_parallel_stages"] = or_(table.c.has_parallel_stages, excluded.has_parallel_stages)
+        self.session.exec(statement.on_conflict_do_update(index_elements=["session_id"], set_=updates))
+    
+    def _add_session_stats_row(self, delta: Dict[str, Any]) -> None:
+        """Read-modify-write fallback of _add_session_stats for other databases."""
+        stats = self.session.get(SessionStats, delta["session_id"])
+        if stats is None:
+            self.session.add(SessionStats(**delta))
+            return
+        for name in SESSION_STATS_COUNTERS:
+            setattr(stats, name, getattr(stats, name) + delta[name])
+        for name in SESSION_STATS_TOKENS:
+            if delta[name] is not None:
+                setattr(stats, name, (getattr(stats, name) or 0) + delta[name])
+        stats.has_parallel_stages = stats.has_parallel_stages or delta["has_parallel_stages"]
+    
+    def _insert_ignoring_conflicts(self, model: type, rows: List[dict]) -> None:
+        """Insert content-addressed rows, skipping rows whose key already exists."""
+        dialect = self.session.bind.dialect.name
+        if dialect == 'postgresql':
+            statement = postgresql_insert(model).values(rows).on_conflict_do_nothing()
+        elif dialect == 'sqlite':
+            statement = sqlite_insert(model).values(rows).on_conflict_do_nothing()
+        else:
+            statement = model.__table__.insert().values(rows)
+        self.session.exec(statement)
+    
+    def get_tool_catalogs(self, catalog_hashes: List[str]) -> Dict[str, List[dict]]:
+        """
+        Get stored tool catalogs by hash.
+        
+        Args:
+            catalog_hashes: Catalog hashes to load
+            
+        Returns:
+            Catalog hash -> serialized tools (missing hashes are omitted)
+        """
+        if not catalog_hashes:
+            return {}
+        statement = select(MCPToolCatalog).where(MCPToolCatalog.catalog_hash.in_(catalog_hashes))
+        return {
+            catalog.catalog_hash: catalog.tools if catalog.tools_compressed is None
+            else json.loads(decompress_payload(catalog.tools_compressed))
+            for catalog in self.session.exec(statement).all()
+        }
     
     def get_mcp_communications_for_session(self, session_id: str) -> List[MCPInteraction]:
         """
@@ -296,7 +869,7 @@ class HistoryRepository:
                 MCPInteraction.session_id == session_id
             ).order_by(asc(MCPInteraction.timestamp_us))
             
-            return self.session.exec(statement).all()
+            return self._decompress_tool_results(self.session.exec(statement).all())
         except Exception as e:
             logger.error(f"Failed to get MCP communications for session {session_id}: {str(e)}")
             raise
@@ -324,6 +897,13 @@ class HistoryRepository:
     def create_stage_execution(self, stage_execution: StageExecution) -> str:
         """Create a new stage execution record."""
         try:
+            if (
+                stage_execution.parallel_type != ParallelType.SINGLE.value
+                or stage_execution.parent_stage_execution_id is not None
+            ):
+                self._add_session_stats([
+                    {**self._empty_session_stats(stage_execution.session_id), "has_parallel_stages": True}
+                ])
             self.session.add(stage_execution)
             self.session.commit()
             self.session.refresh(stage_execution)
@@ -386,10 +966,13 @@ class HistoryRepository:
             logger.error(f"Failed to get stage execution {execution_id}: {str(e)}")
             raise
     
-    def get_stage_executions_for_session(self, session_id: str) -> List['StageExecution']:
+    def get_stage_executions_for_session(
+        self, session_id: str, include_output: bool = True
+    ) -> List['StageExecution']:
         """Get all stage executions for a session with parent-child relationships.
         
         Returns parent stages with child executions embedded for parallel stages.
+        With include_output=False, stage_output is not loaded.
         
         Ordering:
         1. Regular stages (chat_id IS NULL) first, sorted by stage_index
@@ -413,6 +996,8 @@ class HistoryRepository:
                     asc(StageExecution.started_at_us)
                 )
             )
+            if not include_output:
+                stmt = stmt.options(defer(StageExecution.stage_output))
             all_stages = self.session.exec(stmt).all()
             
             # Group children under parents
@@ -457,6 +1042,47 @@ class HistoryRepository:
             logger.error(f"Failed to get parallel stage children for parent {parent_execution_id}: {str(e)}")
             raise
 
+    @staticmethod
+    def _after_cursor_condition(
+        sort_column: Any,
+        sort_direction: str,
+        nullable: bool,
+        value: Optional[Union[int, str]],
+        session_id: str,
+    ) -> Any:
+        """
+        Keyset condition for sessions after (value, session_id) in the list order.
+        
+        Matches ORDER BY sort_column <direction> [NULLS LAST], session_id <direction>.
+        """
+        if sort_direction == 'asc':
+            after_id = AlertSession.session_id > session_id
+        else:
+            after_id = AlertSession.session_id < session_id
+        if value is None:
+            # Already among the trailing NULLs: only ties on session_id remain
+            return and_(sort_column.is_(None), after_id)
+        if not nullable:
+            # Row-value comparison, so the (column, session_id) index can seek to the position
+            position = tuple_(sort_column, AlertSession.session_id)
+            return position > (value, session_id) if sort_direction == 'asc' else position < (value, session_id)
+        after_value = sort_column > value if sort_direction == 'asc' else sort_column < value
+        return or_(after_value, and_(sort_column == value, after_id), sort_column.is_(None))
+    
+    def _estimate_alert_session_count(self) -> Optional[int]:
+        """
+        Planner row estimate of alert_sessions (PostgreSQL), or None when unavailable.
+        """
+        if self.session.bind.dialect.name != 'postgresql':
+            return None
+        estimate = self.session.exec(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'alert_sessions'")
+        ).scalar()
+        # -1 until the table was first vacuumed or analyzed
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+    
     def get_alert_sessions(
         self,
         status: Optional[Union[str, List[str]]] = None,
@@ -468,17 +1094,32 @@ class HistoryRepository:
         page: int = 1,
         page_size: int = 20,
         sort_by: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[SessionCursor] = None,
+        count_mode: str = SessionCountMode.EXACT.value,
+        known_total_items: Optional[int] = None,
     ) -> Optional[PaginatedSessions]:
         """
         Retrieve alert sessions with filtering and pagination.
+        
+        Pages are addressed either by page number (OFFSET) or by a keyset cursor
+        taken from the previous page's pagination.next_cursor, which seeks
+        directly to the next session on the sort order instead of skipping rows.
+        
+        Args:
+            cursor: Continue after this position (its sort replaces sort_by/sort_order)
+            count_mode: 'exact' counts with the filters; 'approximate' uses the planner's
+                row estimate for unfiltered PostgreSQL listings
+            known_total_items: Total to report (e.g. a cached count) instead of counting
         """
         try:
             # Defensively handle pagination parameters to prevent negative DB offsets
             page = max(1, int(page)) if page is not None else 1
             page_size = max(1, int(page_size)) if page_size is not None else 20
-            # Build the base query (same logic as dict version but builds models directly)
-            statement = select(AlertSession)
+            # Build the base query; counts and token sums come from the maintained SessionStats rollup
+            statement = select(AlertSession, SessionStats).outerjoin(
+                SessionStats, SessionStats.session_id == AlertSession.session_id
+            )
             conditions = []
             
             # Apply filters using AND logic
@@ -492,33 +1133,11 @@ class HistoryRepository:
             if alert_type:
                 conditions.append(AlertSession.alert_type == alert_type)
             
-            # Search functionality using OR logic across multiple text fields
+            # Full-text search: only matching sessions, ranked by relevance
+            search_matches = None
             if search:
-                search_term = f"%{search.lower()}%"
-                search_conditions = []
-                
-                # Search in error_message field
-                search_conditions.append(func.lower(AlertSession.error_message).like(search_term))
-                # Search in final_analysis field
-                search_conditions.append(func.lower(AlertSession.final_analysis).like(search_term))
-                # Search in alert_type field
-                search_conditions.append(func.lower(AlertSession.alert_type).like(search_term))
-                # Search in agent_type field
-                search_conditions.append(func.lower(AlertSession.agent_type).like(search_term))
-                # Search in JSON alert_data fields
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.message')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.context')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.namespace')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.pod')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.cluster')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.severity')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.environment')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.runbook')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.alert_data, '$.id')).like(search_term))
-                search_conditions.append(func.lower(func.json_extract(AlertSession.session_metadata, '$')).like(search_term))
-                
-                # Combine all search conditions with OR logic
-                conditions.append(or_(*search_conditions))
+                search_matches, search_match = self._session_search_matches(search)
+                statement = statement.join(search_matches, search_matches.c.session_id == AlertSession.session_id)
             
             if start_date_us:
                 conditions.append(AlertSession.started_at_us >= start_date_us)
@@ -539,14 +1158,29 @@ class HistoryRepository:
                 'agent_type': AlertSession.agent_type,
                 'author': AlertSession.author,
                 'completed_at_us': AlertSession.completed_at_us,
+                'session_total_tokens': SessionStats.total_tokens,
             }
             
+            # A cursor continues the listing it came from, so its sort wins over sort_by/sort_order
+            if cursor:
+                if cursor.sort_by not in sort_field_map:
+                    raise ValueError(f"Cursor pagination is not supported when sorting by {cursor.sort_by!r}")
+                sort_by, sort_order = cursor.sort_by, cursor.sort_order
+            
             # Default sorting: started_at_us descending (most recent first)
+            sort_key = 'started_at_us'
             sort_column = AlertSession.started_at_us
             sort_direction = 'desc'
             
             # Apply custom sorting if provided and valid
-            if sort_by and sort_by in sort_field_map:
+            by_relevance = search_matches is not None and not sort_by
+            if by_relevance:
+                # Search results default to relevance; ranks depend on the query, so there is no cursor
+                sort_key = None
+                sort_column = search_matches.c.rank
+                sort_direction = 'asc'
+            elif sort_by and sort_by in sort_field_map:
+                sort_key = sort_by
                 sort_column = sort_field_map[sort_by]
                 if sort_order and sort_order.lower() in ('asc', 'desc'):
                     sort_direction = sort_order.lower()
@@ -556,145 +1190,104 @@ class HistoryRepository:
                 # For in-progress sessions (completed_at_us=NULL), use current runtime.
                 # Note: In practice, the UI filters these out (shown in separate active panel),
                 # but API consumers might query mixed statuses.
+                # Durations of running sessions change between requests, so there is no cursor.
                 current_time_us = now_us()
                 duration_expr = case(
                     (AlertSession.completed_at_us.is_not(None), 
                      (AlertSession.completed_at_us - AlertSession.started_at_us) / 1000),
                     else_=((current_time_us - AlertSession.started_at_us) / 1000)
                 )
+                sort_key = None
                 sort_column = duration_expr
                 if sort_order and sort_order.lower() in ('asc', 'desc'):
                     sort_direction = sort_order.lower()
-            # Note: session_total_tokens sorting not implemented as it requires complex aggregation
-            # Frontend should disable sorting for this column
             
-            # Apply the sorting direction
-            if sort_direction == 'asc':
-                statement = statement.order_by(asc(sort_column))
+            # Apply the sorting direction. NULLs (e.g. sessions without token usage) sort last either
+            # way on every database, and session_id breaks ties so each session has a unique position.
+            nullable = sort_key in NULLABLE_SESSION_SORT_KEYS
+            ordering = asc(sort_column) if sort_direction == 'asc' else desc(sort_column)
+            if nullable:
+                ordering = ordering.nulls_last()
+            if by_relevance:
+                # Equally relevant sessions: most recently created first (by the search index's own
+                # row order, so ranking never reads whole session rows)
+                tie_breakers = [desc(search_matches.c.position)]
+            elif sort_direction == 'asc':
+                tie_breakers = [asc(AlertSession.session_id)]
             else:
-                statement = statement.order_by(desc(sort_column))
+                tie_breakers = [desc(AlertSession.session_id)]
+            statement = statement.order_by(ordering, *tie_breakers)
             
             # Count total results for pagination
-            count_statement = select(func.count(AlertSession.session_id))
-            if conditions:
-                count_statement = count_statement.where(and_(*conditions))
-            total_items = self.session.exec(count_statement).first() or 0
-            
-            # Apply pagination
-            offset = (page - 1) * page_size
-            statement = statement.offset(offset).limit(page_size)
-            
-            # Execute query to get AlertSession objects
-            alert_sessions = self.session.exec(statement).all()
-            
-            # Get interaction counts for sessions
-            interaction_counts = {}
-            if alert_sessions:
-                session_ids = [s.session_id for s in alert_sessions]
-                
-                # Count LLM interactions for each session
-                llm_count_query = select(
-                    LLMInteraction.session_id,
-                    func.count(LLMInteraction.interaction_id).label('count')
-                ).where(LLMInteraction.session_id.in_(session_ids)).group_by(LLMInteraction.session_id)
-                llm_results = self.session.exec(llm_count_query).all()
-                llm_counts = {result.session_id: result.count for result in llm_results}
-                
-                # Count MCP communications for each session
-                mcp_count_query = select(
-                    MCPInteraction.session_id,
-                    func.count(MCPInteraction.communication_id).label('count')
-                ).where(MCPInteraction.session_id.in_(session_ids)).group_by(MCPInteraction.session_id)
-                mcp_results = self.session.exec(mcp_count_query).all()
-                mcp_counts = {result.session_id: result.count for result in mcp_results}
-                
-                # Calculate token usage aggregations for each session (EP-0009)
-                token_query = select(
-                    LLMInteraction.session_id,
-                    func.sum(LLMInteraction.input_tokens).label('input_tokens'),
-                    func.sum(LLMInteraction.output_tokens).label('output_tokens'),
-                    func.sum(LLMInteraction.total_tokens).label('total_tokens')
-                ).where(LLMInteraction.session_id.in_(session_ids)).group_by(LLMInteraction.session_id)
-                token_results = self.session.exec(token_query).all()
-                token_sums = {
-                    result.session_id: {
-                        'input_tokens': result.input_tokens,
-                        'output_tokens': result.output_tokens, 
-                        'total_tokens': result.total_tokens
-                    } for result in token_results
-                }
-                
-                # Count chat user messages for sessions with chats
-                chat_message_counts = {}
-                try:
-                    from tarsy.models.db_models import Chat, ChatUserMessage
-                    
-                    # First get chat IDs for these sessions
-                    chat_query = select(Chat.session_id, Chat.chat_id).where(
-                        Chat.session_id.in_(session_ids)
-                    )
-                    chat_results = self.session.exec(chat_query).all()
-                    chat_ids_by_session = {result.session_id: result.chat_id for result in chat_results}
-                    
-                    if chat_ids_by_session:
-                        # Count messages for each chat
-                        message_count_query = select(
-                            ChatUserMessage.chat_id,
-                            func.count(ChatUserMessage.message_id).label('count')
-                        ).where(
-                            ChatUserMessage.chat_id.in_(list(chat_ids_by_session.values()))
-                        ).group_by(ChatUserMessage.chat_id)
-                        message_results = self.session.exec(message_count_query).all()
-                        message_counts_by_chat = {result.chat_id: result.count for result in message_results}
-                        
-                        # Map back to session IDs
-                        for session_id, chat_id in chat_ids_by_session.items():
-                            count = message_counts_by_chat.get(chat_id, 0)
-                            if count > 0:
-                                chat_message_counts[session_id] = count
-                except Exception as e:
-                    # Don't fail entire query if chat counting fails
-                    logger.error(f"Failed to count chat messages for sessions: {e}")
-                
-                # Check for parallel stages in sessions
-                parallel_stages_flags = {}
-                try:
-                    # Query for sessions that have at least one stage with parallel executions
-                    # A stage has parallel executions if it has children (parent_stage_execution_id points to it)
-                    # OR if its parallel_type is not 'single'
-                    parallel_stages_query = select(StageExecution.session_id).where(
-                        and_(
-                            StageExecution.session_id.in_(session_ids),
-                            or_(
-                                StageExecution.parallel_type != ParallelType.SINGLE.value,
-                                StageExecution.parent_stage_execution_id.is_not(None)
-                            )
+            total_is_estimate = False
+            if known_total_items is not None:
+                total_items = known_total_items
+                total_is_estimate = True
+            else:
+                total_items = None
+                if count_mode == SessionCountMode.APPROXIMATE.value and not conditions and search_matches is None:
+                    total_items = self._estimate_alert_session_count()
+                    total_is_estimate = total_items is not None
+                if total_items is None:
+                    count_statement = select(func.count(AlertSession.session_id))
+                    if search_matches is not None:
+                        count_statement = count_statement.join(
+                            search_matches, search_matches.c.session_id == AlertSession.session_id
                         )
-                    ).distinct()
-                    parallel_results = self.session.exec(parallel_stages_query).all()
-                    parallel_stages_flags = {session_id: True for session_id in parallel_results}
-                except Exception as e:
-                    # Don't fail entire query if parallel stages check fails
-                    logger.error(f"Failed to check for parallel stages: {e}")
-                
-                # Combine counts for each session
-                for session_id in session_ids:
-                    tokens = token_sums.get(session_id, {})
-                    interaction_counts[session_id] = {
-                        'llm_interactions': llm_counts.get(session_id, 0),
-                        'mcp_communications': mcp_counts.get(session_id, 0),
-                        'input_tokens': tokens.get('input_tokens'),
-                        'output_tokens': tokens.get('output_tokens'),
-                        'total_tokens': tokens.get('total_tokens'),
-                        'chat_message_count': chat_message_counts.get(session_id),
-                        'has_parallel_stages': parallel_stages_flags.get(session_id, False)
-                    }
+                    if conditions:
+                        count_statement = count_statement.where(and_(*conditions))
+                    total_items = self.session.exec(count_statement).first() or 0
+            
+            # Apply pagination: seek past the cursor's session, or skip whole pages without one
+            if cursor:
+                statement = statement.where(self._after_cursor_condition(
+                    sort_column, sort_direction, nullable, cursor.value, cursor.session_id
+                ))
+            else:
+                statement = statement.offset((page - 1) * page_size)
+            # One extra row tells whether there is a next page
+            statement = statement.limit(page_size + 1)
+            
+            # Execute query to get AlertSession objects with their rollups
+            if search_matches is not None:
+                # Sort the matches by their keys alone, then load the page's sessions: sorting
+                # whole session rows would dominate searches with many matches
+                page_ids = list(self.session.scalars(statement.with_only_columns(AlertSession.session_id)).all())
+                loaded = {
+                    alert_session.session_id: (alert_session, stats)
+                    for alert_session, stats in self.session.exec(
+                        select(AlertSession, SessionStats)
+                        .outerjoin(SessionStats, SessionStats.session_id == AlertSession.session_id)
+                        .where(AlertSession.session_id.in_(page_ids))
+                    ).all()
+                }
+                rows = [loaded[session_id] for session_id in page_ids if session_id in loaded]
+            else:
+                rows = self.session.exec(statement).all()
+            next_cursor = None
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                if sort_key is not None:
+                    last_session, last_stats = rows[-1]
+                    last_value = (
+                        last_stats.total_tokens if last_stats else None
+                    ) if sort_key == 'session_total_tokens' else getattr(last_session, sort_key)
+                    next_cursor = SessionCursor(
+                        sort_by=sort_key,
+                        sort_order=sort_direction,
+                        value=last_value,
+                        session_id=last_session.session_id,
+                    ).encode()
+            
+            snippets = self._session_search_snippets(
+                search_match, [alert_session.session_id for alert_session, _ in rows]
+            ) if search_matches is not None else {}
             
             session_overviews = []
-            for alert_session in alert_sessions:
-                session_counts = interaction_counts.get(alert_session.session_id, {})
-                llm_count = session_counts.get('llm_interactions', 0)
-                mcp_count = session_counts.get('mcp_communications', 0)
+            for alert_session, stats in rows:
+                stats = stats or SessionStats(session_id=alert_session.session_id)
+                llm_count = stats.llm_interaction_count
+                mcp_count = stats.mcp_communication_count
                 
                 overview = SessionOverview(
                     # Core identification
@@ -712,20 +1305,20 @@ class HistoryRepository:
                     error_message=alert_session.error_message,
                     pause_metadata=alert_session.pause_metadata,
                     
-                    # Summary counts (merged from interaction_counts)
+                    # Summary counts (from the session's rollup)
                     llm_interaction_count=llm_count,
                     mcp_communication_count=mcp_count,
                     total_interactions=llm_count + mcp_count,
                     
                     # Token usage aggregations (EP-0009)
-                    session_input_tokens=session_counts.get('input_tokens'),
-                    session_output_tokens=session_counts.get('output_tokens'),
-                    session_total_tokens=session_counts.get('total_tokens'),
+                    session_input_tokens=stats.input_tokens,
+                    session_output_tokens=stats.output_tokens,
+                    session_total_tokens=stats.total_tokens,
                     
                     # Chain progress info
                     chain_id=alert_session.chain_id,
                     current_stage_index=alert_session.current_stage_index,
-                    has_parallel_stages=session_counts.get('has_parallel_stages', False),
+                    has_parallel_stages=stats.has_parallel_stages,
                     
                     # MCP configuration override
                     mcp_selection=alert_session.mcp_selection,
@@ -733,7 +1326,9 @@ class HistoryRepository:
                     # Slack integration
                     slack_message_fingerprint=alert_session.slack_message_fingerprint,
                     
-                    chat_message_count=session_counts.get('chat_message_count'),
+                    chat_message_count=stats.chat_message_count or None,
+                    
+                    search_snippet=snippets.get(alert_session.session_id),
                     
                     # Optional fields that may need calculation elsewhere (defaults from SessionOverview)
                     total_stages=None,
@@ -750,7 +1345,9 @@ class HistoryRepository:
                 page=page,
                 page_size=page_size,
                 total_pages=total_pages,
-                total_items=total_items
+                total_items=total_items,
+                total_is_estimate=total_is_estimate,
+                next_cursor=next_cursor,
             )
             
             # Return type-safe PaginatedSessions model
@@ -807,55 +1404,28 @@ class HistoryRepository:
             ]
             
             # Fetch all user messages in bulk if there are any
-            user_messages_map: Dict[str, ChatUserMessage] = {}
-            if message_ids:
-                messages_stmt = select(ChatUserMessage).where(
-                    ChatUserMessage.message_id.in_(message_ids)
-                )
-                user_messages = self.session.exec(messages_stmt).all()
-                user_messages_map = {msg.message_id: msg for msg in user_messages}
+            user_messages_map = self._chat_user_messages(message_ids)
             
             # Group interactions by stage_execution_id
             interactions_by_stage = defaultdict(list)
             
             # Convert LLM DB interaction models to timeline events using LLMInteraction directly
             for llm_db in llm_interactions_db:
-                llm_event = LLMTimelineEvent(
-                    id=llm_db.interaction_id,
-                    event_id=llm_db.interaction_id,
-                    timestamp_us=llm_db.timestamp_us,
-                    duration_ms=llm_db.duration_ms,
-                    stage_execution_id=llm_db.stage_execution_id or SESSION_LEVEL_STAGE_ID,
-                    step_description=f"LLM analysis using {llm_db.model_name}",
-                    details=llm_db
-                )
+                llm_event = self._llm_timeline_event(llm_db)
                 
                 stage_id = llm_db.stage_execution_id or SESSION_LEVEL_STAGE_ID
                 interactions_by_stage[stage_id].append(llm_event)
             
+            # Load the tool catalogs referenced by tool_list communications in one query
+            tool_catalogs = self.get_tool_catalogs(list({
+                catalog_hash
+                for mcp_db in mcp_communications_db
+                for catalog_hash in (mcp_db.tool_catalog_hashes or {}).values()
+            }))
+            
             # Convert MCP communications to type-safe models
             for mcp_db in mcp_communications_db:
-                mcp_details = MCPEventDetails(
-                    tool_name=mcp_db.tool_name or '',
-                    server_name=mcp_db.server_name,
-                    communication_type=mcp_db.communication_type,
-                    tool_arguments=mcp_db.tool_arguments or {},
-                    tool_result=mcp_db.tool_result or {},
-                    available_tools=mcp_db.available_tools or {},
-                    success=mcp_db.success,
-                    error_message=mcp_db.error_message,
-                    duration_ms=mcp_db.duration_ms
-                )
-                
-                mcp_interaction = MCPTimelineEvent(
-                    id=mcp_db.communication_id,
-                    event_id=mcp_db.communication_id,
-                    timestamp_us=mcp_db.timestamp_us,
-                    step_description=mcp_db.step_description,
-                    duration_ms=mcp_db.duration_ms,
-                    stage_execution_id=mcp_db.stage_execution_id or SESSION_LEVEL_STAGE_ID,
-                    details=mcp_details
-                )
+                mcp_interaction = self._mcp_timeline_event(mcp_db, tool_catalogs)
                 
                 stage_id = mcp_db.stage_execution_id or SESSION_LEVEL_STAGE_ID
                 interactions_by_stage[stage_id].append(mcp_interaction)
@@ -876,15 +1446,7 @@ class HistoryRepository:
                 )
                 
                 # Get user message data if this stage has a chat message
-                chat_user_message_data = None
-                if stage_db.chat_user_message_id and stage_db.chat_user_message_id in user_messages_map:
-                    user_msg = user_messages_map[stage_db.chat_user_message_id]
-                    chat_user_message_data = ChatUserMessageData(
-                        message_id=user_msg.message_id,
-                        content=user_msg.content,
-                        author=user_msg.author,
-                        created_at_us=user_msg.created_at_us
-                    )
+                chat_user_message_data = user_messages_map.get(stage_db.chat_user_message_id)
                 
                 # Convert nested children if they exist
                 parallel_executions_detailed = None
@@ -1013,6 +1575,334 @@ class HistoryRepository:
             logger.error(f"Failed to get detailed session {session_id}: {str(e)}")
             return None
 
+    @staticmethod
+    def _llm_timeline_event(llm_db: LLMInteraction) -> LLMTimelineEvent:
+        """Timeline event of an LLM interaction, with its full details."""
+        return LLMTimelineEvent(
+            id=llm_db.interaction_id,
+            event_id=llm_db.interaction_id,
+            timestamp_us=llm_db.timestamp_us,
+            duration_ms=llm_db.duration_ms,
+            stage_execution_id=llm_db.stage_execution_id or SESSION_LEVEL_STAGE_ID,
+            step_description=f"LLM analysis using {llm_db.model_name}",
+            details=llm_db
+        )
+    
+    @staticmethod
+    def _mcp_timeline_event(mcp_db: MCPInteraction, tool_catalogs: Dict[str, List[dict]]) -> MCPTimelineEvent:
+        """Timeline event of an MCP communication, with its tool payloads."""
+        # Legacy rows store the tool lists inline
+        available_tools = mcp_db.available_tools or {
+            server_name: tool_catalogs.get(catalog_hash, [])
+            for server_name, catalog_hash in (mcp_db.tool_catalog_hashes or {}).items()
+        }
+        mcp_details = MCPEventDetails(
+            tool_name=mcp_db.tool_name or '',
+            server_name=mcp_db.server_name,
+            communication_type=mcp_db.communication_type,
+            tool_arguments=mcp_db.tool_arguments or {},
+            tool_result=mcp_db.tool_result or {},
+            available_tools=available_tools,
+            success=mcp_db.success,
+            error_message=mcp_db.error_message,
+            duration_ms=mcp_db.duration_ms
+        )
+        return MCPTimelineEvent(
+            id=mcp_db.communication_id,
+            event_id=mcp_db.communication_id,
+            timestamp_us=mcp_db.timestamp_us,
+            step_description=mcp_db.step_description,
+            duration_ms=mcp_db.duration_ms,
+            stage_execution_id=mcp_db.stage_execution_id or SESSION_LEVEL_STAGE_ID,
+            details=mcp_details
+        )
+    
+    def _chat_user_messages(self, message_ids: List[str]) -> Dict[str, ChatUserMessageData]:
+        """Chat user messages by ID, loaded in one query."""
+        if not message_ids:
+            return {}
+        messages = self.session.exec(
+            select(ChatUserMessage).where(ChatUserMessage.message_id.in_(message_ids))
+        ).all()
+        return {
+            message.message_id: ChatUserMessageData(
+                message_id=message.message_id,
+                content=message.content,
+                author=message.author,
+                created_at_us=message.created_at_us
+            )
+            for message in messages
+        }
+    
+    @staticmethod
+    def _preview(text_value: Optional[str]) -> Optional[str]:
+        """Preview of a text selected with one character more than TIMELINE_PREVIEW_CHARS."""
+        if not text_value or len(text_value) <= TIMELINE_PREVIEW_CHARS:
+            return text_value or None
+        return text_value[:TIMELINE_PREVIEW_CHARS] + "…"
+    
+    def _llm_interaction_summaries(self, session_id: str) -> List[LLMInteractionSummary]:
+        """
+        Summaries of a session's LLM interactions, without loading their conversations.
+        
+        The response preview is the start of each conversation's last message.
+        Interactions stored before messages were stored by hash have none.
+        """
+        rows = self.session.exec(
+            select(
+                LLMInteraction.interaction_id,
+                LLMInteraction.timestamp_us,
+                LLMInteraction.duration_ms,
+                LLMInteraction.stage_execution_id,
+                LLMInteraction.model_name,
+                LLMInteraction.provider,
+                LLMInteraction.interaction_type,
+                LLMInteraction.success,
+                LLMInteraction.error_message,
+                LLMInteraction.input_tokens,
+                LLMInteraction.output_tokens,
+                LLMInteraction.total_tokens,
+                LLMInteraction.cached_input_tokens,
+                LLMInteraction.mcp_event_id,
+                LLMInteraction.message_hashes,
+            )
+            .where(LLMInteraction.session_id == session_id)
+            .order_by(asc(LLMInteraction.timestamp_us))
+        ).all()
+        
+        last_hashes = list({row.message_hashes[-1] for row in rows if row.message_hashes})
+        previews: Dict[str, str] = {}
+        for start in range(0, len(last_hashes), MESSAGE_HASH_BATCH_SIZE):
+            statement = select(
+                LLMConversationMessage.message_hash,
+                func.substr(LLMConversationMessage.content, 1, TIMELINE_PREVIEW_CHARS + 1),
+                func.substr(LLMConversationMessage.content_compressed, 1, PREVIEW_COMPRESSED_BYTES, type_=LargeBinary),
+            ).where(
+                LLMConversationMessage.session_id == session_id,
+                LLMConversationMessage.message_hash.in_(last_hashes[start:start + MESSAGE_HASH_BATCH_SIZE]),
+            )
+            previews.update(
+                (message_hash, content if compressed is None
+                 else decompress_payload_prefix(compressed, TIMELINE_PREVIEW_CHARS + 1))
+                for message_hash, content, compressed in self.session.exec(statement).all()
+            )
+        
+        return [
+            LLMInteractionSummary(
+                interaction_id=row.interaction_id,
+                timestamp_us=row.timestamp_us,
+                step_description=f"LLM analysis using {row.model_name}",
+                model_name=row.model_name,
+                duration_ms=row.duration_ms,
+                stage_execution_id=row.stage_execution_id or SESSION_LEVEL_STAGE_ID,
+                provider=row.provider,
+                interaction_type=row.interaction_type,
+                success=row.success,
+                error_message=row.error_message,
+                input_tokens=row.input_tokens,
+                output_tokens=row.output_tokens,
+                total_tokens=row.total_tokens,
+                cached_input_tokens=row.cached_input_tokens,
+                mcp_event_id=row.mcp_event_id,
+                response_preview=self._preview(
+                    previews.get(row.message_hashes[-1]) if row.message_hashes else None
+                ),
+            )
+            for row in rows
+        ]
+    
+    def _mcp_communication_summaries(self, session_id: str) -> List[MCPCommunicationSummary]:
+        """Summaries of a session's MCP communications, with previews cut by the database."""
+        rows = self.session.exec(
+            select(
+                MCPInteraction.communication_id,
+                MCPInteraction.timestamp_us,
+                MCPInteraction.step_description,
+                MCPInteraction.server_name,
+                MCPInteraction.tool_name,
+                MCPInteraction.success,
+                MCPInteraction.duration_ms,
+                MCPInteraction.stage_execution_id,
+                MCPInteraction.communication_type,
+                MCPInteraction.error_message,
+                func.substr(cast(MCPInteraction.tool_arguments, String), 1, TIMELINE_PREVIEW_CHARS + 1),
+                func.substr(cast(MCPInteraction.tool_result, String), 1, TIMELINE_PREVIEW_CHARS + 1),
+                func.substr(MCPInteraction.tool_result_compressed, 1, PREVIEW_COMPRESSED_BYTES, type_=LargeBinary),
+            )
+            .where(MCPInteraction.session_id == session_id)
+            .order_by(asc(MCPInteraction.timestamp_us))
+        ).all()
+        return [
+            MCPCommunicationSummary(
+                communication_id=communication_id,
+                timestamp_us=timestamp_us,
+                step_description=step_description,
+                server_name=server_name,
+                tool_name=tool_name,
+                success=success,
+                duration_ms=duration_ms,
+                stage_execution_id=stage_execution_id or SESSION_LEVEL_STAGE_ID,
+                communication_type=communication_type,
+                error_message=error_message,
+                arguments_preview=self._preview(arguments),
+                result_preview=self._preview(
+                    result if compressed_result is None
+                    else decompress_payload_prefix(compressed_result, TIMELINE_PREVIEW_CHARS + 1)
+                ),
+            )
+            for (
+                communication_id, timestamp_us, step_description, server_name, tool_name, success,
+                duration_ms, stage_execution_id, communication_type, error_message, arguments, result,
+                compressed_result,
+            ) in rows
+        ]
+    
+    def get_session_timeline(self, session_id: str) -> Optional[SessionTimeline]:
+        """
+        Get a session's stages and interaction summaries, without interaction payloads.
+        
+        Every query selects only the columns the timeline shows: conversations,
+        tool payloads, stage outputs and the alert data stay in the database, and
+        the payload of a single interaction is fetched with get_llm_interaction_event
+        or get_mcp_interaction_event.
+        """
+        try:
+            if self.session.bind.dialect.name == 'sqlite':
+                self.session.expire_all()
+            
+            session = self.session.exec(
+                select(
+                    AlertSession.session_id,
+                    AlertSession.alert_type,
+                    AlertSession.agent_type,
+                    AlertSession.status,
+                    AlertSession.author,
+                    AlertSession.runbook_url,
+                    AlertSession.started_at_us,
+                    AlertSession.completed_at_us,
+                    AlertSession.error_message,
+                    AlertSession.pause_metadata,
+                    AlertSession.chain_id,
+                    AlertSession.current_stage_index,
+                    AlertSession.current_stage_id,
+                    AlertSession.mcp_selection,
+                    AlertSession.slack_message_fingerprint,
+                ).where(AlertSession.session_id == session_id)
+            ).first()
+            if not session:
+                return None
+            
+            interactions_by_stage: Dict[str, List[Union[LLMInteractionSummary, MCPCommunicationSummary]]] = (
+                defaultdict(list)
+            )
+            llm_summaries = self._llm_interaction_summaries(session_id)
+            mcp_summaries = self._mcp_communication_summaries(session_id)
+            for summary in [*llm_summaries, *mcp_summaries]:
+                interactions_by_stage[summary.stage_execution_id].append(summary)
+            
+            stage_executions_db = self.get_stage_executions_for_session(session_id, include_output=False)
+            user_messages_map = self._chat_user_messages([
+                stage.chat_user_message_id for stage in stage_executions_db if stage.chat_user_message_id
+            ])
+            
+            def token_sum(summaries: List[Any], field: str, children: List[TimelineStage]) -> Optional[int]:
+                total = sum(getattr(s, field) or 0 for s in summaries if s.type == "llm")
+                total += sum(getattr(child, f"stage_{field}") or 0 for child in children)
+                return total or None
+            
+            def convert_stage(stage_db: StageExecution) -> TimelineStage:
+                interactions = sorted(
+                    interactions_by_stage.get(stage_db.execution_id, []), key=lambda i: i.timestamp_us
+                )
+                children = [convert_stage(child) for child in getattr(stage_db, 'parallel_executions', None) or []]
+                llm_count = sum(1 for i in interactions if i.type == "llm")
+                return TimelineStage(
+                    execution_id=stage_db.execution_id,
+                    session_id=stage_db.session_id,
+                    stage_id=stage_db.stage_id,
+                    stage_index=stage_db.stage_index,
+                    stage_name=stage_db.stage_name,
+                    agent=stage_db.agent,
+                    iteration_strategy=stage_db.iteration_strategy,
+                    status=StageStatus(stage_db.status),
+                    started_at_us=stage_db.started_at_us,
+                    completed_at_us=stage_db.completed_at_us,
+                    duration_ms=stage_db.duration_ms,
+                    error_message=stage_db.error_message,
+                    chat_id=stage_db.chat_id,
+                    chat_user_message_id=stage_db.chat_user_message_id,
+                    chat_user_message=user_messages_map.get(stage_db.chat_user_message_id),
+                    parent_stage_execution_id=stage_db.parent_stage_execution_id,
+                    parallel_index=stage_db.parallel_index,
+                    parallel_type=stage_db.parallel_type,
+                    parallel_executions=children or None,
+                    interactions=interactions,
+                    llm_interaction_count=llm_count,
+                    mcp_communication_count=len(interactions) - llm_count,
+                    total_interactions=len(interactions),
+                    stage_input_tokens=token_sum(interactions, "input_tokens", children),
+                    stage_output_tokens=token_sum(interactions, "output_tokens", children),
+                    stage_total_tokens=token_sum(interactions, "total_tokens", children),
+                )
+            
+            session_level_interactions = sorted(
+                interactions_by_stage.get(SESSION_LEVEL_STAGE_ID, []), key=lambda i: i.timestamp_us
+            )
+            return SessionTimeline(
+                session_id=session.session_id,
+                alert_type=session.alert_type,
+                agent_type=session.agent_type,
+                status=AlertSessionStatus(session.status),
+                author=session.author,
+                runbook_url=session.runbook_url,
+                started_at_us=session.started_at_us,
+                completed_at_us=session.completed_at_us,
+                error_message=session.error_message,
+                pause_metadata=session.pause_metadata,
+                chain_id=session.chain_id,
+                current_stage_index=session.current_stage_index,
+                current_stage_id=session.current_stage_id,
+                mcp_selection=session.mcp_selection,
+                slack_message_fingerprint=session.slack_message_fingerprint,
+                total_interactions=len(llm_summaries) + len(mcp_summaries),
+                llm_interaction_count=len(llm_summaries),
+                mcp_communication_count=len(mcp_summaries),
+                session_input_tokens=token_sum(llm_summaries, "input_tokens", []),
+                session_output_tokens=token_sum(llm_summaries, "output_tokens", []),
+                session_total_tokens=token_sum(llm_summaries, "total_tokens", []),
+                stages=[convert_stage(stage_db) for stage_db in stage_executions_db],
+                session_level_interactions=session_level_interactions,
+            )
+        except Exception as e:
+            logger.error(f"Failed to get session timeline {session_id}: {str(e)}")
+            return None
+    
+    def get_llm_interaction_event(self, session_id: str, interaction_id: str) -> Optional[LLMTimelineEvent]:
+        """Get one LLM interaction of a session with its full conversation, or None if not found."""
+        llm_db = self.session.exec(
+            select(LLMInteraction).where(
+                LLMInteraction.session_id == session_id,
+                LLMInteraction.interaction_id == interaction_id,
+            )
+        ).first()
+        if llm_db is None:
+            return None
+        return self._llm_timeline_event(self._rehydrate_conversations([llm_db])[0])
+    
+    def get_mcp_interaction_event(self, session_id: str, communication_id: str) -> Optional[MCPTimelineEvent]:
+        """Get one MCP communication of a session with its tool payloads, or None if not found."""
+        mcp_db = self.session.exec(
+            select(MCPInteraction).where(
+                MCPInteraction.session_id == session_id,
+                MCPInteraction.communication_id == communication_id,
+            )
+        ).first()
+        if mcp_db is None:
+            return None
+        self._decompress_tool_results([mcp_db])
+        tool_catalogs = self.get_tool_catalogs(list((mcp_db.tool_catalog_hashes or {}).values()))
+        return self._mcp_timeline_event(mcp_db, tool_catalogs)
+
     def get_filter_options(self) -> FilterOptions:
         """
         Get dynamic filter options based on actual data in the database.
@@ -1279,12 +2169,116 @@ class HistoryRepository:
         """
         return self.count_sessions_by_status(AlertSessionStatus.PENDING.value)
     
+    def attach_duplicate_alert(self, fingerprint: str, completed_since_us: int) -> Optional[str]:
+        """
+        Coalesce a re-fired alert into the latest session with the same fingerprint.
+        
+        Matches sessions that are still PENDING, IN_PROGRESS or PAUSED, or that
+        COMPLETED at or after completed_since_us. Failed, cancelled and timed-out
+        sessions never absorb duplicates so the alert gets a fresh investigation.
+        The matched session's duplicate_count is incremented atomically.
+        
+        Args:
+            fingerprint: Deduplication fingerprint of the incoming alert
+            completed_since_us: Oldest completion timestamp still absorbing duplicates
+            
+        Returns:
+            session_id of the session the alert was attached to, None if there is none
+        """
+        try:
+            session_id = self._attach_duplicate_alert(fingerprint, completed_since_us)
+            if session_id is None:
+                return None
+            self.session.commit()
+            return session_id
+        except Exception as e:
+            logger.error(f"Failed to attach duplicate alert {fingerprint}: {str(e)}")
+            self.session.rollback()
+            raise
+    
+    def create_alert_session_unless_duplicate(
+        self,
+        alert_session: AlertSession,
+        completed_since_us: int
+    ) -> Optional[str]:
+        """
+        Create a fingerprinted alert session, or attach the alert to a matching one.
+        
+        The duplicate lookup (see attach_duplicate_alert()) and the insert run
+        in one transaction, serialized per fingerprint: on PostgreSQL by a
+        transaction-level advisory lock on the fingerprint, and on every
+        database by the unique index on the fingerprints of in-flight sessions.
+        An insert that loses a race past the lookup fails on that index and
+        the alert is attached to the session that won, so concurrent re-fires
+        on any pod never start two sessions.
+        
+        Args:
+            alert_session: New PENDING session carrying alert_fingerprint
+            completed_since_us: Oldest completion timestamp still absorbing duplicates
+            
+        Returns:
+            session_id of the created session, or of the session the alert was
+            attached to; None if creation failed
+        """
+        fingerprint = alert_session.alert_fingerprint
+        for attempt in range(2):
+            try:
+                if self.session.bind.dialect.name == 'postgresql':
+                    # Released automatically on commit/rollback
+                    self.session.exec(
+                        text(
+                            "SELECT pg_advisory_xact_lock(CAST(:namespace AS integer), hashtext(:fingerprint))"
+                        ).bindparams(namespace=ALERT_FINGERPRINT_LOCK_NAMESPACE, fingerprint=fingerprint)
+                    )
+                session_id = self._attach_duplicate_alert(fingerprint, completed_since_us)
+                if session_id is None:
+                    # The search document is committed together with the session
+                    self.session.add(alert_session)
+                    self._write_session_search(alert_session)
+                    session_id = alert_session.session_id
+                self.session.commit()
+                return session_id
+            except IntegrityError as e:
+                self.session.rollback()
+                if attempt:
+                    logger.error(f"Failed to create alert session {alert_session.session_id}: {str(e)}")
+                    return None
+                logger.info(f"Concurrent session created for alert fingerprint {fingerprint}, attaching to it")
+            except Exception as e:
+                self.session.rollback()
+                logger.error(f"Failed to create alert session {alert_session.session_id}: {str(e)}")
+                return None
+        return None
+    
+    def _attach_duplicate_alert(self, fingerprint: str, completed_since_us: int) -> Optional[str]:
+        """Increment duplicate_count of the session absorbing the alert (committed by the caller)."""
+        statement = (
+            select(AlertSession.session_id)
+            .where(AlertSession.alert_fingerprint == fingerprint)
+            .where(or_(
+                AlertSession.status.in_(IN_FLIGHT_DEDUP_STATUSES),
+                and_(
+                    AlertSession.status == AlertSessionStatus.COMPLETED.value,
+                    AlertSession.completed_at_us >= completed_since_us
+                )
+            ))
+            .order_by(desc(AlertSession.started_at_us))
+            .limit(1)
+        )
+        session_id = self.session.exec(statement).first()
+        if session_id is not None:
+            self.session.exec(
+                update(AlertSession)
+                .where(AlertSession.session_id == session_id)
+                .values(duplicate_count=AlertSession.duplicate_count + 1)
+            )
+        return session_id
+    
     def claim_next_pending_session(self, pod_id: str) -> Optional[AlertSession]:
         """
         Atomically claim next PENDING session for this pod.
         
-        Uses FOR UPDATE SKIP LOCKED on PostgreSQL for efficient lock-free claiming.
-        Uses status transition on SQLite with retry logic (less efficient but acceptable for dev).
+        Thin wrapper around claim_pending_sessions() with a batch size of one.
         
         Args:
             pod_id: Pod identifier claiming the session
@@ -1292,115 +2286,523 @@ class HistoryRepository:
         Returns:
             Claimed AlertSession if available, None otherwise
         """
-        try:
-            from tarsy.utils.timestamp import now_us
+        claimed = self.claim_pending_sessions(pod_id, limit=1)
+        return claimed[0] if claimed else None
+    
+    def claim_pending_sessions(
+        self,
+        pod_id: str,
+        limit: int,
+        max_active_sessions: Optional[int] = None,
+        queue_config: Optional[QueueConfig] = None
+    ) -> List[AlertSession]:
+        """
+        Atomically claim up to `limit` PENDING sessions for this pod.
+        
+        Sessions are selected by priority (highest first) and, within a priority,
+        by weighted fair share across alert types (see _fair_share_candidates()),
+        oldest first as the final tie-breaker. Alert types at their configured
+        concurrency cap are skipped.
+        
+        Uses a single SELECT ... FOR UPDATE SKIP LOCKED on PostgreSQL so concurrent
+        pods claim disjoint batches without blocking each other. Uses status
+        transition on SQLite (single writer, less efficient but acceptable for dev).
+        All claimed sessions are committed in one transaction.
+        
+        When max_active_sessions is given, a session lease is recorded for every
+        claimed session in the same transaction and the batch is capped so the
+        number of leases never exceeds the global limit. On PostgreSQL the check
+        is serialized across pods with a transaction-scoped advisory lock.
+        
+        Args:
+            pod_id: Pod identifier claiming the sessions
+            limit: Maximum number of sessions to claim
+            max_active_sessions: Global concurrency limit enforced via session leases
+                                 (None disables lease accounting)
+            queue_config: Fair-share weights and per-alert-type caps
+                          (None uses equal weights and no caps)
             
+        Returns:
+            List of claimed AlertSessions (empty if none available)
+        """
+        if limit <= 0:
+            return []
+        
+        try:
             # Detect database dialect
             dialect = self.session.bind.dialect.name
             
+            if max_active_sessions is not None:
+                if dialect == 'postgresql':
+                    # Released automatically on commit/rollback
+                    self.session.exec(
+                        text("SELECT pg_advisory_xact_lock(:key)").bindparams(key=QUEUE_CAPACITY_LOCK_KEY)
+                    )
+                free_slots = max_active_sessions - self.count_active_leases()
+                if free_slots <= 0:
+                    self.session.rollback()
+                    logger.debug(f"Pod {pod_id}: no free global slots ({max_active_sessions} leased)")
+                    return []
+                limit = min(limit, free_slots)
+            
+            statement = select(AlertSession).where(
+                AlertSession.session_id.in_(
+                    self._fair_share_candidates(limit, queue_config or QueueConfig())
+                ),
+                # PostgreSQL rechecks this on the locked row (not the subquery), so a
+                # session another pod claimed since our snapshot is not claimed again
+                AlertSession.status == AlertSessionStatus.PENDING.value,
+            )
+            
             if dialect == 'postgresql':
                 # PostgreSQL: Use FOR UPDATE SKIP LOCKED for efficient claiming
-                statement = (
-                    select(AlertSession)
-                    .where(AlertSession.status == AlertSessionStatus.PENDING.value)
-                    .order_by(asc(AlertSession.started_at_us))
-                    .limit(1)
-                    .with_for_update(skip_locked=True)
-                )
-                
-                session = self.session.exec(statement).first()
-                if session:
-                    # Update session with pod_id and IN_PROGRESS status
-                    session.status = AlertSessionStatus.IN_PROGRESS.value
-                    session.pod_id = pod_id
-                    session.last_interaction_at = now_us()
-                    self.session.add(session)
-                    self.session.commit()
-                    self.session.refresh(session)
-                    logger.debug(f"Pod {pod_id} claimed session {session.session_id} (PostgreSQL)")
-                    return session
-                return None
-                
-            elif dialect == 'sqlite':
-                # SQLite: Status-based claiming with optimistic locking
-                # Find oldest PENDING session
-                statement = (
-                    select(AlertSession)
-                    .where(AlertSession.status == AlertSessionStatus.PENDING.value)
-                    .order_by(asc(AlertSession.started_at_us))
-                    .limit(1)
-                )
-                
-                session = self.session.exec(statement).first()
-                if not session:
-                    return None
-                
-                # Try to claim by updating status
-                # SQLite acquires a write lock on commit; concurrent claims may
-                # fail with a database locked error, handled by the except block
-                try:
+                statement = statement.with_for_update(skip_locked=True)
+            elif dialect != 'sqlite':
+                logger.error(f"Unsupported database dialect for queue: {dialect}")
+                return []
+            
+            sessions = list(self.session.exec(statement).all())
+            if not sessions:
+                return []
+            # Row locking does not preserve the scheduling order; dispatch by priority, then age
+            sessions.sort(key=lambda s: (-s.priority, s.started_at_us))
+            
+            # Try to claim by updating status
+            # SQLite acquires a write lock on commit; concurrent claims may
+            # fail with a database locked error, handled below
+            try:
+                claimed_at = now_us()
+                for session in sessions:
                     session.status = AlertSessionStatus.IN_PROGRESS.value
                     session.pod_id = pod_id
-                    session.last_interaction_at = now_us()
+                    session.last_interaction_at = claimed_at
                     self.session.add(session)
-                    self.session.commit()
+                    if max_active_sessions is not None:
+                        self.session.merge(SessionLease(
+                            session_id=session.session_id,
+                            pod_id=pod_id,
+                            alert_type=session.alert_type,
+                            acquired_at_us=claimed_at
+                        ))
+                self.session.commit()
+                for session in sessions:
                     self.session.refresh(session)
-                    logger.debug(f"Pod {pod_id} claimed session {session.session_id} (SQLite)")
-                    return session
-                except Exception as e:
-                    # Race condition: another pod claimed it first
-                    self.session.rollback()
-                    logger.debug(f"Pod {pod_id} failed to claim session {session.session_id}: {e}")
-                    return None
-            else:
-                logger.error(f"Unsupported database dialect for queue: {dialect}")
-                return None
+            except Exception as e:
+                if dialect == 'postgresql':
+                    raise
+                # Race condition: another pod claimed them first
+                self.session.rollback()
+                logger.debug(f"Pod {pod_id} failed to claim {len(sessions)} session(s): {e}")
+                return []
+            
+            logger.debug(f"Pod {pod_id} claimed {len(sessions)} session(s) ({dialect})")
+            return sessions
                 
         except Exception as e:
-            logger.error(f"Failed to claim next pending session: {str(e)}")
+            logger.error(f"Failed to claim pending sessions: {str(e)}")
             self.session.rollback()
             raise
     
-    def delete_sessions_older_than(self, cutoff_timestamp_us: int) -> int:
+    def _fair_share_candidates(self, limit: int, queue_config: QueueConfig) -> Select:
         """
-        Delete alert sessions older than cutoff timestamp.
+        Build the subquery selecting the next `limit` PENDING session IDs to claim.
         
-        Deletes sessions where started_at_us < cutoff_timestamp_us, regardless of status.
-        Related records (stage_executions, llm_interactions, mcp_communications) are
-        automatically deleted via CASCADE foreign key constraints.
+        Every PENDING session gets a position within its alert type: the sessions
+        of that type already running (session leases) plus its rank among the
+        type's PENDING sessions (priority, then age). Candidates are ordered by
+        priority, then by position / weight - a weighted fair queue where a type
+        with weight 2 gets two slots for every slot of a weight-1 type - then by
+        age. Sessions whose position exceeds their type's max_concurrent are
+        filtered out. The ranking is served by ix_alert_sessions_queue_order.
         
         Args:
-            cutoff_timestamp_us: Cutoff timestamp (microseconds since epoch).
-                                Sessions started before this are deleted.
-        
+            limit: Maximum number of candidates
+            queue_config: Fair-share weights and per-alert-type caps
+            
         Returns:
-            Number of sessions deleted
+            SELECT of candidate session IDs
         """
-        try:
-            # Find sessions to delete
-            statement = select(AlertSession).where(
-                AlertSession.started_at_us < cutoff_timestamp_us
+        weights = queue_config.weights()
+        caps = queue_config.concurrency_caps()
+        
+        running_by_type = (
+            select(SessionLease.alert_type, func.count().label('running'))
+            .group_by(SessionLease.alert_type)
+            .subquery()
+        )
+        type_rank = func.row_number().over(
+            partition_by=AlertSession.alert_type,
+            order_by=(desc(AlertSession.priority), asc(AlertSession.started_at_us))
+        )
+        if weights:
+            type_weight = case(weights, value=AlertSession.alert_type, else_=queue_config.default_weight)
+        else:
+            type_weight = literal(queue_config.default_weight)
+        type_cap = case(caps, value=AlertSession.alert_type, else_=None) if caps else null()
+        
+        ranked = (
+            select(
+                AlertSession.session_id,
+                AlertSession.priority,
+                AlertSession.started_at_us,
+                (func.coalesce(running_by_type.c.running, 0) + type_rank).label('type_position'),
+                cast(type_weight, Float).label('type_weight'),
+                type_cap.label('type_cap')
+            )
+            .outerjoin(running_by_type, running_by_type.c.alert_type == AlertSession.alert_type)
+            .where(AlertSession.status == AlertSessionStatus.PENDING.value)
+            .subquery()
+        )
+        
+        return (
+            select(ranked.c.session_id)
+            .where(or_(ranked.c.type_cap.is_(None), ranked.c.type_position <= ranked.c.type_cap))
+            .order_by(
+                desc(ranked.c.priority),
+                asc(ranked.c.type_position / ranked.c.type_weight),
+                asc(ranked.c.started_at_us)
             )
-            sessions_to_delete = self.session.exec(statement).all()
+            .limit(limit)
+        )
+    
+    def count_active_leases(self) -> int:
+        """
+        Count session leases (globally occupied processing slots) across all pods.
+        
+        Returns:
+            Number of leases currently held
+        """
+        statement = select(func.count()).select_from(SessionLease)
+        return self.session.exec(statement).one()
+    
+    def count_leases_by_pod(self) -> Dict[str, int]:
+        """
+        Count session leases held by each pod.
+        
+        Returns:
+            Pod ID -> number of leases it holds (pods without leases are absent)
+        """
+        statement = select(SessionLease.pod_id, func.count()).group_by(SessionLease.pod_id)
+        return dict(self.session.exec(statement).all())
+    
+    def record_pod_heartbeat(self, pod_id: str, live_since_us: int) -> List[str]:
+        """
+        Refresh a pod's heartbeat and forget pods that stopped refreshing theirs.
+        
+        Args:
+            pod_id: Pod whose heartbeat to refresh
+            live_since_us: Pods whose last heartbeat is older than this are no longer live
             
-            if not sessions_to_delete:
-                return 0
+        Returns:
+            IDs of the live pods, including pod_id
+        """
+        try:
+            self.session.exec(delete(PodHeartbeat).where(PodHeartbeat.last_seen_at_us < live_since_us))
+            self.session.merge(PodHeartbeat(pod_id=pod_id, last_seen_at_us=now_us()))
+            self.session.commit()
+            return list(self.session.exec(select(PodHeartbeat.pod_id)).all())
+        except Exception as e:
+            logger.error(f"Failed to record heartbeat of pod {pod_id}: {str(e)}")
+            self.session.rollback()
+            raise
+    
+    def delete_pod_heartbeat(self, pod_id: str) -> bool:
+        """
+        Delete a pod's heartbeat when it shuts down, so other pods stop counting it.
+        
+        Args:
+            pod_id: Pod whose heartbeat to delete
             
-            # Delete sessions (CASCADE will handle related records)
-            for session in sessions_to_delete:
-                self.session.delete(session)
+        Returns:
+            True if a heartbeat was deleted
+        """
+        try:
+            result = self.session.exec(delete(PodHeartbeat).where(PodHeartbeat.pod_id == pod_id))
+            self.session.commit()
+            return result.rowcount > 0
+        except Exception as e:
+            logger.error(f"Failed to delete heartbeat of pod {pod_id}: {str(e)}")
+            self.session.rollback()
+            raise
+    
+    def release_session_lease(self, session_id: str) -> bool:
+        """
+        Release the processing slot held for a session once it has left IN_PROGRESS.
+        
+        A session that is still IN_PROGRESS keeps its lease (matching how active
+        sessions are counted) until it finishes or is marked orphaned.
+        
+        Args:
+            session_id: Session whose lease should be released
             
+        Returns:
+            True if a lease was deleted, False if none existed or the session is still active
+        """
+        try:
+            still_active = exists().where(
+                AlertSession.session_id == session_id,
+                AlertSession.status == AlertSessionStatus.IN_PROGRESS.value
+            )
+            result = self.session.exec(
+                delete(SessionLease)
+                .where(SessionLease.session_id == session_id)
+                .where(~still_active)
+            )
             self.session.commit()
+            return result.rowcount > 0
+        except Exception as e:
+            logger.error(f"Failed to release session lease for {session_id}: {str(e)}")
+            self.session.rollback()
+            raise
+    
+    def reconcile_session_leases(self) -> Tuple[int, int]:
+        """
+        Bring session leases back in sync with IN_PROGRESS sessions.
+        
+        Removes leases whose session is no longer IN_PROGRESS (finished, failed, or
+        released without the owning pod noticing, e.g. after a crash) and adds
+        leases for IN_PROGRESS sessions that are missing one.
+        
+        Returns:
+            Tuple of (leases removed, leases added)
+        """
+        try:
+            in_progress_ids = (
+                select(AlertSession.session_id)
+                .where(AlertSession.status == AlertSessionStatus.IN_PROGRESS.value)
+            )
+            removed = self.session.exec(
+                delete(SessionLease).where(SessionLease.session_id.not_in(in_progress_ids))
+            ).rowcount
+            
+            missing_statement = (
+                select(AlertSession)
+                .where(AlertSession.status == AlertSessionStatus.IN_PROGRESS.value)
+                .where(AlertSession.session_id.not_in(select(SessionLease.session_id)))
+            )
+            missing_sessions = self.session.exec(missing_statement).all()
+            for session in missing_sessions:
+                self.session.add(SessionLease(
+                    session_id=session.session_id,
+                    pod_id=session.pod_id or "unknown",
+                    alert_type=session.alert_type,
+                    acquired_at_us=session.last_interaction_at or now_us()
+                ))
             
-            deleted_count = len(sessions_to_delete)
-            logger.info(f"Deleted {deleted_count} alert session(s) older than timestamp {cutoff_timestamp_us}")
-            return deleted_count
+            self.session.commit()
+            return removed, len(missing_sessions)
+        except Exception as e:
+            logger.error(f"Failed to reconcile session leases: {str(e)}")
+            self.session.rollback()
+            raise
+    
+    def verify_session_stats(
+        self,
+        started_since_us: Optional[int] = None,
+        repair: bool = True,
+        batch_size: int = 500,
+    ) -> List[str]:
+        """
+        Recompute SessionStats rollups from the source tables and compare.
+        
+        Drift only appears when rows are written without the rollup (e.g. by a
+        pod still running an older release during a rolling upgrade, or by
+        manual SQL), so callers usually check recent sessions only. Sessions
+        still being written are included: a session that looks drifted is
+        checked again with its SessionStats row locked (SELECT ... FOR UPDATE)
+        before it is reported or repaired, so writes committed in between are
+        neither reported as drift nor lost by the repair.
+        
+        Args:
+            started_since_us: Only check sessions started at or after this time (None = all)
+            repair: Overwrite drifted rollups with the recomputed values
+            batch_size: Sessions recomputed per round of queries
             
+        Returns:
+            IDs of sessions whose rollup did not match
+        """
+        try:
+            statement = select(AlertSession.session_id).order_by(AlertSession.session_id)
+            if started_since_us is not None:
+                statement = statement.where(AlertSession.started_at_us >= started_since_us)
+            session_ids = list(self.session.exec(statement).all())
+            
+            drifted: List[str] = []
+            for start in range(0, len(session_ids), batch_size):
+                batch = session_ids[start:start + batch_size]
+                candidates = list(self._find_session_stats_drift(batch))
+                if not candidates:
+                    continue
+                # Start a new transaction so the recheck sees writes committed since the first read
+                self.session.commit()
+                # Every candidate gets a row to lock, writers adding to it then wait for the repair
+                self._insert_ignoring_conflicts(
+                    SessionStats, [self._empty_session_stats(session_id) for session_id in candidates]
+                )
+                for session_id, (current, actual, expected) in self._find_session_stats_drift(
+                    candidates, lock=True
+                ).items():
+                    drifted.append(session_id)
+                    logger.warning(f"Session stats drift for {session_id}: stored {actual}, expected {expected}")
+                    if repair:
+                        for name, value in expected.items():
+                            setattr(current, name, value)
+                if repair:
+                    self.session.commit()
+                else:
+                    self.session.rollback()
+            return drifted
         except Exception as e:
-            logger.error(f"Failed to delete old sessions: {str(e)}")
+            logger.error(f"Failed to verify session stats: {str(e)}")
             self.session.rollback()
             raise
     
+    def _find_session_stats_drift(
+        self, session_ids: List[str], lock: bool = False
+    ) -> Dict[str, Tuple[Optional[SessionStats], Dict[str, Any], Dict[str, Any]]]:
+        """
+        Compare stored SessionStats rows with the source tables.
+        
+        Args:
+            session_ids: Sessions to compare
+            lock: Lock the stored rows before recomputing, so no writer can change them until commit
+            
+        Returns:
+            Session ID -> (stored row, stored values, recomputed values) for sessions that differ
+        """
+        statement = select(SessionStats).where(SessionStats.session_id.in_(session_ids))
+        if lock:
+            statement = statement.with_for_update().execution_options(populate_existing=True)
+        stored = {stats.session_id: stats for stats in self.session.exec(statement).all()}
+        expected = self._compute_session_stats(session_ids)
+        drift = {}
+        for session_id in session_ids:
+            current = stored.get(session_id)
+            actual = current.model_dump() if current else self._empty_session_stats(session_id)
+            if actual != expected[session_id]:
+                drift[session_id] = (current, actual, expected[session_id])
+        return drift
+    
+    def _compute_session_stats(self, session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Aggregate the source tables into SessionStats values for the given sessions."""
+        stats = {session_id: self._empty_session_stats(session_id) for session_id in session_ids}
+        
+        for row in self.session.exec(
+            select(
+                LLMInteraction.session_id,
+                func.count(LLMInteraction.interaction_id).label('count'),
+                func.sum(LLMInteraction.input_tokens).label('input_tokens'),
+                func.sum(LLMInteraction.output_tokens).label('output_tokens'),
+                func.sum(LLMInteraction.total_tokens).label('total_tokens'),
+            ).where(LLMInteraction.session_id.in_(session_ids)).group_by(LLMInteraction.session_id)
+        ).all():
+            stats[row.session_id].update(
+                llm_interaction_count=row.count,
+                input_tokens=row.input_tokens,
+                output_tokens=row.output_tokens,
+                total_tokens=row.total_tokens,
+            )
+        
+        for row in self.session.exec(
+            select(MCPInteraction.session_id, func.count(MCPInteraction.communication_id).label('count'))
+            .where(MCPInteraction.session_id.in_(session_ids)).group_by(MCPInteraction.session_id)
+        ).all():
+            stats[row.session_id]["mcp_communication_count"] = row.count
+        
+        for row in self.session.exec(
+            select(Chat.session_id, func.count(ChatUserMessage.message_id).label('count'))
+            .join(ChatUserMessage, ChatUserMessage.chat_id == Chat.chat_id)
+            .where(Chat.session_id.in_(session_ids)).group_by(Chat.session_id)
+        ).all():
+            stats[row.session_id]["chat_message_count"] = row.count
+        
+        for session_id in self.session.exec(
+            select(StageExecution.session_id).where(
+                StageExecution.session_id.in_(session_ids),
+                or_(
+                    StageExecution.parallel_type != ParallelType.SINGLE.value,
+                    StageExecution.parent_stage_execution_id.is_not(None)
+                )
+            ).distinct()
+        ).all():
+            stats[session_id]["has_parallel_stages"] = True
+        
+        return stats
+    
+    def delete_sessions_older_than(
+        self,
+        cutoff_timestamp_us: int,
+        batch_size: int = RETENTION_BATCH_SIZE,
+        batch_pause_seconds: float = 0.0,
+    ) -> int:
+        """
+        Delete alert sessions older than cutoff timestamp, in bounded batches.
+        
+        Deletes sessions where started_at_us < cutoff_timestamp_us, regardless of status,
+        oldest first. Each batch is one set-based DELETE of at most batch_size sessions
+        in its own transaction, so a retention backlog never loads sessions into memory
+        or holds one long transaction that blocks writers. Related records
+        (stage_executions, llm_interactions, mcp_communications, ...) are deleted via
+        CASCADE foreign key constraints; chats of the sessions are deleted first.
+        
+        Args:
+            cutoff_timestamp_us: Cutoff timestamp (microseconds since epoch).
+                                Sessions started before this are deleted.
+            batch_size: Sessions deleted per transaction
+            batch_pause_seconds: Pause between batches, giving writers the tables
+        
+        Returns:
+            Number of sessions deleted
+            
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got: {batch_size}")
+        expired_batch = (
+            select(AlertSession.session_id)
+            .where(AlertSession.started_at_us < cutoff_timestamp_us)
+            .order_by(AlertSession.started_at_us, AlertSession.session_id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        deleted_count = 0
+        batches = 0
+        started = time.monotonic()
+        while True:
+            try:
+                # Chats reference sessions without CASCADE (their user messages cascade from them)
+                self.session.exec(delete(Chat).where(Chat.session_id.in_(expired_batch)))
+                deleted = self.session.exec(
+                    delete(AlertSession).where(AlertSession.session_id.in_(expired_batch))
+                ).rowcount
+                self.session.commit()
+            except Exception as e:
+                logger.error(
+                    f"Failed to delete old sessions after deleting {deleted_count}: {str(e)}"
+                )
+                self.session.rollback()
+                raise
+            
+            deleted_count += deleted
+            batches += 1
+            if deleted < batch_size:
+                break
+            elapsed = time.monotonic() - started
+            logger.info(
+                f"Retention cleanup progress: {deleted_count} session(s) deleted in {batches} batch(es), "
+                f"{elapsed:.1f}s ({deleted_count / max(elapsed, 0.001):.0f} sessions/s)"
+            )
+            if batch_pause_seconds > 0:
+                time.sleep(batch_pause_seconds)
+        
+        if deleted_count:
+            logger.info(
+                f"Deleted {deleted_count} alert session(s) older than timestamp {cutoff_timestamp_us} "
+                f"in {batches} batch(es), {time.monotonic() - started:.1f}s"
+            )
+        return deleted_count
+    
     # ===== CHAT OPERATIONS =====
     
     def create_chat(self, chat: Chat) -> Optional[Chat]:
@@ -1448,6 +2850,11 @@ class HistoryRepository:
     def create_chat_user_message(self, message: ChatUserMessage) -> Optional[ChatUserMessage]:
         """Create new chat user message."""
         try:
+            session_id = self.session.exec(select(Chat.session_id).where(Chat.chat_id == message.chat_id)).first()
+            if session_id:
+                self._add_session_stats([
+                    {**self._empty_session_stats(session_id), "chat_message_count": 1}
+                ])
             self.session.add(message)
             self.session.commit()
             self.session.refresh(message)
@@ -1563,6 +2970,10 @@ class HistoryRepository:
         try:
             # Build base conditions
             base_conditions = [LLMInteraction.session_id == session_id]
+            has_conversation = or_(
+                LLMInteraction.message_hashes.isnot(None),
+                LLMInteraction.conversation.isnot(None)
+            )
             
             # If chat_id is provided, filter to only chat stage interactions
             if chat_id:
@@ -1590,23 +3001,24 @@ class HistoryRepository:
                     and_(
                         *base_conditions,
                         LLMInteraction.interaction_type == LLMInteractionType.FINAL_ANALYSIS.value,
-                        LLMInteraction.conversation.isnot(None)
+                        has_conversation
                     )
                 ).order_by(desc(LLMInteraction.timestamp_us)).limit(1)
                 
                 result = self.session.exec(statement).first()
                 if result:
-                    return result
+                    return self._rehydrate_conversations([result])[0]
             
             # Fall back to the last LLM interaction by timestamp
             statement = select(LLMInteraction).where(
                 and_(
                     *base_conditions,
-                    LLMInteraction.conversation.isnot(None)
+                    has_conversation
                 )
             ).order_by(desc(LLMInteraction.timestamp_us)).limit(1)
             
-            return self.session.exec(statement).first()
+            result = self.session.exec(statement).first()
+            return self._rehydrate_conversations([result])[0] if result else None
             
         except Exception as e:
             logger.error(f"Failed to get last LLM interaction for session {session_id}: {str(e)}")
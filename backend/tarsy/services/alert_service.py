@@ -92,15 +92,18 @@ class AlertService:
             configured_servers=self.parsed_config.mcp_servers
         )
         
-        # Initialize services that depend on registries
-        # Note: This health check client is ONLY for health monitoring, never for alert processing
-        self.health_check_mcp_client = MCPClient(settings, self.mcp_server_registry)
-        self.llm_manager = LLMManager(settings)
-        
         # Initialize MCP client factory for creating per-session clients
         from tarsy.services.mcp_client_factory import MCPClientFactory
         self.mcp_client_factory = MCPClientFactory(settings, self.mcp_server_registry)
         
+        # Initialize services that depend on registries
+        # Note: This health check client is ONLY for health monitoring, never for alert processing.
+        # It shares the tool catalog so health checks keep the session clients' cache warm.
+        self.health_check_mcp_client = MCPClient(
+            settings, self.mcp_server_registry, tool_catalog=self.mcp_client_factory.tool_catalog
+        )
+        self.llm_manager = LLMManager(settings)
+        
         # Initialize manager classes for modular architecture
         self.stage_manager = StageExecutionManager(history_service=self.history_service)
         self.session_manager = SessionManager(history_service=self.history_service)
@@ -1903,6 +1906,12 @@ class AlertService:
                 if asyncio.iscoroutine(result):
                     await result
 
+            # Safely close pooled MCP connections shared by session-scoped clients
+            if hasattr(self.mcp_client_factory, 'close'):
+                result = self.mcp_client_factory.close()
+                if asyncio.iscoroutine(result):
+                    await result
+
             # Safely close Slack service (handle both sync and async close methods)
             if hasattr(self.slack_service, 'close'):
                 result = self.slack_service.close()
@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 # Type alias for async event callbacks
 AsyncCallback = Callable[[dict], Awaitable[None]]
 
+# NOTIFY stand-in for an event too large to notify: {"type": EVENT_REFERENCE_TYPE, "id": 42};
+# listeners read the event row by id instead
+EVENT_REFERENCE_TYPE = "event.reference"
+
 
 class EventListener(ABC):
     """Abstract base class for event listener implementations."""
@@ -0,0 +1,195 @@
+"""Batched event publishing: one transaction and one NOTIFY per channel per batch."""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import suppress
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tarsy.models.event_models import BaseEvent
+from tarsy.repositories.event_repository import EventRepository
+from tarsy.services.events.base import EVENT_REFERENCE_TYPE
+from tarsy.services.events.publisher import build_notify_statement
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+
+def split_notify_payloads(events: List[dict]) -> Tuple[List[str], int]:
+    """
+    Pack a channel's events into as few NOTIFY payloads as fit the size limit.
+
+    A payload is a single event object or, for several events, a JSON array in
+    event ID order (PostgreSQLEventListener accepts both). An event too large
+    to notify is replaced by a reference to its row, which listeners fetch.
+
+    Args:
+        events: Event payloads (including their "id") in ID order
+
+    Returns:
+        Tuple of (payloads, number of events sent as references)
+    """
+    payloads: List[str] = []
+    group: List[str] = []
+    group_size = 2  # Enclosing brackets
+    oversized = 0
+
+    def close_group() -> None:
+        if group:
+            payloads.append(group[0] if len(group) == 1 else f"[{','.join(group)}]")
+
+    for event in events:
+        event_json = json.dumps(event)
+        if len(event_json.encode()) + 2 > NOTIFY_PAYLOAD_LIMIT:
+            event_json = json.dumps({"type": EVENT_REFERENCE_TYPE, "id": event["id"]})
+            oversized += 1
+        size = len(event_json.encode()) + 1
+        if group and group_size + size > NOTIFY_PAYLOAD_LIMIT:
+            close_group()
+            group, group_size = [], 2
+        group.append(event_json)
+        group_size += size
+    close_group()
+    return payloads, oversized
+
+
+class EventBatchPublisher:
+    """
+    Publishes events through an in-process queue drained by a background flusher.
+
+    The flusher lingers up to `max_latency_ms` after the first queued event to
+    collect a batch, then persists it with one multi-row INSERT and broadcasts
+    it with one NOTIFY per channel (PostgreSQL) in a single transaction. A
+    single flusher writes batches in submission order, so event IDs keep the
+    order events were published in, which catchup relies on. When
+    `max_pending` events are queued, submit() waits (backpressure).
+    """
+
+    def __init__(
+        self,
+        db_session_factory: Callable,
+        max_latency_ms: int = 20,
+        max_batch_size: int = 200,
+        max_pending: int = 10000,
+    ) -> None:
+        """
+        Initialize batch publisher.
+
+        Args:
+            db_session_factory: Factory for async database sessions
+            max_latency_ms: How long the flusher waits to fill a batch (milliseconds)
+            max_batch_size: Maximum events written per batch
+            max_pending: Maximum queued events before submit() waits
+        """
+        self.db_session_factory = db_session_factory
+        self.max_latency_ms = max_latency_ms
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.running = False
+        self.batches_written = 0
+        self.events_written = 0
+        self.events_dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background flusher."""
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._flusher = asyncio.create_task(self._flush_loop(), name="event-batch-flusher")
+        self.running = True
+        logger.info(
+            f"Event batch publisher started (max latency {self.max_latency_ms}ms, "
+            f"batch size {self.max_batch_size})"
+        )
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop accepting events, write what is queued and stop the flusher.
+
+        Args:
+            timeout: Maximum time to wait for queued events to be written (seconds)
+        """
+        if not self.running:
+            return
+        self.running = False
+        try:
+            await asyncio.wait_for(self.flush(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Timed out writing queued events on shutdown, {self._queue.qsize()} event(s) dropped"
+            )
+        if self._flusher:
+            self._flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flusher
+        logger.info("Event batch publisher stopped")
+
+    async def submit(self, channel: str, event: BaseEvent) -> None:
+        """
+        Queue event for publishing; waits while the queue is full.
+
+        Args:
+            channel: Channel name (e.g., 'sessions', 'session:abc-123')
+            event: Pydantic event model
+
+        Raises:
+            RuntimeError: If the publisher is not running
+        """
+        if not self.running:
+            raise RuntimeError("Event batch publisher is not running")
+        # Serialize now so later mutations of the model don't leak into the event
+        await self._queue.put((channel, event.model_dump()))
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _flush_loop(self) -> None:
+        """Background task: collect batches and write them in order."""
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() < self.max_batch_size - 1:
+                # Linger so a burst of events (e.g. one ReAct iteration) shares a batch
+                await asyncio.sleep(self.max_latency_ms / 1000)
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                self.events_dropped += len(batch)
+                logger.error(f"Failed to publish batch of {len(batch)} event(s): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write_batch(self, batch: List[Tuple[str, dict]]) -> None:
+        """Persist a batch with one INSERT and broadcast it with one NOTIFY per channel."""
+        async with self.db_session_factory() as session:
+            event_repo = EventRepository(session)
+            event_ids = await event_repo.create_events(batch)
+
+            if session.bind.dialect.name == "postgresql":
+                by_channel: Dict[str, List[dict]] = defaultdict(list)
+                for (channel, payload), event_id in zip(batch, event_ids, strict=True):
+                    by_channel[channel].append({**payload, "id": event_id})
+                for channel, events in by_channel.items():
+                    payloads, oversized = split_notify_payloads(events)
+                    if oversized:
+                        logger.debug(
+                            f"{oversized} event(s) on '{channel}' exceed the NOTIFY size limit; "
+                            "notified by reference"
+                        )
+                    for payload_json in payloads:
+                        await session.execute(build_notify_statement(channel, payload_json))
+            # SQLite: Polling handles delivery (see SQLiteEventListener)
+
+            # Commit transaction (event rows + NOTIFYs if PostgreSQL)
+            await session.commit()
+
+        self.batches_written += 1
+        self.events_written += len(batch)
+        logger.debug(f"Published batch of {len(batch)} event(s) (ids {event_ids[0]}-{event_ids[-1]})")
@@ -20,6 +20,14 @@ class EventChannel:
     Consumers: All backend pods (for cross-pod cancellation coordination)
     """
 
+    QUEUE = "queue"
+    """
+    Backend-only channel for alert queue notifications.
+
+    Events: session.enqueued
+    Consumers: SessionClaimWorker on all backend pods (wakes up claiming)
+    """
+
     @staticmethod
     def session_details(session_id: str) -> str:
         """
@@ -19,6 +19,10 @@ class EventCleanupService:
     Runs as background task on each pod (idempotent - multiple pods
     running cleanup simultaneously is safe).
     Uses EventRepository for type-safe database operations.
+
+    When the events table is partitioned (PostgreSQL), each run creates the
+    hourly partitions of the coming hours and detaches and drops the expired
+    ones instead of deleting rows.
     """
 
     def __init__(
@@ -91,12 +95,15 @@ class EventCleanupService:
 
                 # Calculate cutoff time (use UTC for consistency)
                 # Remove timezone info to match database column (TIMESTAMP WITHOUT TIME ZONE)
-                cutoff_time = (datetime.now(timezone.utc) - timedelta(
-                    hours=self.retention_hours
-                )).replace(tzinfo=None)
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+                cutoff_time = now - timedelta(hours=self.retention_hours)
 
-                # Delete old events using repository (type-safe)
-                deleted_count = await event_repo.delete_events_before(cutoff_time)
+                connection = await session.connection()
+                if connection.dialect.name == "postgresql" and await event_repo.is_partitioned():
+                    deleted_count = await self._rotate_partitions(event_repo, now, cutoff_time)
+                else:
+                    # Delete old events using repository (type-safe)
+                    deleted_count = await event_repo.delete_events_before(cutoff_time)
 
                 await session.commit()
 
@@ -112,3 +119,24 @@ class EventCleanupService:
             logger.error(f"Failed to cleanup old events: {e}", exc_info=True)
             raise
 
+    async def _rotate_partitions(
+        self, event_repo: EventRepository, now: datetime, cutoff_time: datetime
+    ) -> int:
+        """
+        Create upcoming event partitions and drop expired ones.
+
+        Partitions are created for the next two cleanup intervals (at least a
+        day), so inserts keep landing in hourly partitions if a run is missed.
+
+        Returns:
+            Number of expired events removed from the default partition
+        """
+        ahead = timedelta(hours=max(24, 2 * self.cleanup_interval_hours))
+        created = await event_repo.create_event_partitions(now, now + ahead)
+        dropped = await event_repo.drop_event_partitions_before(cutoff_time)
+        if created or dropped:
+            logger.info(
+                f"Rotated event partitions: created {len(created)}, dropped {len(dropped)} "
+                f"(older than {self.retention_hours} hours)"
+            )
+        return await event_repo.delete_default_partition_events_before(cutoff_time)
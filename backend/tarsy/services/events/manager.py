@@ -3,8 +3,10 @@
 from typing import Callable, Optional
 
 from tarsy.services.events.base import EventListener
+from tarsy.services.events.batch_publisher import EventBatchPublisher
 from tarsy.services.events.cleanup import EventCleanupService
 from tarsy.services.events.factory import create_event_listener
+from tarsy.services.events.stream_transport import StreamingTransport
 from tarsy.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +26,12 @@ class EventSystemManager:
         db_session_factory: Callable,
         event_retention_hours: int = 24,
         event_cleanup_interval_hours: int = 6,
+        publish_batching_enabled: bool = True,
+        publish_max_latency_ms: int = 20,
+        publish_max_batch_size: int = 200,
+        publish_max_pending: int = 10000,
+        llm_streaming_enabled: bool = True,
+        llm_streaming_coalesce_ms: int = 50,
     ):
         """
         Initialize event system manager.
@@ -33,14 +41,28 @@ class EventSystemManager:
             db_session_factory: Factory for database sessions
             event_retention_hours: Event retention period (hours)
             event_cleanup_interval_hours: Cleanup interval (hours)
+            publish_batching_enabled: Publish helper events through EventBatchPublisher
+            publish_max_latency_ms: How long a batch collects events (milliseconds)
+            publish_max_batch_size: Maximum events written per batch
+            publish_max_pending: Queued events before publishers wait (backpressure)
+            llm_streaming_enabled: Deliver LLM stream chunks through StreamingTransport (PostgreSQL only)
+            llm_streaming_coalesce_ms: How long LLM stream snapshots are coalesced (milliseconds)
         """
         self.database_url = database_url
         self.db_session_factory = db_session_factory
         self.event_retention_hours = event_retention_hours
         self.event_cleanup_interval_hours = event_cleanup_interval_hours
+        self.publish_batching_enabled = publish_batching_enabled
+        self.publish_max_latency_ms = publish_max_latency_ms
+        self.publish_max_batch_size = publish_max_batch_size
+        self.publish_max_pending = publish_max_pending
+        self.llm_streaming_enabled = llm_streaming_enabled
+        self.llm_streaming_coalesce_ms = llm_streaming_coalesce_ms
 
         self.event_listener: Optional[EventListener] = None
         self.cleanup_service: Optional[EventCleanupService] = None
+        self.batch_publisher: Optional[EventBatchPublisher] = None
+        self.streaming_transport: Optional[StreamingTransport] = None
         self._channel_handlers: dict[str, Callable] = {}
 
     async def start(self) -> None:
@@ -59,12 +81,39 @@ class EventSystemManager:
         )
         await self.cleanup_service.start()
 
+        # 3. Start batched publishing for event helpers
+        if self.publish_batching_enabled:
+            self.batch_publisher = EventBatchPublisher(
+                db_session_factory=self.db_session_factory,
+                max_latency_ms=self.publish_max_latency_ms,
+                max_batch_size=self.publish_max_batch_size,
+                max_pending=self.publish_max_pending,
+            )
+            await self.batch_publisher.start()
+
+        # 4. Start delta-encoded LLM stream delivery (NOTIFY requires PostgreSQL)
+        if self.llm_streaming_enabled and self.database_url.startswith("postgresql://"):
+            self.streaming_transport = StreamingTransport(
+                database_url=self.database_url,
+                coalesce_ms=self.llm_streaming_coalesce_ms,
+            )
+            await self.streaming_transport.start()
+
         logger.info("Event system started successfully")
 
     async def stop(self) -> None:
         """Stop event system gracefully."""
         logger.info("Stopping event system...")
 
+        if self.streaming_transport:
+            await self.streaming_transport.stop()
+            self.streaming_transport = None
+
+        # Write queued events before the listener goes away
+        if self.batch_publisher:
+            await self.batch_publisher.stop()
+            self.batch_publisher = None
+
         if self.cleanup_service:
             await self.cleanup_service.stop()
 
@@ -126,6 +175,38 @@ def get_event_system() -> EventSystemManager:
     return _event_system
 
 
+def get_event_batch_publisher() -> Optional[EventBatchPublisher]:
+    """
+    Get the running batch publisher of the global event system.
+
+    Returns:
+        EventBatchPublisher, or None if the event system is not started or
+        publishes without batching
+    """
+    if _event_system is None:
+        return None
+    batch_publisher = _event_system.batch_publisher
+    if batch_publisher is None or not batch_publisher.running:
+        return None
+    return batch_publisher
+
+
+def get_streaming_transport() -> Optional[StreamingTransport]:
+    """
+    Get the running LLM streaming transport of the global event system.
+
+    Returns:
+        StreamingTransport, or None if the event system is not started,
+        streaming is disabled or the database is not PostgreSQL
+    """
+    if _event_system is None:
+        return None
+    streaming_transport = _event_system.streaming_transport
+    if streaming_transport is None or not streaming_transport.running:
+        return None
+    return streaming_transport
+
+
 def set_event_system(manager: EventSystemManager) -> None:
     """
     Set global event system manager (called during startup).
@@ -3,11 +3,11 @@
 import asyncio
 import json
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
 
 import asyncpg
 
-from .base import EventListener
+from .base import EVENT_REFERENCE_TYPE, EventListener
 
 logger = logging.getLogger(__name__)
 
@@ -16,13 +16,20 @@ class PostgreSQLEventListener(EventListener):
     """
     PostgreSQL LISTEN/NOTIFY event listener.
 
-    Maintains dedicated connection for real-time notifications.
+    Maintains dedicated connection for real-time notifications. Events sent
+    by reference (too large for NOTIFY) are read from the events table on the
+    same connection; a channel's notifications are dispatched in the order
+    they arrived even while such a read is pending.
     """
 
     def __init__(self, database_url: str):
         super().__init__()
         self.database_url = database_url
         self.listener_conn: Optional[asyncpg.Connection] = None
+        # Serializes queries on the listener connection
+        self._query_lock = asyncio.Lock()
+        # channel -> latest dispatch task (the next one waits for it)
+        self._dispatches: Dict[str, asyncio.Task] = {}
 
     async def start(self) -> None:
         """Create dedicated connection for LISTEN."""
@@ -95,12 +102,57 @@ class PostgreSQLEventListener(EventListener):
         """
         try:
             event = json.loads(payload)
-            logger.debug(f"Received event on {channel}: {event.get('type', 'unknown')}")
 
-            # Dispatch to callbacks (async)
-            asyncio.create_task(self._dispatch_to_callbacks(channel, event))
+            if isinstance(event, list):
+                # Batched NOTIFY (EventBatchPublisher): events in ID order
+                logger.debug(f"Received {len(event)} batched event(s) on {channel}")
+                events = event
+            else:
+                logger.debug(f"Received event on {channel}: {event.get('type', 'unknown')}")
+                events = [event]
+
+            # Dispatch to callbacks (async), after the channel's previous notification
+            previous = self._dispatches.get(channel)
+            task = asyncio.create_task(self._dispatch_batch(channel, events, previous))
+            self._dispatches[channel] = task
+            task.add_done_callback(lambda done: self._forget_dispatch(channel, done))
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in notification: {e}")
         except Exception as e:
             logger.error(f"Error handling notification: {e}", exc_info=True)
 
+    def _forget_dispatch(self, channel: str, task: asyncio.Task) -> None:
+        if self._dispatches.get(channel) is task:
+            del self._dispatches[channel]
+
+    async def _dispatch_batch(
+        self, channel: str, events: list, previous: Optional[asyncio.Task] = None
+    ) -> None:
+        """Dispatch events to callbacks one after another, preserving order."""
+        if any(event.get("type") == EVENT_REFERENCE_TYPE for event in events):
+            events = await self._resolve_references(events)
+        if previous is not None:
+            await asyncio.wait([previous])
+        for event in events:
+            await self._dispatch_to_callbacks(channel, event)
+
+    async def _resolve_references(self, events: list) -> List[dict]:
+        """Replace events sent by reference with their rows from the events table."""
+        resolved = []
+        for event in events:
+            if event.get("type") != EVENT_REFERENCE_TYPE:
+                resolved.append(event)
+                continue
+            try:
+                async with self._query_lock:
+                    payload = await self.listener_conn.fetchval(
+                        "SELECT payload FROM events WHERE id = $1", event["id"]
+                    )
+            except Exception as e:
+                logger.error(f"Failed to read referenced event {event['id']}: {e}")
+                continue
+            if payload is None:
+                logger.warning(f"Referenced event {event['id']} no longer exists")
+                continue
+            resolved.append({**json.loads(payload), "id": event["id"]})
+        return resolved
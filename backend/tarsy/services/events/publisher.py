@@ -3,7 +3,7 @@
 import json
 import logging
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tarsy.models.event_models import BaseEvent
@@ -12,6 +12,27 @@ from tarsy.repositories.event_repository import EventRepository
 logger = logging.getLogger(__name__)
 
 
+def build_notify_statement(channel: str, payload_json: str) -> TextClause:
+    """
+    Build a PostgreSQL NOTIFY statement.
+
+    NOTIFY is database-specific, no ORM abstraction exists, and it does not
+    support bind parameters, so both parts are escaped:
+    1. Channel: Quote as identifier and escape internal double quotes (SQL identifier rules)
+    2. Payload: Escape single quotes for string literal
+
+    Args:
+        channel: Channel name
+        payload_json: Serialized notification payload
+
+    Returns:
+        Executable NOTIFY statement
+    """
+    channel_escaped = channel.replace('"', '""')
+    payload_escaped = payload_json.replace("'", "''")
+    return text(f'''NOTIFY "{channel_escaped}", '{payload_escaped}' ''')
+
+
 class EventPublisher:
     """
     Publishes events to database and broadcasts via NOTIFY.
@@ -73,15 +94,9 @@ class EventPublisher:
             notify_payload = {**event_dict, "id": db_event.id}
             notify_payload_json = json.dumps(notify_payload)
 
-            # NOTIFY is database-specific, no ORM abstraction exists
-            # Using text() is the standard SQLAlchemy approach
-            # Security: Properly escape both channel identifier and payload
-            # 1. Channel: Quote as identifier and escape internal double quotes (SQL identifier rules)
-            # 2. Payload: Escape single quotes for string literal (NOTIFY doesn't support parameters)
-            channel_escaped = channel.replace('"', '""')
-            payload_escaped = notify_payload_json.replace("'", "''")
-            notify_sql = text(f'''NOTIFY "{channel_escaped}", '{payload_escaped}' ''')
-            await self.event_repo.session.execute(notify_sql)
+            await self.event_repo.session.execute(
+                build_notify_statement(channel, notify_payload_json)
+            )
             # Note: No try/except - NOTIFY failures on PostgreSQL are real errors
         else:
             # SQLite: Polling handles delivery (see SQLiteEventListener)
@@ -112,11 +127,9 @@ class EventPublisher:
         
         if db_dialect == "postgresql":
             # Direct NOTIFY without INSERT
-            notify_payload_json = json.dumps(event_dict)
-            channel_escaped = channel.replace('"', '""')
-            payload_escaped = notify_payload_json.replace("'", "''")
-            notify_sql = text(f'''NOTIFY "{channel_escaped}", '{payload_escaped}' ''')
-            await self.event_repo.session.execute(notify_sql)
+            await self.event_repo.session.execute(
+                build_notify_statement(channel, json.dumps(event_dict))
+            )
             await self.event_repo.session.commit()
             logger.debug(f"Published transient event to '{channel}': {event.type}")
         else:
@@ -0,0 +1,357 @@
+"""
+Delta-encoded LLM stream delivery over a dedicated asyncpg connection.
+
+LLM clients publish snapshots (the accumulated content of a stream) at a high
+rate. Instead of one SQLAlchemy session and one NOTIFY carrying the full
+content per snapshot, StreamingTransport:
+
+- Coalesces snapshots per stream on a time budget, so only the latest
+  snapshot of each stream is encoded per flush
+- Sends deltas: `chunk` holds the content from `offset` on and clients keep
+  `content[:offset] + chunk`. Offsets count UTF-16 code units, the unit of
+  JavaScript string indices, so they stay valid around non-BMP characters
+  such as emoji. `seq` numbers the messages of a stream and
+  `base_seq` names the message a delta applies on top of, so clients can
+  detect a gap and wait for the next keyframe (offset 0)
+- Sends a keyframe every `keyframe_interval` messages, on completion and
+  after a delivery failure
+- Splits messages that would exceed PostgreSQL's NOTIFY payload limit into
+  consecutive messages of the same stream
+- Sends every flush through one long-lived connection with a single
+  executemany of `pg_notify($1, $2)` (parameterized, no quoting)
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import asyncpg
+
+from tarsy.models.event_models import LLMStreamChunkEvent
+from tarsy.services.events.batch_publisher import NOTIFY_PAYLOAD_LIMIT
+from tarsy.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+NOTIFY_SQL = "SELECT pg_notify($1, $2)"
+
+# Seconds to wait before reconnecting after a connection failure
+RECONNECT_DELAY_SECONDS = 5.0
+
+# Seconds to wait before resending streams after a failed send (at least)
+RESYNC_DELAY_SECONDS = 1.0
+
+# Streams that see no snapshot for this long (e.g. the LLM call failed before
+# completing) are forgotten
+IDLE_STREAM_TTL_SECONDS = 600.0
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Length of the longest common prefix of two strings."""
+    limit = min(len(a), len(b))
+    if b.startswith(a[:limit]):
+        return limit
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _utf16_length(text: str) -> int:
+    """Length of text in UTF-16 code units (JavaScript string length)."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _utf16_prefix(text: str, units: int) -> str:
+    """First `units` UTF-16 code units of text."""
+    return text.encode("utf-16-le")[:units * 2].decode("utf-16-le")
+
+
+def _json_length(text: str) -> int:
+    """Bytes `text` takes as a JSON string (without the quotes)."""
+    return len(json.dumps(text)) - 2
+
+
+def split_for_payload(text: str, budget: int) -> List[str]:
+    """
+    Split text into pieces whose JSON encoding fits in `budget` bytes.
+
+    Args:
+        text: Text to split (may be empty)
+        budget: Maximum JSON-encoded size of each piece (bytes)
+
+    Returns:
+        Pieces in order; a single empty piece for empty text
+    """
+    if _json_length(text) <= budget:
+        return [text]
+    pieces: List[str] = []
+    while text:
+        size = min(len(text), budget)
+        encoded = _json_length(text[:size])
+        while encoded > budget:
+            # Escaped characters take up to 12 bytes; shrink proportionally
+            size = max(1, min(size - 1, size * budget // encoded))
+            encoded = _json_length(text[:size])
+        pieces.append(text[:size])
+        text = text[size:]
+    return pieces
+
+
+def merge_stream_chunks(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combine two consecutive messages of one stream into one.
+
+    Used when a queued message is superseded before delivery. The result
+    applies on top of whatever `older` applied on top of.
+
+    Args:
+        older: Earlier llm.stream.chunk event
+        newer: Later llm.stream.chunk event of the same stream
+
+    Returns:
+        Event equivalent to applying `older` then `newer`
+    """
+    newer_offset = newer.get("offset")
+    if not newer_offset:
+        # Full content (snapshot or keyframe) supersedes anything before it
+        return newer
+    older_offset = older.get("offset") or 0
+    merged = dict(newer)
+    if newer_offset >= older_offset:
+        merged["offset"] = older_offset
+        merged["chunk"] = _utf16_prefix(older["chunk"], newer_offset - older_offset) + newer["chunk"]
+    if older.get("offset") is None:
+        # The older message carried full content, so the merge does too
+        merged["offset"] = 0
+    merged["base_seq"] = older.get("base_seq")
+    return merged
+
+
+class _StreamState:
+    """Delivery state of one stream: latest snapshot and what clients have."""
+
+    __slots__ = ("channel", "latest", "sent", "seq", "since_keyframe", "dirty", "updated_at")
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self.latest: Optional[LLMStreamChunkEvent] = None
+        self.sent = ""
+        self.seq = 0
+        self.since_keyframe = 0
+        self.dirty = False
+        self.updated_at = 0.0
+
+
+class StreamingTransport:
+    """
+    Publishes LLM stream chunks as coalesced, delta-encoded NOTIFYs.
+
+    submit() never awaits: it records the snapshot and wakes the flusher,
+    which waits up to `coalesce_ms` (or not at all for completions) and
+    sends every changed stream in one round trip.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        coalesce_ms: int = 50,
+        keyframe_interval: int = 20,
+    ) -> None:
+        """
+        Initialize streaming transport.
+
+        Args:
+            database_url: PostgreSQL connection string
+            coalesce_ms: How long snapshots of a stream are coalesced (milliseconds)
+            keyframe_interval: Messages per stream between full-content keyframes
+        """
+        self.database_url = database_url
+        self.coalesce_ms = coalesce_ms
+        self.keyframe_interval = keyframe_interval
+        self.running = False
+        self.snapshots_received = 0
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.messages_dropped = 0
+        self._conn: Optional[asyncpg.Connection] = None
+        self._reconnect_at = 0.0
+        self._streams: Dict[Tuple[Any, ...], _StreamState] = {}
+        self._wakeup = asyncio.Event()
+        self._urgent = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background flusher (the connection is opened on first use)."""
+        self._flusher = asyncio.create_task(self._flush_loop(), name="llm-stream-flusher")
+        self.running = True
+        logger.info(f"LLM streaming transport started (coalescing {self.coalesce_ms}ms)")
+
+    async def stop(self) -> None:
+        """Send pending snapshots, stop the flusher and close the connection."""
+        if not self.running:
+            return
+        self.running = False
+        if self._flusher:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+        await self.flush()
+        if self._conn is not None:
+            try:
+                await self._conn.close()
+            except Exception as e:
+                logger.debug(f"Error closing streaming connection: {e}")
+            self._conn = None
+        logger.info("LLM streaming transport stopped")
+
+    def submit(self, event: LLMStreamChunkEvent) -> None:
+        """
+        Record the latest snapshot of a stream for delivery.
+
+        Args:
+            event: Chunk event whose `chunk` is the accumulated content
+        """
+        key = (
+            event.session_id,
+            event.stage_execution_id,
+            event.stream_type,
+            event.llm_interaction_id,
+            event.mcp_event_id,
+        )
+        state = self._streams.get(key)
+        if state is None:
+            state = self._streams[key] = _StreamState(f"session:{event.session_id}")
+        state.latest = event
+        state.dirty = True
+        state.updated_at = time.monotonic()
+        self.snapshots_received += 1
+        if event.is_complete:
+            self._urgent.set()
+        self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Encode and send every changed stream now."""
+        messages, completed = self._collect_messages()
+        if messages and not await self._send(messages):
+            return
+        for key, state in completed:
+            # Forgotten only once delivered; a failed send leaves them dirty for the resync
+            if self._streams.get(key) is state and not state.dirty:
+                del self._streams[key]
+
+    async def _flush_loop(self) -> None:
+        """Background task: send coalesced snapshots on the time budget."""
+        while True:
+            await self._wakeup.wait()
+            if not self._urgent.is_set():
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._urgent.wait(), timeout=self.coalesce_ms / 1000)
+            self._wakeup.clear()
+            self._urgent.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Failed to flush LLM stream chunks: {e}")
+
+    def _collect_messages(
+        self,
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[Tuple[Any, ...], _StreamState]]]:
+        """
+        Encode changed streams into (channel, payload) messages and forget idle ones.
+
+        Returns:
+            Messages to send, and the completed streams they finish
+        """
+        messages: List[Tuple[str, str]] = []
+        completed: List[Tuple[Tuple[Any, ...], _StreamState]] = []
+        idle_before = time.monotonic() - IDLE_STREAM_TTL_SECONDS
+        for key, state in list(self._streams.items()):
+            if state.dirty:
+                messages.extend(self._encode(state))
+                state.dirty = False
+                if state.latest.is_complete:
+                    completed.append((key, state))
+            elif state.updated_at < idle_before:
+                del self._streams[key]
+        return messages, completed
+
+    def _encode(self, state: _StreamState) -> List[Tuple[str, str]]:
+        """Encode a stream's latest snapshot as delta messages."""
+        event = state.latest
+        content = event.chunk
+        if event.is_complete or state.since_keyframe >= self.keyframe_interval:
+            prefix = 0
+        else:
+            prefix = _common_prefix_length(state.sent, content)
+            if prefix == len(content) == len(state.sent):
+                return []  # Nothing new
+
+        keyframe = prefix == 0
+        # Offsets are sent in UTF-16 code units, as clients index strings
+        offset = _utf16_length(content[:prefix])
+        base = event.model_dump()
+        base.update(chunk="", offset=offset, seq=state.seq + 1, base_seq=state.seq, is_complete=False)
+        budget = NOTIFY_PAYLOAD_LIMIT - len(json.dumps(base)) - 32  # Room for larger numbers
+        pieces = split_for_payload(content[prefix:], budget)
+
+        messages = []
+        for index, piece in enumerate(pieces):
+            state.seq += 1
+            base.update(
+                chunk=piece,
+                offset=offset,
+                seq=state.seq,
+                base_seq=state.seq - 1,
+                is_complete=event.is_complete and index == len(pieces) - 1,
+            )
+            messages.append((state.channel, json.dumps(base)))
+            offset += _utf16_length(piece)
+
+        state.sent = content
+        state.since_keyframe = 0 if keyframe else state.since_keyframe + 1
+        return messages
+
+    async def _connect(self) -> bool:
+        """Open the connection if needed; returns False while unavailable."""
+        if self._conn is not None and not self._conn.is_closed():
+            return True
+        if time.monotonic() < self._reconnect_at:
+            return False
+        try:
+            self._conn = await asyncio.wait_for(asyncpg.connect(self.database_url), timeout=10.0)
+            return True
+        except Exception as e:
+            self._conn = None
+            self._reconnect_at = time.monotonic() + RECONNECT_DELAY_SECONDS
+            logger.warning(f"LLM streaming connection unavailable, retrying in {RECONNECT_DELAY_SECONDS:.0f}s: {e}")
+            return False
+
+    async def _send(self, messages: List[Tuple[str, str]]) -> bool:
+        """Send messages in one round trip; on failure clients resync from a keyframe."""
+        if await self._connect():
+            try:
+                await self._conn.executemany(NOTIFY_SQL, messages)
+                self.messages_sent += len(messages)
+                self.bytes_sent += sum(len(payload) for _, payload in messages)
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to send {len(messages)} LLM stream chunk(s): {e}")
+                conn, self._conn = self._conn, None
+                with contextlib.suppress(Exception):
+                    await conn.close()
+        self.messages_dropped += len(messages)
+        for state in self._streams.values():
+            # Clients missed these deltas; resend each stream as a keyframe
+            state.since_keyframe = self.keyframe_interval
+            state.dirty = state.latest is not None
+        # Resync without waiting for the next snapshot (once the connection may be back)
+        retry_in = max(self._reconnect_at - time.monotonic(), RESYNC_DELAY_SECONDS)
+        asyncio.get_running_loop().call_later(retry_in, self._wakeup.set)
+        return False
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-from typing import Callable, ContextManager, Optional
+from typing import Callable, ContextManager, List, Optional
 
 from sqlmodel import Session
 
@@ -24,7 +24,11 @@ class HistoryCleanupService:
     1. Orphaned sessions: Checked every N minutes (default: 10)
     2. Old history retention: Checked every M hours (default: 12)
     
-    Uses HistoryRepository for type-safe database operations with CASCADE deletes.
+    Along with retention cleanup, session_stats rollups of recent sessions
+    are checked against the interaction tables and repaired if they drifted.
+    
+    Uses HistoryRepository for type-safe database operations with CASCADE deletes;
+    expired sessions are deleted in bounded, paced batches.
     """
 
     def __init__(
@@ -32,6 +36,8 @@ class HistoryCleanupService:
         db_session_factory: Callable[[], ContextManager[Session]],
         retention_days: int = 90,
         retention_cleanup_interval_hours: int = 12,
+        retention_batch_size: int = 500,
+        retention_batch_pause_ms: int = 200,
         orphaned_timeout_minutes: int = 30,
         orphaned_check_interval_minutes: int = 10,
     ):
@@ -42,12 +48,16 @@ class HistoryCleanupService:
             db_session_factory: Context manager that yields sync database session
             retention_days: Keep history for N days (default: 90)
             retention_cleanup_interval_hours: Run retention cleanup every N hours (default: 12)
+            retention_batch_size: Expired sessions deleted per transaction (default: 500)
+            retention_batch_pause_ms: Pause between retention delete batches (default: 200)
             orphaned_timeout_minutes: Mark sessions as orphaned if no activity for N minutes (default: 30)
             orphaned_check_interval_minutes: Check for orphaned sessions every N minutes (default: 10)
         """
         self.db_session_factory = db_session_factory
         self.retention_days = retention_days
         self.retention_cleanup_interval_hours = retention_cleanup_interval_hours
+        self.retention_batch_size = retention_batch_size
+        self.retention_batch_pause_ms = retention_batch_pause_ms
         self.orphaned_timeout_minutes = orphaned_timeout_minutes
         self.orphaned_check_interval_minutes = orphaned_check_interval_minutes
 
@@ -94,7 +104,7 @@ class HistoryCleanupService:
         
         Checks for orphaned sessions every N minutes.
         Checks for orphaned chats every N minutes.
-        Checks for old history retention every M hours.
+        Checks for old history retention (and session_stats drift) every M hours.
         """
         while self.running:
             try:
@@ -107,6 +117,7 @@ class HistoryCleanupService:
                 # Only cleanup old history when interval has elapsed
                 if self._should_run_retention_cleanup():
                     await self._cleanup_old_history()
+                    await self._verify_session_stats()
                     self._update_last_retention_cleanup()
                 
                 # Wait until next orphaned session check
@@ -160,11 +171,53 @@ class HistoryCleanupService:
             retention_microseconds = self.retention_days * 24 * 3600 * 1_000_000
             cutoff_timestamp_us = now_us() - retention_microseconds
 
-            # Delete old sessions (CASCADE handles related records)
-            deleted_count = history_repo.delete_sessions_older_than(cutoff_timestamp_us)
+            # Delete old sessions in paced batches (CASCADE handles related records)
+            deleted_count = history_repo.delete_sessions_older_than(
+                cutoff_timestamp_us,
+                batch_size=self.retention_batch_size,
+                batch_pause_seconds=self.retention_batch_pause_ms / 1000,
+            )
 
             return deleted_count
     
+    async def _verify_session_stats(self) -> int:
+        """
+        Check session_stats rollups of recently started sessions and repair drift.
+        
+        Failures are logged and not raised: the rollups only feed the session list.
+        
+        Returns:
+            Number of sessions whose rollup was repaired
+        """
+        try:
+            drifted = await asyncio.to_thread(self._verify_session_stats_sync)
+        except Exception as e:
+            logger.error(f"Failed to verify session stats: {e}", exc_info=True)
+            return 0
+
+        if drifted:
+            logger.warning(
+                f"Repaired session_stats rollup of {len(drifted)} session(s): {', '.join(drifted[:10])}"
+            )
+        else:
+            logger.debug("Session stats rollups are consistent")
+        return len(drifted)
+
+    def _verify_session_stats_sync(self) -> List[str]:
+        """
+        Verify session_stats rollups synchronously (called from thread pool).
+        
+        Checks sessions started within two retention cleanup intervals so
+        consecutive checks overlap.
+        
+        Returns:
+            IDs of sessions whose rollup was repaired
+        """
+        with self.db_session_factory() as session:
+            history_repo = HistoryRepository(session)
+            window_us = 2 * self.retention_cleanup_interval_hours * 3600 * 1_000_000
+            return history_repo.verify_session_stats(started_since_us=now_us() - window_us)
+
     async def _cleanup_orphaned_sessions(self) -> int:
         """
         Check for and mark orphaned sessions as failed.
@@ -5,11 +5,17 @@ import logging
 import random
 import time
 from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from typing import Callable, Final, Generator, Optional, TypeVar
 
 from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from tarsy.config.settings import Settings, get_settings
+from tarsy.database.init_db import create_async_database_engine
+from tarsy.models.constants import HistoryAsyncDbMode
 from tarsy.repositories.base_repository import DatabaseManager
 from tarsy.repositories.history_repository import HistoryRepository
 
@@ -71,6 +77,12 @@ class _NoInteractionsSentinel:
 
 NO_INTERACTIONS: Final[_NoInteractionsSentinel] = _NoInteractionsSentinel()
 
+# Session of the async engine that get_repository() hands out while run_async()
+# executes an operation (set inside the operation's greenlet only)
+_async_operation_session: ContextVar[Optional[Session]] = ContextVar(
+    "history_async_operation_session", default=None
+)
+
 
 class BaseHistoryInfra:
     """Core infrastructure: DB access, retry logic, health tracking."""
@@ -78,6 +90,8 @@ class BaseHistoryInfra:
     def __init__(self) -> None:
         self.settings: Settings = get_settings()
         self.db_manager: Optional[DatabaseManager] = None
+        self.async_engine: Optional[AsyncEngine] = None
+        self.async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._initialization_attempted: bool = False
         self._is_healthy: bool = False
         self.max_retries: int = 3
@@ -109,6 +123,7 @@ class BaseHistoryInfra:
             self.db_manager = DatabaseManager(self.settings.database_url)
             self.db_manager.initialize()
             self.db_manager.create_tables()
+            self._initialize_async_engine()
             self._is_healthy = True
             logger.info("History service initialized successfully")
             return True
@@ -119,6 +134,64 @@ class BaseHistoryInfra:
             self._is_healthy = False
             return False
     
+    def _initialize_async_engine(self) -> None:
+        """Create the async engine that run_async() executes operations on."""
+        try:
+            database_url = self.settings.database_url
+            mode = self.settings.history_async_db
+            if mode == HistoryAsyncDbMode.NEVER.value:
+                return
+            if mode != HistoryAsyncDbMode.ALWAYS.value and not self._is_postgresql():
+                # aiosqlite runs each statement on a thread anyway; see HISTORY_ASYNC_DB
+                return
+            if ':memory:' in database_url:
+                # A second engine would open a separate in-memory database
+                logger.debug("In-memory database: history operations run on executor threads")
+                return
+            self.async_engine = create_async_database_engine(database_url, self.settings)
+            self.async_session_factory = async_sessionmaker(
+                self.async_engine, class_=AsyncSession, expire_on_commit=False
+            )
+        except Exception as e:
+            logger.warning(f"Async history database unavailable, using executor threads: {str(e)}")
+            self.async_engine = None
+            self.async_session_factory = None
+    
+    async def run_async(self, operation_func: Callable[[], T]) -> T:
+        """
+        Run a synchronous repository operation without blocking the event loop.
+        
+        On the async engine, the operation runs in a greenlet via
+        AsyncSession.run_sync and get_repository() inside it hands out that
+        session, so every query awaits the async driver instead of holding an
+        executor thread. Falls back to asyncio.to_thread without an async engine.
+        
+        Args:
+            operation_func: Operation using get_repository(); must not sleep
+        
+        Returns:
+            The operation's result
+        """
+        if self.async_session_factory is None:
+            return await asyncio.to_thread(operation_func)
+        async with self.async_session_factory() as session:
+            return await session.run_sync(self._run_with_session, operation_func)
+    
+    @staticmethod
+    def _run_with_session(session: Session, operation_func: Callable[[], T]) -> T:
+        token = _async_operation_session.set(session)
+        try:
+            return operation_func()
+        finally:
+            _async_operation_session.reset(token)
+    
+    async def dispose_async_engine(self) -> None:
+        """Close the async engine's connections."""
+        if self.async_engine is not None:
+            await self.async_engine.dispose()
+            self.async_engine = None
+            self.async_session_factory = None
+    
     def _is_postgresql(self) -> bool:
         """Check if the database backend is PostgreSQL."""
         if not self.db_manager or not self.db_manager.database_url:
@@ -195,12 +268,16 @@ class BaseHistoryInfra:
             
         session = None
         repository = None
+        # Inside run_async() the async engine's session is used and owned by it
+        async_session = _async_operation_session.get()
         try:
-            if not self.db_manager:
+            if async_session is not None:
+                session = async_session
+            elif not self.db_manager:
                 yield None
                 return
-                
-            session = self.db_manager.get_session()
+            else:
+                session = self.db_manager.get_session()
             repository = HistoryRepository(session)
             yield repository
             
@@ -211,7 +288,7 @@ class BaseHistoryInfra:
                     session.rollback()
             
         finally:
-            if session:
+            if session and session is not async_session:
                 try:
                     session.close()
                 except Exception as e:
@@ -267,11 +344,11 @@ class BaseHistoryInfra:
         *,
         treat_none_as_success: bool = False,
     ) -> Optional[T]:
-        """Async retry database operations with exponential backoff."""
+        """Async retry database operations with exponential backoff (see run_async)."""
         last_exception = None
         for attempt in range(self.max_retries + 1):
             try:
-                result = await asyncio.to_thread(operation_func)
+                result = await self.run_async(operation_func)
                 if result is not None:
                     return result
                 if treat_none_as_success:
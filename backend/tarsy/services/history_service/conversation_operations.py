@@ -97,6 +97,7 @@ class ConversationOperations:
                 input_tokens=interaction.input_tokens,
                 output_tokens=interaction.output_tokens,
                 total_tokens=interaction.total_tokens,
+                cached_input_tokens=interaction.cached_input_tokens,
                 messages=messages
             )
         except Exception as e:
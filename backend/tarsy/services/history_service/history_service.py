@@ -2,14 +2,19 @@
 
 from typing import Any, ContextManager, Dict, List, Optional, Tuple
 
-from tarsy.models.agent_config import ChainConfigModel
+from tarsy.models.agent_config import ChainConfigModel, QueueConfig
+from tarsy.models.constants import HistoryWriteDurability, SessionCountMode
 from tarsy.models.db_models import AlertSession, Chat, ChatUserMessage, StageExecution
 from tarsy.models.history_models import (
     DetailedSession,
     FilterOptions,
     LLMConversationHistory,
+    LLMTimelineEvent,
+    MCPTimelineEvent,
     PaginatedSessions,
+    SessionCursor,
     SessionStats,
+    SessionTimeline,
 )
 from tarsy.models.processing_context import ChainContext
 from tarsy.models.unified_interactions import LLMInteraction, MCPInteraction
@@ -24,6 +29,7 @@ from tarsy.services.history_service.queue_operations import QueueOperations
 from tarsy.services.history_service.session_operations import SessionOperations
 from tarsy.services.history_service.stage_operations import StageOperations
 from tarsy.services.history_service.tracking_operations import TrackingOperations
+from tarsy.services.history_service.write_buffer import InteractionWriteBuffer
 
 
 class HistoryService:
@@ -40,6 +46,7 @@ class HistoryService:
         self._conversations: ConversationOperations = ConversationOperations(self._infra)
         self._tracking: TrackingOperations = TrackingOperations(self._infra)
         self._queue: QueueOperations = QueueOperations(self._infra)
+        self._write_buffer: Optional[InteractionWriteBuffer] = None
     
     # Infrastructure
     def initialize(self) -> bool:
@@ -50,11 +57,47 @@ class HistoryService:
         """Get repository context manager (delegates to _infra)."""
         return self._infra.get_repository()
     
+    async def start_write_buffer(self) -> None:
+        """Start buffering interaction history writes (HISTORY_WRITE_DURABILITY=stage)."""
+        settings = self._infra.settings
+        if settings.history_write_durability != HistoryWriteDurability.STAGE.value or self._write_buffer:
+            return
+        self._write_buffer = InteractionWriteBuffer(
+            self._infra,
+            max_latency_ms=settings.history_write_max_latency_ms,
+            max_batch_size=settings.history_write_max_batch_size,
+            max_pending=settings.history_write_max_pending,
+        )
+        await self._write_buffer.start()
+    
+    async def flush_write_buffer(self) -> None:
+        """Write buffered interaction history now."""
+        if self._write_buffer:
+            await self._write_buffer.flush()
+    
+    def _buffering(self) -> bool:
+        return self._write_buffer is not None and self._write_buffer.running
+    
+    async def close(self) -> None:
+        """Write buffered interaction history and close the async database engine."""
+        if self._write_buffer:
+            await self._write_buffer.stop()
+        await self._infra.dispose_async_engine()
+    
     # Session lifecycle
     def create_session(self, chain_context: ChainContext, chain_definition: ChainConfigModel) -> bool:
         """Create a new alert processing session."""
         return self._sessions.create_session(chain_context, chain_definition)
     
+    def create_session_unless_duplicate(
+        self,
+        chain_context: ChainContext,
+        chain_definition: ChainConfigModel,
+        window_minutes: int
+    ) -> Optional[str]:
+        """Create a session for a fingerprinted alert, or attach the alert to a matching session."""
+        return self._sessions.create_session_unless_duplicate(chain_context, chain_definition, window_minutes)
+    
     def update_session_status(
         self,
         session_id: str,
@@ -81,11 +124,13 @@ class HistoryService:
     
     # Stage execution
     async def create_stage_execution(self, stage_execution: StageExecution) -> str:
-        """Create a new stage execution record."""
+        """Create a new stage execution record (a stage boundary: flushes buffered history)."""
+        await self.flush_write_buffer()
         return await self._stages.create_stage_execution(stage_execution)
     
     async def update_stage_execution(self, stage_execution: StageExecution) -> bool:
-        """Update an existing stage execution record."""
+        """Update an existing stage execution record (a stage boundary: flushes buffered history)."""
+        await self.flush_write_buffer()
         return await self._stages.update_stage_execution(stage_execution)
     
     async def update_session_current_stage(self, session_id: str, current_stage_index: int, current_stage_id: str) -> bool:
@@ -121,10 +166,22 @@ class HistoryService:
         """Store an LLM interaction to the database."""
         return self._interactions.store_llm_interaction(interaction)
     
+    async def store_llm_interaction_async(self, interaction: LLMInteraction) -> bool:
+        """Store an LLM interaction without blocking the event loop (buffered when enabled)."""
+        if self._buffering():
+            return await self._write_buffer.submit_llm_interaction(interaction)
+        return await self._interactions.store_llm_interaction_async(interaction)
+    
     def store_mcp_interaction(self, interaction: MCPInteraction) -> bool:
         """Store an MCP interaction to the database."""
         return self._interactions.store_mcp_interaction(interaction)
     
+    async def store_mcp_interaction_async(self, interaction: MCPInteraction) -> bool:
+        """Store an MCP interaction without blocking the event loop (buffered when enabled)."""
+        if self._buffering():
+            return await self._write_buffer.submit_mcp_interaction(interaction)
+        return await self._interactions.store_mcp_interaction_async(interaction)
+    
     # Query operations
     def get_sessions_list(
         self,
@@ -132,10 +189,14 @@ class HistoryService:
         page: int = 1,
         page_size: int = 20,
         sort_by: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[SessionCursor] = None,
+        count_mode: str = SessionCountMode.EXACT.value,
     ) -> Optional[PaginatedSessions]:
-        """Retrieve alert sessions with filtering and pagination."""
-        return self._queries.get_sessions_list(filters, page, page_size, sort_by, sort_order)
+        """Retrieve alert sessions with filtering and offset or keyset pagination."""
+        return self._queries.get_sessions_list(
+            filters, page, page_size, sort_by, sort_order, cursor=cursor, count_mode=count_mode
+        )
 
     def test_database_connection(self) -> bool:
         """Test database connectivity."""
@@ -145,6 +206,18 @@ class HistoryService:
         """Get complete session details including timeline and interactions."""
         return self._queries.get_session_details(session_id)
     
+    def get_session_timeline(self, session_id: str) -> Optional[SessionTimeline]:
+        """Get a session's stages and interaction summaries without interaction payloads."""
+        return self._queries.get_session_timeline(session_id)
+    
+    def get_llm_interaction_event(self, session_id: str, interaction_id: str) -> Optional[LLMTimelineEvent]:
+        """Get one LLM interaction of a session with its full conversation."""
+        return self._queries.get_llm_interaction_event(session_id, interaction_id)
+    
+    def get_mcp_interaction_event(self, session_id: str, communication_id: str) -> Optional[MCPTimelineEvent]:
+        """Get one MCP communication of a session with its tool payloads."""
+        return self._queries.get_mcp_interaction_event(session_id, communication_id)
+    
     def get_active_sessions(self) -> List[AlertSession]:
         """Get all currently active sessions."""
         return self._queries.get_active_sessions()
@@ -158,6 +231,14 @@ class HistoryService:
         """Find and mark orphaned sessions as failed based on inactivity timeout."""
         return self._maintenance.cleanup_orphaned_sessions(timeout_minutes)
     
+    def reconcile_session_leases(self) -> int:
+        """Bring session leases back in sync with IN_PROGRESS sessions."""
+        return self._maintenance.reconcile_session_leases()
+    
+    async def reconcile_session_leases_async(self) -> int:
+        """Bring session leases back in sync without blocking the event loop."""
+        return await self._maintenance.reconcile_session_leases_async()
+    
     async def mark_pod_sessions_interrupted(self, pod_id: str) -> int:
         """Mark sessions being processed by a pod as failed during graceful shutdown."""
         return await self._maintenance.mark_pod_sessions_interrupted(pod_id)
@@ -170,6 +251,12 @@ class HistoryService:
         """Update session last_interaction_at timestamp."""
         return self._maintenance.record_session_interaction(session_id)
     
+    async def record_session_interaction_async(self, session_id: str) -> bool:
+        """Update session last_interaction_at without blocking the event loop (buffered when enabled)."""
+        if self._buffering():
+            return await self._write_buffer.submit_session_interaction(session_id)
+        return await self._maintenance.record_session_interaction_async(session_id)
+    
     # Chat operations
     async def create_chat(self, chat: Chat) -> Chat:
         """Create a new chat record."""
@@ -193,14 +280,17 @@ class HistoryService:
     
     async def has_llm_interactions(self, session_id: str) -> bool:
         """Check if session has any LLM interactions."""
+        await self.flush_write_buffer()
         return await self._chats.has_llm_interactions(session_id)
     
     async def get_llm_interactions_for_session(self, session_id: str) -> List[LLMInteraction]:
         """Get all LLM interactions for a session."""
+        await self.flush_write_buffer()
         return await self._chats.get_llm_interactions_for_session(session_id)
     
     async def get_llm_interactions_for_stage(self, stage_execution_id: str) -> List[LLMInteraction]:
         """Get all LLM interactions for a stage execution."""
+        await self.flush_write_buffer()
         return await self._chats.get_llm_interactions_for_stage(stage_execution_id)
     
     async def get_chat_user_message_count(self, chat_id: str) -> int:
@@ -268,6 +358,54 @@ class HistoryService:
         """Count sessions in PENDING state."""
         return self._queue.count_pending_sessions()
     
+    def attach_duplicate_alert(self, fingerprint: str, window_minutes: int) -> Optional[str]:
+        """Coalesce a re-fired alert into an existing session with the same fingerprint."""
+        return self._queue.attach_duplicate_alert(fingerprint, window_minutes)
+    
     def claim_next_pending_session(self, pod_id: str) -> Optional[AlertSession]:
         """Atomically claim next PENDING session for this pod."""
         return self._queue.claim_next_pending_session(pod_id)
+    
+    def claim_pending_sessions(
+        self,
+        pod_id: str,
+        limit: int,
+        max_active_sessions: Optional[int] = None,
+        queue_config: Optional[QueueConfig] = None
+    ) -> List[AlertSession]:
+        """Atomically claim up to `limit` PENDING sessions for this pod."""
+        return self._queue.claim_pending_sessions(pod_id, limit, max_active_sessions, queue_config)
+    
+    async def claim_pending_sessions_async(
+        self,
+        pod_id: str,
+        limit: int,
+        max_active_sessions: Optional[int] = None,
+        queue_config: Optional[QueueConfig] = None
+    ) -> List[AlertSession]:
+        """Atomically claim PENDING sessions without blocking the event loop."""
+        return await self._queue.claim_pending_sessions_async(pod_id, limit, max_active_sessions, queue_config)
+    
+    def count_active_leases(self) -> int:
+        """Count globally occupied processing slots (session leases)."""
+        return self._queue.count_active_leases()
+    
+    async def count_leases_by_pod_async(self) -> Dict[str, int]:
+        """Count session leases held by each pod without blocking the event loop."""
+        return await self._queue.count_leases_by_pod_async()
+    
+    async def record_pod_heartbeat_async(self, pod_id: str, live_since_us: int) -> List[str]:
+        """Refresh a pod's heartbeat and return the live pods without blocking the event loop."""
+        return await self._queue.record_pod_heartbeat_async(pod_id, live_since_us)
+    
+    async def delete_pod_heartbeat_async(self, pod_id: str) -> bool:
+        """Delete a pod's heartbeat without blocking the event loop."""
+        return await self._queue.delete_pod_heartbeat_async(pod_id)
+    
+    def release_session_lease(self, session_id: str) -> bool:
+        """Release the processing slot held for a session that left IN_PROGRESS."""
+        return self._queue.release_session_lease(session_id)
+    
+    async def release_session_lease_async(self, session_id: str) -> bool:
+        """Release a session's processing slot without blocking the event loop."""
+        return await self._queue.release_session_lease_async(session_id)
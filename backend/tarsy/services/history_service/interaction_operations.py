@@ -1,6 +1,7 @@
 """LLM and MCP interaction logging operations."""
 
 import logging
+from functools import partial
 
 from tarsy.models.unified_interactions import LLMInteraction, MCPInteraction
 from tarsy.services.history_service.base_infrastructure import BaseHistoryInfra
@@ -18,16 +19,18 @@ class InteractionOperations:
         """Store an LLM interaction to the database."""
         if not interaction.session_id:
             return False
-            
-        def _store_llm_operation() -> bool:
-            with self._infra.get_repository() as repo:
-                if not repo:
-                    raise RuntimeError("History repository unavailable - cannot store LLM interaction")
-                repo.create_llm_interaction(interaction)
-                logger.debug(f"Stored LLM interaction for session {interaction.session_id}")
-                return True
-
-        result = self._infra._retry_database_operation("store_llm_interaction", _store_llm_operation)
+        result = self._infra._retry_database_operation(
+            "store_llm_interaction", partial(self._store_llm_operation, interaction)
+        )
+        return bool(result)
+    
+    async def store_llm_interaction_async(self, interaction: LLMInteraction) -> bool:
+        """Store an LLM interaction to the database without blocking the event loop."""
+        if not interaction.session_id:
+            return False
+        result = await self._infra._retry_database_operation_async(
+            "store_llm_interaction", partial(self._store_llm_operation, interaction)
+        )
         return bool(result)
     
     def store_mcp_interaction(self, interaction: MCPInteraction) -> bool:
@@ -37,16 +40,37 @@ class InteractionOperations:
         """
         if not interaction.session_id:
             return False
-            
-        def _store_mcp_operation() -> bool:
-            with self._infra.get_repository() as repo:
-                if not repo:
-                    raise RuntimeError("History repository unavailable - cannot store MCP interaction")
-                if not interaction.step_description:
-                    interaction.step_description = interaction.get_step_description()
-                repo.create_mcp_communication(interaction)
-                logger.debug(f"Stored MCP interaction for session {interaction.session_id}")
-                return True
-
-        result = self._infra._retry_database_operation("store_mcp_interaction", _store_mcp_operation)
+        result = self._infra._retry_database_operation(
+            "store_mcp_interaction", partial(self._store_mcp_operation, interaction)
+        )
         return bool(result)
+    
+    async def store_mcp_interaction_async(self, interaction: MCPInteraction) -> bool:
+        """Store an MCP interaction to the database without blocking the event loop.
+        
+        Note: May populate interaction.step_description if not set.
+        """
+        if not interaction.session_id:
+            return False
+        result = await self._infra._retry_database_operation_async(
+            "store_mcp_interaction", partial(self._store_mcp_operation, interaction)
+        )
+        return bool(result)
+    
+    def _store_llm_operation(self, interaction: LLMInteraction) -> bool:
+        with self._infra.get_repository() as repo:
+            if not repo:
+                raise RuntimeError("History repository unavailable - cannot store LLM interaction")
+            repo.create_llm_interaction(interaction)
+            logger.debug(f"Stored LLM interaction for session {interaction.session_id}")
+            return True
+    
+    def _store_mcp_operation(self, interaction: MCPInteraction) -> bool:
+        with self._infra.get_repository() as repo:
+            if not repo:
+                raise RuntimeError("History repository unavailable - cannot store MCP interaction")
+            if not interaction.step_description:
+                interaction.step_description = interaction.get_step_description()
+            repo.create_mcp_communication(interaction)
+            logger.debug(f"Stored MCP interaction for session {interaction.session_id}")
+            return True
@@ -1,6 +1,7 @@
 """Maintenance and cleanup operations."""
 
 import logging
+from functools import partial
 
 from sqlmodel import select
 
@@ -108,8 +109,43 @@ class MaintenanceOperations:
         if count and count > 0:
             logger.info(f"Cleaned up {count} orphaned sessions during startup")
         
+        # Free slots leaked by crashed pods (including the ones just marked failed)
+        self.reconcile_session_leases()
+        
         return count or 0
     
+    def reconcile_session_leases(self) -> int:
+        """Bring session leases back in sync with IN_PROGRESS sessions.
+        
+        Releases leases held for sessions that are no longer IN_PROGRESS (e.g. the
+        owning pod crashed before releasing them) and adds leases for IN_PROGRESS
+        sessions that were started without one. Failures are logged and ignored -
+        the next orphan check retries.
+        
+        Returns:
+            Total number of leases removed or added.
+        """
+        try:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    return 0
+                removed, added = repo.reconcile_session_leases()
+        except Exception as e:
+            logger.warning(f"Failed to reconcile session leases: {str(e)}")
+            return 0
+        
+        if removed or added:
+            logger.info(f"Reconciled session leases: {removed} released, {added} added")
+        return removed + added
+    
+    async def reconcile_session_leases_async(self) -> int:
+        """Bring session leases back in sync without blocking the event loop.
+        
+        Returns:
+            Total number of leases removed or added.
+        """
+        return await self._infra.run_async(self.reconcile_session_leases)
+    
     async def mark_pod_sessions_interrupted(self, pod_id: str) -> int:
         """Mark sessions being processed by a pod as failed during graceful shutdown.
         
@@ -137,6 +173,7 @@ class MaintenanceOperations:
                     session_record.error_message = f"Session interrupted during pod '{pod_id}' graceful shutdown"
                     session_record.completed_at_us = now_us()
                     repo.update_alert_session(session_record)
+                    repo.release_session_lease(session_record.session_id)
                 
                 return len(in_progress_sessions)
         
@@ -188,16 +225,31 @@ class MaintenanceOperations:
         Returns:
             True if the timestamp was successfully updated, False otherwise.
         """
-        def _interaction_operation() -> bool:
-            with self._infra.get_repository() as repo:
-                if not repo:
-                    return False
-                
-                session = repo.get_alert_session(session_id)
-                if not session:
-                    return False
-                
-                session.last_interaction_at = now_us()
-                return repo.update_alert_session(session)
+        return self._infra._retry_database_operation(
+            "record_interaction", partial(self._record_interaction_operation, session_id)
+        ) or False
+    
+    async def record_session_interaction_async(self, session_id: str) -> bool:
+        """Update session last_interaction_at timestamp without blocking the event loop.
+        
+        Args:
+            session_id: Unique identifier of the session to update.
         
-        return self._infra._retry_database_operation("record_interaction", _interaction_operation) or False
+        Returns:
+            True if the timestamp was successfully updated, False otherwise.
+        """
+        return await self._infra._retry_database_operation_async(
+            "record_interaction", partial(self._record_interaction_operation, session_id)
+        ) or False
+    
+    def _record_interaction_operation(self, session_id: str) -> bool:
+        with self._infra.get_repository() as repo:
+            if not repo:
+                return False
+            
+            session = repo.get_alert_session(session_id)
+            if not session:
+                return False
+            
+            session.last_interaction_at = now_us()
+            return repo.update_alert_session(session)
@@ -1,10 +1,21 @@
 """Session query operations."""
 
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+from tarsy.models.constants import SessionCountMode
 from tarsy.models.db_models import AlertSession
-from tarsy.models.history_models import DetailedSession, FilterOptions, PaginatedSessions
+from tarsy.models.history_models import (
+    DetailedSession,
+    FilterOptions,
+    LLMTimelineEvent,
+    MCPTimelineEvent,
+    PaginatedSessions,
+    SessionCursor,
+    SessionTimeline,
+)
 from tarsy.services.history_service.base_infrastructure import BaseHistoryInfra
 
 logger = logging.getLogger(__name__)
@@ -15,6 +26,8 @@ class QueryOperations:
     
     def __init__(self, infra: BaseHistoryInfra) -> None:
         self._infra: BaseHistoryInfra = infra
+        # Approximate session list totals per filter combination: key -> (expires at, count)
+        self._session_counts: Dict[str, Tuple[float, int]] = {}
     
     def get_sessions_list(
         self,
@@ -22,7 +35,9 @@ class QueryOperations:
         page: int = 1,
         page_size: int = 20,
         sort_by: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[SessionCursor] = None,
+        count_mode: str = SessionCountMode.EXACT.value,
     ) -> Optional[PaginatedSessions]:
         """Retrieve alert sessions with filtering and pagination.
         
@@ -33,18 +48,29 @@ class QueryOperations:
             page_size: Number of results per page. Defaults to 20.
             sort_by: Field name to sort by.
             sort_order: Sort direction, either 'asc' or 'desc'.
+            cursor: Keyset position to continue after (replaces page, sort_by and sort_order).
+            count_mode: 'exact', or 'approximate' to accept a planner estimate or
+                a count cached for history_session_count_cache_seconds.
         
         Returns:
             PaginatedSessions containing the results and pagination metadata,
             or None if the operation fails.
         """
+        filters_local = filters or {}
+        count_key = json.dumps(filters_local, sort_keys=True, default=str)
+        approximate = count_mode == SessionCountMode.APPROXIMATE.value
+        cache_seconds = self._infra.settings.history_session_count_cache_seconds if approximate else 0
+        known_total_items = None
+        if cache_seconds > 0:
+            cached = self._session_counts.get(count_key)
+            if cached and cached[0] > time.monotonic():
+                known_total_items = cached[1]
+        
         def _get_sessions_operation() -> Optional[PaginatedSessions]:
             with self._infra.get_repository() as repo:
                 if not repo:
                     raise RuntimeError("History repository unavailable - cannot retrieve sessions list")
                 
-                filters_local = filters or {}
-                
                 paginated_sessions = repo.get_alert_sessions(
                     status=filters_local.get('status'),
                     agent_type=filters_local.get('agent_type'),
@@ -55,7 +81,10 @@ class QueryOperations:
                     page=page,
                     page_size=page_size,
                     sort_by=sort_by,
-                    sort_order=sort_order
+                    sort_order=sort_order,
+                    cursor=cursor,
+                    count_mode=count_mode,
+                    known_total_items=known_total_items,
                 )
                 
                 if paginated_sessions and filters_local:
@@ -63,11 +92,19 @@ class QueryOperations:
                 
                 return paginated_sessions
         
-        return self._infra._retry_database_operation(
+        paginated_sessions = self._infra._retry_database_operation(
             "get_sessions_list",
             _get_sessions_operation,
             treat_none_as_success=True
         )
+        # Empty pages are not cached: the repository reports failures as an empty listing
+        if paginated_sessions and paginated_sessions.sessions and cache_seconds > 0 and known_total_items is None:
+            if len(self._session_counts) >= 1000:
+                self._session_counts.clear()  # Bound memory against arbitrary search terms
+            self._session_counts[count_key] = (
+                time.monotonic() + cache_seconds, paginated_sessions.pagination.total_items
+            )
+        return paginated_sessions
 
     def test_database_connection(self) -> bool:
         """Test database connectivity.
@@ -115,6 +152,66 @@ class QueryOperations:
             treat_none_as_success=True
         )
     
+    def get_session_timeline(self, session_id: str) -> Optional[SessionTimeline]:
+        """Get a session's stages and interaction summaries without interaction payloads.
+        
+        Args:
+            session_id: The unique identifier of the session.
+        
+        Returns:
+            SessionTimeline, or None if the session was not found.
+        """
+        def _get_session_timeline_operation() -> Optional[SessionTimeline]:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    raise RuntimeError("History repository unavailable - cannot retrieve session timeline")
+                
+                return repo.get_session_timeline(session_id)
+        
+        return self._infra._retry_database_operation(
+            "get_session_timeline",
+            _get_session_timeline_operation,
+            treat_none_as_success=True
+        )
+    
+    def get_llm_interaction_event(self, session_id: str, interaction_id: str) -> Optional[LLMTimelineEvent]:
+        """Get one LLM interaction of a session with its full conversation.
+        
+        Returns:
+            LLMTimelineEvent, or None if the interaction was not found in the session.
+        """
+        def _get_llm_interaction_operation() -> Optional[LLMTimelineEvent]:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    raise RuntimeError("History repository unavailable - cannot retrieve LLM interaction")
+                
+                return repo.get_llm_interaction_event(session_id, interaction_id)
+        
+        return self._infra._retry_database_operation(
+            "get_llm_interaction_event",
+            _get_llm_interaction_operation,
+            treat_none_as_success=True
+        )
+    
+    def get_mcp_interaction_event(self, session_id: str, communication_id: str) -> Optional[MCPTimelineEvent]:
+        """Get one MCP communication of a session with its tool payloads.
+        
+        Returns:
+            MCPTimelineEvent, or None if the communication was not found in the session.
+        """
+        def _get_mcp_interaction_operation() -> Optional[MCPTimelineEvent]:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    raise RuntimeError("History repository unavailable - cannot retrieve MCP interaction")
+                
+                return repo.get_mcp_interaction_event(session_id, communication_id)
+        
+        return self._infra._retry_database_operation(
+            "get_mcp_interaction_event",
+            _get_mcp_interaction_operation,
+            treat_none_as_success=True
+        )
+    
     def get_active_sessions(self) -> List[AlertSession]:
         """Get all currently active sessions.
         
@@ -1,9 +1,12 @@
 """Queue management operations."""
 
-from typing import Optional
+from functools import partial
+from typing import Dict, List, Optional
 
+from tarsy.models.agent_config import QueueConfig
 from tarsy.models.db_models import AlertSession
 from tarsy.services.history_service.base_infrastructure import BaseHistoryInfra
+from tarsy.utils.timestamp import now_us
 
 
 class QueueOperations:
@@ -37,6 +40,23 @@ class QueueOperations:
                 return 0
             return repo.count_pending_sessions()
     
+    def attach_duplicate_alert(self, fingerprint: str, window_minutes: int) -> Optional[str]:
+        """Coalesce a re-fired alert into an existing session with the same fingerprint.
+        
+        Args:
+            fingerprint: Deduplication fingerprint of the incoming alert.
+            window_minutes: How long after completion a session still absorbs duplicates.
+        
+        Returns:
+            session_id of the session the alert was attached to, None if the
+            alert should start a new session.
+        """
+        completed_since_us = now_us() - window_minutes * 60 * 1_000_000
+        with self._infra.get_repository() as repo:
+            if not repo:
+                return None
+            return repo.attach_duplicate_alert(fingerprint, completed_since_us)
+    
     def claim_next_pending_session(self, pod_id: str) -> Optional[AlertSession]:
         """Atomically claim next PENDING session for this pod.
         
@@ -53,3 +73,142 @@ class QueueOperations:
             if not repo:
                 return None
             return repo.claim_next_pending_session(pod_id)
+    
+    def claim_pending_sessions(
+        self,
+        pod_id: str,
+        limit: int,
+        max_active_sessions: Optional[int] = None,
+        queue_config: Optional[QueueConfig] = None
+    ) -> List[AlertSession]:
+        """Atomically claim up to `limit` PENDING sessions for this pod.
+        
+        Claims by priority and weighted fair share across alert types in a
+        single locking statement so a burst of queued alerts can be drained up
+        to free capacity in one round-trip.
+        
+        Args:
+            pod_id: Identifier of the pod attempting to claim work.
+            limit: Maximum number of sessions to claim.
+            max_active_sessions: Global concurrency limit. When set, a session
+                lease is recorded per claimed session and the batch is capped
+                so leases never exceed this limit.
+            queue_config: Fair-share weights and per-alert-type concurrency caps.
+        
+        Returns:
+            List of claimed AlertSessions (empty if none were available).
+        """
+        with self._infra.get_repository() as repo:
+            if not repo:
+                return []
+            return repo.claim_pending_sessions(pod_id, limit, max_active_sessions, queue_config)
+    
+    async def claim_pending_sessions_async(
+        self,
+        pod_id: str,
+        limit: int,
+        max_active_sessions: Optional[int] = None,
+        queue_config: Optional[QueueConfig] = None
+    ) -> List[AlertSession]:
+        """Atomically claim up to `limit` PENDING sessions without blocking the event loop.
+        
+        See claim_pending_sessions for the claiming rules.
+        
+        Returns:
+            List of claimed AlertSessions (empty if none were available).
+        """
+        return await self._infra.run_async(
+            partial(self.claim_pending_sessions, pod_id, limit, max_active_sessions, queue_config)
+        )
+    
+    def count_active_leases(self) -> int:
+        """Count session leases held across all pods.
+        
+        Returns:
+            Number of globally occupied processing slots.
+        """
+        with self._infra.get_repository() as repo:
+            if not repo:
+                return 0
+            return repo.count_active_leases()
+    
+    async def count_leases_by_pod_async(self) -> Dict[str, int]:
+        """Count session leases held by each pod without blocking the event loop.
+        
+        Returns:
+            Pod ID -> number of leases it holds.
+        """
+        return await self._infra.run_async(self._count_leases_by_pod_operation)
+    
+    def _count_leases_by_pod_operation(self) -> Dict[str, int]:
+        with self._infra.get_repository() as repo:
+            if not repo:
+                return {}
+            return repo.count_leases_by_pod()
+    
+    async def record_pod_heartbeat_async(self, pod_id: str, live_since_us: int) -> List[str]:
+        """Refresh a pod's heartbeat without blocking the event loop.
+        
+        Args:
+            pod_id: Pod whose heartbeat to refresh.
+            live_since_us: Pods whose last heartbeat is older than this are no longer live.
+        
+        Returns:
+            IDs of the live pods.
+        """
+        return await self._infra.run_async(partial(self._record_pod_heartbeat_operation, pod_id, live_since_us))
+    
+    def _record_pod_heartbeat_operation(self, pod_id: str, live_since_us: int) -> List[str]:
+        with self._infra.get_repository() as repo:
+            if not repo:
+                return []
+            return repo.record_pod_heartbeat(pod_id, live_since_us)
+    
+    async def delete_pod_heartbeat_async(self, pod_id: str) -> bool:
+        """Delete a pod's heartbeat without blocking the event loop.
+        
+        Args:
+            pod_id: Pod whose heartbeat to delete.
+        
+        Returns:
+            True if a heartbeat was deleted, False otherwise.
+        """
+        return await self._infra.run_async(partial(self._delete_pod_heartbeat_operation, pod_id))
+    
+    def _delete_pod_heartbeat_operation(self, pod_id: str) -> bool:
+        with self._infra.get_repository() as repo:
+            if not repo:
+                return False
+            return repo.delete_pod_heartbeat(pod_id)
+    
+    def release_session_lease(self, session_id: str) -> bool:
+        """Release the processing slot held for a session that left IN_PROGRESS.
+        
+        Args:
+            session_id: Session whose lease should be released.
+        
+        Returns:
+            True if a lease was released, False otherwise.
+        """
+        return self._infra._retry_database_operation(
+            "release_session_lease", partial(self._release_operation, session_id)
+        ) or False
+    
+    async def release_session_lease_async(self, session_id: str) -> bool:
+        """Release a session's processing slot without blocking the event loop.
+        
+        Args:
+            session_id: Session whose lease should be released.
+        
+        Returns:
+            True if a lease was released, False otherwise.
+        """
+        return await self._infra._retry_database_operation_async(
+            "release_session_lease", partial(self._release_operation, session_id)
+        ) or False
+    
+    def _release_operation(self, session_id: str) -> bool:
+        with self._infra.get_repository() as repo:
+            if not repo:
+                return False
+            return repo.release_session_lease(session_id)
@@ -30,23 +30,7 @@ class SessionOperations:
                 if not repo:
                     raise RuntimeError("History repository unavailable - cannot create session")
                 
-                agent_type = f"chain:{chain_definition.chain_id}"
-                
-                session = AlertSession(
-                    session_id=chain_context.session_id,
-                    alert_data=chain_context.processing_alert.alert_data,
-                    agent_type=agent_type,
-                    alert_type=chain_context.processing_alert.alert_type,
-                    status=AlertSessionStatus.PENDING.value,
-                    chain_id=chain_definition.chain_id,
-                    chain_definition=chain_definition.model_dump(),
-                    author=chain_context.author,
-                    runbook_url=chain_context.processing_alert.runbook_url,
-                    slack_message_fingerprint=chain_context.processing_alert.slack_message_fingerprint,  # Slack message fingerprint for threading
-                    mcp_selection=chain_context.mcp.model_dump() if chain_context.mcp else None
-                )
-                
-                created_session = repo.create_alert_session(session)
+                created_session = repo.create_alert_session(self._build_session(chain_context, chain_definition))
                 if created_session:
                     logger.info(f"Created history session {created_session.session_id}")
                     return True
@@ -55,6 +39,58 @@ class SessionOperations:
         result = self._infra._retry_database_operation("create_session", _create_session_operation)
         return result if result is not None else False
     
+    def create_session_unless_duplicate(
+        self,
+        chain_context: ChainContext,
+        chain_definition: ChainConfigModel,
+        window_minutes: int
+    ) -> Optional[str]:
+        """Create a session for a fingerprinted alert, or attach the alert to a matching session.
+        
+        Args:
+            chain_context: Chain context of the alert (processing_alert.fingerprint set)
+            chain_definition: Chain definition that will be executed
+            window_minutes: How long after completion a session still absorbs duplicates.
+        
+        Returns:
+            chain_context.session_id if the session was created, the ID of the
+            session the alert was attached to, or None if creation failed.
+        """
+        completed_since_us = now_us() - window_minutes * 60 * 1_000_000
+        
+        def _create_session_operation() -> Optional[str]:
+            with self._infra.get_repository() as repo:
+                if not repo:
+                    raise RuntimeError("History repository unavailable - cannot create session")
+                
+                session_id = repo.create_alert_session_unless_duplicate(
+                    self._build_session(chain_context, chain_definition), completed_since_us
+                )
+                if session_id == chain_context.session_id:
+                    logger.info(f"Created history session {session_id}")
+                return session_id
+        
+        return self._infra._retry_database_operation("create_session", _create_session_operation)
+    
+    @staticmethod
+    def _build_session(chain_context: ChainContext, chain_definition: ChainConfigModel) -> AlertSession:
+        """Build the PENDING session record of an alert."""
+        return AlertSession(
+            session_id=chain_context.session_id,
+            alert_data=chain_context.processing_alert.alert_data,
+            agent_type=f"chain:{chain_definition.chain_id}",
+            alert_type=chain_context.processing_alert.alert_type,
+            status=AlertSessionStatus.PENDING.value,
+            priority=int(chain_context.processing_alert.priority),
+            chain_id=chain_definition.chain_id,
+            chain_definition=chain_definition.model_dump(),
+            author=chain_context.author,
+            runbook_url=chain_context.processing_alert.runbook_url,
+            slack_message_fingerprint=chain_context.processing_alert.slack_message_fingerprint,  # Slack message fingerprint for threading
+            alert_fingerprint=chain_context.processing_alert.fingerprint,
+            mcp_selection=chain_context.mcp.model_dump() if chain_context.mcp else None
+        )
+    
     def update_session_status(
         self,
         session_id: str,
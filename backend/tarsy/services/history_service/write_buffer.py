@@ -0,0 +1,226 @@
+"""Write-behind buffer batching interaction history writes."""
+
+import asyncio
+import contextlib
+import logging
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
+
+from tarsy.models.unified_interactions import LLMInteraction, MCPInteraction
+from tarsy.services.history_service.base_infrastructure import BaseHistoryInfra
+
+logger = logging.getLogger(__name__)
+
+# Buffered entry: an interaction to insert, or a session whose activity to record
+BufferedEntry = Tuple[str, Union[LLMInteraction, MCPInteraction, str]]
+
+
+class InteractionWriteBuffer:
+    """
+    Buffers interaction history writes and writes them in batches.
+
+    A background flusher lingers up to `max_latency_ms` after the first
+    buffered entry, then inserts the batch's LLM and MCP interactions of all
+    sessions with one multi-row INSERT per table and sets last_interaction_at
+    of the sessions touched in the batch with a single UPDATE, in one
+    transaction. flush() cuts the linger short and waits until everything
+    buffered before the call is written (entries are numbered as they are
+    buffered, so later submissions from other sessions do not extend the
+    wait); the history service calls it at stage
+    boundaries, so a crash loses at most the interactions of running stages
+    from the current window. When `max_pending` entries are buffered, submit
+    calls wait (backpressure).
+    """
+
+    def __init__(
+        self,
+        infra: BaseHistoryInfra,
+        max_latency_ms: int = 250,
+        max_batch_size: int = 500,
+        max_pending: int = 10000,
+    ) -> None:
+        """
+        Initialize write buffer.
+
+        Args:
+            infra: History infrastructure used to run the batch writes
+            max_latency_ms: How long the flusher waits to fill a batch (milliseconds)
+            max_batch_size: Maximum entries written per batch
+            max_pending: Maximum buffered entries before submit calls wait
+        """
+        self._infra: BaseHistoryInfra = infra
+        self.max_latency_ms = max_latency_ms
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.running = False
+        self.batches_written = 0
+        self.interactions_written = 0
+        self.interactions_dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._written: Optional[asyncio.Condition] = None
+        self._submitted_seq = 0
+        self._written_seq = 0
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background flusher."""
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._flush_requested = asyncio.Event()
+        self._written = asyncio.Condition()
+        self._submitted_seq = 0
+        self._written_seq = 0
+        self._flusher = asyncio.create_task(self._flush_loop(), name="history-write-flusher")
+        self.running = True
+        logger.info(
+            f"History write buffer started (max latency {self.max_latency_ms}ms, "
+            f"batch size {self.max_batch_size})"
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop buffering, write what is buffered and stop the flusher.
+
+        Args:
+            timeout: Maximum time to wait for buffered writes (seconds)
+        """
+        if not self.running:
+            return
+        self.running = False
+        try:
+            await asyncio.wait_for(self.flush(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Timed out writing buffered history on shutdown, {self._queue.qsize()} entries dropped"
+            )
+        if self._flusher:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+        logger.info("History write buffer stopped")
+
+    async def submit_llm_interaction(self, interaction: LLMInteraction) -> bool:
+        """Buffer an LLM interaction; returns False if it has no session."""
+        if not interaction.session_id:
+            return False
+        await self._put(("llm", interaction))
+        return True
+
+    async def submit_mcp_interaction(self, interaction: MCPInteraction) -> bool:
+        """Buffer an MCP interaction; returns False if it has no session."""
+        if not interaction.session_id:
+            return False
+        await self._put(("mcp", interaction))
+        return True
+
+    async def submit_session_interaction(self, session_id: str) -> bool:
+        """Buffer a last_interaction_at update (collapsed per session per batch)."""
+        await self._put(("touch", session_id))
+        return True
+
+    async def flush(self) -> None:
+        """Write everything buffered so far without waiting for the batch window."""
+        if self._queue is None:
+            return
+        target_seq = self._submitted_seq
+        if self._written_seq >= target_seq:
+            return
+        self._flush_requested.set()
+        async with self._written:
+            await self._written.wait_for(lambda: self._written_seq >= target_seq)
+
+    async def _put(self, entry: BufferedEntry) -> None:
+        if not self.running:
+            raise RuntimeError("History write buffer is not running")
+        await self._queue.put(entry)
+        # Entries leave the queue in submission order, so the count numbers them
+        self._submitted_seq += 1
+
+    async def _flush_loop(self) -> None:
+        """Background task: collect batches and write them in order."""
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() < self.max_batch_size - 1 and not self._flush_requested.is_set():
+                # Linger so the writes of concurrent sessions share a batch
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._flush_requested.wait(), timeout=self.max_latency_ms / 1000)
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if self._queue.empty():
+                self._flush_requested.clear()
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to write history batch of {len(batch)} entries: {e}")
+            finally:
+                async with self._written:
+                    self._written_seq += len(batch)
+                    self._written.notify_all()
+
+    async def _write_batch(self, batch: List[BufferedEntry]) -> None:
+        """Write a batch in one transaction, falling back to one entry at a time."""
+        llm_interactions: List[LLMInteraction] = []
+        mcp_interactions: List[MCPInteraction] = []
+        touched: Dict[str, None] = {}
+        for kind, item in batch:
+            if kind == "llm":
+                llm_interactions.append(item)
+            elif kind == "mcp":
+                mcp_interactions.append(item)
+            else:
+                touched[item] = None
+
+        written = await self._infra._retry_database_operation_async(
+            "write_history_batch",
+            partial(self._write_operation, llm_interactions, mcp_interactions, list(touched)),
+        )
+        if written:
+            self.batches_written += 1
+            self.interactions_written += len(llm_interactions) + len(mcp_interactions)
+            logger.debug(
+                f"Wrote history batch: {len(llm_interactions)} LLM, {len(mcp_interactions)} MCP "
+                f"interaction(s), {len(touched)} session(s) touched"
+            )
+            return
+
+        # One bad entry (e.g. its session was deleted) must not take the rest of the batch with it
+        logger.warning(f"History batch of {len(batch)} entries failed, writing entries individually")
+        for interaction in llm_interactions:
+            await self._write_single(f"LLM interaction {interaction.interaction_id}", [interaction], [], [])
+        for interaction in mcp_interactions:
+            await self._write_single(f"MCP interaction {interaction.request_id}", [], [interaction], [])
+        if touched:
+            await self._write_single("session activity", [], [], list(touched))
+
+    async def _write_single(
+        self,
+        description: str,
+        llm_interactions: List[LLMInteraction],
+        mcp_interactions: List[MCPInteraction],
+        touched_session_ids: List[str],
+    ) -> None:
+        written = await self._infra._retry_database_operation_async(
+            "write_history_entry",
+            partial(self._write_operation, llm_interactions, mcp_interactions, touched_session_ids),
+        )
+        count = len(llm_interactions) + len(mcp_interactions)
+        if written:
+            self.interactions_written += count
+        else:
+            self.interactions_dropped += count
+            logger.error(f"Dropped buffered {description}")
+
+    def _write_operation(
+        self,
+        llm_interactions: List[LLMInteraction],
+        mcp_interactions: List[MCPInteraction],
+        touched_session_ids: List[str],
+    ) -> bool:
+        with self._infra.get_repository() as repo:
+            if not repo:
+                raise RuntimeError("History repository unavailable - cannot write buffered history")
+            for interaction in mcp_interactions:
+                if not interaction.step_description:
+                    interaction.step_description = interaction.get_step_description()
+            repo.create_interactions(llm_interactions, mcp_interactions, touched_session_ids)
+            return True
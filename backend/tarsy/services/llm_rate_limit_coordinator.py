@@ -0,0 +1,121 @@
+"""
+LLM Rate Limit Coordinator.
+
+Background service splitting every LLM provider's rate limits across pods
+that share one provider quota.
+"""
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Optional
+
+from tarsy.integrations.llm.rate_limiter import (
+    ProviderRateLimiters,
+    get_provider_rate_limiters,
+)
+from tarsy.utils.logger import get_module_logger
+from tarsy.utils.timestamp import now_us
+
+if TYPE_CHECKING:
+    from tarsy.services.history_service import HistoryService
+
+logger = get_module_logger(__name__)
+
+
+class LLMRateLimitCoordinator:
+    """
+    Periodically sizes this pod's share of the provider rate limits.
+
+    Each pod's share is proportional to the session leases it holds (one per
+    session it is processing), read from the session_leases table, so the
+    pods together stay within the requests/min and tokens/min configured for
+    each provider. A pod without sessions keeps the budget of one session for
+    chats and late calls; pods find each other through the pod_heartbeats
+    table, so idle pods are counted as well and the leases of pods that
+    stopped heartbeating are not.
+    """
+
+    # Heartbeats missed before a pod no longer counts as live
+    LIVE_INTERVALS = 3
+
+
+    def __init__(
+        self,
+        history_service: "HistoryService",
+        pod_id: str,
+        interval_seconds: float,
+        rate_limiters: Optional[ProviderRateLimiters] = None,
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            history_service: HistoryService for reading session leases
+            pod_id: Identifier of this pod
+            interval_seconds: Interval between share updates (seconds)
+            rate_limiters: Provider rate limiters to resize (process-wide registry by default)
+        """
+        self.history_service = history_service
+        self.pod_id = pod_id
+        self.interval_seconds = interval_seconds
+        self.rate_limiters = rate_limiters or get_provider_rate_limiters()
+        self.share = 1.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background share updates."""
+        if self._task and not self._task.done():
+            logger.warning("LLM rate limit coordinator already running; ignoring start()")
+            return
+        self._task = asyncio.create_task(self._coordination_loop())
+        logger.info(f"LLM rate limit coordinator started on pod {self.pod_id} (interval={self.interval_seconds}s)")
+
+    async def stop(self) -> None:
+        """Stop the background share updates."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            try:
+                await self.history_service.delete_pod_heartbeat_async(self.pod_id)
+            except Exception as e:
+                logger.warning(f"Failed to delete heartbeat of pod {self.pod_id}: {e}")
+        logger.info("LLM rate limit coordinator stopped")
+
+    async def refresh(self) -> float:
+        """
+        Recompute this pod's share from the session leases of all live pods.
+
+        Returns:
+            Share of the provider rate limits this pod now uses
+        """
+        live_since_us = now_us() - int(self.LIVE_INTERVALS * self.interval_seconds * 1_000_000)
+        live_pods = await self.history_service.record_pod_heartbeat_async(self.pod_id, live_since_us)
+        leases = await self.history_service.count_leases_by_pod_async()
+        # Every live pod keeps the budget of at least one session; leases left by
+        # dead pods are ignored until they expire
+        sessions = {pod_id: max(leases.get(pod_id, 0), 1) for pod_id in live_pods}
+        sessions[self.pod_id] = max(leases.get(self.pod_id, 0), 1)
+        local = sessions[self.pod_id]
+        total = sum(sessions.values())
+        share = local / total
+        if share != self.share:
+            logger.info(
+                f"Pod {self.pod_id} now uses {share:.0%} of the LLM provider rate limits "
+                f"({local} of {total} sessions)"
+            )
+        self.share = share
+        self.rate_limiters.set_share(share)
+        return share
+
+    async def _coordination_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep the previous share until the database is reachable again
+                logger.warning(f"Failed to update LLM rate limit share on pod {self.pod_id}: {e}")
+            await asyncio.sleep(self.interval_seconds)
@@ -1,13 +1,21 @@
 """
 MCP Client Factory for creating isolated MCP client instances.
 
-This factory creates fresh MCP client instances on-demand, ensuring
-each alert session gets its own isolated client to avoid cross-context
-cancel scope issues.
+This factory creates fresh MCP client instances on-demand, so each alert
+session gets its own client state (sessions, failed servers, summarizer).
+Server connections are leased from a per-pod MCPSessionPool owned by the
+factory, so sessions skip the transport setup and MCP handshake when a
+healthy pooled connection is available. Servers configured with
+isolated_sessions still get a dedicated connection per session. Tool lists
+are served from a per-pod MCPToolCatalogCache shared by all clients.
 """
 
+from typing import Optional
+
 from tarsy.config.settings import Settings
 from tarsy.integrations.mcp.client import MCPClient
+from tarsy.integrations.mcp.session_pool import MCPSessionPool
+from tarsy.integrations.mcp.tool_catalog import MCPToolCatalogCache
 from tarsy.services.mcp_server_registry import MCPServerRegistry
 from tarsy.utils.logger import get_module_logger
 
@@ -19,6 +27,8 @@ class MCPClientFactory:
 
     settings: Settings
     mcp_registry: MCPServerRegistry
+    session_pool: Optional[MCPSessionPool]
+    tool_catalog: Optional[MCPToolCatalogCache]
 
     def __init__(self, settings: Settings, mcp_registry: MCPServerRegistry):
         """
@@ -30,13 +40,23 @@ class MCPClientFactory:
         """
         self.settings = settings
         self.mcp_registry = mcp_registry
+        self.session_pool = None
+        if settings.mcp_session_pool_enabled:
+            self.session_pool = MCPSessionPool(
+                max_sessions_per_server=settings.mcp_session_pool_max_per_server,
+                idle_timeout_seconds=settings.mcp_session_pool_idle_timeout_seconds,
+            )
+        self.tool_catalog = None
+        if settings.mcp_tool_catalog_ttl_seconds > 0:
+            self.tool_catalog = MCPToolCatalogCache(ttl_seconds=settings.mcp_tool_catalog_ttl_seconds)
 
     async def create_client(self) -> MCPClient:
         """
         Create and initialize a new MCP client instance.
 
         Each client is isolated and should be used for a single alert session.
-        The client must be closed after use to cleanup resources.
+        The client must be closed after use to return pooled connections and
+        cleanup resources.
 
         Returns:
             Initialized MCPClient instance
@@ -46,16 +66,22 @@ class MCPClientFactory:
         """
         logger.debug("Creating new MCP client instance")
 
-        # Create fresh client with shared registry
+        # Create fresh client with shared registry, connection pool and tool catalog
         client = MCPClient(
             settings=self.settings,
             mcp_registry=self.mcp_registry,
             summarizer=None,  # Summarizer will be set by agent when needed
+            session_pool=self.session_pool,
+            tool_catalog=self.tool_catalog,
         )
 
-        # Initialize the client (connects to MCP servers)
+        # Initialize the client (leases or opens connections to MCP servers)
         await client.initialize()
 
         logger.debug("MCP client instance created and initialized")
         return client
 
+    async def close(self) -> None:
+        """Close pooled MCP connections."""
+        if self.session_pool is not None:
+            await self.session_pool.close()
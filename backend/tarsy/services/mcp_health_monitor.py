@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 
 from mcp.types import Tool
 
+from tarsy.integrations.mcp.tool_catalog import MCPToolCatalogCache
 from tarsy.models.system_models import WarningCategory
 from tarsy.utils.logger import get_module_logger
 
@@ -33,6 +34,7 @@ class MCPHealthMonitor:
     - Add warnings for unhealthy servers
     - Clear warnings for healthy servers
     - Attempt recovery of startup-failed servers
+    - Refresh the shared tool catalog cache with the tools listed by each ping
     
     Does NOT:
     - Manipulate session state directly
@@ -44,7 +46,8 @@ class MCPHealthMonitor:
         self,
         mcp_client: "MCPClient",
         warnings_service: "SystemWarningsService",
-        check_interval: float = 15.0
+        check_interval: float = 15.0,
+        tool_catalog: Optional[MCPToolCatalogCache] = None
     ):
         """
         Initialize MCP health monitor.
@@ -53,6 +56,8 @@ class MCPHealthMonitor:
             mcp_client: MCP client instance to monitor
             warnings_service: System warnings service for managing warnings
             check_interval: Seconds between health checks (default: 15s)
+            tool_catalog: Tool catalog cache shared with the session MCP clients
+                (a private cache is used when None)
         """
         self._mcp_client = mcp_client
         self._warnings_service = warnings_service
@@ -61,9 +66,9 @@ class MCPHealthMonitor:
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
         
-        # Tool cache: server_id -> list of tools from last successful check
+        # Tool catalog: server_id -> tools from last successful check
         # Retains last successful tool list even if server becomes unhealthy
-        self._tool_cache: Dict[str, List[Tool]] = {}
+        self._tool_catalog = tool_catalog if tool_catalog is not None else MCPToolCatalogCache()
     
     async def start(self) -> None:
         """Start health monitoring background task."""
@@ -103,7 +108,7 @@ class MCPHealthMonitor:
         Returns:
             Dictionary mapping server IDs to their tool lists
         """
-        return {k: v.copy() for k, v in self._tool_cache.items()}
+        return self._tool_catalog.get_last_known()
     
     async def _monitor_loop(self) -> None:
         """Main monitoring loop - checks all servers periodically."""
@@ -186,8 +191,8 @@ class MCPHealthMonitor:
                 timeout=5.0
             )
             
-            # Update cache with new tool list
-            self._tool_cache[server_id] = tools_result.tools
+            # Refresh the catalog (also detects tool schema changes)
+            self._tool_catalog.put(server_id, tools_result.tools)
             logger.debug(f"Pinged and cached {len(tools_result.tools)} tools for {server_id}")
             return True
             
@@ -1,13 +1,18 @@
 """
 SessionClaimWorker - Global Alert Queue Management
 
-Manages the global alert queue by periodically claiming PENDING sessions
-from the database and dispatching them for processing when capacity is available.
+Manages the global alert queue by claiming PENDING sessions from the database
+in batches and dispatching them for processing when capacity is available.
+Claiming is event-driven ('session.enqueued' notifications) with polling as fallback.
+Admission is checked against a local ledger of dispatched sessions; the global
+limit is enforced atomically in the claim transaction via session leases.
 """
 
 import asyncio
-from typing import Callable, Optional
+import contextlib
+from typing import Callable, List, Optional, Set
 
+from tarsy.models.agent_config import QueueConfig
 from tarsy.models.constants import AlertSessionStatus
 from tarsy.services.history_service import HistoryService
 from tarsy.utils.logger import get_logger
@@ -19,11 +24,16 @@ class SessionClaimWorker:
     """
     Background worker for claiming pending sessions from the global queue.
     
-    Runs a periodic loop that:
-    1. Checks if global capacity is available (active sessions < max_concurrent_alerts)
-    2. Claims the next PENDING session atomically from the database
-    3. Dispatches the claimed session to the processing callback
-    4. Repeats until stopped
+    Runs a loop that:
+    1. Computes free capacity from the local ledger (max_concurrent_alerts - sessions
+       running on this pod) without touching the database
+    2. Claims up to that many PENDING sessions atomically in one transaction, which
+       also caps the batch by the global lease count and records a lease per session.
+       Sessions are picked by priority, then by weighted fair share across alert
+       types, skipping alert types at their concurrency cap (QueueConfig)
+    3. Dispatches the claimed sessions to the processing callback
+    4. Sleeps until woken by a queue notification, a locally finished session,
+       or the fallback polling interval - whichever comes first
     
     Supports graceful shutdown and multiple concurrent instances (multi-pod).
     """
@@ -34,7 +44,8 @@ class SessionClaimWorker:
         max_global_concurrent: int,
         claim_interval: float,
         process_callback: Callable,
-        pod_id: str = "unknown"
+        pod_id: str = "unknown",
+        queue_config: Optional[QueueConfig] = None
     ):
         """
         Initialize SessionClaimWorker.
@@ -42,20 +53,29 @@ class SessionClaimWorker:
         Args:
             history_service: HistoryService for database operations
             max_global_concurrent: Maximum concurrent sessions across all pods
-            claim_interval: Interval between claim attempts (seconds)
+            claim_interval: Fallback interval between claim attempts when no
+                            wake-up notification arrives (seconds)
             process_callback: Callback function to process claimed sessions
                              Signature: async def process_callback(session_id: str, alert: ChainContext)
             pod_id: Pod identifier for this worker
+            queue_config: Queue scheduling policy (fair-share weights and per-alert-type
+                          caps from agents.yaml); equal weights and no caps if not set
         """
         self.history_service = history_service
         self.max_global_concurrent = max_global_concurrent
         self.claim_interval = claim_interval
         self.process_callback = process_callback
         self.pod_id = pod_id
+        self.queue_config = queue_config or QueueConfig()
         
         self._worker_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
+        self._wake_event = asyncio.Event()
         self._running = False
+        
+        # Local capacity ledger: sessions dispatched by this worker and still running
+        self._active_sessions: Set[str] = set()
+        self._background_tasks: Set[asyncio.Task] = set()
     
     async def start(self) -> None:
         """Start the claim worker background task."""
@@ -65,6 +85,7 @@ class SessionClaimWorker:
         
         self._running = True
         self._stop_event.clear()
+        self._wake_event.clear()
         self._worker_task = asyncio.create_task(self._claim_loop())
         logger.info(
             f"SessionClaimWorker started on pod {self.pod_id} "
@@ -78,6 +99,7 @@ class SessionClaimWorker:
         
         logger.info(f"Stopping SessionClaimWorker on pod {self.pod_id}")
         self._stop_event.set()
+        self._wake_event.set()
         
         if self._worker_task:
             try:
@@ -93,45 +115,49 @@ class SessionClaimWorker:
         self._running = False
         logger.info(f"SessionClaimWorker stopped on pod {self.pod_id}")
     
+    def notify(self) -> None:
+        """Wake the claim loop immediately (new work queued or capacity freed)."""
+        self._wake_event.set()
+    
+    async def handle_queue_event(self, event: dict) -> None:
+        """
+        Event channel handler for 'queue' notifications.
+        
+        Registered on EventChannel.QUEUE so a 'session.enqueued' event published
+        by any pod triggers an immediate claim attempt on this pod.
+        
+        Args:
+            event: Event dict received from the event listener
+        """
+        logger.debug(
+            f"Pod {self.pod_id} received queue event {event.get('type')} "
+            f"for session {event.get('session_id')}"
+        )
+        self.notify()
+    
     async def _claim_loop(self) -> None:
         """Main claim loop - runs until stopped."""
         try:
+            # Account for sessions started without a lease (e.g. by pods running an
+            # older version) before the first capacity-capped claim
+            await self._reconcile_leases()
+            
             while not self._stop_event.is_set():
+                # Clear before checking so notifications arriving mid-claim are not lost
+                self._wake_event.clear()
                 try:
-                    # Check if we have capacity to process more sessions
-                    if await self._has_capacity():
-                        # Try to claim next pending session
-                        claimed_session = await self._claim_next_session()
-                        
-                        if claimed_session:
-                            # Dispatch claimed session for processing
-                            await self._dispatch_session(claimed_session)
-                        else:
-                            # No pending sessions available - wait before retry
-                            await asyncio.wait_for(
-                                self._stop_event.wait(),
-                                timeout=self.claim_interval
-                            )
-                    else:
-                        # At capacity - wait before checking again
-                        await asyncio.wait_for(
-                            self._stop_event.wait(),
-                            timeout=self.claim_interval
-                        )
-                
-                except asyncio.TimeoutError:
-                    # Timeout from wait_for is expected - continue loop
-                    continue
+                    # Claim up to the free capacity in a single batch
+                    available_slots = await self._available_slots()
+                    if available_slots > 0:
+                        claimed_sessions = await self._claim_sessions(available_slots)
+                        for session_data in claimed_sessions:
+                            await self._dispatch_session(session_data)
                 except Exception as e:
                     logger.error(f"Error in claim loop on pod {self.pod_id}: {e}", exc_info=True)
-                    # Wait before retry to avoid tight error loop
-                    try:
-                        await asyncio.wait_for(
-                            self._stop_event.wait(),
-                            timeout=self.claim_interval
-                        )
-                    except asyncio.TimeoutError:
-                        continue
+                
+                # Either capacity is exhausted or the queue is drained - wait for a
+                # wake-up notification, falling back to polling after claim_interval
+                await self._wait_for_wakeup()
         
         except asyncio.CancelledError:
             logger.info(f"SessionClaimWorker claim loop cancelled on pod {self.pod_id}")
@@ -140,67 +166,71 @@ class SessionClaimWorker:
             logger.error(f"Fatal error in claim loop on pod {self.pod_id}: {e}", exc_info=True)
             raise
     
-    async def _has_capacity(self) -> bool:
-        """
-        Check if there is capacity to process more sessions.
-        
-        Returns:
-            True if active sessions < max_global_concurrent, False otherwise
-        """
+    async def _wait_for_wakeup(self) -> None:
+        """Wait until notified, stopped, or the fallback polling interval elapses."""
+        # Timeout is expected - polling fallback
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._wake_event.wait(), timeout=self.claim_interval)
+    
+    async def _reconcile_leases(self) -> None:
+        """Reconcile global session leases against IN_PROGRESS sessions."""
         try:
-            active_count = await self._count_active_sessions()
-            has_capacity = active_count < self.max_global_concurrent
-            
-            if not has_capacity:
-                logger.debug(
-                    f"Pod {self.pod_id}: At capacity ({active_count}/{self.max_global_concurrent}), waiting..."
-                )
-            
-            return has_capacity
+            await self.history_service.reconcile_session_leases_async()
         except Exception as e:
-            logger.error(f"Failed to check capacity on pod {self.pod_id}: {e}")
-            return False
+            logger.warning(f"Failed to reconcile session leases on pod {self.pod_id}: {e}")
     
-    async def _count_active_sessions(self) -> int:
+    async def _available_slots(self) -> int:
         """
-        Count sessions currently in IN_PROGRESS state across all pods.
+        Compute how many more sessions this pod may try to claim.
+        
+        O(1) check against the local ledger: a pod can never run more than the
+        global limit itself, and the claim transaction trims the batch further
+        based on leases held by other pods.
         
         Returns:
-            Count of active sessions
+            Number of free slots (0 when this pod alone is at capacity)
         """
-        try:
-            # Run blocking database operation in executor
-            count = await asyncio.to_thread(
-                self.history_service.count_sessions_by_status,
-                AlertSessionStatus.IN_PROGRESS.value
+        active_count = len(self._active_sessions)
+        available_slots = max(self.max_global_concurrent - active_count, 0)
+        if available_slots == 0:
+            logger.debug(
+                f"Pod {self.pod_id}: At capacity ({active_count}/{self.max_global_concurrent}), waiting..."
             )
-            return count
-        except Exception as e:
-            logger.error(f"Failed to count active sessions: {e}")
-            raise
+        return available_slots
     
-    async def _claim_next_session(self) -> Optional[dict]:
+    async def _claim_sessions(self, limit: int) -> List[dict]:
         """
-        Atomically claim the next PENDING session from the database.
+        Atomically claim up to `limit` PENDING sessions from the database.
+        
+        Args:
+            limit: Maximum number of sessions to claim
         
         Returns:
-            Dict with session_id and alert_context if claimed, None otherwise
+            List of dicts with session_id and alert context data (empty if none claimed)
         """
         try:
-            # Run blocking database operation in executor
-            session = await asyncio.to_thread(
-                self.history_service.claim_next_pending_session,
-                self.pod_id
+            sessions = await self.history_service.claim_pending_sessions_async(
+                self.pod_id,
+                limit,
+                self.max_global_concurrent,
+                self.queue_config
             )
-            
-            if not session:
-                return None
-            
-            logger.info(f"Pod {self.pod_id} claimed session {session.session_id} for processing")
-            
-            # Return session data needed for processing
-            # alert_context will be reconstructed from session data
-            return {
+        except Exception as e:
+            logger.error(f"Failed to claim pending sessions on pod {self.pod_id}: {e}")
+            return []
+        
+        if not sessions:
+            return []
+        
+        logger.info(
+            f"Pod {self.pod_id} claimed {len(sessions)} session(s) for processing: "
+            f"{', '.join(session.session_id for session in sessions)}"
+        )
+        
+        # Return session data needed for processing
+        # alert_context will be reconstructed from session data
+        return [
+            {
                 "session_id": session.session_id,
                 "alert_data": session.alert_data,
                 "alert_type": session.alert_type,
@@ -211,10 +241,8 @@ class SessionClaimWorker:
                 "session_metadata": session.session_metadata,
                 "started_at_us": session.started_at_us  # Timestamp for ProcessingAlert
             }
-        
-        except Exception as e:
-            logger.error(f"Failed to claim next session on pod {self.pod_id}: {e}")
-            return None
+            for session in sessions
+        ]
     
     async def _dispatch_session(self, session_data: dict) -> None:
         """
@@ -252,8 +280,10 @@ class SessionClaimWorker:
             if session_data.get("session_metadata"):
                 alert_context.session_metadata = session_data["session_metadata"]
             
-            # Dispatch to processing callback
-            asyncio.create_task(self.process_callback(session_id, alert_context))
+            # Dispatch to processing callback; release the slot once it finishes
+            self._active_sessions.add(session_id)
+            task = asyncio.create_task(self.process_callback(session_id, alert_context))
+            task.add_done_callback(lambda _: self._on_session_done(session_id))
             logger.debug(f"Pod {self.pod_id} dispatched session {session_id} for processing")
             
         except Exception as e:
@@ -267,10 +297,43 @@ class SessionClaimWorker:
             try:
                 session_id = session_data.get("session_id")
                 if session_id:
+                    self._active_sessions.discard(session_id)
                     self.history_service.update_session_status(
                         session_id=session_id,
                         status=AlertSessionStatus.FAILED.value,
                         error_message=f"Failed to dispatch session: {str(e)}"
                     )
+                    self.history_service.release_session_lease(session_id)
             except Exception as update_error:
                 logger.error(f"Failed to mark session as failed: {update_error}")
+    
+    def _on_session_done(self, session_id: str) -> None:
+        """
+        Free the local slot of a finished session and release its global lease.
+        
+        Args:
+            session_id: Session whose processing task finished
+        """
+        self._active_sessions.discard(session_id)
+        task = asyncio.create_task(self._release_lease(session_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _release_lease(self, session_id: str) -> None:
+        """
+        Release the global lease of a finished session, then wake the claim loop
+        since the freed slot can be refilled immediately.
+        
+        The lease is kept while the session is still IN_PROGRESS (e.g. the task
+        died without recording a terminal status); such leases, and any failed
+        release, are reconciled by the orphan-cleanup path.
+        
+        Args:
+            session_id: Session whose lease should be released
+        """
+        try:
+            await self.history_service.release_session_lease_async(session_id)
+        except Exception as e:
+            logger.warning(f"Failed to release lease for session {session_id} on pod {self.pod_id}: {e}")
+        finally:
+            self.notify()
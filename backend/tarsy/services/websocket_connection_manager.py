@@ -1,30 +1,231 @@
-"""WebSocket connection manager for real-time event distribution."""
+"""WebSocket connection manager for real-time event distribution.
 
+The manager is the pod's channel fan-out hub:
+
+- One EventListener callback per channel, registered when the first
+  connection subscribes and removed when the last one leaves, no matter how
+  many connections watch the channel
+- Each event is serialized once per channel and handed to every subscriber
+- Delivery goes through a bounded send queue per connection drained by its
+  own writer task, so broadcasting never awaits the network
+- A connection whose queue overflows is handled by the configured
+  WebSocketOverflowPolicy, so a stalled client only ever hurts itself
+"""
+
+import asyncio
 import json
-from typing import Dict, Set
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
 from fastapi import WebSocket
 
+from tarsy.models.constants import WebSocketOverflowPolicy
+from tarsy.services.events.base import AsyncCallback, EventListener
+from tarsy.services.events.stream_transport import merge_stream_chunks
 from tarsy.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum serialized events buffered per connection before the overflow policy applies
+DEFAULT_SEND_QUEUE_SIZE = 256
+
+# Event types that are not persisted (clients cannot catch up on them) and can
+# be merged with the next event of the same stream
+TRANSIENT_EVENT_TYPES = frozenset({"llm.stream.chunk"})
+
+# Close code sent to evicted slow consumers ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+def _stream_key(event: dict) -> Optional[Tuple[Any, ...]]:
+    """Identify the stream a transient event belongs to (None for persisted events)."""
+    if event.get("type") not in TRANSIENT_EVENT_TYPES:
+        return None
+    return (
+        event.get("session_id"),
+        event.get("stage_execution_id"),
+        event.get("stream_type"),
+        event.get("llm_interaction_id"),
+        event.get("mcp_event_id"),
+    )
+
+
+class _PendingEvent:
+    """Serialized event waiting in a connection's send queue."""
+
+    __slots__ = ("event_json", "stream_key", "enqueued_at")
+
+    def __init__(self, event_json: str, stream_key: Optional[Tuple[Any, ...]], enqueued_at: float) -> None:
+        self.event_json = event_json
+        self.stream_key = stream_key
+        self.enqueued_at = enqueued_at
+
+
+class ConnectionSender:
+    """
+    Bounded send queue of one connection, drained by its writer task.
+
+    Enqueueing never awaits; when the queue is full the overflow policy
+    decides what gives way. Only stream chunks are ever dropped or merged: a
+    persisted event that does not fit evicts the connection instead, so the
+    client reconnects and catches up from its last delivered event.
+    Tracks delivery lag for monitoring.
+    """
+
+    def __init__(self, connection_id: str, max_size: int, policy: WebSocketOverflowPolicy) -> None:
+        self.connection_id = connection_id
+        self.max_size = max_size
+        self.policy = policy
+        self.pending: Deque[_PendingEvent] = deque()
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.evicted = False
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def enqueue(self, event_json: str, stream_key: Optional[Tuple[Any, ...]]) -> bool:
+        """
+        Queue a serialized event, applying the overflow policy when full.
+
+        Returns:
+            False if the connection must be evicted (DISCONNECT policy), True otherwise
+        """
+        if self.evicted:
+            return True
+        if len(self.pending) >= self.max_size and not self._make_room(event_json, stream_key):
+            return not self.evicted
+        self.pending.append(_PendingEvent(event_json, stream_key, time.monotonic()))
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    def _make_room(self, event_json: str, stream_key: Optional[Tuple[Any, ...]]) -> bool:
+        """Apply the overflow policy; returns True if the new event should still be appended."""
+        if self.policy == WebSocketOverflowPolicy.DISCONNECT:
+            self.evict()
+            return False
+
+        if self.policy == WebSocketOverflowPolicy.COALESCE and stream_key is not None:
+            # Fold the new chunk into the pending one of its stream (deltas are merged)
+            for pending in self.pending:
+                if pending.stream_key == stream_key:
+                    pending.event_json = json.dumps(
+                        merge_stream_chunks(json.loads(pending.event_json), json.loads(event_json))
+                    )
+                    self.coalesced += 1
+                    return False
+
+        for index, pending in enumerate(self.pending):
+            if pending.stream_key is not None:
+                del self.pending[index]
+                self._record_drop("oldest stream chunk")
+                return True
+
+        if stream_key is not None:
+            # Nothing transient to give up: the incoming chunk is the cheapest loss
+            self._record_drop("incoming stream chunk")
+            return False
+
+        # Only persisted events are queued; dropping one would hide it from catchup too
+        self.evict()
+        return False
+
+    def _record_drop(self, what: str) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 100 == 0:
+            logger.warning(
+                f"Send queue full for {self.connection_id}, dropped {what} "
+                f"({self.dropped} dropped so far)"
+            )
+
+    def evict(self) -> None:
+        """Discard pending events and stop accepting new ones."""
+        self.evicted = True
+        self.dropped += len(self.pending)
+        self.pending.clear()
+        self._idle.set()
+
+    async def run(self, websocket: WebSocket) -> None:
+        """Writer task: send queued events to the connection in order."""
+        while True:
+            while not self.pending:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            pending = self.pending.popleft()
+            try:
+                await websocket.send_text(pending.event_json)
+                self.sent += 1
+            except Exception as e:
+                logger.error(f"Failed to send to {self.connection_id}: {e}")
+                # Don't disconnect here - let the WebSocket endpoint handle it
+            lag_ms = (time.monotonic() - pending.enqueued_at) * 1000
+            self.last_lag_ms = lag_ms
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    async def wait_idle(self) -> None:
+        """Wait until every queued event has been handed to the WebSocket."""
+        await self._idle.wait()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, delivery counters and lag of this connection."""
+        oldest_pending_ms = (
+            (time.monotonic() - self.pending[0].enqueued_at) * 1000 if self.pending else 0.0
+        )
+        return {
+            "connection_id": self.connection_id,
+            "queue_depth": len(self.pending),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "oldest_pending_ms": round(oldest_pending_ms, 1),
+            "last_lag_ms": round(self.last_lag_ms, 1),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+        }
+
 
 class WebSocketConnectionManager:
-    """Manages WebSocket connections and channel subscriptions."""
+    """Manages WebSocket connections, channel subscriptions and event fan-out."""
+
+    def __init__(
+        self,
+        send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        overflow_policy: WebSocketOverflowPolicy = WebSocketOverflowPolicy.DROP_TRANSIENT,
+    ) -> None:
+        """
+        Initialize connection manager.
 
-    def __init__(self) -> None:
-        """Initialize connection manager."""
+        Args:
+            send_queue_size: Maximum events buffered per connection
+            overflow_policy: What gives way when a connection's queue is full
+        """
+        self.send_queue_size = send_queue_size
+        self.overflow_policy = WebSocketOverflowPolicy(overflow_policy)
         # connection_id -> WebSocket
         self.connections: Dict[str, WebSocket] = {}
         # connection_id -> set of subscribed channels
         self.subscriptions: Dict[str, Set[str]] = {}
         # channel -> set of connection_ids
         self.channel_subscribers: Dict[str, Set[str]] = {}
+        # connection_id -> bounded send queue
+        self.senders: Dict[str, ConnectionSender] = {}
+        # connection_id -> task draining the send queue
+        self._writers: Dict[str, asyncio.Task] = {}
+        # channel -> the single callback registered with the EventListener
+        self._listener_callbacks: Dict[str, AsyncCallback] = {}
+        # Serializes listener registration so concurrent subscribers register once
+        self._listener_lock = asyncio.Lock()
+        # Close handshakes of evicted connections (kept referenced until done)
+        self._evictions: Set[asyncio.Task] = set()
 
     async def connect(self, connection_id: str, websocket: WebSocket) -> None:
         """
-        Accept WebSocket connection.
+        Accept WebSocket connection and start its writer task.
 
         Args:
             connection_id: Unique identifier for this connection
@@ -33,11 +234,18 @@ class WebSocketConnectionManager:
         await websocket.accept()
         self.connections[connection_id] = websocket
         self.subscriptions[connection_id] = set()
+        sender = ConnectionSender(connection_id, self.send_queue_size, self.overflow_policy)
+        self.senders[connection_id] = sender
+        self._writers[connection_id] = asyncio.create_task(
+            sender.run(websocket), name=f"websocket-writer-{connection_id}"
+        )
         logger.debug(f"WebSocket connected: {connection_id}")
 
     def disconnect(self, connection_id: str) -> None:
         """
-        Remove connection and cleanup subscriptions.
+        Remove connection, stop its writer and cleanup subscriptions.
+
+        Channel listener callbacks are removed separately by detach_channel().
 
         Args:
             connection_id: Connection to disconnect
@@ -51,6 +259,14 @@ class WebSocketConnectionManager:
                         del self.channel_subscribers[channel]
             del self.subscriptions[connection_id]
 
+        # Stop writer (undelivered events are dropped with the connection)
+        writer = self._writers.pop(connection_id, None)
+        if writer is not None:
+            writer.cancel()
+        sender = self.senders.pop(connection_id, None)
+        if sender is not None:
+            sender.evict()
+
         # Remove connection
         if connection_id in self.connections:
             del self.connections[connection_id]
@@ -95,9 +311,48 @@ class WebSocketConnectionManager:
 
         logger.debug(f"Unsubscribed {connection_id} from channel '{channel}'")
 
+    async def attach_channel(self, channel: str, event_listener: EventListener) -> None:
+        """
+        Register the channel's fan-out callback with the EventListener (once per channel).
+
+        Args:
+            channel: Channel that gained a subscriber
+            event_listener: Event listener delivering the channel's events
+        """
+        async with self._listener_lock:
+            if channel in self._listener_callbacks or channel not in self.channel_subscribers:
+                return
+
+            async def callback(event: dict) -> None:
+                # Called by EventListener when a DB event occurs on the channel
+                await self.broadcast_to_channel(channel, event)
+
+            await event_listener.subscribe(channel, callback)
+            self._listener_callbacks[channel] = callback
+            logger.debug(f"Registered fan-out for channel '{channel}' with EventListener")
+
+    async def detach_channel(self, channel: str, event_listener: EventListener) -> None:
+        """
+        Remove the channel's fan-out callback once the channel has no subscribers.
+
+        Args:
+            channel: Channel that lost a subscriber
+            event_listener: Event listener the callback was registered with
+        """
+        async with self._listener_lock:
+            if channel in self.channel_subscribers or channel not in self._listener_callbacks:
+                return
+            callback = self._listener_callbacks.pop(channel)
+            await event_listener.unsubscribe(channel, callback)
+            logger.debug(f"Removed fan-out for channel '{channel}' from EventListener")
+
     async def broadcast_to_channel(self, channel: str, event: dict) -> None:
         """
-        Broadcast event to all subscribers of a channel.
+        Queue an event for all subscribers of a channel.
+
+        The event is serialized once and enqueued for every subscriber without
+        awaiting the network; each connection's writer task does the sending.
+        Full queues are handled by the overflow policy.
 
         Args:
             channel: Channel to broadcast to
@@ -106,15 +361,76 @@ class WebSocketConnectionManager:
         if channel not in self.channel_subscribers:
             return
 
-        subscribers = list(self.channel_subscribers[channel])
         event_json = json.dumps(event)
+        stream_key = _stream_key(event)
 
-        for connection_id in subscribers:
-            websocket = self.connections.get(connection_id)
-            if websocket:
-                try:
-                    await websocket.send_text(event_json)
-                except Exception as e:
-                    logger.error(f"Failed to send to {connection_id}: {e}")
-                    # Don't disconnect here - let the WebSocket endpoint handle it
+        for connection_id in list(self.channel_subscribers[channel]):
+            sender = self.senders.get(connection_id)
+            if sender is not None and not sender.enqueue(event_json, stream_key):
+                self._evict(connection_id)
+
+    def send_to_connection(self, connection_id: str, *messages: dict) -> None:
+        """
+        Queue messages for one connection behind the events already queued for it.
+
+        Replies to the client (confirmations, catchup, pong) go through the same
+        send queue and overflow policy as broadcasts, so only the writer task
+        ever sends on the WebSocket. The messages are queued together, so no
+        broadcast lands between them.
+
+        Args:
+            connection_id: Connection to send to
+            messages: Messages to send, in order
+        """
+        sender = self.senders.get(connection_id)
+        if sender is None:
+            return
+        for message in messages:
+            if not sender.enqueue(json.dumps(message), _stream_key(message)):
+                self._evict(connection_id)
+                return
+
+    def _evict(self, connection_id: str) -> None:
+        """Close a slow consumer's WebSocket without awaiting it."""
+        logger.warning(
+            f"Evicting slow WebSocket consumer {connection_id}: send queue full "
+            f"({self.send_queue_size} events)"
+        )
+        writer = self._writers.get(connection_id)
+        if writer is not None:
+            writer.cancel()
+        websocket = self.connections.get(connection_id)
+        if websocket is None:
+            return
+
+        async def close() -> None:
+            try:
+                await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Slow consumer")
+            except Exception as e:
+                logger.debug(f"Failed to close evicted connection {connection_id}: {e}")
+
+        task = asyncio.create_task(close(), name=f"websocket-evict-{connection_id}")
+        self._evictions.add(task)
+        task.add_done_callback(self._evictions.discard)
+
+    def get_connection_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-connection send queue depth, counters and delivery lag.
+
+        Returns:
+            Mapping of connection_id to stats (see ConnectionSender.get_stats)
+        """
+        return {
+            connection_id: {
+                **sender.get_stats(),
+                "channels": sorted(self.subscriptions.get(connection_id, ())),
+                "evicted": sender.evicted,
+            }
+            for connection_id, sender in list(self.senders.items())
+        }
 
+    async def flush(self) -> None:
+        """Wait until every queued event has been handed to its WebSocket."""
+        await asyncio.gather(
+            *(sender.wait_idle() for sender in list(self.senders.values()))
+        )
@@ -0,0 +1,58 @@
+"""
+Alert fingerprinting for submission-time deduplication.
+
+A fingerprint identifies re-fires of the same alert: it is a hash of the alert
+type and the values of a configurable set of key fields from the client's
+alert data (dotted paths address nested fields, e.g. "labels.pod").
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+_MISSING = object()
+
+
+def _resolve_path(data: Dict[str, Any], path: str) -> Any:
+    """Resolve a dotted path in nested dicts, returning _MISSING if any segment is absent."""
+    value: Any = data
+    for segment in path.split("."):
+        if not isinstance(value, dict) or segment not in value:
+            return _MISSING
+        value = value[segment]
+    return value
+
+
+def compute_alert_fingerprint(
+    alert_type: str,
+    alert_data: Dict[str, Any],
+    key_fields: List[str]
+) -> Optional[str]:
+    """
+    Compute the deduplication fingerprint of an alert.
+
+    Args:
+        alert_type: Alert type the alert is processed as
+        alert_data: Client's alert data
+        key_fields: Dotted paths of the fields identifying an alert instance
+
+    Returns:
+        Hex SHA-256 fingerprint, or None if none of the key fields is present
+        (such alerts are never deduplicated)
+    """
+    key_values = {}
+    for path in key_fields:
+        value = _resolve_path(alert_data, path)
+        if value is not _MISSING:
+            key_values[path] = value
+
+    if not key_values:
+        return None
+
+    canonical = json.dumps(
+        {"alert_type": alert_type, "keys": key_values},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
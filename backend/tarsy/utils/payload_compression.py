@@ -0,0 +1,111 @@
+"""
+Compression of large history payloads.
+
+MCP tool results, tool catalogs and LLM conversation messages above
+COMPRESSION_THRESHOLD_BYTES are stored zlib-compressed in a blob column next
+to their plain column, which is left empty. The repositories compress on
+write and decompress on read, so callers only ever see the plain values.
+
+Every payload offered for compression is counted per kind, so the
+compression ratio this pod achieves can be reported.
+"""
+
+import threading
+import zlib
+from typing import Any, Dict, Optional
+
+# Payloads smaller than this (UTF-8 bytes) are stored as they are
+COMPRESSION_THRESHOLD_BYTES = 4096
+COMPRESSION_LEVEL = 6
+# Compressed payloads must save at least this share of their size to be stored compressed
+MIN_SAVINGS_RATIO = 0.1
+# Compressed bytes read from the database to build a preview without loading the whole blob
+PREVIEW_COMPRESSED_BYTES = 2048
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _record(kind: str, raw_bytes: int, stored_bytes: int, compressed: bool) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(kind, {
+            "payloads": 0,
+            "compressed_payloads": 0,
+            "raw_bytes": 0,
+            "stored_bytes": 0,
+        })
+        stats["payloads"] += 1
+        stats["compressed_payloads"] += int(compressed)
+        stats["raw_bytes"] += raw_bytes
+        stats["stored_bytes"] += stored_bytes
+
+
+def compress_payload(text: str, kind: str) -> Optional[bytes]:
+    """
+    Compress a payload if it is large and compresses well.
+
+    Args:
+        text: Serialized payload
+        kind: Payload kind the compression is counted under
+
+    Returns:
+        The compressed payload, or None if it should be stored as it is
+    """
+    raw = text.encode("utf-8")
+    if len(raw) >= COMPRESSION_THRESHOLD_BYTES:
+        compressed = zlib.compress(raw, COMPRESSION_LEVEL)
+        if len(compressed) <= len(raw) * (1 - MIN_SAVINGS_RATIO):
+            _record(kind, len(raw), len(compressed), compressed=True)
+            return compressed
+    _record(kind, len(raw), len(raw), compressed=False)
+    return None
+
+
+def decompress_payload(data: bytes) -> str:
+    """Decompress a payload stored by compress_payload."""
+    return zlib.decompress(data).decode("utf-8")
+
+
+def decompress_payload_prefix(data: Optional[bytes], max_chars: int) -> Optional[str]:
+    """
+    Decompress the start of a payload from a prefix of its compressed bytes.
+
+    Args:
+        data: Leading bytes of a compressed payload (at most PREVIEW_COMPRESSED_BYTES
+            are needed), or None
+        max_chars: Characters wanted
+
+    Returns:
+        Up to max_chars leading characters of the payload, or None if data is None
+    """
+    if data is None:
+        return None
+    decompressor = zlib.decompressobj()
+    # A UTF-8 character takes at most 4 bytes; a character cut off at the end is dropped
+    raw = decompressor.decompress(bytes(data), max_chars * 4)
+    return raw.decode("utf-8", errors="ignore")[:max_chars]
+
+
+def get_compression_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the payload compression counters of this process.
+
+    Returns:
+        Payload kind -> payloads, compressed_payloads, raw_bytes, stored_bytes
+        and compression_ratio (raw / stored bytes)
+    """
+    with _stats_lock:
+        return {
+            kind: {
+                **stats,
+                "compression_ratio": round(stats["raw_bytes"] / stats["stored_bytes"], 2)
+                if stats["stored_bytes"] else 1.0,
+            }
+            for kind, stats in _stats.items()
+        }
+
+
+def reset_compression_stats() -> None:
+    """Clear the payload compression counters."""
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,138 @@
+"""
+LLM conversation storage benchmark.
+
+Stores the LLM interactions of simulated ReAct sessions (each iteration resends
+the whole conversation so far plus a tool observation) into a file-backed
+SQLite database, with:
+
+- inline: every interaction stores its complete conversation (the previous
+          behavior; rows written before the migration are still read this way)
+- hashed: messages stored once per session in llm_conversation_messages and
+          referenced by hash from llm_interactions
+
+Reports bytes written per session (conversation JSON, hash lists and message
+rows), database file size and how long get_session_details takes to load
+and rehydrate a session.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_conversation_storage [--sessions 5] [--iterations 30]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict
+
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import func  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine, select  # noqa: E402
+
+from tarsy.models.unified_interactions import (  # noqa: E402
+    LLMConversation,
+    LLMConversationMessage,
+    LLMInteraction,
+    LLMMessage,
+    MessageRole,
+)
+from tarsy.repositories.history_repository import HistoryRepository  # noqa: E402
+from tests.benchmarks.common import print_table  # noqa: E402
+from tests.utils import SessionFactory  # noqa: E402
+
+
+def _observation(n: int, size: int) -> str:
+    line = f"pod-{n}-abcde   1/1   Running   0   {n}h   10.0.{n % 255}.1   node-{n % 7}\n"
+    return "Observation: " + line * max(1, size // len(line))
+
+
+def _store_session(repo: HistoryRepository, session_id: str, iterations: int, observation_size: int,
+                   mode: str) -> None:
+    repo.create_alert_session(SessionFactory.create_test_session(session_id=session_id))
+    messages = [
+        LLMMessage(role=MessageRole.SYSTEM, content="You are an expert SRE. " * 200),
+        LLMMessage(role=MessageRole.USER, content="Alert: pod crashlooping in namespace prod. " * 20),
+    ]
+    for n in range(iterations):
+        messages = messages + [
+            LLMMessage(role=MessageRole.ASSISTANT, content=f"Thought: check step {n}\nAction: kubectl_get\n"),
+        ]
+        interaction = LLMInteraction(
+            session_id=session_id,
+            model_name="gemini-2.5-pro",
+            timestamp_us=1_000_000 + n,
+            conversation=LLMConversation(messages=messages),
+        )
+        if mode == "inline":
+            repo.llm_interaction_repo.create(interaction)
+        else:
+            repo.create_llm_interaction(interaction)
+        messages = messages + [LLMMessage(role=MessageRole.USER, content=_observation(n, observation_size))]
+
+
+def _run_mode(mode: str, sessions: int, iterations: int, observation_size: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, f"{mode}.db")
+        engine = create_engine(f"sqlite:///{path}")
+        SQLModel.metadata.create_all(engine)
+
+        started = time.perf_counter()
+        with Session(engine) as session:
+            repo = HistoryRepository(session)
+            for s in range(sessions):
+                _store_session(repo, f"session-{s}", iterations, observation_size, mode)
+        write_s = time.perf_counter() - started
+
+        with Session(engine) as session:
+            conversation_bytes = session.exec(
+                select(func.coalesce(func.sum(func.length(LLMInteraction.conversation)), 0))
+            ).one()
+            hash_bytes = session.exec(
+                select(func.coalesce(func.sum(func.length(LLMInteraction.message_hashes)), 0))
+            ).one()
+            message_bytes = session.exec(
+                select(func.coalesce(func.sum(func.length(LLMConversationMessage.content)), 0))
+            ).one()
+
+        load_ms = []
+        with Session(engine) as session:
+            repo = HistoryRepository(session)
+            for s in range(sessions):
+                session.expunge_all()
+                started = time.perf_counter()
+                details = repo.get_session_details(f"session-{s}")
+                load_ms.append((time.perf_counter() - started) * 1000)
+                assert len(details.session_level_interactions) == iterations
+        engine.dispose()
+        file_mb = os.path.getsize(path) / 1_000_000
+
+    return {
+        "kb_per_session": (conversation_bytes + hash_bytes + message_bytes) / sessions / 1000,
+        "file_mb": file_mb,
+        "write_s": write_s,
+        "load_ms": sum(load_ms) / len(load_ms),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=5, help="Sessions to store")
+    parser.add_argument("--iterations", type=int, default=30, help="ReAct iterations per session")
+    parser.add_argument("--observation-kb", type=int, default=8, help="Size of each tool observation")
+    args = parser.parse_args()
+
+    rows = []
+    for mode in ("inline", "hashed"):
+        result = _run_mode(mode, args.sessions, args.iterations, args.observation_kb * 1000)
+        rows.append([mode, result["kb_per_session"], result["file_mb"], result["write_s"], result["load_ms"]])
+
+    print_table(
+        f"Conversation storage - {args.sessions} sessions x {args.iterations} iterations "
+        f"({args.observation_kb}KB observations)",
+        ["mode", "KB written/session", "db file MB", "write s", "details load ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
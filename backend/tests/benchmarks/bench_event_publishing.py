@@ -0,0 +1,135 @@
+"""
+Event publishing benchmark.
+
+Runs concurrent simulated alert sessions against a file-backed SQLite database.
+Each ReAct iteration publishes a progress update (global and session channel),
+an MCP tool call started/completed pair and an LLM interaction through the
+event helpers, with:
+
+- direct:  one database session and one transaction per event per channel
+           (the previous behavior, still used when batching is disabled)
+- batched: EventBatchPublisher queues events and writes them in batches
+
+Reports events per commit, wall time until the last event is persisted and
+how long each helper call keeps the caller waiting.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_event_publishing [--sessions 10] [--iterations 20]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import event as sa_event  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from tarsy.models.db_models import Event  # noqa: E402
+from tarsy.services.events import event_helpers  # noqa: E402
+from tarsy.services.events.batch_publisher import EventBatchPublisher  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+
+
+async def _react_iteration(session_id: str, n: int, waits_ms: List[float]) -> None:
+    """Publish the events of one ReAct iteration, recording caller wait times."""
+    calls = [
+        event_helpers.publish_session_progress_update(session_id, "investigating"),
+        event_helpers.publish_mcp_tool_call_started(session_id, f"comm-{n}", "kubernetes", "get_pods", {}),
+        event_helpers.publish_mcp_tool_call(session_id, f"mcp-{n}", "get_pods"),
+        event_helpers.publish_llm_interaction(session_id, f"llm-{n}"),
+    ]
+    for call in calls:
+        started = time.perf_counter()
+        await call
+        waits_ms.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0)  # Let other sessions interleave like real agents
+
+
+async def _run_session(session_id: str, iterations: int, waits_ms: List[float]) -> None:
+    for n in range(iterations):
+        await _react_iteration(session_id, n, waits_ms)
+
+
+async def _run_mode(mode: str, sessions: int, iterations: int, latency_ms: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'events.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Event.__table__.create)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        commits = 0
+
+        def on_commit(_conn) -> None:
+            nonlocal commits
+            commits += 1
+
+        sa_event.listen(engine.sync_engine, "commit", on_commit)
+
+        batch_publisher = None
+        if mode == "batched":
+            batch_publisher = EventBatchPublisher(session_factory, max_latency_ms=latency_ms)
+            await batch_publisher.start()
+
+        waits_ms: List[float] = []
+        with patch.object(event_helpers, "get_async_session_factory", return_value=session_factory), \
+             patch.object(event_helpers, "get_event_batch_publisher", return_value=batch_publisher), \
+             patch.object(event_helpers.logger, "info"):
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                _run_session(f"session-{s}", iterations, waits_ms) for s in range(sessions)
+            ))
+            if batch_publisher is not None:
+                await batch_publisher.flush()
+            elapsed = time.perf_counter() - started
+
+        if batch_publisher is not None:
+            await batch_publisher.stop()
+        async with session_factory() as session:
+            persisted = (await session.execute(select(func.count()).select_from(Event))).scalar_one()
+        await engine.dispose()
+
+    stats = summarize(waits_ms)
+    return {
+        "events": float(persisted),
+        "events_per_commit": persisted / max(commits, 1),
+        "total_s": elapsed,
+        "events_per_s": persisted / elapsed,
+        "wait_p50_ms": stats["p50"],
+        "wait_p95_ms": stats["p95"],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent alert sessions")
+    parser.add_argument("--iterations", type=int, default=20, help="ReAct iterations per session")
+    parser.add_argument("--latency-ms", type=int, default=20, help="Batch publisher max latency")
+    args = parser.parse_args()
+
+    rows = []
+    for mode in ("direct", "batched"):
+        result = await _run_mode(mode, args.sessions, args.iterations, args.latency_ms)
+        rows.append([
+            mode, int(result["events"]), result["events_per_commit"], result["total_s"],
+            result["events_per_s"], result["wait_p50_ms"], result["wait_p95_ms"],
+        ])
+
+    print_table(
+        f"Event publishing - {args.sessions} sessions x {args.iterations} iterations",
+        ["mode", "events", "events/commit", "total s", "events/s", "wait p50 ms", "wait p95 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+"""
+Interaction history write benchmark.
+
+Runs concurrent simulated alert sessions that log their interactions through
+HistoryService the way the history hooks do (store an LLM or MCP interaction,
+then record session activity), with each session completing a stage every
+few iterations, and:
+
+- immediate: one transaction per interaction and per activity update
+             (HISTORY_WRITE_DURABILITY=immediate)
+- stage:     write-behind buffer batching interactions across sessions and
+             collapsing activity updates, flushed at stage boundaries
+             (HISTORY_WRITE_DURABILITY=stage)
+
+Reports commits, UPDATE statements, total time and how long logging calls take.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_history_writes [--sessions 20] [--iterations 20]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict, List
+from unittest.mock import Mock, patch
+
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import event  # noqa: E402
+
+from tarsy.config.settings import Settings  # noqa: E402
+from tarsy.models.constants import StageStatus  # noqa: E402
+from tarsy.models.db_models import StageExecution  # noqa: E402
+from tarsy.models.unified_interactions import (  # noqa: E402
+    LLMConversation,
+    LLMInteraction,
+    LLMMessage,
+    MCPInteraction,
+    MessageRole,
+)
+from tarsy.services.history_service import HistoryService  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+from tests.utils import SessionFactory  # noqa: E402
+
+STAGE_ITERATIONS = 5
+
+
+def _llm_interaction(session_id: str, n: int) -> LLMInteraction:
+    return LLMInteraction(
+        session_id=session_id,
+        model_name="gemini-2.5-pro",
+        conversation=LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE assistant. " * 20),
+            LLMMessage(role=MessageRole.USER, content=f"Iteration {n}: investigate the alert. " * 20),
+            LLMMessage(role=MessageRole.ASSISTANT, content="Thought: check pods\nAction: get_pods " * 20),
+        ]),
+        duration_ms=1200,
+    )
+
+
+def _mcp_interaction(session_id: str, n: int) -> MCPInteraction:
+    return MCPInteraction(
+        session_id=session_id,
+        server_name="kubernetes-server",
+        communication_type="tool_call",
+        tool_name="get_pods",
+        tool_arguments={"namespace": f"ns-{n}"},
+        tool_result={"pods": [{"name": f"pod-{i}", "status": "Running"} for i in range(20)]},
+        success=True,
+    )
+
+
+async def _run_session(service: HistoryService, session_id: str, iterations: int,
+                       latencies_ms: List[float]) -> None:
+    stage = None
+    for n in range(iterations):
+        if n % STAGE_ITERATIONS == 0:
+            if stage:
+                stage.status = StageStatus.COMPLETED.value
+                await service.update_stage_execution(stage)
+            stage = StageExecution(
+                session_id=session_id, stage_id=f"stage-{n}", stage_index=n // STAGE_ITERATIONS,
+                stage_name="Analysis", agent="KubernetesAgent", status=StageStatus.ACTIVE.value,
+            )
+            await service.create_stage_execution(stage)
+        for log in (
+            service.store_llm_interaction_async(_llm_interaction(session_id, n)),
+            service.record_session_interaction_async(session_id),
+            service.store_mcp_interaction_async(_mcp_interaction(session_id, n)),
+            service.record_session_interaction_async(session_id),
+        ):
+            started = time.perf_counter()
+            await log
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.005)  # The LLM call of the next iteration
+    stage.status = StageStatus.COMPLETED.value
+    await service.update_stage_execution(stage)
+
+
+async def _run_mode(durability: str, database_url: str, sessions: int, iterations: int) -> Dict[str, float]:
+    settings = Mock(spec=Settings)
+    settings.database_url = database_url
+    settings.history_retention_days = 90
+    settings.history_async_db = "never"
+    for name in ("history_write_max_latency_ms", "history_write_max_batch_size", "history_write_max_pending"):
+        setattr(settings, name, Settings.model_fields[name].default)
+    settings.history_write_durability = durability
+
+    with patch("tarsy.services.history_service.base_infrastructure.get_settings", return_value=settings):
+        service = HistoryService()
+        if not service.initialize():
+            raise RuntimeError(f"Could not initialize history database at {database_url}")
+    with service.get_repository() as repo:
+        for s in range(sessions):
+            repo.create_alert_session(SessionFactory.create_test_session(session_id=f"session-{s}"))
+    await service.start_write_buffer()
+
+    counts = {"commits": 0, "updates": 0}
+
+    def on_commit(_conn):
+        counts["commits"] += 1
+
+    def on_execute(_conn, _cursor, statement, _parameters, _context, _executemany):
+        if statement.startswith("UPDATE alert_sessions"):
+            counts["updates"] += 1
+
+    engine = service._infra.db_manager.engine
+    event.listen(engine, "commit", on_commit)
+    event.listen(engine, "before_cursor_execute", on_execute)
+
+    latencies_ms: List[float] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _run_session(service, f"session-{s}", iterations, latencies_ms) for s in range(sessions)
+    ))
+    await service.close()
+    elapsed = time.perf_counter() - started
+
+    event.remove(engine, "commit", on_commit)
+    event.remove(engine, "before_cursor_execute", on_execute)
+    service._infra.db_manager.close()
+
+    stats = summarize(latencies_ms)
+    return {
+        "commits": float(counts["commits"]),
+        "updates": float(counts["updates"]),
+        "total_s": elapsed,
+        "p50_ms": stats["p50"],
+        "p95_ms": stats["p95"],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent alert sessions")
+    parser.add_argument("--iterations", type=int, default=20, help="ReAct iterations per session")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for durability in ("immediate", "stage"):
+            url = f"sqlite:///{os.path.join(tmp_dir, f'history-{durability}.db')}"
+            result = await _run_mode(durability, url, args.sessions, args.iterations)
+            rows.append([
+                durability, int(result["commits"]), int(result["updates"]), result["total_s"],
+                result["p50_ms"], result["p95_ms"],
+            ])
+
+    print_table(
+        f"Interaction history writes - {args.sessions} sessions x {args.iterations} iterations "
+        f"(stage boundary every {STAGE_ITERATIONS})",
+        ["durability", "commits", "session UPDATEs", "total s", "log call p50 ms", "log call p95 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
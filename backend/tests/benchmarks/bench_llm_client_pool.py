@@ -0,0 +1,121 @@
+"""
+LLM provider client pool benchmark.
+
+Runs concurrent sessions that each make several LLM calls against a local
+keep-alive HTTP server which adds a fixed delay to every new connection (the
+TCP + TLS handshake to a remote provider), with:
+
+- per-call: a new native Google client (and so a new httpx client and
+            connection) for every call, as GeminiNativeThinkingClient did
+- pooled:   one client reused for every call, sending through the shared
+            provider connection pool
+
+Reports client setup time, call latency, connections opened and the pool's
+connection reuse rate.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_llm_client_pool [--sessions 20] [--calls 5] [--handshake-ms 60]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import List
+
+os.environ.setdefault("TESTING", "true")
+
+import httpx  # noqa: E402
+from google import genai  # noqa: E402
+from google.genai import types as google_genai_types  # noqa: E402
+
+from tarsy.integrations.llm.client_pool import ProviderClientPool  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+
+
+async def _start_server(handshake_s: float):
+    accepted = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        accepted.append(writer)
+        await asyncio.sleep(handshake_s)
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+    return server, f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/v1beta/models", accepted
+
+
+def _setup_ms(pooled: bool, pool: ProviderClientPool, calls: int) -> float:
+    started = time.perf_counter()
+    if pooled:
+        genai.Client(api_key="bench-key", http_options=google_genai_types.HttpOptions(
+            httpx_async_client=pool.get_async_client("google")
+        ))
+    else:
+        for _ in range(calls):
+            genai.Client(api_key="bench-key")
+    return (time.perf_counter() - started) * 1000 / calls
+
+
+async def _session(url: str, calls: int, pool: ProviderClientPool, pooled: bool, latencies: List[float]) -> None:
+    for _ in range(calls):
+        started = time.perf_counter()
+        if pooled:
+            await pool.get_async_client("google").post(url, content=b"{}")
+        else:
+            async with httpx.AsyncClient() as client:
+                await client.post(url, content=b"{}")
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def _run(pooled: bool, sessions: int, calls: int, handshake_s: float) -> list:
+    server, url, accepted = await _start_server(handshake_s)
+    pool = ProviderClientPool(max_connections=100, max_keepalive_connections=20, keepalive_expiry=120.0)
+    latencies: List[float] = []
+    setup_ms = _setup_ms(pooled, pool, calls)
+    try:
+        await asyncio.gather(*(_session(url, calls, pool, pooled, latencies) for _ in range(sessions)))
+    finally:
+        await pool.aclose()
+        server.close()
+        await server.wait_closed()
+    latency = summarize(latencies)
+    stats = pool.get_stats().get("google")
+    return [
+        "pooled" if pooled else "per-call",
+        f"{setup_ms:.2f}",
+        f"{latency['p50']:.1f}",
+        f"{latency['p95']:.1f}",
+        len(accepted),
+        f"{stats['reuse_rate']:.0%}" if stats else "-",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent sessions")
+    parser.add_argument("--calls", type=int, default=5, help="LLM calls per session")
+    parser.add_argument("--handshake-ms", type=int, default=60, help="Delay added to every new connection")
+    args = parser.parse_args()
+
+    rows = [
+        asyncio.run(_run(pooled, args.sessions, args.calls, args.handshake_ms / 1000))
+        for pooled in (False, True)
+    ]
+    print_table(
+        f"LLM provider clients - {args.sessions} sessions x {args.calls} calls, "
+        f"{args.handshake_ms} ms per new connection",
+        ["mode", "client setup ms/call", "call p50 ms", "call p95 ms", "connections opened", "reuse rate"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
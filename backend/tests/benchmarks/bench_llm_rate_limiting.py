@@ -0,0 +1,126 @@
+"""
+LLM provider rate limiting benchmark.
+
+Simulates an alert storm: many sessions make several LLM calls each against a
+provider that rejects calls beyond its requests-per-minute limit (sliding
+one-minute window) with 429, with:
+
+- reactive:  every session retries on its own after 1s, 2s and 4s backoff
+             (3 retries), as LLMClient did before the shared rate limiter
+- scheduled: calls wait in a shared ProviderRateLimiter configured with the
+             provider limit; 429s pause the provider for all sessions
+
+Time runs 60x faster than wall-clock time; reported durations are simulated.
+Reports completed and failed calls, 429 responses, throughput and the spread
+of per-session completion times.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_llm_rate_limiting [--sessions 100] [--calls 8] [--rpm 600]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+from unittest.mock import patch
+
+os.environ.setdefault("TESTING", "true")
+
+from tarsy.integrations.llm.rate_limiter import ProviderRateLimiter  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+
+SPEEDUP = 60
+CALL_SECONDS = 2.0
+MAX_RETRIES = 3
+
+_real_sleep = asyncio.sleep
+
+
+def _clock() -> float:
+    return time.monotonic() * SPEEDUP
+
+
+async def _scaled_sleep(seconds: float, result=None):
+    return await _real_sleep(seconds / SPEEDUP, result)
+
+
+class _Provider:
+    """Provider API rejecting calls beyond `rpm` within the last minute."""
+
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        self.accepted: Deque[float] = deque()
+        self.rejected = 0
+
+    async def call(self) -> bool:
+        now = _clock()
+        while self.accepted and self.accepted[0] <= now - 60:
+            self.accepted.popleft()
+        if len(self.accepted) >= self.rpm:
+            self.rejected += 1
+            return False
+        self.accepted.append(now)
+        await asyncio.sleep(CALL_SECONDS)
+        return True
+
+
+async def _session(
+    session_id: str, calls: int, provider: _Provider, limiter: Optional[ProviderRateLimiter], results: Dict
+) -> None:
+    for _ in range(calls):
+        for attempt in range(MAX_RETRIES + 1):
+            if limiter is not None:
+                await limiter.acquire(session_id, 1000)
+            if await provider.call():
+                results["completed"] += 1
+                break
+            if attempt == MAX_RETRIES:
+                results["failed"] += 1
+            elif limiter is not None:
+                limiter.record_rate_limit(2 ** attempt)
+            else:
+                await asyncio.sleep(2 ** attempt)
+    results["finished"].append(_clock() - results["started"])
+
+
+async def _run(scheduled: bool, sessions: int, calls: int, rpm: int) -> list:
+    provider = _Provider(rpm)
+    limiter = ProviderRateLimiter("bench", requests_per_minute=rpm, clock=_clock) if scheduled else None
+    results = {"completed": 0, "failed": 0, "finished": [], "started": _clock()}
+    await asyncio.gather(*(_session(f"session-{i}", calls, provider, limiter, results) for i in range(sessions)))
+    elapsed = max(results["finished"])
+    finished: List[float] = results["finished"]
+    spread = summarize(finished)
+    return [
+        "scheduled" if scheduled else "reactive",
+        results["completed"],
+        results["failed"],
+        provider.rejected,
+        f"{elapsed:.0f}",
+        f"{results['completed'] / elapsed * 60:.0f}",
+        f"{spread['p50']:.0f}",
+        f"{spread['max']:.0f}",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=100, help="Concurrent sessions")
+    parser.add_argument("--calls", type=int, default=8, help="LLM calls per session")
+    parser.add_argument("--rpm", type=int, default=600, help="Provider requests per minute")
+    args = parser.parse_args()
+
+    with patch("asyncio.sleep", _scaled_sleep):
+        rows = [asyncio.run(_run(scheduled, args.sessions, args.calls, args.rpm)) for scheduled in (False, True)]
+    print_table(
+        f"LLM rate limiting - {args.sessions} sessions x {args.calls} calls, provider limit {args.rpm} rpm "
+        f"(simulated time)",
+        ["mode", "completed", "failed", "429s", "duration s", "calls/min", "session done p50 s", "session done max s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+LLM streaming delivery benchmark.
+
+Simulates concurrent LLM calls that stream a thought token by token, publishing
+the accumulated content every 2 tokens like LLMClient does, and compares:
+
+- snapshot:  one NOTIFY carrying the full accumulated content per snapshot
+             (the per-chunk publishing path, still used without the transport)
+- transport: StreamingTransport coalescing snapshots and sending deltas
+
+NOTIFYs are recorded by a fake asyncpg connection, so the numbers show wire
+volume and round trips rather than database latency. Also verifies that the
+deltas reassemble to the streamed content.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_llm_streaming [--streams 10] [--tokens 1500]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List
+from unittest.mock import AsyncMock, Mock, patch
+
+os.environ.setdefault("TESTING", "true")
+
+from tarsy.models.event_models import LLMStreamChunkEvent  # noqa: E402
+from tarsy.services.events.batch_publisher import NOTIFY_PAYLOAD_LIMIT  # noqa: E402
+from tarsy.services.events.stream_transport import StreamingTransport  # noqa: E402
+from tests.benchmarks.common import print_table  # noqa: E402
+
+TOKENS_PER_SNAPSHOT = 2
+
+
+def _snapshot(stream: int, content: str, is_complete: bool = False) -> LLMStreamChunkEvent:
+    return LLMStreamChunkEvent(
+        session_id=f"session-{stream}",
+        chunk=content,
+        stream_type="thought",
+        is_complete=is_complete,
+        llm_interaction_id=f"llm-{stream}",
+    )
+
+
+async def _stream(stream: int, tokens: int, token_interval_s: float, publish) -> str:
+    content = ""
+    for n in range(tokens):
+        content += f"tok{n % 97} "
+        if n % TOKENS_PER_SNAPSHOT == 0:
+            await publish(_snapshot(stream, content))
+        await asyncio.sleep(token_interval_s)
+    await publish(_snapshot(stream, content, is_complete=True))
+    return content
+
+
+async def _run_mode(mode: str, streams: int, tokens: int, token_interval_s: float,
+                    coalesce_ms: int) -> Dict[str, float]:
+    notifies: List[str] = []
+    round_trips = 0
+    oversized = 0
+
+    if mode == "snapshot":
+        async def publish(event: LLMStreamChunkEvent) -> None:
+            nonlocal round_trips, oversized
+            payload = json.dumps(event.model_dump())
+            round_trips += 1
+            if len(payload.encode()) >= NOTIFY_PAYLOAD_LIMIT:
+                oversized += 1  # PostgreSQL rejects it
+                return
+            notifies.append(payload)
+
+        started = time.perf_counter()
+        contents = await asyncio.gather(*(
+            _stream(s, tokens, token_interval_s, publish) for s in range(streams)
+        ))
+        elapsed = time.perf_counter() - started
+        reassembled_ok = True  # Full content per message by construction
+    else:
+        async def executemany(_sql, args) -> None:
+            nonlocal round_trips
+            round_trips += 1
+            notifies.extend(payload for _, payload in args)
+
+        conn = Mock()
+        conn.is_closed = Mock(return_value=False)
+        conn.executemany = executemany
+        conn.close = AsyncMock()
+        transport = StreamingTransport("postgresql://bench", coalesce_ms=coalesce_ms)
+
+        async def publish(event: LLMStreamChunkEvent) -> None:
+            transport.submit(event)
+
+        with patch("tarsy.services.events.stream_transport.asyncpg.connect", AsyncMock(return_value=conn)):
+            await transport.start()
+            started = time.perf_counter()
+            contents = await asyncio.gather(*(
+                _stream(s, tokens, token_interval_s, publish) for s in range(streams)
+            ))
+            await asyncio.sleep(0.05)  # Completions are flushed right away
+            elapsed = time.perf_counter() - started
+            await transport.stop()
+
+        reassembled: Dict[str, str] = {}
+        for payload in notifies:
+            message = json.loads(payload)
+            key = message["llm_interaction_id"]
+            reassembled[key] = reassembled.get(key, "")[:message["offset"]] + message["chunk"]
+        reassembled_ok = all(reassembled[f"llm-{s}"] == contents[s] for s in range(streams))
+
+    total_bytes = sum(len(p.encode()) for p in notifies)
+    return {
+        "notifies": float(len(notifies)),
+        "round_trips": float(round_trips),
+        "mb": total_bytes / 1_000_000,
+        "largest_kb": max(len(p.encode()) for p in notifies) / 1000,
+        "oversized": float(oversized),
+        "total_s": elapsed,
+        "ok": reassembled_ok,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", type=int, default=10, help="Concurrent LLM streams")
+    parser.add_argument("--tokens", type=int, default=1500, help="Tokens per stream")
+    parser.add_argument("--token-ms", type=float, default=1.0, help="Delay between tokens")
+    parser.add_argument("--coalesce-ms", type=int, default=50, help="Transport coalescing window")
+    args = parser.parse_args()
+
+    rows = []
+    for mode in ("snapshot", "transport"):
+        result = await _run_mode(mode, args.streams, args.tokens, args.token_ms / 1000, args.coalesce_ms)
+        rows.append([
+            mode, int(result["notifies"]), int(result["round_trips"]), result["mb"],
+            result["largest_kb"], int(result["oversized"]), result["total_s"],
+            "yes" if result["ok"] else "NO",
+        ])
+
+    print_table(
+        f"LLM streaming - {args.streams} streams x {args.tokens} tokens",
+        ["mode", "notifies", "round trips", "MB sent", "largest KB", "rejected", "total s", "content ok"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
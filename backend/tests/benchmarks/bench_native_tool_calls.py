@@ -0,0 +1,101 @@
+"""
+Native thinking tool dispatch benchmark.
+
+Runs native thinking iterations in which the model requests several
+independent tool calls, against a fake MCP client whose calls take a fixed
+round-trip time, with:
+
+- serial:     max_concurrent_tool_calls 1 (one call at a time, as before)
+- concurrent: the server's max_concurrent_tool_calls (default 4)
+
+Reports the latency of executing one iteration's tool calls.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_native_tool_calls [--calls 5] [--round-trip-ms 300] [--iterations 5]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import List
+from unittest.mock import Mock
+
+os.environ.setdefault("TESTING", "true")
+
+from tarsy.agents.base_agent import DEFAULT_MAX_CONCURRENT_TOOL_CALLS, BaseAgent  # noqa: E402
+from tarsy.agents.iteration_controllers.native_thinking_controller import (  # noqa: E402
+    NativeThinkingController,
+)
+from tarsy.integrations.llm.gemini_client import NativeThinkingToolCall  # noqa: E402
+from tarsy.models.unified_interactions import LLMConversation  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+
+
+class _BenchAgent(BaseAgent):
+    @classmethod
+    def mcp_servers(cls):
+        return ["kubernetes-server"]
+
+    def custom_instructions(self):
+        return ""
+
+
+def _agent(round_trip_s: float, limit: int) -> BaseAgent:
+    async def call_tool(_server_name, _tool_name, parameters, *_args):
+        await asyncio.sleep(round_trip_s)
+        return {"result": f"{parameters['name']} Running"}
+
+    mcp_client = Mock()
+    mcp_client.call_tool = call_tool
+    registry = Mock()
+    registry.get_server_config_safe.return_value = Mock(max_concurrent_tool_calls=limit)
+    agent = _BenchAgent(Mock(), mcp_client, registry)
+    agent._configured_servers = ["kubernetes-server"]
+    return agent
+
+
+async def _iteration_ms(agent: BaseAgent, calls: int) -> float:
+    controller = NativeThinkingController(Mock(), Mock())
+    context = Mock()
+    context.session_id = "bench-session"
+    conversation = LLMConversation(messages=[{"role": "system", "content": "System"}, {"role": "user", "content": "Go"}])
+    tool_calls = [
+        NativeThinkingToolCall(server="kubernetes-server", tool="resources_get", parameters={"name": f"pod-{i}"})
+        for i in range(calls)
+    ]
+    started = time.perf_counter()
+    # The controller's dispatch: one execute_mcp_tools call per requested tool, gathered
+    await asyncio.gather(*(
+        controller._execute_tool_call(agent, tool_call, context, conversation) for tool_call in tool_calls
+    ))
+    return (time.perf_counter() - started) * 1000
+
+
+async def _run(calls: int, round_trip_s: float, iterations: int, limit: int) -> dict:
+    agent = _agent(round_trip_s, limit)
+    latencies: List[float] = [await _iteration_ms(agent, calls) for _ in range(iterations)]
+    return summarize(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5, help="Tool calls requested per iteration")
+    parser.add_argument("--round-trip-ms", type=int, default=300, help="Round-trip time of one tool call")
+    parser.add_argument("--iterations", type=int, default=5, help="Iterations per mode")
+    args = parser.parse_args()
+
+    rows = []
+    for label, limit in (("serial", 1), ("concurrent", DEFAULT_MAX_CONCURRENT_TOOL_CALLS)):
+        latency = asyncio.run(_run(args.calls, args.round_trip_ms / 1000, args.iterations, limit))
+        rows.append([label, limit, f"{latency['p50']:.0f}", f"{latency['max']:.0f}"])
+
+    print_table(
+        f"Tool calls of one native thinking iteration - {args.calls} calls x {args.round_trip_ms} ms round trip",
+        ["mode", "per-server limit", "p50 ms", "max ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+History payload compression benchmark.
+
+Records sessions whose MCP tool calls return kubectl-style outputs (and whose
+LLM conversations re-embed them as observations) into a file-backed SQLite
+database, with:
+
+- raw:        every payload stored as it is
+- compressed: payloads above COMPRESSION_THRESHOLD_BYTES stored zlib-compressed
+
+Reports the stored payload bytes, database file size, write time per
+session and the latency of loading a session's details and timeline.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_payload_compression [--sessions 20] [--tool-calls 30]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+from unittest.mock import Mock, patch
+
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import func  # noqa: E402
+from sqlmodel import select  # noqa: E402
+
+from tarsy.config.settings import Settings  # noqa: E402
+from tarsy.models.unified_interactions import (  # noqa: E402
+    LLMConversation,
+    LLMConversationMessage,
+    LLMInteraction,
+    LLMMessage,
+    MCPInteraction,
+    MessageRole,
+)
+from tarsy.services.history_service import HistoryService  # noqa: E402
+from tarsy.utils import payload_compression  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+from tests.utils import SessionFactory  # noqa: E402
+
+POD_LINE = "{name:<40} 1/1     Running   {restarts:<3} {age}d   10.42.{a}.{b}   node-{node}\n"
+
+
+def _kubectl_output(seed: int, pods: int) -> str:
+    return "NAME                                     READY   STATUS    RESTARTS   AGE   IP             NODE\n" + "".join(
+        POD_LINE.format(
+            name=f"api-server-{seed:03d}-{i:04d}-7d9f8c6b5-x{i % 97:02d}k", restarts=i % 5, age=i % 30,
+            a=i % 256, b=(seed * i) % 256, node=i % 12,
+        )
+        for i in range(pods)
+    )
+
+
+def _record_session(service: HistoryService, session_id: str, tool_calls: int, pods: int) -> None:
+    with service.get_repository() as repo:
+        repo.create_alert_session(SessionFactory.create_test_session(session_id=session_id))
+        messages = [
+            LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE agent. " * 200),
+            LLMMessage(role=MessageRole.USER, content="Investigate the alert."),
+        ]
+        for i in range(tool_calls):
+            output = _kubectl_output(i, pods)
+            repo.create_mcp_communication(MCPInteraction(
+                session_id=session_id, server_name="kubernetes-server", communication_type="tool_call",
+                tool_name="kubectl_get", tool_arguments={"resource": "pods"}, tool_result={"result": output},
+                step_description="Get pods", timestamp_us=1_000_000 + 2 * i,
+            ))
+            messages = messages + [
+                LLMMessage(role=MessageRole.ASSISTANT, content=f"Thought: check pods ({i})\nAction: kubectl_get"),
+                LLMMessage(role=MessageRole.USER, content=f"Observation: {output}"),
+            ]
+            repo.create_llm_interaction(LLMInteraction(
+                session_id=session_id, model_name="gpt-4", timestamp_us=1_000_001 + 2 * i,
+                conversation=LLMConversation(messages=messages),
+            ))
+
+
+def _stored_payload_bytes(service: HistoryService) -> int:
+    with service.get_repository() as repo:
+        return sum(repo.session.exec(statement).one() or 0 for statement in (
+            select(func.sum(func.length(MCPInteraction.tool_result) + func.coalesce(
+                func.length(MCPInteraction.tool_result_compressed), 0))),
+            select(func.sum(func.length(LLMConversationMessage.content) + func.coalesce(
+                func.length(LLMConversationMessage.content_compressed), 0))),
+        ))
+
+
+def _time_ms(load, session_ids: List[str]) -> dict:
+    latencies: List[float] = []
+    for session_id in session_ids:
+        started = time.perf_counter()
+        load(session_id)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return summarize(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20, help="Sessions to record")
+    parser.add_argument("--tool-calls", type=int, default=30, help="Tool calls (and LLM iterations) per session")
+    parser.add_argument("--pods", type=int, default=800, help="Pods listed per kubectl output")
+    args = parser.parse_args()
+
+    rows = []
+    for label, threshold in (("raw", float("inf")), ("compressed", payload_compression.COMPRESSION_THRESHOLD_BYTES)):
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch.object(payload_compression, "COMPRESSION_THRESHOLD_BYTES", threshold):
+            db_path = os.path.join(tmp_dir, "history.db")
+            settings = Mock(spec=Settings)
+            settings.database_url = f"sqlite:///{db_path}"
+            settings.history_retention_days = 90
+            settings.history_async_db = "never"
+            with patch("tarsy.services.history_service.base_infrastructure.get_settings", return_value=settings):
+                service = HistoryService()
+                if not service.initialize():
+                    raise RuntimeError("Could not initialize history database")
+
+            session_ids = [f"session-{s:03d}" for s in range(args.sessions)]
+            started = time.perf_counter()
+            for session_id in session_ids:
+                _record_session(service, session_id, args.tool_calls, args.pods)
+            write_ms = (time.perf_counter() - started) * 1000 / args.sessions
+            with service.get_repository() as repo:
+                repo.session.connection().exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+            detail_ms = _time_ms(service.get_session_details, session_ids)
+            timeline_ms = _time_ms(service.get_session_timeline, session_ids)
+            rows.append([
+                label,
+                f"{_stored_payload_bytes(service) / 2**20:.1f}",
+                f"{os.path.getsize(db_path) / 2**20:.1f}",
+                f"{write_ms:.0f}",
+                detail_ms["p50"],
+                timeline_ms["p50"],
+            ])
+            service._infra.db_manager.close()
+
+    print_table(
+        f"History payload storage - {args.sessions} sessions x {args.tool_calls} tool calls "
+        f"({args.pods} pods per kubectl output)",
+        ["mode", "payload MiB", "db file MiB", "write ms/session", "detail p50 ms", "timeline p50 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Prompt caching benchmark.
+
+Replays ReAct sessions (instructions, tool catalog + alert, then one
+thought/observation pair per iteration) through LLMClient's Anthropic message
+conversion and feeds the requests to a simulated provider prompt cache that,
+like Anthropic's, serves the longest previously written prefix ending at a
+block boundary and writes new entries only at cache_control breakpoints:
+
+- off: prompt_caching disabled, no breakpoints (nothing is cached)
+- on:  breakpoints after the system message, the first user message and the
+       latest message
+
+Reports input tokens, tokens read from the cache and the input cost relative
+to an uncached run (cache writes cost 1.25x, cache reads 0.1x).
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_prompt_caching [--sessions 3] [--iterations 15] [--tools 40]
+"""
+
+import argparse
+import hashlib
+import os
+from typing import List, Set, Tuple
+
+os.environ.setdefault("TESTING", "true")
+
+from mcp.types import Tool  # noqa: E402
+
+from tarsy.agents.prompts.builders import PromptBuilder  # noqa: E402
+from tarsy.integrations.llm.client import LLMClient  # noqa: E402
+from tarsy.models.llm_models import LLMProviderConfig  # noqa: E402
+from tarsy.models.processing_context import ToolWithServer  # noqa: E402
+from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole  # noqa: E402
+from tests.benchmarks.common import print_table  # noqa: E402
+
+CHARS_PER_TOKEN = 4
+CACHE_WRITE_COST = 1.25
+CACHE_READ_COST = 0.1
+
+
+def _tool_catalog(tools: int) -> str:
+    catalog = [
+        ToolWithServer(server="kubernetes-server", tool=Tool(
+            name=f"tool_{i}",
+            description=f"Inspect cluster resource kind {i} and report its status, events and owners",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "namespace": {"type": "string", "description": "Namespace of the resource"},
+                    "name": {"type": "string", "description": "Name of the resource"},
+                    "output": {"type": "string", "enum": ["yaml", "json", "wide"]},
+                },
+                "required": ["namespace"],
+            },
+        ))
+        for i in range(tools)
+    ]
+    return PromptBuilder()._format_available_actions(catalog)
+
+
+def _blocks(client: LLMClient, conversation: LLMConversation) -> List[Tuple[str, bool]]:
+    """Flatten converted messages into (text, has cache_control) blocks in request order."""
+    blocks = []
+    for message in client._convert_conversation_to_langchain(conversation):
+        if isinstance(message.content, str):
+            blocks.append((f"{message.type}:{message.content}", False))
+        else:
+            blocks.extend((f"{message.type}:{block['text']}", "cache_control" in block) for block in message.content)
+    return blocks
+
+
+def _send(blocks: List[Tuple[str, bool]], cache: Set[str]) -> Tuple[int, int, int]:
+    """Simulate one request; returns (input tokens, cache read tokens, cache write tokens)."""
+    digest = hashlib.sha256()
+    boundaries = []
+    length = 0
+    for text, breakpoint in blocks:
+        digest.update(text.encode())
+        length += len(text)
+        boundaries.append((digest.copy().hexdigest(), length, breakpoint))
+
+    read = max((length for key, length, _ in boundaries if key in cache), default=0)
+    written = 0
+    for key, length, breakpoint in boundaries:
+        if breakpoint and key not in cache:
+            cache.add(key)
+            written = max(written, length)
+    total = length // CHARS_PER_TOKEN
+    read_tokens = read // CHARS_PER_TOKEN
+    write_tokens = max(written - read, 0) // CHARS_PER_TOKEN
+    return total, read_tokens, write_tokens
+
+
+def _run(prompt_caching: bool, sessions: int, iterations: int, tools: int) -> list:
+    client = LLMClient("anthropic", LLMProviderConfig(
+        type="anthropic", model="claude-sonnet-4-5", api_key="bench-key", prompt_caching=prompt_caching
+    ))
+    instructions = PromptBuilder().get_enhanced_react_system_message("## General SRE Instructions\n" + "Be thorough. " * 300)
+    catalog = _tool_catalog(tools)
+    cache: Set[str] = set()
+    total = read = written = 0
+    for session in range(sessions):
+        conversation = LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content=instructions),
+            LLMMessage(role=MessageRole.USER, content=(
+                f"Answer the following question using the available tools.\n\nAvailable tools:\n\n{catalog}\n\n"
+                f"Question: Analyze alert {session}: pod crash-loop-{session} is restarting. " + "Details. " * 200
+            )),
+        ])
+        for iteration in range(iterations):
+            request_tokens, read_tokens, write_tokens = _send(_blocks(client, conversation), cache)
+            total += request_tokens
+            read += read_tokens
+            written += write_tokens
+            conversation.append_assistant_message(
+                f"Thought: step {iteration} needs more data\nAction: kubernetes-server.tool_{iteration % tools}\n"
+                f"Action Input: namespace: prod-{session}"
+            )
+            conversation.append_observation(f"Observation: result {iteration} " + "status: Running. " * 150)
+
+    cost = (total - read - written) + written * CACHE_WRITE_COST + read * CACHE_READ_COST
+    return [
+        "on" if prompt_caching else "off",
+        sessions * iterations,
+        total,
+        read,
+        f"{read / total:.0%}" if total else "-",
+        f"{cost / total:.2f}x" if total else "-",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=3, help="Sessions of the same agent")
+    parser.add_argument("--iterations", type=int, default=15, help="ReAct iterations per session")
+    parser.add_argument("--tools", type=int, default=40, help="Tools in the catalog")
+    args = parser.parse_args()
+
+    rows = [_run(prompt_caching, args.sessions, args.iterations, args.tools) for prompt_caching in (False, True)]
+    print_table(
+        f"Prompt caching - {args.sessions} sessions x {args.iterations} iterations, {args.tools} tools",
+        ["prompt caching", "requests", "input tokens", "cached tokens", "cache hit", "input cost"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Queue-drain benchmark for SessionClaimWorker.
+
+Enqueues a burst of PENDING sessions into a file-backed SQLite database and
+measures time-to-dispatch (enqueue -> process callback invoked) with:
+
+- poll:  batch claiming, woken only by the fallback polling interval
+- event: batch claiming, woken by 'session.enqueued' notifications and by
+         locally finished sessions (the production default)
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_queue_drain [--alerts 200] [--capacity 5]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from typing import Dict, List
+
+os.environ.setdefault("TESTING", "true")
+
+from tarsy.models.constants import AlertSessionStatus  # noqa: E402
+from tarsy.models.db_models import AlertSession  # noqa: E402
+from tarsy.repositories.base_repository import DatabaseManager  # noqa: E402
+from tarsy.services.history_service import HistoryService  # noqa: E402
+from tarsy.services.session_claim_worker import SessionClaimWorker  # noqa: E402
+from tarsy.utils.timestamp import now_us  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+
+
+def _create_history_service(db_path: str) -> HistoryService:
+    """Build a HistoryService bound to a fresh SQLite database file."""
+    db_manager = DatabaseManager(f"sqlite:///{db_path}")
+    db_manager.initialize()
+    db_manager.create_tables()
+    service = HistoryService()
+    service._infra.db_manager = db_manager
+    service._infra._set_healthy_for_testing()
+    return service
+
+
+def _enqueue(service: HistoryService, count: int) -> Dict[str, float]:
+    """Insert `count` PENDING sessions and return their enqueue wall-clock times."""
+    enqueued_at: Dict[str, float] = {}
+    with service.get_repository() as repo:
+        for _ in range(count):
+            session_id = str(uuid.uuid4())
+            repo.session.add(AlertSession(
+                session_id=session_id,
+                alert_type="benchmark",
+                agent_type="benchmark",
+                status=AlertSessionStatus.PENDING.value,
+                started_at_us=now_us(),
+                alert_data={"benchmark": True},
+                chain_id="benchmark-chain",
+            ))
+            enqueued_at[session_id] = time.perf_counter()
+        repo.session.commit()
+    return enqueued_at
+
+
+async def _run_mode(mode: str, alerts: int, capacity: int, interval: float, work_seconds: float) -> List[float]:
+    """Drain one burst and return per-session time-to-dispatch in milliseconds."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = _create_history_service(os.path.join(tmp_dir, "queue_bench.db"))
+        dispatched_at: Dict[str, float] = {}
+        completed: List[str] = []
+        all_completed = asyncio.Event()
+
+        async def process_callback(session_id: str, _alert_context) -> None:
+            dispatched_at[session_id] = time.perf_counter()
+            await asyncio.sleep(work_seconds)
+            await asyncio.to_thread(
+                service.update_session_status, session_id, AlertSessionStatus.COMPLETED.value
+            )
+            completed.append(session_id)
+            if len(completed) == alerts:
+                all_completed.set()
+
+        worker = SessionClaimWorker(
+            history_service=service,
+            max_global_concurrent=capacity,
+            claim_interval=interval,
+            process_callback=process_callback,
+            pod_id=f"bench-{mode}",
+        )
+        if mode == "poll":
+            # Disable every wake-up source so only the polling interval drives claiming
+            worker.notify = lambda: None
+
+        await worker.start()
+        enqueued_at = _enqueue(service, alerts)
+        worker.notify()  # Equivalent of the 'session.enqueued' NOTIFY delivery
+        try:
+            await asyncio.wait_for(all_completed.wait(), timeout=600)
+        finally:
+            await worker.stop()
+            service._infra.db_manager.close()
+
+        return [
+            (dispatched_at[session_id] - enqueued) * 1000
+            for session_id, enqueued in enqueued_at.items()
+        ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alerts", type=int, default=200, help="Burst size (sessions enqueued at once)")
+    parser.add_argument("--capacity", type=int, default=5, help="max_concurrent_alerts")
+    parser.add_argument("--interval", type=float, default=1.0, help="queue_claim_interval_seconds")
+    parser.add_argument("--work-ms", type=float, default=50.0, help="Simulated processing time per session")
+    args = parser.parse_args()
+
+    rows = []
+    for mode in ("poll", "event"):
+        latencies = await _run_mode(mode, args.alerts, args.capacity, args.interval, args.work_ms / 1000)
+        stats = summarize(latencies)
+        rows.append([mode, int(stats["count"]), stats["p50"], stats["p95"], stats["p99"], stats["max"]])
+
+    print_table(
+        f"Time-to-dispatch (ms) - {args.alerts} alerts, capacity {args.capacity}, "
+        f"interval {args.interval}s, work {args.work_ms}ms",
+        ["mode", "sessions", "p50", "p95", "p99", "max"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
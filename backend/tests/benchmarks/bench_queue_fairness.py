@@ -0,0 +1,159 @@
+"""
+Queue fairness benchmark for SessionClaimWorker.
+
+Simulates a skewed load on a file-backed SQLite database: a storm of one noisy
+alert type is enqueued together with a trickle of other alert types, then the
+queue is drained by a SessionClaimWorker with a fixed global capacity. Reports
+queue wait (enqueue -> process callback invoked) per alert type with:
+
+- equal:    default QueueConfig - equal weights, no caps; free slots are
+            shared evenly across alert types (oldest first within a type)
+- weighted: quiet alert types weighted higher and the noisy type capped via
+            QueueConfig (the agents.yaml 'queue' section)
+
+With the previous oldest-first ordering a quiet alert waited for every noisy
+alert enqueued before it; compare the quiet types' p95 against the noisy one.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_queue_fairness [--noisy 150] [--quiet 10] [--capacity 5]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+os.environ.setdefault("TESTING", "true")
+
+from tarsy.models.agent_config import AlertTypeQueueConfig, QueueConfig  # noqa: E402
+from tarsy.models.constants import AlertPriority, AlertSessionStatus  # noqa: E402
+from tarsy.models.db_models import AlertSession  # noqa: E402
+from tarsy.services.session_claim_worker import SessionClaimWorker  # noqa: E402
+from tarsy.utils.timestamp import now_us  # noqa: E402
+from tests.benchmarks.bench_queue_drain import _create_history_service  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+
+NOISY_TYPE = "NoisyStorm"
+QUIET_TYPES = ("PodCrashLoop", "NamespaceTerminating", "OutOfSyncApplication")
+
+
+def _workload(noisy: int, quiet: int, seed: int) -> List[Tuple[str, int]]:
+    """
+    Build the enqueue order: the noisy storm arrives first with quiet alerts
+    interleaved towards its tail, a few of them critical.
+    """
+    rng = random.Random(seed)
+    alerts = [(NOISY_TYPE, AlertPriority.NORMAL.value)] * noisy
+    for alert_type in QUIET_TYPES:
+        for i in range(quiet):
+            priority = AlertPriority.CRITICAL.value if i == 0 else AlertPriority.NORMAL.value
+            alerts.insert(rng.randint(noisy // 2, len(alerts)), (alert_type, priority))
+    return alerts
+
+
+def _enqueue(service, alerts: List[Tuple[str, int]]) -> Dict[str, Tuple[str, float]]:
+    """Insert PENDING sessions and return session_id -> (alert_type, enqueue time)."""
+    enqueued: Dict[str, Tuple[str, float]] = {}
+    with service.get_repository() as repo:
+        for alert_type, priority in alerts:
+            session_id = str(uuid.uuid4())
+            repo.session.add(AlertSession(
+                session_id=session_id,
+                alert_type=alert_type,
+                agent_type="benchmark",
+                status=AlertSessionStatus.PENDING.value,
+                priority=priority,
+                started_at_us=now_us(),
+                alert_data={"benchmark": True},
+                chain_id="benchmark-chain",
+            ))
+            enqueued[session_id] = (alert_type, time.perf_counter())
+        repo.session.commit()
+    return enqueued
+
+
+async def _run_mode(
+    queue_config: Optional[QueueConfig],
+    alerts: List[Tuple[str, int]],
+    capacity: int,
+    work_seconds: float,
+) -> Dict[str, List[float]]:
+    """Drain the workload and return queue wait in milliseconds grouped by alert type."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = _create_history_service(os.path.join(tmp_dir, "queue_fairness.db"))
+        dispatched_at: Dict[str, float] = {}
+        completed: List[str] = []
+        all_completed = asyncio.Event()
+
+        async def process_callback(session_id: str, _alert_context) -> None:
+            dispatched_at[session_id] = time.perf_counter()
+            await asyncio.sleep(work_seconds)
+            await asyncio.to_thread(
+                service.update_session_status, session_id, AlertSessionStatus.COMPLETED.value
+            )
+            completed.append(session_id)
+            if len(completed) == len(alerts):
+                all_completed.set()
+
+        worker = SessionClaimWorker(
+            history_service=service,
+            max_global_concurrent=capacity,
+            claim_interval=1.0,
+            process_callback=process_callback,
+            pod_id="bench-fairness",
+            queue_config=queue_config,
+        )
+
+        enqueued = _enqueue(service, alerts)
+        await worker.start()
+        try:
+            await asyncio.wait_for(all_completed.wait(), timeout=600)
+        finally:
+            await worker.stop()
+            service._infra.db_manager.close()
+
+        waits: Dict[str, List[float]] = defaultdict(list)
+        for session_id, (alert_type, enqueued_at) in enqueued.items():
+            waits[alert_type].append((dispatched_at[session_id] - enqueued_at) * 1000)
+        return waits
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--noisy", type=int, default=150, help="Sessions of the noisy alert type")
+    parser.add_argument("--quiet", type=int, default=10, help="Sessions of each quiet alert type")
+    parser.add_argument("--capacity", type=int, default=5, help="max_concurrent_alerts")
+    parser.add_argument("--work-ms", type=float, default=20.0, help="Simulated processing time per session")
+    parser.add_argument("--seed", type=int, default=42, help="Workload shuffle seed")
+    args = parser.parse_args()
+
+    alerts = _workload(args.noisy, args.quiet, args.seed)
+    weighted = QueueConfig(
+        alert_types={
+            NOISY_TYPE: AlertTypeQueueConfig(weight=0.5, max_concurrent=max(args.capacity // 2, 1)),
+            **{alert_type: AlertTypeQueueConfig(weight=2.0) for alert_type in QUIET_TYPES},
+        }
+    )
+
+    rows = []
+    for mode, queue_config in (("equal", None), ("weighted", weighted)):
+        waits = await _run_mode(queue_config, alerts, args.capacity, args.work_ms / 1000)
+        for alert_type in (NOISY_TYPE, *QUIET_TYPES):
+            stats = summarize(waits[alert_type])
+            rows.append([mode, alert_type, int(stats["count"]), stats["p50"], stats["p95"], stats["max"]])
+
+    print_table(
+        f"Queue wait (ms) per alert type - {args.noisy} noisy + {len(QUIET_TYPES)}x{args.quiet} quiet alerts, "
+        f"capacity {args.capacity}, work {args.work_ms}ms",
+        ["mode", "alert_type", "sessions", "p50", "p95", "max"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+"""
+ReAct stream scanning benchmark.
+
+Feeds 50 KB ReAct responses, as LangChain message chunks of a few characters,
+through the per-chunk work LLMClient.generate_response does before publishing,
+with:
+
+- rescan:      the previous loop - adding each chunk to a growing aggregate,
+               appending to one string and searching all of it for the
+               ReAct markers on every chunk
+- incremental: ReActStreamScanner (markers searched in the new token plus a
+               short lookbehind, list buffer) and one chunk merge at the end
+
+Publishing is replaced by collecting the chunks that would be published, and
+both modes are checked to produce the same final answer chunks.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_react_streaming [--response-kb 50] [--token-chars 4] [--iterations 5]
+"""
+
+import argparse
+import os
+import time
+from typing import List, Tuple
+
+os.environ.setdefault("TESTING", "true")
+
+from langchain_core.messages import AIMessageChunk  # noqa: E402
+
+from tarsy.integrations.llm.client import _aggregate_chunks  # noqa: E402
+from tarsy.integrations.llm.react_stream import ReActStreamScanner  # noqa: E402
+from tarsy.models.constants import StreamingEventType  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+
+Event = Tuple[StreamingEventType, str, bool]
+
+
+def _response(kind: str, size: int) -> str:
+    line = "- pod api-server-7d9f8c6b5 restarted after OOMKilled (limit 512Mi, peak 731Mi)\n"
+    if kind == "final answer":
+        thought = "Thought: I have enough information to conclude.\n"
+        body = (line * (size // len(line) + 1))[:size - len(thought) - 14]
+        return thought + "Final Answer: " + body
+    action = "\nAction: kubernetes-server.resources_get\nAction Input: {\"name\": \"api-server\"}"
+    body = (line * (size // len(line) + 1))[:size - len(action) - 9]
+    return "Thought: " + body + action
+
+
+def _chunks(response: str, token_chars: int) -> List[AIMessageChunk]:
+    chunks = [
+        AIMessageChunk(content=response[i:i + token_chars]) for i in range(0, len(response), token_chars)
+    ]
+    chunks.append(AIMessageChunk(content="", usage_metadata={
+        "input_tokens": 4000, "output_tokens": len(chunks), "total_tokens": 4000 + len(chunks),
+    }))
+    return chunks
+
+
+def _rescan(chunks: List[AIMessageChunk]) -> Tuple[List[Event], AIMessageChunk]:
+    """The per-chunk loop LLMClient ran before the scanner, with publishing collected."""
+    events: List[Event] = []
+    accumulated_content = ""
+    is_streaming_thought = False
+    is_streaming_final_answer = False
+    token_count_since_last_send = 0
+    aggregate_chunk = None
+    for chunk in chunks:
+        aggregate_chunk = chunk if aggregate_chunk is None else aggregate_chunk + chunk
+        accumulated_content += chunk.content
+        if (
+            not is_streaming_thought
+            and not is_streaming_final_answer
+            and "Thought:" in accumulated_content
+            and "Final Answer:" not in accumulated_content
+        ):
+            is_streaming_thought = True
+            token_count_since_last_send = 0
+        if is_streaming_thought and ("Action:" in accumulated_content or "Final Answer:" in accumulated_content):
+            thought_start_idx = accumulated_content.find("Thought:")
+            stop_idx = (accumulated_content.find("Action:") if "Action:" in accumulated_content
+                        else accumulated_content.find("Final Answer:"))
+            clean_thought = accumulated_content[thought_start_idx + len("Thought:"):stop_idx].strip()
+            events.append((StreamingEventType.THOUGHT, clean_thought, True))
+            is_streaming_thought = False
+            token_count_since_last_send = 0
+            if "Final Answer:" in accumulated_content:
+                is_streaming_final_answer = True
+            continue
+        if is_streaming_thought or is_streaming_final_answer:
+            token_count_since_last_send += 1
+            if token_count_since_last_send >= (1 if is_streaming_thought else 3):
+                if is_streaming_thought:
+                    thought_start_idx = accumulated_content.find("Thought:")
+                    current_thought = accumulated_content[thought_start_idx + len("Thought:"):].lstrip()
+                    if "Action:" in current_thought:
+                        current_thought = current_thought[:current_thought.find("Action:")].strip()
+                    elif "Final Answer:" in current_thought:
+                        current_thought = current_thought[:current_thought.find("Final Answer:")].strip()
+                    if current_thought:
+                        events.append((StreamingEventType.THOUGHT, current_thought, False))
+                else:
+                    final_answer_start_idx = accumulated_content.find("Final Answer:")
+                    current_final_answer = accumulated_content[final_answer_start_idx + len("Final Answer:"):].lstrip()
+                    if current_final_answer:
+                        events.append((StreamingEventType.FINAL_ANSWER, current_final_answer, False))
+                token_count_since_last_send = 0
+    if is_streaming_final_answer:
+        final_answer_start_idx = accumulated_content.find("Final Answer:")
+        events.append((StreamingEventType.FINAL_ANSWER,
+                       accumulated_content[final_answer_start_idx + len("Final Answer:"):].strip(), True))
+    return events, aggregate_chunk
+
+
+def _incremental(chunks: List[AIMessageChunk]) -> Tuple[List[Event], AIMessageChunk]:
+    scanner = ReActStreamScanner()
+    events: List[Event] = []
+    collected = []
+    for chunk in chunks:
+        collected.append(chunk)
+        events.extend(scanner.feed(chunk.content))
+    events.extend(scanner.finish())
+    return events, _aggregate_chunks(collected)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--response-kb", type=int, default=50, help="Response size")
+    parser.add_argument("--token-chars", type=int, default=4, help="Characters per streamed chunk")
+    parser.add_argument("--iterations", type=int, default=5, help="Runs per mode and response")
+    args = parser.parse_args()
+
+    rows = []
+    for kind in ("final answer", "long thought"):
+        chunks = _chunks(_response(kind, args.response_kb * 1000), args.token_chars)
+        results = {}
+        for label, scan in (("rescan", _rescan), ("incremental", _incremental)):
+            latencies: List[float] = []
+            for _ in range(args.iterations):
+                started = time.perf_counter()
+                events, aggregate = scan(chunks)
+                latencies.append((time.perf_counter() - started) * 1000)
+            results[label] = (events, aggregate)
+            completed = [event for event in events if event[2]]
+            rows.append([
+                kind, label, len(chunks), len(events), len(completed),
+                f"{summarize(latencies)['p50']:.0f}",
+                aggregate.usage_metadata["total_tokens"],
+            ])
+        (old_events, old_aggregate), (new_events, new_aggregate) = results["rescan"], results["incremental"]
+        if [e for e in old_events if e[0] is StreamingEventType.FINAL_ANSWER] != \
+                [e for e in new_events if e[0] is StreamingEventType.FINAL_ANSWER] \
+                or old_aggregate.content != new_aggregate.content:
+            raise RuntimeError(f"Modes disagree on the {kind} response")
+
+    print_table(
+        f"ReAct stream scanning - {args.response_kb} KB responses in {args.token_chars}-character chunks",
+        ["response", "mode", "chunks", "published", "completions", "p50 ms", "total tokens"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+History retention cleanup benchmark.
+
+Fills a file-backed SQLite database with expired alert sessions (each with
+a stage and LLM/MCP interactions) and deletes them while a writer thread
+keeps recording new sessions, with:
+
+- single:  the former cleanup, loading every expired session as an ORM
+           object and deleting them all in one transaction
+- batched: delete_sessions_older_than, set-based DELETE batches in their own
+           transactions with a pause between batches
+
+Reports cleanup duration, the longest delete transaction and the latency of
+the concurrent writes.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_retention_cleanup [--sessions 20000] [--batch-size 500]
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from functools import partial
+from typing import List
+from unittest.mock import Mock, patch
+
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import insert  # noqa: E402
+from sqlmodel import select  # noqa: E402
+
+from tarsy.config.settings import Settings  # noqa: E402
+from tarsy.models.db_models import AlertSession, StageExecution  # noqa: E402
+from tarsy.models.unified_interactions import LLMInteraction, MCPInteraction  # noqa: E402
+from tarsy.services.history_service import HistoryService  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+from tests.utils import SessionFactory  # noqa: E402
+
+INTERACTIONS_PER_SESSION = 4
+CUTOFF_US = 10_000_000
+
+
+def _populate(service: HistoryService, sessions: int) -> None:
+    with service.get_repository() as repo:
+        for start in range(0, sessions, 1000):
+            session_rows, stage_rows, llm_rows, mcp_rows = [], [], [], []
+            for s in range(start, min(start + 1000, sessions)):
+                alert_session = SessionFactory.create_test_session(session_id=f"expired-{s:07d}")
+                alert_session.started_at_us = 1_000_000 + s
+                session_rows.append(alert_session.model_dump())
+                stage = StageExecution(
+                    session_id=alert_session.session_id, stage_id="analysis", stage_index=0,
+                    stage_name="Analysis", agent="KubernetesAgent", status="completed",
+                )
+                stage_rows.append(stage.model_dump())
+                for i in range(INTERACTIONS_PER_SESSION):
+                    llm_rows.append(LLMInteraction(
+                        session_id=alert_session.session_id, stage_execution_id=stage.execution_id,
+                        model_name="gpt-4", message_hashes=[f"hash-{i}"],
+                    ).model_dump())
+                    mcp_rows.append(MCPInteraction(
+                        session_id=alert_session.session_id, stage_execution_id=stage.execution_id,
+                        server_name="kubernetes-server", communication_type="tool_call", tool_name="kubectl_get",
+                        step_description="Get pods", tool_result={"output": "pod Running\n" * 100},
+                    ).model_dump())
+            repo.session.execute(insert(AlertSession), session_rows)
+            repo.session.execute(insert(StageExecution), stage_rows)
+            repo.session.execute(insert(LLMInteraction), llm_rows)
+            repo.session.execute(insert(MCPInteraction), mcp_rows)
+            repo.session.commit()
+
+
+def _single_transaction_delete(service: HistoryService) -> List[float]:
+    """The former cleanup: every expired session as an ORM object, one commit."""
+    started = time.perf_counter()
+    with service.get_repository() as repo:
+        for alert_session in repo.session.exec(
+            select(AlertSession).where(AlertSession.started_at_us < CUTOFF_US)
+        ).all():
+            repo.session.delete(alert_session)
+        repo.session.commit()
+    return [(time.perf_counter() - started) * 1000]
+
+
+def _batched_delete(service: HistoryService, batch_size: int, pause_ms: int) -> List[float]:
+    """delete_sessions_older_than, timing each batch transaction from its first statement to its commit."""
+    transactions_ms: List[float] = []
+    with service.get_repository() as repo:
+        execute, commit = repo.session.exec, repo.session.commit
+        batch_started: List[float] = []
+
+        def timed_exec(*args, **kwargs):
+            if not batch_started:
+                batch_started.append(time.perf_counter())
+            return execute(*args, **kwargs)
+
+        def timed_commit() -> None:
+            commit()
+            transactions_ms.append((time.perf_counter() - batch_started.pop()) * 1000)
+
+        with patch.object(repo.session, "exec", timed_exec), patch.object(repo.session, "commit", timed_commit):
+            repo.delete_sessions_older_than(CUTOFF_US, batch_size=batch_size, batch_pause_seconds=pause_ms / 1000)
+    return transactions_ms
+
+
+def _run(service: HistoryService, delete) -> List:
+    """Run a cleanup while a writer records sessions; returns cleanup and write timings."""
+    write_ms: List[float] = []
+    failed_writes = 0
+    done = threading.Event()
+
+    def writer() -> None:
+        nonlocal failed_writes
+        n = 0
+        while not done.is_set():
+            started = time.perf_counter()
+            try:
+                with service.get_repository() as repo:
+                    repo.create_alert_session(SessionFactory.create_test_session(session_id=f"live-{n}-{id(delete)}"))
+                write_ms.append((time.perf_counter() - started) * 1000)
+            except Exception:
+                failed_writes += 1
+            n += 1
+            time.sleep(0.01)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    started = time.perf_counter()
+    transactions_ms = delete()
+    cleanup_ms = (time.perf_counter() - started) * 1000
+    done.set()
+    thread.join()
+    writes = summarize(write_ms)
+    return [f"{cleanup_ms:.0f}", f"{max(transactions_ms):.0f}", writes["p50"], f"{max(write_ms):.0f}", failed_writes]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20000, help="Expired alert sessions to delete")
+    parser.add_argument("--batch-size", type=int, default=500, help="Sessions per delete batch")
+    parser.add_argument("--pause-ms", type=int, default=200, help="Pause between delete batches")
+    args = parser.parse_args()
+
+    rows = []
+    for label, delete in (
+        ("single", _single_transaction_delete),
+        ("batched", lambda service: _batched_delete(service, args.batch_size, args.pause_ms)),
+    ):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            settings = Mock(spec=Settings)
+            settings.database_url = f"sqlite:///{os.path.join(tmp_dir, 'history.db')}"
+            settings.history_retention_days = 90
+            settings.history_async_db = "never"
+            with patch("tarsy.services.history_service.base_infrastructure.get_settings", return_value=settings):
+                service = HistoryService()
+                if not service.initialize():
+                    raise RuntimeError("Could not initialize history database")
+            _populate(service, args.sessions)
+            rows.append([label, *_run(service, partial(delete, service))])
+            service._infra.db_manager.close()
+
+    print_table(
+        f"Retention cleanup of {args.sessions} sessions ({2 * INTERACTIONS_PER_SESSION} interactions each) "
+        f"with a concurrent writer",
+        ["mode", "cleanup ms", "longest txn ms", "write p50 ms", "write max ms", "failed writes"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
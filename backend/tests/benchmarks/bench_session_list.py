@@ -0,0 +1,177 @@
+"""
+Session list query benchmark.
+
+Fills a file-backed SQLite database with sessions that each have LLM and MCP
+interactions, a chat and (for some) parallel stages, then loads dashboard
+pages of the session list with:
+
+- aggregate: page query plus grouped COUNT/SUM queries over the interaction,
+             chat and stage tables for the page's sessions (the previous
+             behavior, reproduced here for comparison)
+- rollup:    get_alert_sessions reading the maintained session_stats rows
+             through one joined query
+
+and reports per-page latency, plus rollup pages sorted by total tokens (which
+the aggregate path could not sort by).
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_session_list [--sessions 1000] [--interactions 20] [--pages 50]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import and_, desc, event, func, or_  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine, select  # noqa: E402
+
+from tarsy.models.constants import ParallelType, StageStatus  # noqa: E402
+from tarsy.models.db_models import (  # noqa: E402
+    AlertSession,
+    Chat,
+    ChatUserMessage,
+    StageExecution,
+)
+from tarsy.models.unified_interactions import (  # noqa: E402
+    LLMInteraction,
+    MCPInteraction,
+)
+from tarsy.repositories.history_repository import HistoryRepository  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+from tests.utils import SessionFactory  # noqa: E402
+
+PAGE_SIZE = 25
+
+
+def _populate(session: Session, sessions: int, interactions: int) -> None:
+    for s in range(sessions):
+        session_id = f"session-{s:05d}"
+        alert_session = SessionFactory.create_test_session(session_id=session_id)
+        alert_session.started_at_us = 1_000_000 + s
+        session.add(alert_session)
+        session.flush()
+        for n in range(interactions):
+            session.add(LLMInteraction(
+                session_id=session_id, model_name="gemini-2.5-pro", timestamp_us=1_000_000 + n,
+                input_tokens=100 + s, output_tokens=50, total_tokens=150 + s,
+            ))
+            session.add(MCPInteraction(
+                session_id=session_id, server_name="kubernetes-server", communication_type="tool_call",
+                tool_name="get_pods", step_description="Get pods", timestamp_us=1_000_000 + n,
+            ))
+        chat = Chat(session_id=session_id, created_by="sre", conversation_history="", chain_id="chain")
+        session.add(chat)
+        session.flush()
+        session.add(ChatUserMessage(chat_id=chat.chat_id, content="Why?", author="sre"))
+        if s % 4 == 0:
+            session.add(StageExecution(
+                session_id=session_id, stage_id="analysis", stage_index=0, stage_name="Analysis",
+                agent="KubernetesAgent", status=StageStatus.COMPLETED.value,
+                parallel_type=ParallelType.MULTI_AGENT.value,
+            ))
+        if s % 100 == 99:
+            session.commit()
+    session.commit()
+
+
+def _aggregate_page(session: Session, page: int) -> int:
+    """The grouped queries get_alert_sessions ran for each page before session_stats."""
+    alert_sessions = session.exec(
+        select(AlertSession).order_by(desc(AlertSession.started_at_us))
+        .offset((page - 1) * PAGE_SIZE).limit(PAGE_SIZE)
+    ).all()
+    session.exec(select(func.count()).select_from(AlertSession)).one()
+    session_ids = [s.session_id for s in alert_sessions]
+    session.exec(
+        select(LLMInteraction.session_id, func.count(LLMInteraction.interaction_id))
+        .where(LLMInteraction.session_id.in_(session_ids)).group_by(LLMInteraction.session_id)
+    ).all()
+    session.exec(
+        select(MCPInteraction.session_id, func.count(MCPInteraction.communication_id))
+        .where(MCPInteraction.session_id.in_(session_ids)).group_by(MCPInteraction.session_id)
+    ).all()
+    session.exec(
+        select(
+            LLMInteraction.session_id, func.sum(LLMInteraction.input_tokens),
+            func.sum(LLMInteraction.output_tokens), func.sum(LLMInteraction.total_tokens),
+        ).where(LLMInteraction.session_id.in_(session_ids)).group_by(LLMInteraction.session_id)
+    ).all()
+    chats = session.exec(select(Chat.chat_id).where(Chat.session_id.in_(session_ids))).all()
+    session.exec(
+        select(ChatUserMessage.chat_id, func.count(ChatUserMessage.message_id))
+        .where(ChatUserMessage.chat_id.in_(list(chats))).group_by(ChatUserMessage.chat_id)
+    ).all()
+    session.exec(
+        select(StageExecution.session_id).where(and_(
+            StageExecution.session_id.in_(session_ids),
+            or_(
+                StageExecution.parallel_type != ParallelType.SINGLE.value,
+                StageExecution.parent_stage_execution_id.is_not(None),
+            ),
+        )).distinct()
+    ).all()
+    return len(alert_sessions)
+
+
+def _time_pages(load_page, pages: int, total_pages: int) -> List[float]:
+    latencies_ms = []
+    for n in range(pages):
+        started = time.perf_counter()
+        assert load_page(n % total_pages + 1) == PAGE_SIZE
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    return latencies_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=1000, help="Alert sessions in the database")
+    parser.add_argument("--interactions", type=int, default=20, help="LLM and MCP interactions per session")
+    parser.add_argument("--pages", type=int, default=50, help="Pages loaded per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'history.db')}")
+        SQLModel.metadata.create_all(engine)
+        statements = {"count": 0}
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def count_statement(*_args):
+            statements["count"] += 1
+
+        with Session(engine) as session:
+            _populate(session, args.sessions, args.interactions)
+            # Interactions were inserted directly; build the rollups the way the backfill would
+            repo = HistoryRepository(session)
+            logging.disable(logging.WARNING)
+            repo.verify_session_stats(repair=True)
+            logging.disable(logging.NOTSET)
+
+            total_pages = args.sessions // PAGE_SIZE
+            modes: Dict[str, object] = {
+                "aggregate": lambda page: _aggregate_page(session, page),
+                "rollup": lambda page: len(repo.get_alert_sessions(page=page, page_size=PAGE_SIZE).sessions),
+                "rollup, sort by tokens": lambda page: len(repo.get_alert_sessions(
+                    page=page, page_size=PAGE_SIZE, sort_by="session_total_tokens", sort_order="desc",
+                ).sessions),
+            }
+            rows = []
+            for mode, load_page in modes.items():
+                statements["count"] = 0
+                stats = summarize(_time_pages(load_page, args.pages, total_pages))
+                rows.append([mode, round(statements["count"] / args.pages, 1), stats["p50"], stats["p95"]])
+
+    print_table(
+        f"Session list pages of {PAGE_SIZE} - {args.sessions} sessions x {args.interactions} "
+        f"LLM + MCP interactions",
+        ["mode", "queries/page", "p50 ms", "p95 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Session list pagination benchmark.
+
+Fills a file-backed SQLite database with alert sessions and loads pages of
+the session list at increasing depths with:
+
+- offset: page numbers (OFFSET skips every earlier row) and an exact COUNT(*)
+- cursor: keyset cursor of the previous page (seeks on started_at_us,
+          session_id) with count=approximate, served from the count cache
+
+Reports per-page latency at each depth.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_session_pagination [--sessions 100000] [--repeat 20]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+from unittest.mock import Mock, patch
+
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import insert, text  # noqa: E402
+
+from tarsy.config.settings import Settings  # noqa: E402
+from tarsy.models.db_models import AlertSession  # noqa: E402
+from tarsy.models.history_models import SessionCursor  # noqa: E402
+from tarsy.services.history_service import HistoryService  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+from tests.utils import SessionFactory  # noqa: E402
+
+PAGE_SIZE = 25
+STATUSES = ["completed", "failed", "cancelled"]
+
+
+def _populate(service: HistoryService, sessions: int) -> None:
+    with service.get_repository() as repo:
+        for start in range(0, sessions, 5000):
+            rows = []
+            for s in range(start, min(start + 5000, sessions)):
+                alert_session = SessionFactory.create_test_session(session_id=f"session-{s:07d}")
+                alert_session.status = STATUSES[s % len(STATUSES)]
+                alert_session.started_at_us = 1_000_000 + s // 3  # Some sessions share a start time
+                rows.append(alert_session.model_dump())
+            repo.session.execute(insert(AlertSession), rows)
+        repo.session.commit()
+        # Planner statistics, as PostgreSQL autovacuum keeps them; without them SQLite
+        # prefers the status index and sorts every matching row
+        repo.session.execute(text("ANALYZE"))
+
+
+def _time(load_page, repeat: int) -> List[float]:
+    latencies_ms = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        assert len(load_page().sessions) == PAGE_SIZE
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    return latencies_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=100000, help="Alert sessions in the database")
+    parser.add_argument("--repeat", type=int, default=20, help="Loads per page and mode")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings = Mock(spec=Settings)
+        settings.database_url = f"sqlite:///{os.path.join(tmp_dir, 'history.db')}"
+        settings.history_retention_days = 90
+        settings.history_async_db = "never"
+        settings.history_session_count_cache_seconds = 30
+        with patch("tarsy.services.history_service.base_infrastructure.get_settings", return_value=settings):
+            service = HistoryService()
+            if not service.initialize():
+                raise RuntimeError("Could not initialize history database")
+        _populate(service, args.sessions)
+        filters = {"status": STATUSES}
+
+        last_page = args.sessions // PAGE_SIZE
+        for page in sorted({1, 10, last_page // 10, last_page // 2, last_page}):
+            previous = service.get_sessions_list(filters=filters, page=max(page - 1, 1), page_size=PAGE_SIZE)
+            last = previous.sessions[-1]
+            cursor = SessionCursor(
+                sort_by="started_at_us", sort_order="desc", value=last.started_at_us, session_id=last.session_id,
+            )
+            offset_ms = summarize(_time(
+                lambda page=page: service.get_sessions_list(filters=filters, page=page, page_size=PAGE_SIZE), args.repeat,
+            ))
+            cursor_ms = summarize(_time(
+                lambda cursor=cursor: service.get_sessions_list(
+                    filters=filters, page_size=PAGE_SIZE, cursor=cursor, count_mode="approximate",
+                ),
+                args.repeat,
+            ))
+            rows.append([page, offset_ms["p50"], cursor_ms["p50"], offset_ms["p95"], cursor_ms["p95"]])
+        service._infra.db_manager.close()
+
+    print_table(
+        f"Session list pages of {PAGE_SIZE} - {args.sessions} sessions, status filter, newest first",
+        ["page", "offset p50 ms", "cursor p50 ms", "offset p95 ms", "cursor p95 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
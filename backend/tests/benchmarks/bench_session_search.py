@@ -0,0 +1,143 @@
+"""
+Session search benchmark.
+
+Fills a file-backed SQLite database with alert sessions (and their search
+documents) and loads the first page of search results, with its total, for
+rare, common and multi-word searches with:
+
+- like:  the former search, LOWER(...) LIKE '%term%' over the session columns
+         and JSON fields, which scans every session
+- index: the session_search full-text index (FTS5 here, tsvector on
+         PostgreSQL), ranked by relevance, with highlighted snippets
+
+Reports per-search latency.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_session_search [--sessions 1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+from unittest.mock import Mock, patch
+
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import insert, text  # noqa: E402
+from sqlmodel import desc, func, or_, select  # noqa: E402
+
+from tarsy.config.settings import Settings  # noqa: E402
+from tarsy.models.db_models import AlertSession, SessionSearch  # noqa: E402
+from tarsy.repositories.history_repository import HistoryRepository  # noqa: E402
+from tarsy.services.history_service import HistoryService  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+from tests.utils import SessionFactory  # noqa: E402
+
+PAGE_SIZE = 25
+BATCH_SIZE = 5000
+NAMESPACES = [f"team-{n}" for n in range(200)]
+FINDINGS = [
+    "Pod was OOMKilled after the memory limit was reached",
+    "Deployment rollout stuck waiting for readiness probes",
+    "Node disk pressure evicted pods from the namespace",
+    "Certificate expired for the ingress controller",
+    "Finalizers kept the namespace in Terminating state",
+]
+# (label, search): a handful of sessions, one in five sessions, two words
+SEARCHES = [("rare", "team-138 certificate"), ("common", "oomkilled"), ("two words", "namespace terminating")]
+
+
+def _populate(service: HistoryService, sessions: int) -> None:
+    with service.get_repository() as repo:
+        for start in range(0, sessions, BATCH_SIZE):
+            rows, documents = [], []
+            for s in range(start, min(start + BATCH_SIZE, sessions)):
+                alert_session = SessionFactory.create_test_session(session_id=f"session-{s:07d}")
+                alert_session.started_at_us = 1_000_000 + s
+                alert_session.alert_data = {
+                    "message": f"Alert {s} in {NAMESPACES[s % len(NAMESPACES)]}",
+                    "namespace": NAMESPACES[s % len(NAMESPACES)],
+                    "severity": "critical" if s % 10 == 0 else "warning",
+                }
+                alert_session.final_analysis = f"{FINDINGS[s % len(FINDINGS)]}. Investigated {s} resources."
+                rows.append(alert_session.model_dump())
+                documents.append({
+                    "session_id": alert_session.session_id,
+                    "document": HistoryRepository._session_search_document(alert_session),
+                })
+            repo.session.execute(insert(AlertSession), rows)
+            repo.session.execute(insert(SessionSearch), documents)
+        repo.session.commit()
+        repo.session.execute(text("ANALYZE"))
+
+
+def _like_search(repo: HistoryRepository, search: str) -> int:
+    """The former search: substring match over the session columns and JSON fields."""
+    term = f"%{search.lower()}%"
+    columns = [
+        AlertSession.error_message, AlertSession.final_analysis, AlertSession.alert_type, AlertSession.agent_type,
+    ] + [
+        func.json_extract(AlertSession.alert_data, f"$.{key}")
+        for key in ("message", "context", "namespace", "pod", "cluster", "severity", "environment", "runbook", "id")
+    ] + [func.json_extract(AlertSession.session_metadata, "$")]
+    condition = or_(*[func.lower(column).like(term) for column in columns])
+    total = repo.session.exec(select(func.count(AlertSession.session_id)).where(condition)).first()
+    repo.session.exec(
+        select(AlertSession).where(condition).order_by(desc(AlertSession.started_at_us)).limit(PAGE_SIZE)
+    ).all()
+    return total
+
+
+def _time(run, repeat: int) -> List[float]:
+    latencies_ms = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    return latencies_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=1000000, help="Alert sessions in the database")
+    parser.add_argument("--repeat", type=int, default=5, help="Loads per search and mode")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings = Mock(spec=Settings)
+        settings.database_url = f"sqlite:///{os.path.join(tmp_dir, 'history.db')}"
+        settings.history_retention_days = 90
+        settings.history_async_db = "never"
+        with patch("tarsy.services.history_service.base_infrastructure.get_settings", return_value=settings):
+            service = HistoryService()
+            if not service.initialize():
+                raise RuntimeError("Could not initialize history database")
+        started = time.perf_counter()
+        _populate(service, args.sessions)
+        print(f"Populated {args.sessions} sessions in {time.perf_counter() - started:.0f} s")
+
+        with service.get_repository() as repo:
+            for label, search in SEARCHES:
+                result = repo.get_alert_sessions(search=search, page_size=PAGE_SIZE)
+                like_ms = summarize(_time(lambda search=search: _like_search(repo, search), args.repeat))
+                index_ms = summarize(_time(
+                    lambda search=search: repo.get_alert_sessions(search=search, page_size=PAGE_SIZE), args.repeat
+                ))
+                rows.append([
+                    f"{label}: {search!r}", result.pagination.total_items,
+                    like_ms["p50"], index_ms["p50"], like_ms["p95"], index_ms["p95"],
+                ])
+        service._infra.db_manager.close()
+
+    print_table(
+        f"First page of {PAGE_SIZE} search results with total - {args.sessions} sessions",
+        ["search", "matches", "like p50 ms", "index p50 ms", "like p95 ms", "index p95 ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Session page load benchmark.
+
+Fills a file-backed SQLite database with one large session (ReAct stages
+whose conversations grow with every iteration, and MCP tool calls with
+large results) and loads the session page with:
+
+- detail:   GET /sessions/{id}, every conversation and tool payload
+- timeline: GET /sessions/{id}/timeline, interaction summaries with previews,
+            plus the payload of one interaction opened by the user
+
+Reports latency and response size.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_session_timeline [--stages 5] [--iterations 30] [--repeat 10]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+from unittest.mock import Mock, patch
+
+os.environ.setdefault("TESTING", "true")
+
+from tarsy.config.settings import Settings  # noqa: E402
+from tarsy.models.db_models import StageExecution  # noqa: E402
+from tarsy.models.unified_interactions import (  # noqa: E402
+    LLMConversation,
+    LLMInteraction,
+    LLMMessage,
+    MCPInteraction,
+    MessageRole,
+)
+from tarsy.services.history_service import HistoryService  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+from tests.utils import SessionFactory  # noqa: E402
+
+SESSION_ID = "session-timeline"
+RESPONSE_CHARS = 2000
+TOOL_RESULT_CHARS = 20000
+
+
+def _populate(service: HistoryService, stages: int, iterations: int) -> tuple:
+    """Record a session; returns one LLM interaction and one MCP communication ID."""
+    with service.get_repository() as repo:
+        repo.create_alert_session(SessionFactory.create_test_session(session_id=SESSION_ID))
+        for s in range(stages):
+            execution_id = repo.create_stage_execution(StageExecution(
+                session_id=SESSION_ID, stage_id=f"stage-{s}", stage_index=s, stage_name=f"Stage {s}",
+                agent="KubernetesAgent", status="completed", stage_output={"result": "x" * RESPONSE_CHARS},
+            ))
+            messages = [
+                LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE agent. " * 200),
+                LLMMessage(role=MessageRole.USER, content=f"Investigate the alert in stage {s}. " * 50),
+            ]
+            for i in range(iterations):
+                messages = messages + [
+                    LLMMessage(role=MessageRole.ASSISTANT, content=f"Thought {s}-{i}: checking pods. " * 60),
+                ]
+                repo.create_llm_interaction(LLMInteraction(
+                    interaction_id=f"llm-{s}-{i}", session_id=SESSION_ID, model_name="gpt-4",
+                    conversation=LLMConversation(messages=messages), stage_execution_id=execution_id,
+                    input_tokens=1000, output_tokens=100, total_tokens=1100,
+                ))
+                repo.create_mcp_communication(MCPInteraction(
+                    communication_id=f"mcp-{s}-{i}", session_id=SESSION_ID, server_name="kubernetes-server",
+                    communication_type="tool_call", tool_name="kubectl_get", tool_arguments={"resource": "pods"},
+                    tool_result={"output": f"pod-{s}-{i} Running\n" * (TOOL_RESULT_CHARS // 20)},
+                    step_description="Get pods", success=True, stage_execution_id=execution_id,
+                ))
+                messages = messages + [
+                    LLMMessage(role=MessageRole.USER, content=f"Observation: pod-{s}-{i} Running\n" * 100),
+                ]
+    return f"llm-{stages - 1}-{iterations - 1}", f"mcp-{stages - 1}-{iterations - 1}"
+
+
+def _time(load, repeat: int) -> tuple:
+    latencies_ms: List[float] = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(load())
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    return summarize(latencies_ms), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stages", type=int, default=5, help="Stages of the session")
+    parser.add_argument("--iterations", type=int, default=30, help="ReAct iterations per stage")
+    parser.add_argument("--repeat", type=int, default=10, help="Loads per mode")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings = Mock(spec=Settings)
+        settings.database_url = f"sqlite:///{os.path.join(tmp_dir, 'history.db')}"
+        settings.history_retention_days = 90
+        settings.history_async_db = "never"
+        with patch("tarsy.services.history_service.base_infrastructure.get_settings", return_value=settings):
+            service = HistoryService()
+            if not service.initialize():
+                raise RuntimeError("Could not initialize history database")
+        llm_id, mcp_id = _populate(service, args.stages, args.iterations)
+
+        detail_ms, detail_size = _time(
+            lambda: service.get_session_details(SESSION_ID).model_dump_json(), args.repeat
+        )
+        timeline_ms, timeline_size = _time(
+            lambda: service.get_session_timeline(SESSION_ID).model_dump_json(), args.repeat
+        )
+        llm_ms, llm_size = _time(
+            lambda: service.get_llm_interaction_event(SESSION_ID, llm_id).model_dump_json(), args.repeat
+        )
+        mcp_ms, mcp_size = _time(
+            lambda: service.get_mcp_interaction_event(SESSION_ID, mcp_id).model_dump_json(), args.repeat
+        )
+        service._infra.db_manager.close()
+
+    for label, latency, size in (
+        ("detail", detail_ms, detail_size),
+        ("timeline", timeline_ms, timeline_size),
+        ("one LLM interaction", llm_ms, llm_size),
+        ("one MCP interaction", mcp_ms, mcp_size),
+    ):
+        rows.append([label, latency["p50"], latency["p95"], f"{size / 1024:.0f}"])
+    print_table(
+        f"Session page load - {args.stages} stages x {args.iterations} iterations "
+        f"({2 * args.stages * args.iterations} interactions)",
+        ["response", "p50 ms", "p95 ms", "size KiB"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
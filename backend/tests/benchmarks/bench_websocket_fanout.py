@@ -0,0 +1,229 @@
+"""
+WebSocket fan-out load benchmark.
+
+Simulates N dashboard sockets subscribed to the 'sessions' channel and
+dispatches events through an in-process listener with:
+
+- per-connection: every connection registers its own listener callback and
+                  each callback broadcasts to the whole channel (the previous
+                  controller behavior: N serializations and N^2 sends per event)
+- hub:            WebSocketConnectionManager registers one callback per
+                  channel, serializes once and queues to per-connection writers
+
+Reports sends and serializations per event and the time until every socket
+received the event; per-subscriber cost should stay flat for the hub.
+
+A second table adds one stalled socket that never completes a send and streams
+LLM chunks through the hub under each overflow policy: healthy sockets should
+keep their latency while the stalled one stays bounded by its send queue.
+
+Usage (from backend/):
+    uv run python -m tests.benchmarks.bench_websocket_fanout [--sockets 50,100,250,500] [--events 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+os.environ.setdefault("TESTING", "true")
+
+from tarsy.models.constants import WebSocketOverflowPolicy  # noqa: E402
+from tarsy.services.websocket_connection_manager import WebSocketConnectionManager  # noqa: E402
+from tests.benchmarks.common import print_table, summarize  # noqa: E402
+
+CHANNEL = "sessions"
+
+
+class SimulatedSocket:
+    """WebSocket double that counts received messages."""
+
+    def __init__(self, on_receive) -> None:
+        self.received = 0
+        self._on_receive = on_receive
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, _text: str) -> None:
+        await asyncio.sleep(0)  # Yield like a real network write
+        self.received += 1
+        self._on_receive()
+
+
+class InProcessListener:
+    """Minimal EventListener: awaits every channel callback for each event."""
+
+    def __init__(self) -> None:
+        self.callbacks: Dict[str, List] = {}
+
+    async def subscribe(self, channel: str, callback) -> None:
+        self.callbacks.setdefault(channel, []).append(callback)
+
+    async def unsubscribe(self, channel: str, callback) -> None:
+        self.callbacks[channel].remove(callback)
+
+    async def dispatch(self, channel: str, event: dict) -> None:
+        await asyncio.gather(*(callback(event) for callback in self.callbacks.get(channel, [])))
+
+
+async def _run_mode(mode: str, sockets: int, events: int) -> Dict[str, float]:
+    """Deliver `events` events to `sockets` subscribers and return per-event stats."""
+    manager = WebSocketConnectionManager(send_queue_size=max(events * sockets, 1))
+    listener = InProcessListener()
+    sends = 0
+    expected = 0
+    delivered = asyncio.Event()
+
+    def on_receive() -> None:
+        nonlocal sends
+        sends += 1
+        if sends >= expected:
+            delivered.set()
+
+    for i in range(sockets):
+        connection_id = f"conn-{i}"
+        await manager.connect(connection_id, SimulatedSocket(on_receive))
+        manager.subscribe(connection_id, CHANNEL)
+        if mode == "hub":
+            await manager.attach_channel(CHANNEL, listener)
+        else:
+            async def per_connection_callback(event: dict) -> None:
+                # Previous behavior: serialize and send to every subscriber, awaiting each send
+                event_json = json.dumps(event)
+                for subscriber in list(manager.channel_subscribers[CHANNEL]):
+                    await manager.connections[subscriber].send_text(event_json)
+            await listener.subscribe(CHANNEL, per_connection_callback)
+
+    sends_per_event = sockets if mode == "hub" else sockets * sockets
+    latencies_ms: List[float] = []
+    # Both modes serialize with the json module, so one patch counts all serializations
+    with patch("json.dumps", wraps=json.dumps) as dumps:
+        for n in range(events):
+            sends, expected = 0, sends_per_event
+            delivered.clear()
+            started = time.perf_counter()
+            await listener.dispatch(CHANNEL, {"type": "session.progress_update", "id": n})
+            await delivered.wait()
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+        serializations = dumps.call_count
+
+    for i in range(sockets):
+        manager.disconnect(f"conn-{i}")
+
+    stats = summarize(latencies_ms)
+    return {
+        "sends_per_event": float(sends_per_event),
+        "serializations_per_event": serializations / events,
+        "p50_ms": stats["p50"],
+        "p95_ms": stats["p95"],
+        "us_per_socket": stats["p50"] * 1000 / sockets,
+    }
+
+
+class StalledSocket:
+    """WebSocket double whose sends never complete (a frozen browser tab)."""
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, _text: str) -> None:
+        await asyncio.Event().wait()
+
+    async def close(self, **_kwargs) -> None:
+        self.closed = True
+
+
+async def _run_slow_consumer(policy: WebSocketOverflowPolicy, sockets: int, events: int) -> Dict[str, float]:
+    """Stream `events` chunks to `sockets` healthy subscribers plus one stalled one."""
+    manager = WebSocketConnectionManager(send_queue_size=64, overflow_policy=policy)
+    received = 0
+    expected = 0
+    delivered = asyncio.Event()
+
+    def on_receive() -> None:
+        nonlocal received
+        received += 1
+        if received >= expected:
+            delivered.set()
+
+    stalled = StalledSocket()
+    await manager.connect("stalled", stalled)
+    manager.subscribe("stalled", CHANNEL)
+    for i in range(sockets):
+        await manager.connect(f"conn-{i}", SimulatedSocket(on_receive))
+        manager.subscribe(f"conn-{i}", CHANNEL)
+
+    latencies_ms: List[float] = []
+    for n in range(events):
+        received, expected = 0, sockets
+        delivered.clear()
+        started = time.perf_counter()
+        await manager.broadcast_to_channel(CHANNEL, {
+            "type": "llm.stream.chunk", "session_id": "s1", "stream_type": "thought",
+            "llm_interaction_id": f"llm-{n % 4}", "chunk": "x" * n,
+        })
+        await delivered.wait()
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    await asyncio.sleep(0)
+
+    stalled_stats = manager.get_connection_stats()["stalled"]
+    for connection_id in list(manager.connections):
+        manager.disconnect(connection_id)
+
+    stats = summarize(latencies_ms)
+    return {
+        "p50_ms": stats["p50"],
+        "p95_ms": stats["p95"],
+        "stalled_depth": float(stalled_stats["queue_depth"]),
+        "stalled_dropped": float(stalled_stats["dropped"]),
+        "stalled_coalesced": float(stalled_stats["coalesced"]),
+        "stalled_closed": float(stalled.closed),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sockets", default="50,100,250,500", help="Comma-separated subscriber counts")
+    parser.add_argument("--events", type=int, default=10, help="Events dispatched per run")
+    args = parser.parse_args()
+
+    rows = []
+    for sockets in (int(value) for value in args.sockets.split(",")):
+        for mode in ("per-connection", "hub"):
+            result = await _run_mode(mode, sockets, args.events)
+            rows.append([
+                sockets, mode, int(result["sends_per_event"]), result["serializations_per_event"],
+                result["p50_ms"], result["p95_ms"], result["us_per_socket"],
+            ])
+
+    print_table(
+        f"WebSocket fan-out - {args.events} events per run",
+        ["sockets", "mode", "sends/event", "dumps/event", "p50 ms", "p95 ms", "p50 us/socket"],
+        rows,
+    )
+
+    slow_rows = []
+    sockets = max(int(value) for value in args.sockets.split(","))
+    for policy in WebSocketOverflowPolicy:
+        result = await _run_slow_consumer(policy, sockets, args.events * 50)
+        slow_rows.append([
+            policy.value, result["p50_ms"], result["p95_ms"], int(result["stalled_depth"]),
+            int(result["stalled_dropped"]), int(result["stalled_coalesced"]), bool(result["stalled_closed"]),
+        ])
+
+    print_table(
+        f"One stalled socket - {sockets} healthy sockets, {args.events * 50} stream chunks, queue size 64",
+        ["policy", "healthy p50 ms", "healthy p95 ms", "stalled depth", "dropped", "coalesced", "evicted"],
+        slow_rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
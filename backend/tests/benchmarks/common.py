@@ -0,0 +1,59 @@
+"""
+Shared helpers for standalone performance benchmarks.
+
+Benchmarks live next to the tests but are not collected by pytest (files are
+named ``bench_*.py``). Run them from the backend directory, for example:
+
+    uv run python -m tests.benchmarks.bench_queue_drain
+"""
+
+import math
+from typing import Dict, List, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a sequence.
+    
+    Args:
+        values: Sample values
+        pct: Percentile in the range 0-100
+        
+    Returns:
+        Percentile value, or 0.0 for an empty sequence
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """Return count, p50, p95, p99 and max of a sample."""
+    return {
+        "count": float(len(values)),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else 0.0,
+    }
+
+
+def print_table(title: str, headers: List[str], rows: List[List[object]]) -> None:
+    """Print a simple fixed-width results table."""
+    widths = [
+        max(len(str(header)), *(len(_fmt(row[i])) for row in rows)) if rows else len(str(header))
+        for i, header in enumerate(headers)
+    ]
+    print(f"\n{title}")
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths, strict=True)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(_fmt(cell).ljust(w) for cell, w in zip(row, widths, strict=True)))
+
+
+def _fmt(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
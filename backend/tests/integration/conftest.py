@@ -81,6 +81,8 @@ def mock_settings():
 
     settings.slack_bot_token = None
     settings.slack_channel = None
+    settings.mcp_session_pool_enabled = False
+    settings.mcp_tool_catalog_ttl_seconds = 0
     
     # Mock the get_llm_config method that Settings class provides
     from tarsy.models.llm_models import LLMProviderConfig, LLMProviderType
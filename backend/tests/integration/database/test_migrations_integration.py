@@ -128,6 +128,16 @@ class TestMigrationLifecycle:
         # will add the actual schema. This test verifies the migration system
         # works, not the specific schema content.
 
+    def test_migrated_schema_matches_models(self, temp_database: str) -> None:
+        """Test that autogenerate finds nothing to change on a migrated database."""
+        from alembic import command
+
+        assert run_migrations(temp_database)
+
+        # Raises AutogenerateDiffsDetected if models and migrations disagree,
+        # e.g. if it would drop the raw-DDL session search index
+        command.check(get_alembic_config(temp_database))
+
     def test_database_integrity_after_migration(self, temp_database: str) -> None:
         """Test that the database is functional after migration."""
         # Run migrations
@@ -0,0 +1,180 @@
+"""
+Integration tests for HistoryService operations on the async database engine.
+
+Uses a file-backed SQLite database so the sync and async engines share data,
+and checks that *_async operations await the async driver instead of
+occupying executor threads.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from tarsy.config.settings import Settings
+from tarsy.models.constants import AlertSessionStatus
+from tarsy.models.unified_interactions import (
+    LLMConversation,
+    LLMInteraction,
+    LLMMessage,
+    MCPInteraction,
+    MessageRole,
+)
+from tarsy.services.history_service import HistoryService
+from tests.utils import SessionFactory
+
+pytestmark = pytest.mark.integration
+
+
+def _settings(database_url: str, mode: str = "always") -> Mock:
+    settings = Mock(spec=Settings)
+    settings.database_url = database_url
+    settings.history_retention_days = 90
+    settings.history_async_db = mode
+    return settings
+
+
+def _llm_interaction(session_id: str, n: int) -> LLMInteraction:
+    return LLMInteraction(
+        session_id=session_id,
+        model_name="gpt-4",
+        conversation=LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE assistant."),
+            LLMMessage(role=MessageRole.USER, content=f"Check pods, attempt {n}"),
+            LLMMessage(role=MessageRole.ASSISTANT, content="Pods are healthy"),
+        ]),
+        duration_ms=100,
+    )
+
+
+@pytest.fixture
+async def history_service(tmp_path):
+    """HistoryService on a temporary SQLite file with the async engine forced on."""
+    database_url = f"sqlite:///{tmp_path / 'history.db'}"
+    with patch(
+        'tarsy.services.history_service.base_infrastructure.get_settings',
+        return_value=_settings(database_url),
+    ):
+        service = HistoryService()
+        assert service.initialize()
+    with service.get_repository() as repo:
+        for n in range(3):
+            repo.create_alert_session(SessionFactory.create_test_session(session_id=f"session-{n}"))
+    yield service
+    await service.close()
+    service._infra.db_manager.close()
+
+
+@pytest.fixture
+def no_executor_threads():
+    """Fail if a history operation falls back to an executor thread."""
+    with patch(
+        'tarsy.services.history_service.base_infrastructure.asyncio.to_thread',
+        side_effect=AssertionError("history operation ran on an executor thread"),
+    ):
+        yield
+
+
+class TestHistoryAsyncEngine:
+    """Test async operations running on the async engine."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_executor_threads")
+    async def test_interactions_are_stored_through_async_engine(self, history_service):
+        """Test that stored interactions are visible to the sync engine."""
+        assert history_service._infra.async_session_factory is not None
+
+        results = await asyncio.gather(*(
+            history_service.store_llm_interaction_async(_llm_interaction(f"session-{n % 3}", n))
+            for n in range(12)
+        ))
+        mcp_ok = await history_service.store_mcp_interaction_async(MCPInteraction(
+            session_id="session-0",
+            server_name="kubernetes-server",
+            communication_type="tool_call",
+            tool_name="get_pods",
+            tool_arguments={"namespace": "default"},
+            tool_result={"pods": []},
+            success=True,
+        ))
+
+        assert all(results) and mcp_ok
+        with history_service.get_repository() as repo:
+            for n in range(3):
+                assert len(repo.get_llm_interactions_for_session(f"session-{n}")) == 4
+            assert len(repo.get_mcp_communications_for_session("session-0")) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_executor_threads")
+    async def test_claim_and_release_through_async_engine(self, history_service):
+        """Test that the claim worker's queue operations work on the async engine."""
+        claimed = await history_service.claim_pending_sessions_async("pod-1", limit=2, max_active_sessions=5)
+
+        assert len(claimed) == 2
+        assert all(session.status == AlertSessionStatus.IN_PROGRESS.value for session in claimed)
+        assert history_service.count_active_leases() == 2
+
+        history_service.update_session_status(claimed[0].session_id, AlertSessionStatus.COMPLETED.value)
+        assert await history_service.release_session_lease_async(claimed[0].session_id)
+        assert await history_service.reconcile_session_leases_async() == 0
+        assert history_service.count_active_leases() == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_executor_threads")
+    async def test_record_session_interaction_through_async_engine(self, history_service):
+        """Test that last-interaction tracking works on the async engine."""
+        assert await history_service.record_session_interaction_async("session-1")
+
+        session = history_service.get_session("session-1")
+        assert session.last_interaction_at is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_rolls_back_async_session(self, history_service):
+        """Test that a failing operation is retried on a fresh session and classified as before."""
+        infra = history_service._infra
+        infra.base_delay = 0
+        attempts = 0
+
+        def operation():
+            nonlocal attempts
+            attempts += 1
+            with infra.get_repository() as repo:
+                if attempts == 1:
+                    raise OperationalError("UPDATE alert_sessions", {}, Exception("database is locked"))
+                return repo.get_alert_session("session-0") is not None
+
+        result = await infra._retry_database_operation_async("lookup", operation)
+
+        assert result is True
+        assert attempts == 2
+
+
+class TestHistoryAsyncEngineFallback:
+    """Test configurations that keep executor threads."""
+
+    @pytest.mark.parametrize(
+        "database_url,mode",
+        [("sqlite:///:memory:", "always"), ("file", "never"), ("file", "auto")],
+    )
+    @pytest.mark.asyncio
+    async def test_operations_fall_back_to_executor_threads(self, tmp_path, database_url, mode):
+        """Test that in-memory SQLite, 'never' and SQLite under 'auto' run operations on threads."""
+        if database_url == "file":
+            database_url = f"sqlite:///{tmp_path / 'history.db'}"
+        with patch(
+            'tarsy.services.history_service.base_infrastructure.get_settings',
+            return_value=_settings(database_url, mode),
+        ):
+            service = HistoryService()
+            assert service.initialize()
+
+        with patch(
+            'tarsy.services.history_service.base_infrastructure.asyncio.to_thread',
+            wraps=asyncio.to_thread,
+        ) as to_thread:
+            assert await service.claim_pending_sessions_async("pod-1", limit=1) == []
+
+        assert service._infra.async_engine is None
+        to_thread.assert_called_once()
+        service._infra.db_manager.close()
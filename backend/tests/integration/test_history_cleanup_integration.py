@@ -236,6 +236,48 @@ class TestHistoryCleanupServiceIntegration:
             mcp_result = session.exec(mcp_stmt).first()
             assert mcp_result is None
 
+    @pytest.mark.asyncio
+    async def test_cleanup_deletes_in_batches_with_chats(self, test_session_factory):
+        """Test that batched deletion removes every expired session, chats included."""
+        from sqlmodel import select
+
+        from tarsy.models.db_models import Chat, ChatUserMessage
+
+        old_timestamp = now_us() - (100 * 24 * 3600 * 1_000_000)
+        recent_timestamp = now_us() - (10 * 24 * 3600 * 1_000_000)
+
+        with test_session_factory() as session:
+            for i in range(7):
+                self._create_test_session(session, f"old-session-{i}", old_timestamp + i)
+            self._create_test_session(session, "recent-session", recent_timestamp)
+            session.commit()
+            chat = Chat(
+                session_id="old-session-3",
+                conversation_history="Investigation",
+                chain_id="test-chain",
+                context_captured_at_us=old_timestamp,
+            )
+            session.add(chat)
+            session.commit()
+            session.add(ChatUserMessage(chat_id=chat.chat_id, content="Why?", author="user"))
+            session.commit()
+
+        service = HistoryCleanupService(
+            test_session_factory,
+            retention_days=90,
+            retention_cleanup_interval_hours=12,
+            retention_batch_size=3,
+            retention_batch_pause_ms=0,
+        )
+        deleted_count = await service._cleanup_old_history()
+
+        assert deleted_count == 7
+        with test_session_factory() as session:
+            remaining = session.exec(select(AlertSession.session_id)).all()
+            assert remaining == ["recent-session"]
+            assert session.exec(select(Chat)).first() is None
+            assert session.exec(select(ChatUserMessage)).first() is None
+
     @pytest.mark.asyncio
     async def test_cleanup_with_no_old_sessions(self, test_session_factory):
         """Test cleanup when no sessions need to be deleted."""
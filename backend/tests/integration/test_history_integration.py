@@ -616,6 +616,8 @@ class TestAlertServiceHistoryIntegration:
         settings.mcp_tool_call_timeout = 70  # Default 70 second tool timeout
         settings.slack_bot_token = None
         settings.slack_channel = None
+        settings.mcp_session_pool_enabled = False
+        settings.mcp_tool_catalog_ttl_seconds = 0
         return settings
     
     @pytest.fixture
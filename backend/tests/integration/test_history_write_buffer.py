@@ -0,0 +1,288 @@
+"""
+Integration tests for the write-behind buffer of interaction history.
+
+Uses a file-backed SQLite database so a "crashed" service's writes can be
+checked from a fresh service, the way a restarted pod would see them.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import event
+
+from tarsy.config.settings import Settings
+from tarsy.models.constants import StageStatus
+from tarsy.models.db_models import StageExecution
+from tarsy.models.unified_interactions import (
+    LLMConversation,
+    LLMInteraction,
+    LLMMessage,
+    MCPInteraction,
+    MessageRole,
+)
+from tarsy.services.history_service import HistoryService
+from tests.utils import SessionFactory
+
+pytestmark = pytest.mark.integration
+
+
+def _settings(database_url: str, durability: str = "stage", max_latency_ms: int = 10_000) -> Mock:
+    settings = Mock(spec=Settings)
+    settings.database_url = database_url
+    settings.history_retention_days = 90
+    settings.history_async_db = "never"
+    settings.history_write_durability = durability
+    settings.history_write_max_latency_ms = max_latency_ms
+    settings.history_write_max_batch_size = 500
+    settings.history_write_max_pending = 10000
+    return settings
+
+
+def _create_service(database_url: str, **kwargs) -> HistoryService:
+    with patch(
+        'tarsy.services.history_service.base_infrastructure.get_settings',
+        return_value=_settings(database_url, **kwargs),
+    ):
+        service = HistoryService()
+        assert service.initialize()
+    return service
+
+
+def _llm_interaction(session_id: str, n: int) -> LLMInteraction:
+    return LLMInteraction(
+        session_id=session_id,
+        model_name="gpt-4",
+        conversation=LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE assistant."),
+            LLMMessage(role=MessageRole.USER, content=f"Check pods, attempt {n}"),
+        ]),
+    )
+
+
+def _mcp_interaction(session_id: str, n: int) -> MCPInteraction:
+    return MCPInteraction(
+        session_id=session_id,
+        server_name="kubernetes-server",
+        communication_type="tool_call",
+        tool_name="get_pods",
+        tool_arguments={"namespace": f"ns-{n}"},
+        tool_result={"pods": []},
+        success=True,
+    )
+
+
+def _stage(session_id: str) -> StageExecution:
+    return StageExecution(
+        session_id=session_id,
+        stage_id="analysis",
+        stage_index=0,
+        stage_name="Analysis",
+        agent="KubernetesAgent",
+        status=StageStatus.PENDING.value,
+    )
+
+
+async def _log_iteration(service: HistoryService, session_id: str, n: int) -> None:
+    """Log one ReAct iteration the way the history hooks do."""
+    assert await service.store_llm_interaction_async(_llm_interaction(session_id, n))
+    assert await service.record_session_interaction_async(session_id)
+    assert await service.store_mcp_interaction_async(_mcp_interaction(session_id, n))
+    assert await service.record_session_interaction_async(session_id)
+
+
+def _stored_counts(service: HistoryService, session_id: str) -> tuple:
+    with service.get_repository() as repo:
+        return (
+            len(repo.get_llm_interactions_for_session(session_id)),
+            len(repo.get_mcp_communications_for_session(session_id)),
+        )
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'history.db'}"
+    service = _create_service(url)
+    with service.get_repository() as repo:
+        for n in range(3):
+            repo.create_alert_session(SessionFactory.create_test_session(session_id=f"session-{n}"))
+    service._infra.db_manager.close()
+    return url
+
+
+@pytest.fixture
+async def history_service(database_url):
+    """HistoryService with a started write buffer that only writes when flushed."""
+    service = _create_service(database_url)
+    await service.start_write_buffer()
+    yield service
+    await service.close()
+    service._infra.db_manager.close()
+
+
+class TestHistoryWriteBuffer:
+    """Test batching of buffered interaction history."""
+
+    @pytest.mark.asyncio
+    async def test_interactions_written_in_one_batch(self, history_service):
+        """Test that interactions of all sessions share one transaction and one session UPDATE."""
+        statements = []
+
+        def record_statement(_conn, _cursor, statement, _parameters, _context, _executemany):
+            statements.append(" ".join(statement.split()[:3]))
+
+        engine = history_service._infra.db_manager.engine
+        await asyncio.gather(*(
+            _log_iteration(history_service, f"session-{n % 3}", n) for n in range(6)
+        ))
+        assert _stored_counts(history_service, "session-0") == (0, 0)
+
+        event.listen(engine, "before_cursor_execute", record_statement)
+        try:
+            await history_service.flush_write_buffer()
+        finally:
+            event.remove(engine, "before_cursor_execute", record_statement)
+
+        buffer = history_service._write_buffer
+        assert buffer.batches_written == 1
+        assert buffer.interactions_written == 12
+        assert statements.count("UPDATE alert_sessions SET") == 1
+        assert statements.count("INSERT INTO llm_interactions") == 1
+        assert statements.count("INSERT INTO mcp_communications") == 1
+        for n in range(3):
+            assert _stored_counts(history_service, f"session-{n}") == (2, 2)
+            assert history_service.get_session(f"session-{n}").last_interaction_at is not None
+
+    @pytest.mark.asyncio
+    async def test_stage_boundary_flushes_buffer(self, history_service):
+        """Test that creating or updating a stage execution writes buffered interactions first."""
+        await _log_iteration(history_service, "session-0", 0)
+
+        stage = _stage("session-0")
+        await history_service.create_stage_execution(stage)
+        assert _stored_counts(history_service, "session-0") == (1, 1)
+
+        await _log_iteration(history_service, "session-0", 1)
+        stage.status = StageStatus.COMPLETED.value
+        assert await history_service.update_stage_execution(stage)
+        assert _stored_counts(history_service, "session-0") == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_interaction_reads_see_buffered_writes(self, history_service):
+        """Test that async interaction reads flush the buffer first."""
+        await _log_iteration(history_service, "session-1", 0)
+
+        assert await history_service.has_llm_interactions("session-1")
+        assert len(await history_service.get_llm_interactions_for_session("session-1")) == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_does_not_wait_for_later_submissions(self, database_url):
+        """Test that flush returns under steady writes from other sessions."""
+        service = _create_service(database_url, max_latency_ms=50)
+        await service.start_write_buffer()
+        buffer = service._write_buffer
+        write_batch = buffer._write_batch
+
+        async def slow_write_batch(batch):
+            # Batches take longer than producers need to buffer the next entries
+            await asyncio.sleep(0.05)
+            await write_batch(batch)
+
+        buffer._write_batch = slow_write_batch
+        stop = asyncio.Event()
+
+        async def produce(session_id: str) -> None:
+            n = 0
+            while not stop.is_set():
+                await _log_iteration(service, session_id, n)
+                n += 1
+                await asyncio.sleep(0.02)
+
+        producers = [asyncio.create_task(produce(f"session-{n % 3}")) for n in range(5)]
+        try:
+            await asyncio.sleep(0.1)
+            await _log_iteration(service, "session-0", 999)
+            await asyncio.wait_for(service.flush_write_buffer(), timeout=5)
+            with service.get_repository() as repo:
+                tools = [i.tool_arguments for i in repo.get_mcp_communications_for_session("session-0")]
+            assert {"namespace": "ns-999"} in tools
+        finally:
+            stop.set()
+            await asyncio.gather(*producers)
+            await service.close()
+            service._infra.db_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_buffered_interactions(self, database_url):
+        """Test that shutdown writes what is buffered."""
+        service = _create_service(database_url)
+        await service.start_write_buffer()
+        await _log_iteration(service, "session-2", 0)
+
+        await service.close()
+
+        assert _stored_counts(service, "session-2") == (1, 1)
+        service._infra.db_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_immediate_durability_writes_directly(self, database_url):
+        """Test that 'immediate' durability keeps one commit per interaction."""
+        service = _create_service(database_url, durability="immediate")
+        await service.start_write_buffer()
+
+        await _log_iteration(service, "session-0", 0)
+
+        assert service._write_buffer is None
+        assert _stored_counts(service, "session-0") == (1, 1)
+        await service.close()
+        service._infra.db_manager.close()
+
+
+class TestHistoryWriteBufferCrashSafety:
+    """Test what survives a crash and a failing write."""
+
+    @pytest.mark.asyncio
+    async def test_crash_loses_only_writes_after_last_stage_boundary(self, database_url):
+        """Test that interactions before a stage boundary survive a crash; only the open window is lost."""
+        service = _create_service(database_url)
+        await service.start_write_buffer()
+        for n in range(3):
+            await _log_iteration(service, "session-0", n)
+        stage = _stage("session-0")
+        await service.create_stage_execution(stage)
+        await _log_iteration(service, "session-0", 3)
+
+        # Crash: the process dies without flushing or closing anything
+        service._write_buffer._flusher.cancel()
+        await asyncio.sleep(0)
+
+        restarted = _create_service(database_url)
+        assert _stored_counts(restarted, "session-0") == (3, 3)
+        with restarted.get_repository() as repo:
+            interactions = repo.get_llm_interactions_for_session("session-0")
+            assert all(len(i.conversation.messages) == 2 for i in interactions)
+        assert restarted.get_session("session-0").last_interaction_at is not None
+        assert await restarted.get_stage_execution(stage.execution_id) is not None
+        restarted._infra.db_manager.close()
+        service._infra.db_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_failing_entry_does_not_drop_batch(self, history_service):
+        """Test that an entry that cannot be written is dropped alone."""
+        history_service._infra.base_delay = 0
+        await _log_iteration(history_service, "session-0", 0)
+        poisoned = _mcp_interaction("session-1", 1)
+        poisoned.tool_result = {"pods": object()}  # Not JSON serializable
+        assert await history_service.store_mcp_interaction_async(poisoned)
+        assert await history_service.record_session_interaction_async("session-1")
+        await _log_iteration(history_service, "session-2", 2)
+
+        await history_service.flush_write_buffer()
+
+        buffer = history_service._write_buffer
+        assert buffer.interactions_dropped == 1
+        assert buffer.interactions_written == 4
+        assert _stored_counts(history_service, "session-0") == (1, 1)
+        assert _stored_counts(history_service, "session-1") == (0, 0)
+        assert _stored_counts(history_service, "session-2") == (1, 1)
+        assert history_service.get_session("session-1").last_interaction_at is not None
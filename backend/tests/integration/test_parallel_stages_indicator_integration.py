@@ -60,7 +60,7 @@ class TestParallelStagesIndicator:
             parallel_type=parallel_type.value,
             started_at_us=now_us(),
         )
-        test_database_session.add(stage)
+        repository.create_stage_execution(stage)
         test_database_session.commit()
         
         # Retrieve sessions and verify flag
@@ -101,7 +101,7 @@ class TestParallelStagesIndicator:
             parallel_type=ParallelType.MULTI_AGENT.value,
             started_at_us=now_us(),
         )
-        test_database_session.add(parent_stage)
+        repository.create_stage_execution(parent_stage)
         test_database_session.commit()
         test_database_session.refresh(parent_stage)
         
@@ -119,7 +119,7 @@ class TestParallelStagesIndicator:
                 parallel_index=i + 1,
                 started_at_us=now_us(),
             )
-            test_database_session.add(child_stage)
+            repository.create_stage_execution(child_stage)
         
         test_database_session.commit()
         
@@ -161,7 +161,7 @@ class TestParallelStagesIndicator:
                 parallel_type=ParallelType.SINGLE.value,
                 started_at_us=now_us(),
             )
-            test_database_session.add(stage)
+            repository.create_stage_execution(stage)
         
         test_database_session.commit()
         
@@ -200,7 +200,7 @@ class TestParallelStagesIndicator:
             parallel_type=ParallelType.REPLICA.value,
             started_at_us=now_us(),
         )
-        test_database_session.add(stage1)
+        repository.create_stage_execution(stage1)
         
         # Create session 2: without parallel stages
         session2 = AlertSession(
@@ -224,7 +224,7 @@ class TestParallelStagesIndicator:
             parallel_type=ParallelType.SINGLE.value,
             started_at_us=now_us(),
         )
-        test_database_session.add(stage2)
+        repository.create_stage_execution(stage2)
         
         # Create session 3: with no stages at all
         session3 = AlertSession(
@@ -289,7 +289,7 @@ class TestParallelStagesIndicator:
                 ),
                 started_at_us=now_us(),
             )
-            test_database_session.add(stage)
+            repository.create_stage_execution(stage)
         
         test_database_session.commit()
         
@@ -341,7 +341,7 @@ class TestParallelStagesIndicator:
             parallel_type=ParallelType.SINGLE.value,
             started_at_us=now_us(),
         )
-        test_database_session.add(stage)
+        repository.create_stage_execution(stage)
         test_database_session.commit()
         
         # Retrieve sessions - should work even if parallel query fails
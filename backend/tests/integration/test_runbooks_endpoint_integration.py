@@ -140,6 +140,8 @@ class TestRunbooksEndpointIntegration:
             mock_settings.github_token = "test_token"
             mock_settings.slack_bot_token = None
             mock_settings.slack_channel = None
+            mock_settings.mcp_session_pool_enabled = False
+            mock_settings.mcp_tool_catalog_ttl_seconds = 0
             mock_settings.runbooks_repo_url = "https://github.com/org/repo/tree/master/docs"
             mock_get_settings.return_value = mock_settings
 
@@ -196,6 +198,8 @@ class TestRunbooksEndpointWithRealService:
                     mock_settings.github_token = "test_token"
                     mock_settings.slack_bot_token = None
                     mock_settings.slack_channel = None
+                    mock_settings.mcp_session_pool_enabled = False
+                    mock_settings.mcp_tool_catalog_ttl_seconds = 0
                     mock_settings.runbooks_repo_url = (
                         "https://github.com/test-org/test-repo/tree/master/runbooks"
                     )
@@ -755,6 +755,45 @@ class TestBaseAgentMCPIntegration:
         assert "test-server" in results
         assert "Tool execution failed" in results["test-server"][0]["error"]
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_execute_mcp_tools_concurrently_within_server_limit(
+        self, base_agent, mock_mcp_client, mock_mcp_registry
+    ):
+        """Test that tool calls run concurrently up to the server's limit, keep their order and fail independently."""
+        import asyncio
+
+        base_agent._configured_servers = ["test-server"]
+        mock_mcp_registry.get_server_config_safe.return_value = Mock(max_concurrent_tool_calls=2)
+        running = 0
+        max_running = 0
+
+        async def slow_call_tool(_server_name, _tool_name, parameters, *_args):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if parameters["pod"] == "pod-2":
+                raise Exception("pod not found")
+            return {"result": parameters["pod"]}
+
+        mock_mcp_client.call_tool.side_effect = slow_call_tool
+        tools_to_call = [
+            {"server": "test-server", "tool": "kubectl-get", "parameters": {"pod": f"pod-{i}"}}
+            for i in range(5)
+        ]
+
+        results = await base_agent.execute_mcp_tools(tools_to_call, "test-session-123")
+
+        assert max_running == 2
+        entries = results["test-server"]
+        assert [entry["parameters"]["pod"] for entry in entries] == [f"pod-{i}" for i in range(5)]
+        assert "pod not found" in entries[2]["error"]
+        assert [entries[i]["result"] for i in (0, 1, 3, 4)] == [
+            {"result": "pod-0"}, {"result": "pod-1"}, {"result": "pod-3"}, {"result": "pod-4"}
+        ]
+
 
 @pytest.mark.unit
 class TestBaseAgentErrorHandling:
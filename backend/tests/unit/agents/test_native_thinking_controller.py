@@ -254,6 +254,59 @@ class TestNativeThinkingController:
         # Should have executed tools
         sample_context.agent.execute_mcp_tools.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_tool_calls_of_an_iteration_run_concurrently(
+        self, mock_llm_manager_google, mock_prompt_builder, sample_context
+    ):
+        """Test that tool calls run concurrently and observations follow the requested order."""
+        import asyncio
+
+        mock_native_client = mock_llm_manager_google.get_native_thinking_client.return_value
+        conversation = LLMConversation(messages=[
+            {"role": "system", "content": "System"},
+            {"role": "user", "content": "Analyze"},
+        ])
+        pods = ["pod-a", "pod-b", "pod-c"]
+        response_with_tools = NativeThinkingResponse(
+            content="Checking pods.",
+            conversation=conversation,
+            tool_calls=[
+                NativeThinkingToolCall(server="kubernetes-server", tool="resources_get", parameters={"name": pod})
+                for pod in pods
+            ],
+            is_final=False
+        )
+        response_final = NativeThinkingResponse(
+            content="Root cause found.", conversation=conversation, tool_calls=[], is_final=True
+        )
+        mock_native_client.generate = AsyncMock(side_effect=[response_with_tools, response_final])
+        started = []
+        all_started = asyncio.Event()
+
+        async def execute_mcp_tools(tool_requests, *_args):
+            pod = tool_requests[0]["parameters"]["name"]
+            started.append(pod)
+            if len(started) == len(pods):
+                all_started.set()
+            # Every call waits for the others, so this only completes when they run concurrently
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            if pod == "pod-b":
+                raise ValueError("not found")
+            # Finish in reverse order of the requests
+            await asyncio.sleep(0.01 * (len(pods) - pods.index(pod)))
+            return {"kubernetes-server": [{"tool": "resources_get", "result": {"pod": pod}}]}
+
+        sample_context.agent.execute_mcp_tools = AsyncMock(side_effect=execute_mcp_tools)
+
+        controller = NativeThinkingController(mock_llm_manager_google, mock_prompt_builder)
+        await controller.execute_analysis_loop(sample_context)
+
+        observations = [m.content for m in conversation.messages[2:]]
+        assert len(observations) == 3
+        assert "pod-a" in observations[0] and observations[0].startswith("Tool Result:")
+        assert observations[1] == "Tool Error: Error executing kubernetes-server.resources_get: not found"
+        assert "pod-c" in observations[2] and observations[2].startswith("Tool Result:")
+    
     @pytest.mark.asyncio
     @patch('tarsy.agents.iteration_controllers.native_thinking_controller.GeminiNativeThinkingClient')
     async def test_execute_analysis_loop_no_agent_raises(
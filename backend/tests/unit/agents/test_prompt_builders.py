@@ -532,6 +532,24 @@ Stage 2 (Initial): Found resource constraints and recent deployment
         assert "Thought: I need to investigate" in result
         assert "Found 3 pods in CrashLoopBackOff state" in result
     
+    def test_react_prompt_prefix_is_stable_across_alerts(self, builder, full_mock_context):
+        """Instructions and tool catalog come first and are byte-identical for every alert (prompt caching)."""
+        first = builder.build_standard_react_prompt(full_mock_context)
+        full_mock_context.chain_context.processing_alert = ProcessingAlert(
+            alert_type="kubernetes-pod",
+            severity="warning",
+            timestamp=now_us(),
+            environment="staging",
+            alert_data={'title': 'Pod OOMKilled'}
+        )
+        second = builder.build_standard_react_prompt(full_mock_context)
+        
+        prefix = first[:first.index("Question:")]
+        assert "**kubectl.get_logs**" in prefix
+        assert "Pod CrashLoopBackOff" not in prefix
+        assert second.startswith(prefix)
+        assert builder.build_standard_react_prompt(full_mock_context) == second
+    
     def test_stage_analysis_with_comprehensive_context(self, builder, full_mock_context):
         """Test stage analysis prompt with comprehensive context."""
         result = builder.build_stage_analysis_react_prompt(full_mock_context)
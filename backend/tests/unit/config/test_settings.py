@@ -1154,6 +1154,175 @@ class TestAlertQueueValidators:
         assert settings.queue_claim_interval_seconds == 1.0
 
 
+@pytest.mark.unit
+class TestMCPSessionPoolSettings:
+    """Test MCP session pool settings."""
+    
+    def test_mcp_session_pool_defaults(self):
+        """Test the pool is enabled by default with bounded limits."""
+        settings = Settings()
+        
+        assert settings.mcp_session_pool_enabled is True
+        assert settings.mcp_session_pool_max_per_server == 4
+        assert settings.mcp_session_pool_idle_timeout_seconds == 300
+    
+    @pytest.mark.parametrize("field", [
+        "mcp_session_pool_max_per_server",
+        "mcp_session_pool_idle_timeout_seconds",
+    ])
+    def test_mcp_session_pool_limits_reject_non_positive(self, field: str):
+        """Test pool limits reject zero and negative values."""
+        with pytest.raises(ValueError, match=f"{field} must be an integer >= 1"):
+            Settings(**{field: 0})
+
+    def test_mcp_tool_catalog_ttl(self):
+        """Test the tool catalog TTL defaults to 5 minutes, allows 0 and rejects negatives."""
+        assert Settings().mcp_tool_catalog_ttl_seconds == 300
+        assert Settings(mcp_tool_catalog_ttl_seconds=0).mcp_tool_catalog_ttl_seconds == 0
+        with pytest.raises(ValueError, match="mcp_tool_catalog_ttl_seconds must be a non-negative integer"):
+            Settings(mcp_tool_catalog_ttl_seconds=-1)
+
+
+@pytest.mark.unit
+class TestEventPublishSettings:
+    """Test batched event publishing settings."""
+    
+    def test_event_publish_defaults(self):
+        """Test batching is enabled with a 20ms flush latency by default."""
+        settings = Settings()
+        
+        assert settings.event_publish_batching_enabled is True
+        assert settings.event_publish_max_latency_ms == 20
+        assert settings.event_publish_max_batch_size == 200
+        assert settings.event_publish_max_pending == 10000
+    
+    def test_event_publish_validation(self):
+        """Test batch limits must be positive and latency non-negative."""
+        assert Settings(event_publish_max_latency_ms=0).event_publish_max_latency_ms == 0
+        with pytest.raises(ValueError, match="event_publish_max_latency_ms must be an integer >= 0"):
+            Settings(event_publish_max_latency_ms=-1)
+        with pytest.raises(ValueError, match="event_publish_max_batch_size must be an integer >= 1"):
+            Settings(event_publish_max_batch_size=0)
+        with pytest.raises(ValueError, match="event_publish_max_pending must be an integer >= 1"):
+            Settings(event_publish_max_pending=0)
+
+
+@pytest.mark.unit
+class TestLLMStreamingSettings:
+    """Test LLM streaming transport settings."""
+    
+    def test_llm_streaming_coalesce_default_and_validation(self):
+        """Test snapshots are coalesced for 50ms by default and the window is non-negative."""
+        assert Settings().llm_streaming_coalesce_ms == 50
+        assert Settings(llm_streaming_coalesce_ms=0).llm_streaming_coalesce_ms == 0
+        with pytest.raises(ValueError, match="llm_streaming_coalesce_ms must be an integer >= 0"):
+            Settings(llm_streaming_coalesce_ms=-1)
+
+
+@pytest.mark.unit
+class TestHistoryAsyncDbSettings:
+    """Test history async database engine settings."""
+    
+    def test_history_async_db_default_and_validation(self):
+        """Test the async engine is used for PostgreSQL only by default and modes are validated."""
+        assert Settings().history_async_db == "auto"
+        assert Settings(history_async_db="never").history_async_db == "never"
+        with pytest.raises(ValueError, match="history_async_db must be one of"):
+            Settings(history_async_db="sometimes")
+
+
+
+@pytest.mark.unit
+class TestHistoryWriteBufferSettings:
+    """Test history write buffer settings."""
+    
+    def test_history_write_defaults(self):
+        """Test interaction history is buffered with stage durability by default."""
+        settings = Settings()
+        
+        assert settings.history_write_durability == "stage"
+        assert settings.history_write_max_latency_ms == 250
+        assert settings.history_write_max_batch_size == 500
+        assert settings.history_write_max_pending == 10000
+    
+    def test_history_write_validation(self):
+        """Test unknown durability modes and invalid limits are rejected."""
+        assert Settings(history_write_durability="immediate").history_write_durability == "immediate"
+        with pytest.raises(ValueError, match="history_write_durability must be one of"):
+            Settings(history_write_durability="eventual")
+        with pytest.raises(ValueError, match="history_write_max_batch_size must be an integer >= 1"):
+            Settings(history_write_max_batch_size=0)
+        with pytest.raises(ValueError, match="history_write_max_latency_ms must be an integer >= 0"):
+            Settings(history_write_max_latency_ms=-1)
+
+    def test_history_retention_batch_validation(self):
+        """Test retention batches must delete at least one session and pauses cannot be negative."""
+        assert Settings(history_retention_batch_pause_ms=0).history_retention_batch_pause_ms == 0
+        with pytest.raises(ValueError, match="history_retention_batch_size must be an integer >= 1"):
+            Settings(history_retention_batch_size=0)
+        with pytest.raises(ValueError, match="history_retention_batch_size must be an integer >= 1"):
+            Settings(history_retention_batch_size=-1)
+        with pytest.raises(ValueError, match="history_retention_batch_pause_ms must be an integer >= 0"):
+            Settings(history_retention_batch_pause_ms=-1)
+
+    def test_history_session_count_cache_seconds(self):
+        """Test approximate session counts are cached for 30 seconds by default and 0 disables the cache."""
+        assert Settings().history_session_count_cache_seconds == 30
+        assert Settings(history_session_count_cache_seconds=0).history_session_count_cache_seconds == 0
+        with pytest.raises(ValueError, match="history_session_count_cache_seconds must be an integer >= 0"):
+            Settings(history_session_count_cache_seconds=-5)
+
+
+@pytest.mark.unit
+class TestWebSocketDeliverySettings:
+    """Test WebSocket send queue settings."""
+    
+    def test_websocket_delivery_defaults(self):
+        """Test queues hold 256 events and drop stream chunks first by default."""
+        settings = Settings()
+        
+        assert settings.websocket_send_queue_size == 256
+        assert settings.websocket_overflow_policy == "drop_transient"
+    
+    @pytest.mark.parametrize("policy", ["drop_transient", "coalesce", "disconnect"])
+    def test_websocket_overflow_policy_accepts_known_policies(self, policy):
+        """Test every overflow policy is accepted."""
+        assert Settings(websocket_overflow_policy=policy).websocket_overflow_policy == policy
+    
+    def test_websocket_delivery_validation(self):
+        """Test unknown policies and empty queues are rejected."""
+        with pytest.raises(ValueError, match="websocket_overflow_policy must be one of"):
+            Settings(websocket_overflow_policy="block")
+        with pytest.raises(ValueError, match="websocket_send_queue_size must be an integer >= 1"):
+            Settings(websocket_send_queue_size=0)
+
+
+@pytest.mark.unit
+class TestAlertDedupSettings:
+    """Test alert deduplication settings."""
+    
+    def test_alert_dedup_defaults(self):
+        """Test deduplication is disabled by default."""
+        settings = Settings()
+        
+        assert settings.alert_dedup_enabled is False
+        assert settings.alert_dedup_window_minutes == 30
+        assert settings.alert_dedup_key_fields == ["fingerprint", "labels"]
+    
+    def test_alert_dedup_key_fields_parsing(self):
+        """Test key fields are parsed from a comma-separated string."""
+        settings = Settings(alert_dedup_key_fields=" labels.pod, labels.namespace ,,")
+        
+        assert settings.alert_dedup_key_fields == ["labels.pod", "labels.namespace"]
+    
+    def test_alert_dedup_window_minutes_rejects_negative(self):
+        """Test alert_dedup_window_minutes rejects negative values."""
+        assert Settings(alert_dedup_window_minutes=0).alert_dedup_window_minutes == 0
+        
+        with pytest.raises(ValueError, match="alert_dedup_window_minutes must be an integer >= 0"):
+            Settings(alert_dedup_window_minutes=-1)
+
+
 @pytest.mark.unit
 class TestGetSettings:
     """Test settings singleton function."""
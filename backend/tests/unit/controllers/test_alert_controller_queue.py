@@ -50,6 +50,7 @@ def mock_settings_with_queue_limit():
         settings = MagicMock()
         settings.max_queue_size = 10
         settings.alert_data_masking_enabled = False
+        settings.alert_dedup_enabled = False
         mock.return_value = settings
         yield settings
 
@@ -61,15 +62,15 @@ def mock_settings_no_queue_limit():
         settings = MagicMock()
         settings.max_queue_size = None
         settings.alert_data_masking_enabled = False
+        settings.alert_dedup_enabled = False
         mock.return_value = settings
         yield settings
 
 
+@pytest.mark.usefixtures("mock_alert_service", "mock_settings_with_queue_limit")
 def test_submit_alert_queue_not_full(
     test_client,
-    mock_alert_service,
-    mock_history_service,
-    mock_settings_with_queue_limit
+    mock_history_service
 ):
     """Test submitting alert when queue has space."""
     # Queue has space (5 < 10)
@@ -88,11 +89,10 @@ def test_submit_alert_queue_not_full(
     assert data["status"] == "queued"
 
 
+@pytest.mark.usefixtures("mock_alert_service", "mock_settings_with_queue_limit")
 def test_submit_alert_queue_full(
     test_client,
-    mock_alert_service,
-    mock_history_service,
-    mock_settings_with_queue_limit
+    mock_history_service
 ):
     """Test submitting alert when queue is full."""
     # Queue is full (10 >= 10)
@@ -113,11 +113,10 @@ def test_submit_alert_queue_full(
     assert data["detail"]["max_queue_size"] == 10
 
 
+@pytest.mark.usefixtures("mock_alert_service", "mock_settings_no_queue_limit")
 def test_submit_alert_no_queue_limit(
     test_client,
-    mock_alert_service,
-    mock_history_service,
-    mock_settings_no_queue_limit
+    mock_history_service
 ):
     """Test submitting alert when queue has no size limit."""
     # Even with many pending, should succeed
@@ -135,11 +134,10 @@ def test_submit_alert_no_queue_limit(
     assert "session_id" in data
 
 
+@pytest.mark.usefixtures("mock_alert_service", "mock_settings_no_queue_limit")
 def test_submit_alert_queue_check_not_called_when_no_limit(
     test_client,
-    mock_alert_service,
-    mock_history_service,
-    mock_settings_no_queue_limit
+    mock_history_service
 ):
     """Test queue check is skipped when no limit configured."""
     response = test_client.post(
@@ -154,11 +152,10 @@ def test_submit_alert_queue_check_not_called_when_no_limit(
     mock_history_service.count_pending_sessions.assert_not_called()
 
 
+@pytest.mark.usefixtures("mock_alert_service", "mock_settings_with_queue_limit")
 def test_submit_alert_queue_limit_boundary(
     test_client,
-    mock_alert_service,
-    mock_history_service,
-    mock_settings_with_queue_limit
+    mock_history_service
 ):
     """Test queue limit at exact boundary."""
     # Queue at limit - 1 (9 < 10) - should succeed
@@ -184,3 +181,112 @@ def test_submit_alert_queue_limit_boundary(
     )
     
     assert response.status_code == 429
+
+
+@pytest.fixture
+def mock_settings_with_dedup():
+    """Mock settings with alert deduplication enabled."""
+    with patch("tarsy.config.settings.get_settings") as mock:
+        settings = MagicMock()
+        settings.max_queue_size = None
+        settings.alert_data_masking_enabled = False
+        settings.alert_dedup_enabled = True
+        settings.alert_dedup_window_minutes = 30
+        settings.alert_dedup_key_fields = ["fingerprint"]
+        mock.return_value = settings
+        yield settings
+
+
+@pytest.mark.usefixtures("mock_settings_with_dedup")
+def test_submit_alert_duplicate_attached_to_existing_session(
+    test_client,
+    mock_alert_service,
+    mock_history_service
+):
+    """Test a duplicate alert is attached to the existing session instead of queued."""
+    mock_history_service.attach_duplicate_alert.return_value = "existing-session"
+    
+    response = test_client.post(
+        "/api/v1/alerts",
+        json={
+            "data": {"fingerprint": "abc", "message": "test alert"}
+        }
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["session_id"] == "existing-session"
+    assert data["status"] == "duplicate"
+    fingerprint, window_minutes = mock_history_service.attach_duplicate_alert.call_args.args
+    assert fingerprint
+    assert window_minutes == 30
+    mock_alert_service.session_manager.create_chain_history_session.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_settings_with_dedup")
+def test_submit_alert_not_duplicate_is_queued_with_fingerprint(
+    test_client,
+    mock_alert_service,
+    mock_history_service
+):
+    """Test an alert without a matching session is queued carrying its fingerprint."""
+    mock_history_service.attach_duplicate_alert.return_value = None
+    mock_history_service.create_session_unless_duplicate.side_effect = (
+        lambda alert_context, _chain_definition, _window_minutes: alert_context.session_id
+    )
+    
+    response = test_client.post(
+        "/api/v1/alerts",
+        json={
+            "data": {"fingerprint": "abc", "message": "test alert"}
+        }
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "queued"
+    alert_context, _, window_minutes = mock_history_service.create_session_unless_duplicate.call_args.args
+    assert response.json()["session_id"] == alert_context.session_id
+    assert window_minutes == 30
+    assert alert_context.processing_alert.fingerprint == \
+        mock_history_service.attach_duplicate_alert.call_args.args[0]
+    mock_alert_service.session_manager.create_chain_history_session.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_alert_service", "mock_settings_with_dedup")
+def test_submit_alert_concurrent_duplicate_attached_at_creation(
+    test_client,
+    mock_history_service
+):
+    """Test a re-fire that raced past the first check is attached when its session is created."""
+    mock_history_service.attach_duplicate_alert.return_value = None
+    mock_history_service.create_session_unless_duplicate.return_value = "concurrent-session"
+    
+    response = test_client.post(
+        "/api/v1/alerts",
+        json={
+            "data": {"fingerprint": "abc", "message": "test alert"}
+        }
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["session_id"] == "concurrent-session"
+    assert data["status"] == "duplicate"
+
+
+@pytest.mark.usefixtures("mock_alert_service", "mock_settings_with_dedup")
+def test_submit_alert_without_key_fields_skips_dedup(
+    test_client,
+    mock_history_service
+):
+    """Test alerts carrying none of the key fields are never deduplicated."""
+    response = test_client.post(
+        "/api/v1/alerts",
+        json={
+            "data": {"message": "test alert"}
+        }
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "queued"
+    mock_history_service.attach_duplicate_alert.assert_not_called()
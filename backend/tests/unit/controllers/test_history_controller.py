@@ -162,6 +162,50 @@ class TestHistoryControllerEndpoints:
         assert call_args.kwargs["page"] == 2
         assert call_args.kwargs["page_size"] == 10
 
+    @pytest.mark.unit
+    def test_get_sessions_list_with_cursor(self, app, client, mock_history_service):
+        """Test that the cursor is decoded and passed with the count mode."""
+        from tarsy.models.history_models import (
+            PaginatedSessions,
+            PaginationInfo,
+            SessionCursor,
+        )
+        mock_history_service.get_sessions_list.return_value = PaginatedSessions(
+            sessions=[],
+            pagination=PaginationInfo(page=1, page_size=20, total_pages=0, total_items=0),
+            filters_applied={}
+        )
+        cursor = SessionCursor(sort_by="started_at_us", sort_order="desc", value=1_000_000, session_id="session-1")
+        app.dependency_overrides[get_history_service] = lambda: mock_history_service
+
+        response = client.get(
+            "/api/v1/history/sessions",
+            params={"cursor": cursor.encode(), "count": "approximate"}
+        )
+
+        app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        call_args = mock_history_service.get_sessions_list.call_args
+        assert call_args.kwargs["cursor"] == cursor
+        assert call_args.kwargs["count_mode"] == "approximate"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("params", [
+        {"cursor": "not-a-cursor"},
+        {"count": "sometimes"},
+    ])
+    def test_get_sessions_list_rejects_invalid_pagination(self, app, client, mock_history_service, params):
+        """Test that malformed cursors and unknown count modes are rejected."""
+        app.dependency_overrides[get_history_service] = lambda: mock_history_service
+
+        response = client.get("/api/v1/history/sessions", params=params)
+
+        app.dependency_overrides.clear()
+
+        assert response.status_code in (400, 422)
+        mock_history_service.get_sessions_list.assert_not_called()
+
     @pytest.mark.unit
     def test_get_sessions_list_with_single_status_filter(self, app, client, mock_history_service):
         """Test that single status filtering still works (backward compatibility)."""
@@ -1133,6 +1177,130 @@ class TestHistoryControllerEndpoints:
         assert response.status_code == 500
         assert "detail" in response.json()
     
+    @pytest.mark.unit
+    def test_get_session_timeline_revalidates_with_etag(self, app, client, mock_history_service):
+        """Test that the timeline carries an ETag and answers 304 while unchanged."""
+        from tarsy.models.history_models import (
+            LLMInteractionSummary,
+            SessionTimeline,
+            TimelineStage,
+        )
+        
+        timeline = SessionTimeline(
+            session_id="test-session",
+            agent_type="kubernetes",
+            status="in_progress",
+            started_at_us=1_000_000,
+            chain_id="chain-1",
+            stages=[TimelineStage(
+                execution_id="exec-1",
+                session_id="test-session",
+                stage_id="analysis",
+                stage_index=0,
+                stage_name="Analysis",
+                agent="KubernetesAgent",
+                status="active",
+                interactions=[LLMInteractionSummary(
+                    interaction_id="llm-1",
+                    timestamp_us=1_000_001,
+                    step_description="LLM analysis using gpt-4",
+                    model_name="gpt-4",
+                    response_preview="Investigating",
+                )],
+            )],
+        )
+        mock_history_service.get_session_timeline.return_value = timeline
+        app.dependency_overrides[get_history_service] = lambda: mock_history_service
+        
+        response = client.get("/api/v1/history/sessions/test-session/timeline")
+        etag = response.headers["etag"]
+        revalidated = client.get(
+            "/api/v1/history/sessions/test-session/timeline", headers={"If-None-Match": etag}
+        )
+        timeline.stages[0].status = "completed"
+        changed = client.get(
+            "/api/v1/history/sessions/test-session/timeline", headers={"If-None-Match": etag}
+        )
+        
+        app.dependency_overrides.clear()
+        
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+        data = response.json()
+        assert data["stages"][0]["interactions"][0]["type"] == "llm"
+        assert data["stages"][0]["interactions"][0]["response_preview"] == "Investigating"
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+    
+    @pytest.mark.unit
+    def test_get_session_timeline_not_found(self, app, client, mock_history_service):
+        """Test session timeline for non-existent session."""
+        mock_history_service.get_session_timeline.return_value = None
+        app.dependency_overrides[get_history_service] = lambda: mock_history_service
+        
+        response = client.get("/api/v1/history/sessions/non-existent-session/timeline")
+        
+        app.dependency_overrides.clear()
+        
+        assert response.status_code == 404
+        assert "non-existent-session" in response.json()["detail"]
+    
+    @pytest.mark.unit
+    def test_get_interaction_payloads(self, app, client, mock_history_service):
+        """Test per-interaction payload endpoints, revalidated by a hash of the payload."""
+        from tarsy.models.history_models import LLMTimelineEvent
+        from tarsy.models.unified_interactions import (
+            LLMConversation,
+            LLMInteraction,
+            LLMMessage,
+            MessageRole,
+        )
+        
+        mock_history_service.get_llm_interaction_event.return_value = LLMTimelineEvent(
+            id="llm-1",
+            event_id="llm-1",
+            timestamp_us=1_000_001,
+            step_description="LLM analysis using gpt-4",
+            stage_execution_id="exec-1",
+            details=LLMInteraction(
+                interaction_id="llm-1",
+                session_id="test-session",
+                model_name="gpt-4",
+                conversation=LLMConversation(messages=[
+                    LLMMessage(role=MessageRole.SYSTEM, content="You are a helpful assistant."),
+                    LLMMessage(role=MessageRole.USER, content="Investigate"),
+                ]),
+            ),
+        )
+        mock_history_service.get_mcp_interaction_event.return_value = None
+        app.dependency_overrides[get_history_service] = lambda: mock_history_service
+        
+        response = client.get("/api/v1/history/sessions/test-session/llm-interactions/llm-1")
+        cached = client.get(
+            "/api/v1/history/sessions/test-session/llm-interactions/llm-1",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        mock_history_service.get_llm_interaction_event.return_value = None
+        other_session = client.get(
+            "/api/v1/history/sessions/other-session/llm-interactions/llm-1",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        missing = client.get("/api/v1/history/sessions/test-session/mcp-interactions/mcp-9")
+        
+        app.dependency_overrides.clear()
+        
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert "immutable" in response.headers["cache-control"]
+        assert response.json()["details"]["conversation"]["messages"][1]["content"] == "Investigate"
+        assert cached.status_code == 304
+        assert other_session.status_code == 404
+        mock_history_service.get_llm_interaction_event.assert_called_with("other-session", "llm-1")
+        assert missing.status_code == 404
+        assert "mcp-9" in missing.json()["detail"]
+    
     # Final Analysis Endpoint Tests    
     @pytest.mark.unit
     def test_get_final_analysis(self, app, client, mock_history_service):
@@ -1778,7 +1946,9 @@ class TestHistoryControllerResponseFormat:
             # Parallel stages indicator
             "has_parallel_stages",
             # Slack message fingerprint for notification threading
-            "slack_message_fingerprint"
+            "slack_message_fingerprint",
+            # Highlighted excerpt of search results
+            "search_snippet"
         }
         actual_fields = set(session.keys())
         assert required_fields.issubset(actual_fields)
@@ -1787,7 +1957,7 @@ class TestHistoryControllerResponseFormat:
         # Validate pagination structure
         pagination = data["pagination"]
         required_pagination_fields = {
-            "page", "page_size", "total_pages", "total_items"
+            "page", "page_size", "total_pages", "total_items", "total_is_estimate", "next_cursor"
         }
         assert set(pagination.keys()) == required_pagination_fields
         assert isinstance(pagination["page"], int)
@@ -711,3 +711,108 @@ async def test_get_default_tools_handles_server_config_error(client: TestClient)
     # Only good server should be included
     assert len(data["mcp_servers"]) == 1
     assert data["mcp_servers"][0]["server_id"] == "good-server"
+
+
+@pytest.mark.unit
+def test_get_websocket_connections_sorted_by_lag(client: TestClient) -> None:
+    """Test that WebSocket connection stats are returned most lagging first."""
+    from unittest.mock import patch
+
+    def stats(connection_id: str, oldest_pending_ms: float) -> dict:
+        return {
+            "connection_id": connection_id,
+            "channels": ["sessions"],
+            "queue_depth": 3,
+            "sent": 10,
+            "dropped": 0,
+            "coalesced": 0,
+            "oldest_pending_ms": oldest_pending_ms,
+            "last_lag_ms": 1.0,
+            "max_lag_ms": 5.0,
+            "evicted": False,
+        }
+
+    with patch(
+        "tarsy.controllers.websocket_controller.connection_manager.get_connection_stats",
+        return_value={"fast": stats("fast", 2.0), "slow": stats("slow", 900.0)},
+    ):
+        response = client.get("/api/v1/system/websocket-connections")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [c["connection_id"] for c in data] == ["slow", "fast"]
+    assert data[0]["channels"] == ["sessions"]
+
+
+@pytest.mark.unit
+def test_get_payload_compression(client: TestClient) -> None:
+    """Test that payload compression stats are reported per kind with their ratio."""
+    from tarsy.utils.payload_compression import (
+        compress_payload,
+        reset_compression_stats,
+    )
+
+    reset_compression_stats()
+    compress_payload("pod Running\n" * 1000, "tool_result")
+    compress_payload("short", "llm_message")
+
+    response = client.get("/api/v1/system/payload-compression")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["kind"] for s in data] == ["llm_message", "tool_result"]
+    assert data[0]["compressed_payloads"] == 0
+    assert data[0]["compression_ratio"] == 1.0
+    assert data[1]["compressed_payloads"] == 1
+    assert data[1]["raw_bytes"] == 12000
+    assert data[1]["compression_ratio"] > 10
+    reset_compression_stats()
+
+
+@pytest.mark.unit
+def test_get_llm_connection_pools(client: TestClient) -> None:
+    """Test that connection reuse is reported per provider pool."""
+    from unittest.mock import patch
+
+    from tarsy.integrations.llm.client_pool import ProviderClientPool
+
+    pool = ProviderClientPool(max_connections=50, max_keepalive_connections=10, keepalive_expiry=60.0)
+    pool.get_async_client("openai")
+    pool.get_async_client("google", verify=False)
+    pool._counters[("openai", True)].requests = 8
+    pool._counters[("openai", True)].new_connections = 2
+
+    with patch("tarsy.controllers.system_controller.get_provider_client_pool", return_value=pool):
+        response = client.get("/api/v1/system/llm-connection-pools")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["pool"] for p in data] == ["google (ssl verification disabled)", "openai"]
+    assert data[1]["max_connections"] == 50
+    assert data[1]["reused_connections"] == 6
+    assert data[1]["reuse_rate"] == 0.75
+
+
+@pytest.mark.unit
+def test_get_llm_rate_limits(client: TestClient) -> None:
+    """Test that limits, queue and wait times are reported per provider."""
+    from unittest.mock import patch
+
+    from tarsy.integrations.llm.rate_limiter import ProviderRateLimiters
+
+    limiters = ProviderRateLimiters()
+    limiters.get("openai-default", requests_per_minute=500, tokens_per_minute=200_000)
+    limiters.get("gemini-default").record_rate_limit(30)
+
+    with patch("tarsy.controllers.system_controller.get_provider_rate_limiters", return_value=limiters):
+        response = client.get("/api/v1/system/llm-rate-limits")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["provider"] for p in data] == ["gemini-default", "openai-default"]
+    assert data[0]["requests_per_minute"] is None
+    assert data[0]["rate_limit_errors"] == 1
+    assert data[0]["paused_seconds"] > 0
+    assert data[1]["requests_per_minute"] == 500
+    assert data[1]["tokens_per_minute"] == 200_000
+    assert data[1]["queued_calls"] == 0
@@ -13,6 +13,15 @@ from fastapi import WebSocketDisconnect
 from tarsy.controllers.websocket_controller import websocket_endpoint
 
 
+def _sent_messages(mock_manager: Mock) -> list:
+    """Messages queued on the connection's sender, in order."""
+    return [
+        message
+        for call in mock_manager.send_to_connection.call_args_list
+        for message in call[0][1:]
+    ]
+
+
 @pytest.mark.unit
 class TestWebSocketEndpointConnection:
     """Test WebSocket connection establishment."""
@@ -25,6 +34,8 @@ class TestWebSocketEndpointConnection:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.disconnect = Mock()
 
             with patch("tarsy.controllers.websocket_controller.get_event_system"):
@@ -36,11 +47,11 @@ class TestWebSocketEndpointConnection:
                 # Should connect
                 mock_manager.connect.assert_called_once()
                 
-                # Should send connection confirmation
-                assert mock_websocket.send_json.called
-                call_args = mock_websocket.send_json.call_args[0][0]
+                # Should queue connection confirmation (the writer task sends it)
+                mock_websocket.send_json.assert_not_called()
+                connection_id, call_args = mock_manager.send_to_connection.call_args[0]
                 assert call_args["type"] == "connection.established"
-                assert "connection_id" in call_args
+                assert call_args["connection_id"] == connection_id
 
     @pytest.mark.asyncio
     async def test_connection_cleanup_on_disconnect(self):
@@ -54,6 +65,8 @@ class TestWebSocketEndpointConnection:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.disconnect = Mock()
 
             with patch("tarsy.controllers.websocket_controller.get_event_system", return_value=mock_event_system):
@@ -81,6 +94,8 @@ class TestWebSocketEndpointConnection:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.subscribe = Mock()
             mock_manager.disconnect = Mock()
 
@@ -89,9 +104,9 @@ class TestWebSocketEndpointConnection:
             def get_event_system_side_effect():
                 nonlocal call_count
                 call_count += 1
-                if call_count <= 2:  # First two calls succeed (subscription)
+                if call_count <= 1:  # First call succeeds (subscription)
                     return mock_event_system
-                else:  # Third call fails (cleanup)
+                else:  # Second call fails (cleanup)
                     raise RuntimeError("Event system unavailable")
             
             with patch("tarsy.controllers.websocket_controller.get_event_system", side_effect=get_event_system_side_effect):
@@ -110,7 +125,7 @@ class TestWebSocketEndpointSubscribe:
 
     @pytest.mark.asyncio
     async def test_subscribe_action_registers_with_event_listener(self):
-        """Test that subscribe action registers callback with EventListener."""
+        """Test that subscribe action attaches the channel's fan-out to the EventListener."""
         mock_websocket = AsyncMock()
         
         # First call: connection confirmation, second: subscribe, third: disconnect
@@ -123,6 +138,8 @@ class TestWebSocketEndpointSubscribe:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.subscribe = Mock()
             mock_manager.disconnect = Mock()
 
@@ -135,19 +152,16 @@ class TestWebSocketEndpointSubscribe:
                 # Should subscribe to connection manager
                 mock_manager.subscribe.assert_called_once()
                 
-                # Should register with EventListener
-                mock_event_listener.subscribe.assert_called_once()
-                subscribe_args = mock_event_listener.subscribe.call_args
-                assert subscribe_args[0][0] == "sessions"  # channel
-                assert callable(subscribe_args[0][1])  # callback
+                # Should attach the channel fan-out to the EventListener
+                mock_manager.attach_channel.assert_awaited_once_with("sessions", mock_event_listener)
 
                 # Should send confirmation
                 confirmation_calls = [
-                    call for call in mock_websocket.send_json.call_args_list
-                    if call[0][0].get("type") == "subscription.confirmed"
+                    message for message in _sent_messages(mock_manager)
+                    if message.get("type") == "subscription.confirmed"
                 ]
                 assert len(confirmation_calls) == 1
-                assert confirmation_calls[0][0][0]["channel"] == "sessions"
+                assert confirmation_calls[0]["channel"] == "sessions"
 
     @pytest.mark.asyncio
     async def test_subscribe_to_session_specific_channel(self):
@@ -163,6 +177,8 @@ class TestWebSocketEndpointSubscribe:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.subscribe = Mock()
             mock_manager.disconnect = Mock()
 
@@ -173,8 +189,7 @@ class TestWebSocketEndpointSubscribe:
                     pass
 
                 # Should subscribe to session-specific channel
-                subscribe_args = mock_event_listener.subscribe.call_args
-                assert subscribe_args[0][0] == "session:test-123"
+                mock_manager.attach_channel.assert_awaited_once_with("session:test-123", mock_event_listener)
 
     @pytest.mark.asyncio
     async def test_subscribe_duplicate_channel_skipped(self):
@@ -195,6 +210,8 @@ class TestWebSocketEndpointSubscribe:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.subscribe = Mock()
             mock_manager.disconnect = Mock()
 
@@ -204,8 +221,8 @@ class TestWebSocketEndpointSubscribe:
                 except WebSocketDisconnect:
                     pass
 
-                # Should only subscribe once to EventListener
-                assert mock_event_listener.subscribe.call_count == 1
+                # Should only attach the channel once
+                assert mock_manager.attach_channel.await_count == 1
 
 
 @pytest.mark.unit
@@ -214,7 +231,7 @@ class TestWebSocketEndpointUnsubscribe:
 
     @pytest.mark.asyncio
     async def test_unsubscribe_action_removes_from_event_listener(self):
-        """Test that unsubscribe removes callback from EventListener."""
+        """Test that unsubscribe detaches the channel from EventListener."""
         mock_websocket = AsyncMock()
         
         subscribe_msg = json.dumps({"action": "subscribe", "channel": "sessions"})
@@ -227,6 +244,8 @@ class TestWebSocketEndpointUnsubscribe:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.subscribe = Mock()
             mock_manager.unsubscribe = Mock()
             mock_manager.disconnect = Mock()
@@ -240,13 +259,13 @@ class TestWebSocketEndpointUnsubscribe:
                 # Should unsubscribe from connection manager
                 mock_manager.unsubscribe.assert_called_once()
                 
-                # Should remove from EventListener
-                mock_event_listener.unsubscribe.assert_called_once()
+                # Should detach the channel (cleanup has no channels left)
+                mock_manager.detach_channel.assert_awaited_once_with("sessions", mock_event_listener)
 
                 # Should send cancellation confirmation
                 cancellation_calls = [
-                    call for call in mock_websocket.send_json.call_args_list
-                    if call[0][0].get("type") == "subscription.cancelled"
+                    message for message in _sent_messages(mock_manager)
+                    if message.get("type") == "subscription.cancelled"
                 ]
                 assert len(cancellation_calls) == 1
 
@@ -281,6 +300,8 @@ class TestWebSocketEndpointCatchup:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.disconnect = Mock()
 
             with patch("tarsy.controllers.websocket_controller.get_event_system"):
@@ -298,16 +319,17 @@ class TestWebSocketEndpointCatchup:
                             limit=100
                         )
 
-                        # Should send both events with id injected
+                        # Should queue both events with id injected, in one call
+                        assert mock_manager.send_to_connection.call_count == 2
                         event_sends = [
-                            call for call in mock_websocket.send_json.call_args_list
-                            if call[0][0].get("type") in ["session.started", "session.completed"]
+                            message for message in _sent_messages(mock_manager)
+                            if message.get("type") in ["session.started", "session.completed"]
                         ]
                         assert len(event_sends) == 2
                         
                         # Verify id is injected into payloads (for dashboard compatibility)
-                        assert event_sends[0][0][0]["id"] == 43
-                        assert event_sends[1][0][0]["id"] == 44
+                        assert event_sends[0]["id"] == 43
+                        assert event_sends[1]["id"] == 44
 
     @pytest.mark.asyncio
     async def test_catchup_with_default_last_event_id(self):
@@ -327,6 +349,8 @@ class TestWebSocketEndpointCatchup:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.disconnect = Mock()
 
             with patch("tarsy.controllers.websocket_controller.get_event_system"):
@@ -357,6 +381,8 @@ class TestWebSocketEndpointPing:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.disconnect = Mock()
 
             with patch("tarsy.controllers.websocket_controller.get_event_system"):
@@ -367,8 +393,8 @@ class TestWebSocketEndpointPing:
 
                 # Should respond with pong
                 pong_calls = [
-                    call for call in mock_websocket.send_json.call_args_list
-                    if call[0][0].get("type") == "pong"
+                    message for message in _sent_messages(mock_manager)
+                    if message.get("type") == "pong"
                 ]
                 assert len(pong_calls) == 1
 
@@ -390,6 +416,8 @@ class TestWebSocketEndpointErrorHandling:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.disconnect = Mock()
 
             with patch("tarsy.controllers.websocket_controller.get_event_system"):
@@ -411,6 +439,8 @@ class TestWebSocketEndpointErrorHandling:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.disconnect = Mock()
 
             with patch("tarsy.controllers.websocket_controller.get_event_system"):
@@ -436,6 +466,8 @@ class TestWebSocketEndpointErrorHandling:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.subscribe = Mock()
             mock_manager.disconnect = Mock()
 
@@ -447,7 +479,7 @@ class TestWebSocketEndpointErrorHandling:
 
                 # Should not subscribe without channel
                 mock_manager.subscribe.assert_not_called()
-                mock_event_listener.subscribe.assert_not_called()
+                mock_manager.attach_channel.assert_not_called()
 
 
 @pytest.mark.unit
@@ -455,8 +487,8 @@ class TestWebSocketEndpointEventListenerIntegration:
     """Test integration with EventListener system."""
 
     @pytest.mark.asyncio
-    async def test_callback_registered_with_correct_closure(self):
-        """Test that callback closure captures channel correctly."""
+    async def test_each_channel_attached(self):
+        """Test that every subscribed channel is attached to the EventListener."""
         mock_websocket = AsyncMock()
         
         # Subscribe to two different channels
@@ -468,22 +500,16 @@ class TestWebSocketEndpointEventListenerIntegration:
             WebSocketDisconnect()
         ]
 
-        captured_callbacks = {}
-        
-        async def mock_event_listener_subscribe(channel, callback):
-            captured_callbacks[channel] = callback
-
         mock_event_listener = AsyncMock()
-        mock_event_listener.subscribe.side_effect = mock_event_listener_subscribe
-        
         mock_event_system = Mock()
         mock_event_system.get_listener.return_value = mock_event_listener
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.subscribe = Mock()
             mock_manager.disconnect = Mock()
-            mock_manager.broadcast_to_channel = AsyncMock()
 
             with patch("tarsy.controllers.websocket_controller.get_event_system", return_value=mock_event_system):
                 try:
@@ -491,14 +517,8 @@ class TestWebSocketEndpointEventListenerIntegration:
                 except WebSocketDisconnect:
                     pass
 
-                # Verify callbacks were registered for both channels
-                assert "channel1" in captured_callbacks
-                assert "channel2" in captured_callbacks
-                
-                # Test that each callback broadcasts to correct channel
-                test_event = {"type": "test"}
-                await captured_callbacks["channel1"](test_event)
-                mock_manager.broadcast_to_channel.assert_called_with("channel1", test_event)
+                attached = [call.args[0] for call in mock_manager.attach_channel.await_args_list]
+                assert attached == ["channel1", "channel2"]
 
     @pytest.mark.asyncio
     async def test_cleanup_unsubscribes_all_channels(self):
@@ -522,6 +542,8 @@ class TestWebSocketEndpointEventListenerIntegration:
 
         with patch("tarsy.controllers.websocket_controller.connection_manager") as mock_manager:
             mock_manager.connect = AsyncMock()
+            mock_manager.attach_channel = AsyncMock()
+            mock_manager.detach_channel = AsyncMock()
             mock_manager.subscribe = Mock()
             mock_manager.disconnect = Mock()
 
@@ -531,6 +553,6 @@ class TestWebSocketEndpointEventListenerIntegration:
                 except WebSocketDisconnect:
                     pass
 
-                # Should unsubscribe from all 3 channels during cleanup
-                assert mock_event_listener.unsubscribe.call_count == 3
+                # Should detach all 3 channels during cleanup
+                assert mock_manager.detach_channel.await_count == 3
 
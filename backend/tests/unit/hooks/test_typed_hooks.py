@@ -56,7 +56,7 @@ class TestLLMHistoryHook:
     def mock_history_service(self):
         """Mock history service."""
         service = Mock(spec=HistoryService)
-        service.store_llm_interaction = Mock(return_value=True)
+        service.store_llm_interaction_async = AsyncMock(return_value=True)
         return service
     
     @pytest.fixture
@@ -90,12 +90,12 @@ class TestLLMHistoryHook:
         """Test successful execution logs interaction."""
         await llm_hook.execute(sample_llm_interaction)
         
-        mock_history_service.store_llm_interaction.assert_called_once_with(sample_llm_interaction)
+        mock_history_service.store_llm_interaction_async.assert_called_once_with(sample_llm_interaction)
     
     @pytest.mark.asyncio
     async def test_execute_handles_service_error(self, llm_hook, mock_history_service, sample_llm_interaction):
         """Test execution handles history service errors gracefully."""
-        mock_history_service.store_llm_interaction.side_effect = Exception("Database error")
+        mock_history_service.store_llm_interaction_async.side_effect = Exception("Database error")
         
         # Should raise the exception (hook doesn't catch it)
         with pytest.raises(Exception, match="Database error"):
@@ -104,13 +104,13 @@ class TestLLMHistoryHook:
     @pytest.mark.asyncio
     async def test_execute_handles_history_service_returns_false(self, llm_hook, mock_history_service, sample_llm_interaction):
         """Test execution handles when history service returns False (warning path)."""
-        mock_history_service.store_llm_interaction.return_value = False
+        mock_history_service.store_llm_interaction_async.return_value = False
         
         # Should log warning but not raise
         await llm_hook.execute(sample_llm_interaction)
         
         # Verify history service was called
-        mock_history_service.store_llm_interaction.assert_called_once()
+        mock_history_service.store_llm_interaction_async.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_execute_applies_truncation(self, llm_hook, mock_history_service, sample_llm_interaction):
@@ -126,7 +126,7 @@ class TestLLMHistoryHook:
             mock_truncate.assert_called_once_with(sample_llm_interaction)
             
             # Verify history service was called with truncated interaction
-            mock_history_service.store_llm_interaction.assert_called_once_with(truncated_interaction)
+            mock_history_service.store_llm_interaction_async.assert_called_once_with(truncated_interaction)
     
     @pytest.mark.asyncio
     async def test_execute_with_large_conversation(self, llm_hook, mock_history_service):
@@ -150,10 +150,10 @@ class TestLLMHistoryHook:
         await llm_hook.execute(interaction)
         
         # Verify history service was called (with truncated content)
-        mock_history_service.store_llm_interaction.assert_called_once()
+        mock_history_service.store_llm_interaction_async.assert_called_once()
         
         # Get the actual interaction that was stored
-        stored_interaction = mock_history_service.store_llm_interaction.call_args[0][0]
+        stored_interaction = mock_history_service.store_llm_interaction_async.call_args[0][0]
         
         # Verify user message was truncated
         user_message = stored_interaction.conversation.messages[1]
@@ -169,7 +169,7 @@ class TestMCPHistoryHook:
     def mock_history_service(self):
         """Mock history service."""
         service = Mock(spec=HistoryService)
-        service.store_mcp_interaction = Mock(return_value=True)
+        service.store_mcp_interaction_async = AsyncMock(return_value=True)
         return service
     
     @pytest.fixture
@@ -200,23 +200,23 @@ class TestMCPHistoryHook:
         """Test successful execution logs interaction."""
         await mcp_hook.execute(sample_mcp_interaction)
         
-        mock_history_service.store_mcp_interaction.assert_called_once_with(sample_mcp_interaction)
+        mock_history_service.store_mcp_interaction_async.assert_called_once_with(sample_mcp_interaction)
     
     @pytest.mark.asyncio
     async def test_execute_handles_history_service_returns_false(self, mcp_hook, mock_history_service, sample_mcp_interaction):
         """Test execution handles when history service returns False (warning path)."""
-        mock_history_service.store_mcp_interaction.return_value = False
+        mock_history_service.store_mcp_interaction_async.return_value = False
         
         # Should log warning but not raise
         await mcp_hook.execute(sample_mcp_interaction)
         
         # Verify history service was called
-        mock_history_service.store_mcp_interaction.assert_called_once()
+        mock_history_service.store_mcp_interaction_async.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_execute_handles_service_error(self, mcp_hook, mock_history_service, sample_mcp_interaction):
         """Test execution handles history service errors."""
-        mock_history_service.store_mcp_interaction.side_effect = RuntimeError("Database error")
+        mock_history_service.store_mcp_interaction_async.side_effect = RuntimeError("Database error")
         
         # Should raise the exception
         with pytest.raises(RuntimeError, match="Database error"):
@@ -231,7 +231,7 @@ class TestMCPListHistoryHook:
     def mock_history_service(self):
         """Mock history service."""
         service = Mock(spec=HistoryService)
-        service.store_mcp_interaction = Mock(return_value=True)
+        service.store_mcp_interaction_async = AsyncMock(return_value=True)
         return service
     
     @pytest.fixture
@@ -261,23 +261,23 @@ class TestMCPListHistoryHook:
         """Test successful execution logs list interaction."""
         await mcp_list_hook.execute(sample_mcp_list_interaction)
         
-        mock_history_service.store_mcp_interaction.assert_called_once_with(sample_mcp_list_interaction)
+        mock_history_service.store_mcp_interaction_async.assert_called_once_with(sample_mcp_list_interaction)
     
     @pytest.mark.asyncio
     async def test_execute_handles_history_service_returns_false(self, mcp_list_hook, mock_history_service, sample_mcp_list_interaction):
         """Test execution handles when history service returns False (warning path)."""
-        mock_history_service.store_mcp_interaction.return_value = False
+        mock_history_service.store_mcp_interaction_async.return_value = False
         
         # Should log warning but not raise
         await mcp_list_hook.execute(sample_mcp_list_interaction)
         
         # Verify history service was called
-        mock_history_service.store_mcp_interaction.assert_called_once()
+        mock_history_service.store_mcp_interaction_async.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_execute_handles_service_error(self, mcp_list_hook, mock_history_service, sample_mcp_list_interaction):
         """Test execution handles history service errors."""
-        mock_history_service.store_mcp_interaction.side_effect = RuntimeError("Database error")
+        mock_history_service.store_mcp_interaction_async.side_effect = RuntimeError("Database error")
         
         # Should raise the exception
         with pytest.raises(RuntimeError, match="Database error"):
@@ -5,8 +5,12 @@ This module provides shared MockChunk and create_mock_stream helpers
 used across multiple test files to avoid duplication.
 """
 
+import asyncio
 from typing import Optional
 
+# Captured before tests patch asyncio.sleep with FakeClock.sleep
+_real_sleep = asyncio.sleep
+
 
 class MockChunk:
     """Mock chunk that supports LangChain-style aggregation with + operator."""
@@ -130,3 +134,20 @@ def create_test_config(provider_type: str = "openai", **overrides):
     defaults.update(overrides)
     return LLMProviderConfig(**defaults)
 
+
+
+class FakeClock:
+    """Monotonic clock for rate limiter tests; sleep() advances it instead of waiting."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        # Still let other tasks run, like a real sleep
+        await _real_sleep(0)
@@ -0,0 +1,98 @@
+"""
+Unit tests for the shared LLM provider connection pools.
+"""
+
+import asyncio
+
+import pytest
+
+from tarsy.integrations.llm.client_pool import ProviderClientPool
+
+pytestmark = pytest.mark.unit
+
+
+async def _start_http_server():
+    """Start a keep-alive HTTP/1.1 server on localhost; returns (server, url, accepted connections)."""
+    accepted = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        accepted.append(writer)
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nContent-Type: text/plain\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}/v1/models", accepted
+
+
+def _pool(**overrides) -> ProviderClientPool:
+    options = {"max_connections": 10, "max_keepalive_connections": 5, "keepalive_expiry": 60.0}
+    options.update(overrides)
+    return ProviderClientPool(**options)
+
+
+class TestProviderClientPool:
+    """Test cases for ProviderClientPool."""
+
+    def test_one_client_per_provider_and_ssl_mode(self):
+        pool = _pool()
+
+        openai = pool.get_async_client("openai")
+
+        assert pool.get_async_client("openai") is openai
+        assert pool.get_async_client("google") is not openai
+        assert pool.get_async_client("openai", verify=False) is not openai
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_one_connection(self):
+        """Requests after the first are served by the kept-alive connection and counted as reuse."""
+        server, url, accepted = await _start_http_server()
+        pool = _pool()
+        try:
+            client = pool.get_async_client("openai")
+            for _ in range(4):
+                response = await client.get(url)
+                assert response.text == "ok"
+        finally:
+            await pool.aclose()
+            server.close()
+            await server.wait_closed()
+
+        stats = pool.get_stats()["openai"]
+        assert len(accepted) == 1
+        assert stats["requests"] == 4
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 3
+        assert stats["reuse_rate"] == 0.75
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_capped_by_max_connections(self):
+        """Concurrent requests never open more connections than the provider limit."""
+        server, url, accepted = await _start_http_server()
+        pool = _pool(max_connections=2, max_keepalive_connections=2)
+        try:
+            client = pool.get_async_client("xai")
+            responses = await asyncio.gather(*(client.get(url) for _ in range(10)))
+        finally:
+            await pool.aclose()
+            server.close()
+            await server.wait_closed()
+
+        assert all(response.status_code == 200 for response in responses)
+        assert len(accepted) <= 2
+        assert pool.get_stats()["xai"]["new_connections"] == len(accepted)
+
+    def test_stats_label_unverified_pools(self):
+        pool = _pool()
+        pool.get_async_client("openai", verify=False)
+
+        stats = pool.get_stats()
+
+        assert stats["openai (ssl verification disabled)"]["provider"] == "openai"
+        assert stats["openai (ssl verification disabled)"]["reuse_rate"] == 0.0
@@ -11,6 +11,7 @@ import pytest
 from google.genai import types as google_genai_types
 from mcp.types import Tool
 
+from tarsy.integrations.llm.client_pool import get_provider_client_pool
 from tarsy.integrations.llm.gemini_client import (
     GeminiNativeThinkingClient,
     NativeThinkingResponse,
@@ -492,6 +493,7 @@ class TestGeminiNativeThinkingClientGenerate:
         usage.prompt_token_count = 100
         usage.candidates_token_count = 50
         usage.total_token_count = 150
+        usage.cached_content_token_count = 80
         response.usage_metadata = usage
 
         return response
@@ -591,6 +593,46 @@ class TestGeminiNativeThinkingClientGenerate:
         assert "Analysis complete" in result.content
         assert result.has_tool_calls is False
         assert result.thought_signature == b"test_signature"
+        assert mock_ctx.interaction.input_tokens == 100
+        assert mock_ctx.interaction.cached_input_tokens == 80
+
+    @pytest.mark.asyncio
+    @patch("tarsy.integrations.llm.gemini_client.genai")
+    @patch("tarsy.integrations.llm.gemini_client.llm_interaction_context")
+    async def test_native_client_is_reused_across_calls(
+        self,
+        mock_context: MagicMock,
+        mock_genai: MagicMock,
+        client: GeminiNativeThinkingClient,
+        sample_conversation: LLMConversation,
+        mock_response_final: MagicMock,
+    ) -> None:
+        """The native Google client is created once and sends through the shared Google pool."""
+        mock_native_client = MagicMock()
+        mock_native_client.aio.models.generate_content_stream = AsyncMock(
+            side_effect=lambda **_kwargs: mock_stream_response(mock_response_final)
+        )
+        mock_genai.Client.return_value = mock_native_client
+
+        mock_ctx = MagicMock()
+        mock_ctx.interaction = MagicMock()
+        mock_ctx.complete_success = AsyncMock()
+        mock_context_cm = MagicMock()
+        mock_context_cm.__aenter__ = AsyncMock(return_value=mock_ctx)
+        mock_context_cm.__aexit__ = AsyncMock(return_value=None)
+        mock_context.return_value = mock_context_cm
+
+        for _ in range(2):
+            await client.generate(
+                conversation=sample_conversation,
+                session_id="test-session",
+                mcp_tools=[],
+            )
+
+        mock_genai.Client.assert_called_once()
+        http_options = mock_genai.Client.call_args.kwargs["http_options"]
+        assert http_options.httpx_async_client is get_provider_client_pool().get_async_client("google")
+        assert mock_native_client.aio.models.generate_content_stream.call_count == 2
 
     @pytest.mark.asyncio
     @patch("tarsy.integrations.llm.gemini_client.genai")
@@ -13,12 +13,19 @@ from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 from tarsy.hooks.hook_context import llm_interaction_context
 from tarsy.integrations.llm.client import LLM_PROVIDERS, LLMClient
+from tarsy.integrations.llm.client_pool import get_provider_client_pool
 from tarsy.integrations.llm.manager import LLMManager
+from tarsy.integrations.llm.rate_limiter import ProviderRateLimiter
 from tarsy.models.llm_models import GoogleNativeTool, LLMProviderConfig
 from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
 
 # Import shared test helpers from conftest
-from .conftest import MockChunk, create_stream_side_effect, create_test_config
+from .conftest import (
+    FakeClock,
+    MockChunk,
+    create_stream_side_effect,
+    create_test_config,
+)
 
 
 @pytest.mark.unit
@@ -170,7 +177,8 @@ class TestLLMClientInitialization:
                 model="gpt-4",
                 temperature=0.7,
                 api_key="test-api-key",
-                stream_usage=True
+                stream_usage=True,
+                http_async_client=get_provider_client_pool().get_async_client("openai")
             )
     
     def test_initialization_google_success(self, mock_config):
@@ -204,7 +212,8 @@ class TestLLMClientInitialization:
             mock_xai.assert_called_once_with(
                 model="gpt-4",
                 api_key="test-api-key",
-                temperature=0.7
+                temperature=0.7,
+                http_async_client=get_provider_client_pool().get_async_client("xai")
             )
     
     def test_initialization_anthropic_success(self, mock_config):
@@ -353,7 +362,8 @@ class TestLLMClientInitialization:
                 model="gpt-4",  # model from config
                 temperature=None,     # BaseModel default temperature (None = use model default)
                 api_key="test-key",
-                stream_usage=True    # Enabled for token tracking
+                stream_usage=True,    # Enabled for token tracking
+                http_async_client=get_provider_client_pool().get_async_client("openai")  # Shared pool
             )
     
     def test_initialization_handles_langchain_error(self, mock_config):
@@ -449,6 +459,55 @@ class TestLLMClientMessageConversion:
         assert len(result) == 1
         assert isinstance(result[0], SystemMessage)
 
+    def test_openai_messages_have_no_cache_breakpoints(self, client):
+        """OpenAI caches prompt prefixes automatically, so content stays plain text."""
+        conversation = LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="System prompt"),
+            LLMMessage(role=MessageRole.USER, content="User message")
+        ])
+        
+        result = client._convert_conversation_to_langchain(conversation)
+        
+        assert [message.content for message in result] == ["System prompt", "User message"]
+    
+    @pytest.mark.parametrize("provider_type", ["anthropic", "vertexai"])
+    def test_claude_conversation_marks_cache_breakpoints(self, provider_type):
+        """System prompt, first user message and latest message carry cache_control breakpoints."""
+        with patch('tarsy.integrations.llm.client.ChatAnthropic'), \
+             patch('tarsy.integrations.llm.client.ChatAnthropicVertex'):
+            client = LLMClient(provider_type, LLMProviderConfig(
+                type=provider_type, model="claude-sonnet-4-5", api_key="test", project="test-project"
+            ))
+        conversation = LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="Instructions"),
+            LLMMessage(role=MessageRole.USER, content="Tools and alert"),
+            LLMMessage(role=MessageRole.ASSISTANT, content="Thought: check pods"),
+            LLMMessage(role=MessageRole.USER, content="Observation: pods ok"),
+        ])
+        
+        result = client._convert_conversation_to_langchain(conversation)
+        
+        cached = {"type": "ephemeral"}
+        assert result[0].content == [{"type": "text", "text": "Instructions", "cache_control": cached}]
+        assert result[1].content == [{"type": "text", "text": "Tools and alert", "cache_control": cached}]
+        assert result[2].content == "Thought: check pods"
+        assert result[3].content == [{"type": "text", "text": "Observation: pods ok", "cache_control": cached}]
+    
+    def test_prompt_caching_can_be_disabled(self):
+        """Providers configured with prompt_caching: false send plain text."""
+        with patch('tarsy.integrations.llm.client.ChatAnthropic'):
+            client = LLMClient("anthropic", LLMProviderConfig(
+                type="anthropic", model="claude-sonnet-4-5", api_key="test", prompt_caching=False
+            ))
+        conversation = LLMConversation(messages=[
+            LLMMessage(role=MessageRole.SYSTEM, content="Instructions"),
+            LLMMessage(role=MessageRole.USER, content="Tools and alert")
+        ])
+        
+        result = client._convert_conversation_to_langchain(conversation)
+        
+        assert [message.content for message in result] == ["Instructions", "Tools and alert"]
+
 
 @pytest.mark.unit
 class TestLLMClientResponseGeneration:
@@ -768,22 +827,24 @@ class TestLLMClientSSLAndBaseURL:
         )
         
         with patch('tarsy.integrations.llm.client.ChatOpenAI') as mock_openai, \
-             patch('tarsy.integrations.llm.client.httpx.Client') as mock_client, \
-             patch('tarsy.integrations.llm.client.httpx.AsyncClient') as mock_async_client:
+             patch('tarsy.integrations.llm.client.httpx.Client') as mock_client:
             
             client = LLMClient("openai", config)
             
             # Verify SSL warning was logged
             assert client.available is True
             
-            # Verify httpx clients were created with verify=False
+            # Verify the sync httpx client was created with verify=False
             mock_client.assert_called_with(verify=False)
-            mock_async_client.assert_called_with(verify=False)
             
-            # Verify the clients were passed to ChatOpenAI
+            # Verify the clients were passed to ChatOpenAI; streaming uses the
+            # shared pool without SSL verification
             call_args = mock_openai.call_args[1]  # keyword arguments
             assert 'http_client' in call_args
-            assert 'http_async_client' in call_args
+            assert call_args['http_async_client'] is get_provider_client_pool().get_async_client(
+                "openai", verify=False
+            )
+            assert call_args['http_async_client'] is not get_provider_client_pool().get_async_client("openai")
     
     def test_initialization_with_custom_base_url(self):
         """Test client initialization with custom base URL."""
@@ -868,13 +929,17 @@ class TestLLMClientRetryLogic:
             mock_ctx.get_request_id.return_value = "retry-test"
             mock_context.return_value.__aenter__.return_value = mock_ctx
             
-            with patch('asyncio.sleep') as mock_sleep:  # Speed up test
+            clock = FakeClock()
+            client_with_retry._rate_limiter = ProviderRateLimiter("openai", clock=clock)
+            with patch('asyncio.sleep', side_effect=clock.sleep) as mock_sleep:  # Speed up test
                 result = await client_with_retry.generate_response(conversation, "test-session")
                 
                 assert isinstance(result, LLMConversation)
                 assert result.get_latest_assistant_message().content == "Success after retry"
                 assert mock_llm_client.astream.call_count == 2
-                mock_sleep.assert_called_once()  # Should have slept before retry
+                # The retry waited in the rate limiter for the provider pause (2^0 s backoff)
+                mock_sleep.assert_called_once_with(1.0)
+                assert client_with_retry._rate_limiter.get_stats()["rate_limit_errors"] == 1
     
     @pytest.mark.asyncio
     async def test_retry_exhausted_on_rate_limit(self, client_with_retry, mock_llm_client):
@@ -891,12 +956,16 @@ class TestLLMClientRetryLogic:
             mock_ctx = AsyncMock()
             mock_context.return_value.__aenter__.return_value = mock_ctx
             
-            with patch('asyncio.sleep'):  # Speed up test
+            clock = FakeClock()
+            client_with_retry._rate_limiter = ProviderRateLimiter("openai", clock=clock)
+            with patch('asyncio.sleep', side_effect=clock.sleep):  # Speed up test
                 with pytest.raises(Exception, match="rate_limit_exceeded"):
                     await client_with_retry.generate_response(conversation, "test-session")
                 
                 # Should have tried max_retries + 1 times
                 assert mock_llm_client.astream.call_count == 4  # 3 retries + 1 initial
+                # Exponential backoff between attempts
+                assert clock.sleeps == [1.0, 2.0, 4.0]
     
     @pytest.mark.asyncio
     async def test_empty_response_retry(self, client_with_retry, mock_llm_client):
@@ -1250,6 +1319,40 @@ class TestLLMClientTokenUsageTracking:
                 assert mock_ctx.interaction.input_tokens == 120
                 assert mock_ctx.interaction.output_tokens == 45  
                 assert mock_ctx.interaction.total_tokens == 165
+                assert mock_ctx.interaction.cached_input_tokens is None
+    
+    @pytest.mark.asyncio
+    async def test_generate_response_captures_cached_input_tokens(self, client):
+        """Input tokens served from the provider's prompt cache are stored next to input tokens."""
+        with patch('tarsy.integrations.llm.client.UsageMetadataCallbackHandler') as mock_callback_class:
+            mock_callback = Mock()
+            type(mock_callback).usage_metadata = PropertyMock(return_value={
+                'gpt-4o-mini': {
+                    'input_tokens': 5000,
+                    'output_tokens': 45,
+                    'total_tokens': 5045,
+                    'input_token_details': {'cache_read': 4608}
+                }
+            })
+            mock_callback_class.return_value = mock_callback
+            
+            conversation = LLMConversation(messages=[
+                LLMMessage(role=MessageRole.SYSTEM, content="You are a helpful assistant."),
+                LLMMessage(role=MessageRole.USER, content="Test question")
+            ])
+            
+            with patch('tarsy.integrations.llm.client.llm_interaction_context') as mock_context:
+                mock_ctx = Mock()
+                mock_ctx.get_request_id.return_value = "req-126"
+                mock_ctx.interaction = Mock()
+                mock_ctx.complete_success = AsyncMock()
+                mock_context.return_value.__aenter__.return_value = mock_ctx
+                mock_context.return_value.__aexit__.return_value = None
+                
+                await client.generate_response(conversation, "test-session")
+                
+                assert mock_ctx.interaction.input_tokens == 5000
+                assert mock_ctx.interaction.cached_input_tokens == 4608
     
     @pytest.mark.asyncio
     async def test_generate_response_handles_missing_token_usage(self, client, mock_llm_client):
@@ -1323,6 +1426,7 @@ class TestLLMClientTokenUsageTracking:
                 assert mock_ctx.interaction.input_tokens is None
                 assert mock_ctx.interaction.output_tokens is None  
                 assert mock_ctx.interaction.total_tokens is None
+                assert mock_ctx.interaction.cached_input_tokens is None
     
     @pytest.mark.asyncio
     async def test_generate_response_captures_token_usage_from_streaming_chunk(self, client, mock_llm_client):
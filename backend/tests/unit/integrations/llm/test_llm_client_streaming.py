@@ -8,7 +8,7 @@ Tests the real-time streaming of LLM responses via WebSocket, including:
 - Completion markers
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -167,6 +167,30 @@ class TestLLMClientStreamingChunks:
             event = mock_publish.call_args.kwargs["event"]
             assert event.stage_execution_id is None
 
+    @pytest.mark.asyncio
+    async def test_publish_stream_chunk_uses_streaming_transport(self, client):
+        """Test that chunks go to the running StreamingTransport without a DB session."""
+        transport = Mock()
+        with patch(
+            "tarsy.services.events.manager.get_streaming_transport", return_value=transport
+        ), patch(
+            "tarsy.database.init_db.get_async_session_factory"
+        ) as mock_factory:
+            await client._streaming_publisher.publish_chunk(
+                session_id="test-session",
+                stage_execution_id="stage-123",
+                stream_type=StreamingEventType.THOUGHT,
+                chunk="Thinking",
+                is_complete=False,
+                llm_interaction_id="llm-1",
+            )
+
+            mock_factory.assert_not_called()
+            event = transport.submit.call_args.args[0]
+            assert event.chunk == "Thinking"
+            assert event.llm_interaction_id == "llm-1"
+            assert event.offset is None
+
 
 @pytest.mark.unit
 class TestLLMClientStreamingBehavior:
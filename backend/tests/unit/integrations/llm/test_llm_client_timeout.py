@@ -11,10 +11,16 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from tarsy.integrations.llm.client import LLMClient
+from tarsy.integrations.llm.rate_limiter import ProviderRateLimiter
 from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
 
 # Import shared test helpers from conftest
-from .conftest import MockChunk, create_stream_side_effect, create_test_config
+from .conftest import (
+    FakeClock,
+    MockChunk,
+    create_stream_side_effect,
+    create_test_config,
+)
 
 
 @pytest.mark.unit
@@ -62,6 +68,26 @@ class TestLLMClientTimeout:
                 with pytest.raises(TimeoutError, match="LLM streaming timed out"):
                     await client.generate_response(sample_conversation, "test-session")
     
+    @pytest.mark.asyncio
+    async def test_timed_out_attempts_return_their_token_reservations(
+        self, client, mock_llm_client, sample_conversation
+    ):
+        """Test that every failed attempt gives back the tokens it reserved."""
+        mock_llm_client.astream.side_effect = asyncio.TimeoutError()
+        
+        with patch('tarsy.integrations.llm.client.llm_interaction_context') as mock_context:
+            mock_context.return_value.__aenter__.return_value = AsyncMock()
+            
+            clock = FakeClock()
+            client._rate_limiter = ProviderRateLimiter("openai", tokens_per_minute=6000, clock=clock)
+            # Retries do not advance the clock, so nothing is refilled
+            with patch('asyncio.sleep'), pytest.raises(TimeoutError):
+                await client.generate_response(sample_conversation, "test-session", max_tokens=1000)
+            
+            assert mock_llm_client.astream.call_count == 4
+            # The four reservations were all returned, so the whole budget is available
+            assert (await client._rate_limiter.acquire("test-session", 6000)).wait_seconds == 0
+    
     @pytest.mark.asyncio
     async def test_llm_timeout_retry_logic(self, client, mock_llm_client, sample_conversation):
         """Test that timeout triggers retry with 5-second delay."""
@@ -159,7 +185,9 @@ class TestLLMClientTimeout:
             mock_ctx.get_request_id.return_value = "rate-limit-test"
             mock_context.return_value.__aenter__.return_value = mock_ctx
             
-            with patch('asyncio.sleep'):  # Speed up test
+            clock = FakeClock()
+            client._rate_limiter = ProviderRateLimiter("openai", clock=clock)
+            with patch('asyncio.sleep', side_effect=clock.sleep):  # Speed up test
                 result = await client.generate_response(sample_conversation, "test-session")
                 
                 assert result.get_latest_assistant_message().content == "Success after rate limit"
@@ -0,0 +1,206 @@
+"""
+Unit tests for the shared LLM provider rate limiters.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from tarsy.integrations.llm.rate_limiter import (
+    DEFAULT_OUTPUT_TOKENS,
+    ProviderRateLimiter,
+    ProviderRateLimiters,
+    estimate_tokens,
+    is_rate_limit_error,
+    llm_iteration_timeout,
+)
+from tarsy.models.unified_interactions import LLMConversation, LLMMessage, MessageRole
+
+from .conftest import FakeClock
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def clock():
+    """Fake clock; asyncio.sleep advances it instead of waiting."""
+    clock = FakeClock()
+    with patch("asyncio.sleep", side_effect=clock.sleep):
+        yield clock
+
+
+class TestProviderRateLimiter:
+    """Test cases for ProviderRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_provider_never_waits(self, clock):
+        limiter = ProviderRateLimiter("openai", clock=clock)
+
+        grants = [await limiter.acquire("session-1", 50_000) for _ in range(100)]
+
+        assert all(grant.wait_seconds == 0 for grant in grants)
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_the_minute_budget_wait_for_refill(self, clock):
+        limiter = ProviderRateLimiter("openai", requests_per_minute=60, clock=clock)
+
+        for _ in range(60):
+            assert (await limiter.acquire("session-1", 100)).wait_seconds == 0
+
+        grant = await limiter.acquire("session-1", 100)
+
+        assert grant.wait_seconds == pytest.approx(1.0)
+        stats = limiter.get_stats()
+        assert stats["granted_calls"] == 61
+        assert stats["delayed_calls"] == 1
+        assert stats["wait_max_ms"] == pytest.approx(1000.0)
+
+    @pytest.mark.asyncio
+    async def test_token_reservation_is_settled_with_reported_usage(self, clock):
+        limiter = ProviderRateLimiter("openai", tokens_per_minute=6000, clock=clock)
+
+        grant = await limiter.acquire("session-1", 6000)
+        # The call used far less than reserved, so the next one does not wait
+        limiter.settle(grant, 1000)
+
+        assert (await limiter.acquire("session-1", 5000)).wait_seconds == 0
+
+        # A call that used more than reserved delays the following calls
+        grant = await limiter.acquire("session-1", 100)
+        limiter.settle(grant, 700)
+
+        assert (await limiter.acquire("session-1", 600)).wait_seconds == pytest.approx(12.0)
+
+    @pytest.mark.asyncio
+    async def test_waiting_calls_are_served_round_robin_by_session(self, clock):
+        """A session with many queued calls does not hold back another session's call."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=1, clock=clock)
+        await limiter.acquire("busy-session", 100)
+        granted = []
+
+        async def call(session_id: str, name: str) -> None:
+            await limiter.acquire(session_id, 100)
+            granted.append(name)
+
+        await asyncio.gather(
+            call("busy-session", "busy-1"),
+            call("busy-session", "busy-2"),
+            call("busy-session", "busy-3"),
+            call("other-session", "other-1"),
+        )
+
+        assert granted == ["busy-1", "other-1", "busy-2", "busy-3"]
+        assert clock.sleeps == [60.0, 60.0, 60.0, 60.0]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_pauses_every_session(self, clock):
+        limiter = ProviderRateLimiter("openai", clock=clock)
+
+        assert limiter.record_rate_limit(5) == 5
+        # A shorter retry delay reported meanwhile does not shorten the pause
+        assert limiter.record_rate_limit(2) == 5
+        grant = await limiter.acquire("another-session", 100)
+
+        assert grant.wait_seconds == pytest.approx(5.0)
+        assert limiter.get_stats()["rate_limit_errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_leaves_the_queue(self, clock):
+        limiter = ProviderRateLimiter("openai", requests_per_minute=1, clock=clock)
+        await limiter.acquire("session-1", 100)
+
+        waiting = asyncio.create_task(limiter.acquire("session-1", 100))
+        await asyncio.sleep(0)
+        assert limiter.get_stats()["queued_calls"] == 1
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        assert limiter.get_stats()["queued_calls"] == 0
+        assert limiter.get_stats()["queued_sessions"] == 0
+
+    def test_share_scales_the_limits(self):
+        limiter = ProviderRateLimiter("openai", requests_per_minute=100, tokens_per_minute=80_000)
+
+        limiter.set_share(0.25)
+
+        stats = limiter.get_stats()
+        assert stats["share"] == 0.25
+        assert stats["requests_per_minute"] == 25
+        assert stats["tokens_per_minute"] == 20_000
+
+
+class TestLLMIterationTimeout:
+    """Test cases for iteration timeouts that skip rate limiter waits (real time)."""
+
+    @pytest.mark.asyncio
+    async def test_time_queued_for_the_budget_is_not_counted(self):
+        # 600 rpm: once the minute budget is used, the next call waits 0.1s
+        limiter = ProviderRateLimiter("openai", requests_per_minute=600)
+        for _ in range(600):
+            await limiter.acquire("session-1", 100)
+
+        async with llm_iteration_timeout(0.05):
+            grant = await limiter.acquire("session-1", 100)
+            await asyncio.sleep(0.01)
+
+        assert grant.wait_seconds >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_time_spent_outside_the_queue_is_counted(self):
+        limiter = ProviderRateLimiter("openai", requests_per_minute=600)
+        for _ in range(600):
+            await limiter.acquire("session-1", 100)
+
+        with pytest.raises(TimeoutError):
+            async with llm_iteration_timeout(0.05):
+                await asyncio.sleep(0.03)
+                await limiter.acquire("session-1", 100)
+                await asyncio.sleep(0.03)
+
+
+class TestProviderRateLimiters:
+    """Test cases for the rate limiter registry."""
+
+    def test_one_limiter_per_provider(self):
+        limiters = ProviderRateLimiters()
+
+        limiter = limiters.get("openai-default", requests_per_minute=100)
+
+        assert limiters.get("openai-default", requests_per_minute=100) is limiter
+        assert limiters.get("gemini-default") is not limiter
+        assert list(limiters.get_stats()) == ["openai-default", "gemini-default"]
+
+    def test_share_applies_to_existing_and_new_limiters(self):
+        limiters = ProviderRateLimiters()
+        existing = limiters.get("openai-default", requests_per_minute=100)
+
+        limiters.set_share(0.5)
+
+        assert existing.get_stats()["requests_per_minute"] == 50
+        assert limiters.get("xai-default", requests_per_minute=10).get_stats()["requests_per_minute"] == 5
+
+
+def test_estimate_tokens():
+    conversation = LLMConversation(messages=[
+        LLMMessage(role=MessageRole.SYSTEM, content="s" * 400),
+        LLMMessage(role=MessageRole.USER, content="u" * 800),
+    ])
+
+    assert estimate_tokens(conversation) == 300 + DEFAULT_OUTPUT_TOKENS
+    assert estimate_tokens(conversation, max_tokens=200) == 500
+
+
+@pytest.mark.parametrize(
+    "message,expected",
+    [
+        ("429 Too Many Requests", True),
+        ("RESOURCE_EXHAUSTED: Quota exceeded for metric", True),
+        ("Rate limit reached for gpt-4o", True),
+        ("Connection reset by peer", False),
+    ],
+)
+def test_is_rate_limit_error(message, expected):
+    assert is_rate_limit_error(Exception(message)) is expected
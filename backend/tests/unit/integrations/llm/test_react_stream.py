@@ -0,0 +1,118 @@
+"""
+Unit tests for incremental ReAct stream scanning.
+"""
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+from tarsy.integrations.llm.client import _aggregate_chunks
+from tarsy.integrations.llm.react_stream import ReActStreamEvent, ReActStreamScanner
+from tarsy.models.constants import StreamingEventType
+
+pytestmark = pytest.mark.unit
+
+THOUGHT = StreamingEventType.THOUGHT
+FINAL_ANSWER = StreamingEventType.FINAL_ANSWER
+SUMMARIZATION = StreamingEventType.SUMMARIZATION
+
+
+def _scan(tokens, summarization=False):
+    scanner = ReActStreamScanner(summarization=summarization)
+    events = [event for token in tokens for event in scanner.feed(token)]
+    return scanner, events + scanner.finish()
+
+
+def _chars(text):
+    return list(text)
+
+
+class TestReActStreamScanner:
+    """Test cases for ReActStreamScanner."""
+
+    def test_thought_streams_until_action_and_completes_once(self):
+        """Thought snapshots grow per token; the thought completes once when Action: appears."""
+        response = "Thought: Check pods\nAction: kubectl_get\nAction Input: {}"
+
+        scanner, events = _scan(_chars(response))
+
+        assert scanner.content == response
+        thought_events = [event for event in events if event.stream_type == THOUGHT]
+        assert thought_events[0] == ReActStreamEvent(THOUGHT, "C", False)
+        assert ReActStreamEvent(THOUGHT, "Check pods\nAct", False) in thought_events
+        assert [event for event in events if event.is_complete] == [
+            ReActStreamEvent(THOUGHT, "Check pods", True)
+        ]
+        assert events[-1] == ReActStreamEvent(THOUGHT, "Check pods", True)
+
+    def test_final_answer_streams_every_third_token_after_thought(self):
+        """Final Answer: ends the thought and starts final answer snapshots."""
+        tokens = ["Thought: ", "done.\n", "Final ", "Answer: ", "The", " pod", " is", " OOMKilled", "."]
+
+        _, events = _scan(tokens)
+
+        assert events == [
+            ReActStreamEvent(THOUGHT, "done.\n", False),
+            ReActStreamEvent(THOUGHT, "done.\nFinal ", False),
+            ReActStreamEvent(THOUGHT, "done.", True),
+            ReActStreamEvent(FINAL_ANSWER, "The pod is", False),
+            ReActStreamEvent(FINAL_ANSWER, "The pod is OOMKilled.", True),
+        ]
+
+    def test_markers_split_across_tokens_are_found(self):
+        """Markers arriving one character per token are detected at their first position."""
+        response = "Thought: a" + " filler" * 50 + "\nFinal Answer: b"
+
+        scanner, events = _scan(_chars(response))
+
+        assert scanner.content == response
+        assert ReActStreamEvent(THOUGHT, "a" + " filler" * 50, True) in events
+        assert events[-1] == ReActStreamEvent(FINAL_ANSWER, "b", True)
+
+    def test_whole_response_in_one_token(self):
+        """A single token carrying both markers completes the thought immediately."""
+        _, events = _scan(["Thought: x\nAction: y"])
+
+        assert events == [ReActStreamEvent(THOUGHT, "x", True)]
+
+    def test_final_answer_without_thought_is_not_streamed(self):
+        """Only a final answer that follows a streamed thought is streamed."""
+        _, events = _scan(_chars("Final Answer: all good"))
+
+        assert events == []
+
+    def test_summarization_streams_whole_response(self):
+        """Summarizations ignore ReAct markers and stream stripped snapshots."""
+        _, events = _scan([" Pods", " Thought: ", "fine "], summarization=True)
+
+        assert events == [
+            ReActStreamEvent(SUMMARIZATION, "Pods", False),
+            ReActStreamEvent(SUMMARIZATION, "Pods Thought:", False),
+            ReActStreamEvent(SUMMARIZATION, "Pods Thought: fine", False),
+            ReActStreamEvent(SUMMARIZATION, "Pods Thought: fine", True),
+        ]
+
+    def test_empty_section_completes_with_marker(self):
+        """A section with no text completes with an empty completion marker."""
+        _, events = _scan(["Thought:", "  "])
+
+        assert events == [ReActStreamEvent(THOUGHT, "", True)]
+
+
+class TestAggregateChunks:
+    """Test cases for merging streamed chunks once after the stream."""
+
+    def test_message_chunks_merge_like_adding_them_up(self):
+        """Content and usage metadata match the chunk-by-chunk sum."""
+        chunks = [AIMessageChunk(content=token) for token in ("Thought: ", "ok", "")]
+        chunks[-1] = AIMessageChunk(
+            content="", usage_metadata={"input_tokens": 10, "output_tokens": 3, "total_tokens": 13}
+        )
+
+        aggregate = _aggregate_chunks(chunks)
+
+        expected = chunks[0] + chunks[1] + chunks[2]
+        assert aggregate.content == expected.content == "Thought: ok"
+        assert aggregate.usage_metadata == expected.usage_metadata
+
+    def test_no_chunks(self):
+        assert _aggregate_chunks([]) is None
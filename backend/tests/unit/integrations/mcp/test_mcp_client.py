@@ -1045,6 +1045,8 @@ class TestMCPClientSummarization:
         mock_settings.llm_iteration_timeout = 0.5  # 500ms timeout for testing
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         client = MCPClient(mock_settings, mock_registry_with_summarization, slow_summarizer)
         
         # Mock data masking service to return large result
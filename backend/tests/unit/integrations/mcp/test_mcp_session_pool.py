@@ -0,0 +1,236 @@
+"""
+Unit tests for the per-pod MCP session pool and its use by MCPClient.
+"""
+
+import asyncio
+import time
+from typing import List
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tarsy.config.settings import Settings
+from tarsy.integrations.mcp.client import MCPClient
+from tarsy.integrations.mcp.session_pool import MCPSessionPool
+from tarsy.models.mcp_transport_config import TRANSPORT_HTTP
+
+pytestmark = pytest.mark.unit
+
+
+class FakeTransport:
+    """Transport double recording which task opened and closed it."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.session = AsyncMock()
+        self.session.send_ping = AsyncMock(return_value=None)
+        self.closed = False
+        self.opened_in = None
+        self.closed_in = None
+
+    async def create_session(self):
+        self.opened_in = asyncio.current_task()
+        if self.fail:
+            raise ConnectionError("server unreachable")
+        return self.session
+
+    async def close(self):
+        self.closed_in = asyncio.current_task()
+        self.closed = True
+
+
+@pytest.fixture
+def server_config():
+    """Non-isolated HTTP server configuration."""
+    return Mock(transport=Mock(type=TRANSPORT_HTTP, env={}), isolated_sessions=False)
+
+
+@pytest.fixture
+def transports():
+    """Patch transport creation and collect created transports."""
+    created: List[FakeTransport] = []
+
+    def _create(*_args, **_kwargs):
+        transport = FakeTransport()
+        created.append(transport)
+        return transport
+
+    with patch(
+        "tarsy.integrations.mcp.session_pool.MCPTransportFactory.create_transport",
+        side_effect=_create,
+    ):
+        yield created
+
+
+@pytest.fixture
+async def pool():
+    """Session pool closed after each test."""
+    pool = MCPSessionPool(max_sessions_per_server=2, idle_timeout_seconds=60)
+    yield pool
+    await pool.close()
+
+
+class TestMCPSessionPool:
+    """Test leasing, reuse, limits and eviction."""
+
+    async def test_released_connection_is_reused(self, pool, server_config, transports):
+        """A released healthy connection is leased again without reconnecting."""
+        first = await pool.acquire("server-a", server_config)
+        await pool.release(first)
+        second = await pool.acquire("server-a", server_config)
+
+        assert second is first
+        assert len(transports) == 1
+        transports[0].session.send_ping.assert_awaited_once()
+
+    @pytest.mark.usefixtures("transports")
+    async def test_concurrent_leases_get_distinct_connections(self, pool, server_config):
+        """A leased connection is never handed to another client."""
+        first = await pool.acquire("server-a", server_config)
+        second = await pool.acquire("server-a", server_config)
+
+        assert first is not second
+        assert first.session is not second.session
+        assert pool.get_stats()["server-a"] == {"pooled": 2, "idle": 0}
+
+    async def test_unhealthy_idle_connection_is_replaced(self, pool, server_config, transports):
+        """An idle connection failing its health check is closed and replaced."""
+        first = await pool.acquire("server-a", server_config)
+        await pool.release(first)
+        transports[0].session.send_ping.side_effect = ConnectionError("gone")
+
+        second = await pool.acquire("server-a", server_config)
+
+        assert second is not first
+        assert transports[0].closed
+        assert len(transports) == 2
+        assert pool.get_stats()["server-a"] == {"pooled": 1, "idle": 0}
+
+    async def test_connections_beyond_limit_are_closed_on_release(self, pool, server_config, transports):
+        """Leases beyond max_sessions_per_server get a dedicated connection."""
+        leases = [await pool.acquire("server-a", server_config) for _ in range(3)]
+
+        assert [lease.pooled for lease in leases] == [True, True, False]
+        for lease in leases:
+            await pool.release(lease)
+
+        assert pool.get_stats()["server-a"] == {"pooled": 2, "idle": 2}
+        assert [t.closed for t in transports] == [False, False, True]
+
+    async def test_release_not_reusable_closes_connection(self, pool, server_config, transports):
+        """Connections known to be broken are discarded on release."""
+        lease = await pool.acquire("server-a", server_config)
+        await pool.release(lease, reusable=False)
+
+        assert transports[0].closed
+        assert pool.get_stats()["server-a"] == {"pooled": 0, "idle": 0}
+
+    async def test_evict_idle(self, pool, server_config, transports):
+        """Connections idle longer than idle_timeout_seconds are closed."""
+        stale = await pool.acquire("server-a", server_config)
+        fresh = await pool.acquire("server-a", server_config)
+        await pool.release(stale)
+        await pool.release(fresh)
+        stale.last_used_at = time.monotonic() - 120
+
+        assert await pool.evict_idle() == 1
+        assert transports[0].closed
+        assert not transports[1].closed
+        assert pool.get_stats()["server-a"] == {"pooled": 1, "idle": 1}
+
+    async def test_failed_open_frees_slot(self, pool, server_config):
+        """A connection that fails to open does not count against the limit."""
+        with patch(
+            "tarsy.integrations.mcp.session_pool.MCPTransportFactory.create_transport",
+            return_value=FakeTransport(fail=True),
+        ), pytest.raises(ConnectionError, match="server unreachable"):
+            await pool.acquire("server-a", server_config)
+
+        assert pool.get_stats()["server-a"] == {"pooled": 0, "idle": 0}
+
+    async def test_transport_opened_and_closed_in_owner_task(self, pool, server_config, transports):
+        """Teardown runs in the task that created the transport, not the releasing client."""
+        lease = await pool.acquire("server-a", server_config)
+        await pool.release(lease, reusable=False)
+
+        transport = transports[0]
+        assert transport.opened_in is transport.closed_in
+        assert transport.opened_in is not asyncio.current_task()
+
+    async def test_close_closes_idle_and_later_released_connections(self, pool, server_config, transports):
+        """Closing the pool closes idle connections and leases released afterwards."""
+        idle = await pool.acquire("server-a", server_config)
+        leased = await pool.acquire("server-a", server_config)
+        await pool.release(idle)
+
+        await pool.close()
+        assert transports[0].closed
+        assert not transports[1].closed
+
+        await pool.release(leased)
+        assert transports[1].closed
+        with pytest.raises(RuntimeError, match="closed"):
+            await pool.acquire("server-a", server_config)
+
+
+class TestMCPClientWithSessionPool:
+    """Test MCPClient leasing sessions from the pool."""
+
+    @pytest.fixture
+    def client_factory(self, pool, server_config):
+        """Build MCPClients sharing the pool over a single configured server."""
+        registry = Mock()
+        registry.get_all_server_ids.return_value = ["server-a"]
+        registry.get_server_config_safe.return_value = server_config
+
+        def _create() -> MCPClient:
+            with patch("tarsy.integrations.mcp.client.TokenCounter"):
+                return MCPClient(Mock(spec=Settings), registry, session_pool=pool)
+        return _create
+
+    async def test_sessions_reused_across_clients(self, client_factory, pool, transports):
+        """A closed client returns its sessions, the next client reuses them."""
+        first_client = client_factory()
+        await first_client.initialize()
+        session = first_client.sessions["server-a"]
+        await first_client.close()
+
+        second_client = client_factory()
+        await second_client.initialize()
+
+        assert second_client.sessions["server-a"] is session
+        assert len(transports) == 1
+        assert first_client.transports == {}
+        await second_client.close()
+        assert pool.get_stats()["server-a"] == {"pooled": 1, "idle": 1}
+
+    async def test_reinitialize_discards_dead_lease(self, client_factory, pool, transports):
+        """Session recovery replaces the leased connection instead of returning it."""
+        client = client_factory()
+        await client.initialize()
+
+        new_session = await client._reinitialize_server_session("server-a")
+
+        assert transports[0].closed
+        assert new_session is transports[1].session
+        assert client.sessions["server-a"] is new_session
+        await client.close()
+        assert pool.get_stats()["server-a"] == {"pooled": 1, "idle": 1}
+
+    async def test_isolated_server_bypasses_pool(self, client_factory, pool, server_config):
+        """Servers configured with isolated_sessions get their own transport."""
+        server_config.isolated_sessions = True
+        transport = FakeTransport()
+        client = client_factory()
+
+        with patch(
+            "tarsy.integrations.mcp.client.MCPTransportFactory.create_transport",
+            return_value=transport,
+        ):
+            await client.initialize()
+
+        assert client.sessions["server-a"] is transport.session
+        assert client.transports["server-a"] is transport
+        assert pool.get_stats() == {}
+        await client.close()
+        assert transport.closed
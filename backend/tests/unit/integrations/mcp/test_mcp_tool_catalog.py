@@ -0,0 +1,127 @@
+"""
+Unit tests for the MCP tool catalog cache and its use by MCPClient.
+"""
+
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from mcp.types import Tool
+
+from tarsy.config.settings import Settings
+from tarsy.integrations.mcp.client import MCPClient
+from tarsy.integrations.mcp.tool_catalog import MCPToolCatalogCache, serialize_tools
+from tarsy.models.unified_interactions import MCPToolCatalog
+
+pytestmark = pytest.mark.unit
+
+
+def make_tool(name: str, schema: dict = None) -> Tool:
+    """Build a Tool with an optional input schema."""
+    return Tool(name=name, description=f"{name} tool", inputSchema=schema or {"type": "object"})
+
+
+class TestMCPToolCatalogCache:
+    """Test TTL, invalidation and change detection."""
+
+    def test_fresh_entry_is_served(self):
+        """A catalog stored within the TTL is returned with its hash."""
+        cache = MCPToolCatalogCache(ttl_seconds=60)
+        stored = cache.put("server-a", [make_tool("get_pods")])
+
+        entry = cache.get("server-a")
+
+        assert entry is stored
+        assert [tool.name for tool in entry.tools] == ["get_pods"]
+        assert entry.catalog_hash == MCPToolCatalog.compute_hash(serialize_tools(entry.tools))
+
+    def test_expired_entry_is_not_served(self):
+        """Entries older than the TTL must be refetched."""
+        cache = MCPToolCatalogCache(ttl_seconds=60)
+        cache.put("server-a", [make_tool("get_pods")]).fetched_at = time.monotonic() - 61
+
+        assert cache.get("server-a") is None
+        assert cache.get("server-b") is None
+
+    def test_invalidate_keeps_last_known(self):
+        """Invalidated entries are refetched but remain the last known catalog."""
+        cache = MCPToolCatalogCache(ttl_seconds=60)
+        cache.put("server-a", [make_tool("get_pods")])
+
+        cache.invalidate("server-a")
+        cache.invalidate("unknown-server")
+
+        assert cache.get("server-a") is None
+        assert [tool.name for tool in cache.get_last_known()["server-a"]] == ["get_pods"]
+
+    def test_hash_tracks_schema_changes_not_tool_order(self):
+        """The catalog hash changes with schemas but not with listing order."""
+        cache = MCPToolCatalogCache()
+        first = cache.put("server-a", [make_tool("a"), make_tool("b")]).catalog_hash
+        reordered = cache.put("server-a", [make_tool("b"), make_tool("a")]).catalog_hash
+        changed = cache.put(
+            "server-a", [make_tool("a"), make_tool("b", {"type": "object", "required": ["x"]})]
+        ).catalog_hash
+
+        assert first == reordered
+        assert changed != first
+
+
+class TestMCPClientWithToolCatalog:
+    """Test MCPClient serving tool lists from a shared catalog."""
+
+    @pytest.fixture
+    def session(self):
+        """MCP session listing a single tool."""
+        session = AsyncMock()
+        session.list_tools.return_value = Mock(tools=[make_tool("get_pods")])
+        return session
+
+    @pytest.fixture
+    def catalog(self):
+        """Shared tool catalog cache."""
+        return MCPToolCatalogCache(ttl_seconds=60)
+
+    @pytest.fixture
+    def client_factory(self, session, catalog):
+        """Build initialized MCPClients sharing the catalog over one server session."""
+        registry = Mock()
+        registry.get_server_config_safe.return_value = Mock(enabled=True)
+
+        def _create() -> MCPClient:
+            with patch("tarsy.integrations.mcp.client.TokenCounter"):
+                client = MCPClient(Mock(spec=Settings), registry, tool_catalog=catalog)
+            client.sessions = {"server-a": session}
+            client._initialized = True
+            return client
+        return _create
+
+    async def test_catalog_shared_across_clients(self, client_factory, session):
+        """Only the first client lists tools from the server."""
+        first = await client_factory().list_tools_simple("server-a")
+        second = await client_factory().list_tools_simple("server-a")
+
+        assert first == second == {"server-a": session.list_tools.return_value.tools}
+        session.list_tools.assert_awaited_once()
+
+    async def test_reconnect_invalidates_catalog(self, client_factory, session, catalog):
+        """A re-initialized server session has its tools listed again."""
+        client = client_factory()
+        await client.list_tools_simple("server-a")
+        with patch.object(client, "_create_session", AsyncMock(return_value=session)):
+            assert await client.try_initialize_server("server-a")
+
+        await client.list_tools_simple("server-a")
+
+        assert session.list_tools.await_count == 2
+        assert catalog.get("server-a") is not None
+
+    async def test_without_catalog_always_lists(self, client_factory, session):
+        """Clients without a catalog list tools on every call."""
+        client = client_factory()
+        client.tool_catalog = None
+
+        await client.list_tools_simple("server-a")
+        await client.list_tools_simple("server-a")
+
+        assert session.list_tools.await_count == 2
@@ -14,6 +14,7 @@ as that's already tested by Pydantic itself. We test OUR logic.
 import pytest
 
 from tarsy.models.alert import Alert, ProcessingAlert
+from tarsy.models.constants import AlertPriority
 from tarsy.utils.timestamp import now_us
 
 
@@ -115,6 +116,32 @@ class TestProcessingAlertTransformation:
         # But ALSO kept in client data (pristine!)
         assert processing_alert.alert_data["environment"] == "staging"
     
+    @pytest.mark.parametrize(
+        "severity,expected",
+        [
+            ("critical", AlertPriority.CRITICAL),
+            ("High", AlertPriority.HIGH),
+            ("warning", AlertPriority.NORMAL),
+            ("info", AlertPriority.LOW),
+            ("something-else", AlertPriority.NORMAL),
+        ],
+    )
+    def test_priority_derived_from_severity(self, severity, expected):
+        """Test queue priority is derived from client severity when not set explicitly."""
+        alert = Alert(alert_type="kubernetes", data={"severity": severity})
+        
+        processing_alert = ProcessingAlert.from_api_alert(alert, default_alert_type="kubernetes")
+        
+        assert processing_alert.priority == expected
+    
+    def test_explicit_priority_overrides_severity(self):
+        """Test explicit priority on the API alert wins over the severity-derived one."""
+        alert = Alert(alert_type="kubernetes", priority=0, data={"severity": "critical"})
+        
+        processing_alert = ProcessingAlert.from_api_alert(alert, default_alert_type="kubernetes")
+        
+        assert processing_alert.priority == AlertPriority.LOW
+        assert processing_alert.severity == "critical"
     
     def test_preserves_complex_nested_json(self):
         """Test transformation preserves complex nested JSON structures exactly."""
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tarsy.models.db_models import Event
@@ -251,6 +251,117 @@ class TestEventRepositoryDeleteEventsBefore:
             await repository.delete_events_before(cutoff_time)
 
 
+@pytest.mark.unit
+class TestEventRepositoryPartitions:
+    """Test EventRepository partition maintenance (PostgreSQL)."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock database session listing two hourly partitions and the default one."""
+        session = AsyncMock(spec=AsyncSession)
+        partitions = Mock()
+        partitions.scalars.return_value.all.return_value = [
+            "events_p2025010110", "events_p2025010111", "events_default",
+        ]
+        session.execute = AsyncMock(return_value=partitions)
+        session.begin_nested = Mock(return_value=AsyncMock())
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create EventRepository with mocked session."""
+        return EventRepository(mock_session)
+
+    def _statements(self, mock_session) -> list[str]:
+        return [str(call.args[0]) for call in mock_session.execute.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_get_event_partitions_parses_hourly_partitions(self, repository):
+        """Test that hourly partitions are listed by start time, without the default partition."""
+        partitions = await repository.get_event_partitions()
+
+        assert partitions == {
+            "events_p2025010110": datetime(2025, 1, 1, 10),
+            "events_p2025010111": datetime(2025, 1, 1, 11),
+        }
+
+    @pytest.mark.asyncio
+    async def test_create_event_partitions_creates_missing_hours(self, repository, mock_session):
+        """Test that only partitions missing from the period are created."""
+        created = await repository.create_event_partitions(
+            datetime(2025, 1, 1, 10, 30), datetime(2025, 1, 1, 13, 0)
+        )
+
+        assert created == ["events_p2025010112"]
+        assert self._statements(mock_session)[1] == (
+            "CREATE TABLE IF NOT EXISTS events_p2025010112 PARTITION OF events "
+            "FOR VALUES FROM ('2025-01-01 12:00:00') TO ('2025-01-01 13:00:00')"
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_event_partitions_skips_failed_partition(self, repository, mock_session):
+        """Test that a partition that cannot be created is skipped."""
+        partitions = mock_session.execute.return_value
+        mock_session.execute.side_effect = [partitions, OperationalError("default partition", None, None)]
+
+        created = await repository.create_event_partitions(
+            datetime(2025, 1, 1, 10, 0), datetime(2025, 1, 1, 13, 0)
+        )
+
+        assert created == []
+
+    @pytest.mark.asyncio
+    async def test_drop_event_partitions_before_detaches_and_drops(self, repository, mock_session):
+        """Test that partitions ending at or before the cutoff are detached and dropped."""
+        dropped = await repository.drop_event_partitions_before(datetime(2025, 1, 1, 11, 30))
+
+        assert dropped == ["events_p2025010110"]
+        assert self._statements(mock_session)[1:] == [
+            "ALTER TABLE events DETACH PARTITION events_p2025010110",
+            "DROP TABLE IF EXISTS events_p2025010110",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_drop_event_partitions_before_treats_concurrent_drop_as_done(
+        self, repository, mock_session
+    ):
+        """Test that a partition another pod already detached counts as dropped without raising."""
+        partitions = mock_session.execute.return_value
+        detached = Mock()
+        detached.scalar.return_value = None
+        mock_session.execute.side_effect = [
+            partitions,
+            ProgrammingError("is not a partition", None, None),
+            detached,
+            partitions,
+        ]
+
+        dropped = await repository.drop_event_partitions_before(datetime(2025, 1, 1, 11, 30))
+
+        assert dropped == ["events_p2025010110"]
+        assert self._statements(mock_session)[-1] == "DROP TABLE IF EXISTS events_p2025010110"
+        mock_session.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_drop_event_partitions_before_skips_partition_still_attached(
+        self, repository, mock_session
+    ):
+        """Test that a partition that could not be detached is skipped for the next run."""
+        partitions = mock_session.execute.return_value
+        attached = Mock()
+        attached.scalar.return_value = 1
+        mock_session.execute.side_effect = [
+            partitions,
+            OperationalError("lock timeout", None, None),
+            attached,
+        ]
+
+        dropped = await repository.drop_event_partitions_before(datetime(2025, 1, 1, 11, 30))
+
+        assert dropped == []
+        assert mock_session.execute.await_count == 3
+
+
 @pytest.mark.unit
 class TestEventRepositoryContextManager:
     """Test EventRepository initialization."""
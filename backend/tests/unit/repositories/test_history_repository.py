@@ -6,12 +6,13 @@ proper data access layer implementation and database operations.
 """
 
 from datetime import datetime, timedelta, timezone
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from sqlmodel import Session, SQLModel, create_engine
 
 from tarsy.models.db_models import AlertSession, StageExecution
+from tarsy.models.history_models import SessionCursor
 from tarsy.models.unified_interactions import (
     LLMConversation,
     LLMInteraction,
@@ -593,7 +594,113 @@ class TestHistoryRepository:
         result = repository.get_alert_sessions(page=3, page_size=2)
         assert len(result.sessions) == 1
         assert result.pagination.page == 3
-    
+        assert result.pagination.next_cursor is None
+
+    def _walk_cursor_pages(self, repository, page_size, **kwargs):
+        """Follow next_cursor from the first page and return the session IDs in order."""
+        result = repository.get_alert_sessions(page_size=page_size, **kwargs)
+        session_ids = [s.session_id for s in result.sessions]
+        while result.pagination.next_cursor:
+            cursor = SessionCursor.decode(result.pagination.next_cursor)
+            result = repository.get_alert_sessions(page_size=page_size, cursor=cursor)
+            assert result.sessions, "A cursor is only returned when another page follows"
+            session_ids.extend(s.session_id for s in result.sessions)
+        return session_ids
+
+    @pytest.mark.unit
+    def test_get_alert_sessions_keyset_pagination(self, repository):
+        """Test that cursor pages follow the offset order, including sessions started at the same time."""
+        for i in range(7):
+            repository.create_alert_session(AlertSession(
+                session_id=f"session-{i}",
+                alert_data={},
+                agent_type="TestAgent",
+                alert_type="test",
+                status="completed",
+                started_at_us=1_000_000 + (i // 2),  # Pairs of sessions share a start time
+                chain_id=f"test-chain-{i}"
+            ))
+
+        offset_order = [s.session_id for s in repository.get_alert_sessions(page_size=100).sessions]
+        assert offset_order == [f"session-{i}" for i in (6, 5, 4, 3, 2, 1, 0)]
+
+        assert self._walk_cursor_pages(repository, page_size=3) == offset_order
+        assert self._walk_cursor_pages(repository, page_size=3, sort_order='asc', sort_by='started_at_us') == (
+            offset_order[::-1]
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_get_alert_sessions_keyset_pagination_nullable_sort(self, repository, sort_order):
+        """Test cursor pages over a nullable sort column; NULLs come last in both directions."""
+        authors = ["bob", None, "alice", "bob", None, "carol", "alice"]
+        for i, author in enumerate(authors):
+            repository.create_alert_session(AlertSession(
+                session_id=f"session-{i}",
+                alert_data={},
+                agent_type="TestAgent",
+                alert_type="test",
+                status="completed",
+                author=author,
+                started_at_us=1_000_000 + i,
+                chain_id=f"test-chain-{i}"
+            ))
+
+        offset_order = [
+            s.session_id
+            for s in repository.get_alert_sessions(page_size=100, sort_by='author', sort_order=sort_order).sessions
+        ]
+        walked = self._walk_cursor_pages(repository, page_size=2, sort_by='author', sort_order=sort_order)
+
+        assert walked == offset_order
+        assert sorted(walked) == [f"session-{i}" for i in range(7)]
+        assert set(walked[-2:]) == {"session-1", "session-4"}
+
+    @pytest.mark.unit
+    def test_get_alert_sessions_cursor_replaces_sort(self, repository):
+        """Test that a cursor keeps the sort of the listing it came from."""
+        for i in range(4):
+            repository.create_alert_session(AlertSession(
+                session_id=f"session-{i}",
+                alert_data={},
+                agent_type="TestAgent",
+                alert_type=f"type-{i}",
+                status="completed",
+                started_at_us=1_000_000 + i,
+                chain_id=f"test-chain-{i}"
+            ))
+        first = repository.get_alert_sessions(page_size=2, sort_by='alert_type', sort_order='asc')
+        cursor = SessionCursor.decode(first.pagination.next_cursor)
+
+        result = repository.get_alert_sessions(page_size=2, cursor=cursor, sort_by='started_at_us', sort_order='desc')
+
+        assert [s.session_id for s in result.sessions] == ["session-2", "session-3"]
+        assert result.pagination.next_cursor is None
+
+    @pytest.mark.unit
+    def test_get_alert_sessions_count_modes(self, repository):
+        """Test approximate counts (exact on SQLite) and reported known totals."""
+        for i in range(3):
+            repository.create_alert_session(AlertSession(
+                session_id=f"session-{i}",
+                alert_data={},
+                agent_type="TestAgent",
+                alert_type="test",
+                status="completed",
+                chain_id=f"test-chain-{i}"
+            ))
+
+        # No planner estimate on SQLite: approximate falls back to counting
+        result = repository.get_alert_sessions(count_mode='approximate')
+        assert result.pagination.total_items == 3
+        assert result.pagination.total_is_estimate is False
+
+        result = repository.get_alert_sessions(page_size=2, known_total_items=40)
+        assert len(result.sessions) == 2
+        assert result.pagination.total_items == 40
+        assert result.pagination.total_pages == 20
+        assert result.pagination.total_is_estimate is True
+
     @pytest.mark.unit
     def test_get_alert_sessions_with_search_error_message(self, repository):
         """Test search functionality in error_message field."""
@@ -864,7 +971,90 @@ class TestHistoryRepository:
         result = repository.get_alert_sessions(search="kubernetes")  # Not in any field
         assert len(result.sessions) == 0
         assert result.pagination.total_items == 0
-    
+
+        result = repository.get_alert_sessions(search="!!!")  # No words to search for
+        assert len(result.sessions) == 0
+
+    @pytest.mark.unit
+    def test_get_alert_sessions_search_ranks_and_highlights(self, repository):
+        """Test search results are ordered by relevance and carry escaped, highlighted snippets."""
+        for index, analysis in enumerate([
+            "Pod was <b>OOMKilled</b>. OOMKilled again after restart, OOMKilled three times.",
+            "Deployment rollout stuck; one container was OOMKilled during the rollout of the new release.",
+            "Disk pressure on the node",
+        ]):
+            repository.create_alert_session(AlertSession(
+                session_id=f"rank-{index}",
+                alert_data={"message": "Pod restarts"},
+                agent_type="KubernetesAgent",
+                alert_type="PodRestarts",
+                status="completed",
+                final_analysis=analysis,
+                started_at_us=1_000_000 + index,
+                chain_id="test-chain-rank",
+            ))
+
+        result = repository.get_alert_sessions(search="oomkill")
+
+        assert [s.session_id for s in result.sessions] == ["rank-0", "rank-1"]
+        assert result.pagination.total_items == 2
+        assert result.pagination.next_cursor is None
+        snippet = result.sessions[0].search_snippet
+        assert "<mark>OOMKilled</mark>" in snippet
+        assert "&lt;b&gt;<mark>OOMKilled</mark>&lt;/b&gt;" in snippet
+
+        # An explicit sort replaces relevance
+        result = repository.get_alert_sessions(search="oomkill", sort_by="started_at_us", sort_order="desc")
+        assert [s.session_id for s in result.sessions] == ["rank-1", "rank-0"]
+
+        # Sessions listed without a search have no snippet
+        assert all(s.search_snippet is None for s in repository.get_alert_sessions().sessions)
+
+    @pytest.mark.unit
+    def test_get_alert_sessions_search_term_forms(self, repository):
+        """Test CamelCase parts and punctuated terms (matched as phrases) in searches."""
+        for index, pod in enumerate(["web-7-abc", "web-1-7", "web-70-def"]):
+            repository.create_alert_session(AlertSession(
+                session_id=f"terms-{index}",
+                alert_data={"message": "Namespace stuck", "pod": pod},
+                agent_type="KubernetesAgent",
+                alert_type="NamespaceTerminating",
+                status="completed",
+                started_at_us=1_000_000 + index,
+                chain_id="test-chain-terms",
+            ))
+
+        for search in ("terminating", "NamespaceTerminating", "namespace term"):
+            assert repository.get_alert_sessions(search=search).pagination.total_items == 3, search
+
+        result = repository.get_alert_sessions(search="web-7", sort_by="started_at_us", sort_order="asc")
+        assert [s.session_id for s in result.sessions] == ["terms-0", "terms-2"]
+        result = repository.get_alert_sessions(search="web-7-abc")
+        assert [s.session_id for s in result.sessions] == ["terms-0"]
+
+    @pytest.mark.unit
+    def test_get_alert_sessions_search_indexes_finalized_session(self, repository):
+        """Test the search document is refreshed when a session reaches a terminal status."""
+        session = AlertSession(
+            session_id="finalize-1",
+            alert_data={"message": "Database latency"},
+            agent_type="DatabaseAgent",
+            status="in_progress",
+            started_at_us=1_000_000,
+            chain_id="test-chain-finalize",
+        )
+        repository.create_alert_session(session)
+        assert repository.get_alert_sessions(search="latency").pagination.total_items == 1
+        assert repository.get_alert_sessions(search="deadlock").pagination.total_items == 0
+
+        session.status = "completed"
+        session.final_analysis = "Root cause: a deadlock between two migrations"
+        assert repository.update_alert_session(session)
+
+        result = repository.get_alert_sessions(search="deadlock")
+        assert [s.session_id for s in result.sessions] == ["finalize-1"]
+        assert repository.get_alert_sessions(search="latency").pagination.total_items == 1
+
     @pytest.mark.unit
     def test_get_session_details_chronological_order(self, repository, sample_alert_session):
         """Test session timeline reconstruction with chronological ordering."""
@@ -1285,7 +1475,428 @@ class TestHistoryRepository:
         assert result.session_level_interactions is not None
         assert isinstance(result.session_level_interactions, list)
         assert len(result.session_level_interactions) == 0
+
+    @pytest.mark.unit
+    def test_get_session_timeline_summarizes_interactions(self, repository, sample_alert_session):
+        """Test that the timeline carries interaction summaries with previews instead of payloads."""
+        from tarsy.repositories.history_repository import TIMELINE_PREVIEW_CHARS
+        from tarsy.utils.timestamp import now_us
+        
+        repository.create_alert_session(sample_alert_session)
+        stage_execution_id = repository.create_stage_execution(StageExecution(
+            session_id=sample_alert_session.session_id,
+            stage_id="analysis",
+            stage_index=0,
+            stage_name="Analysis",
+            agent="KubernetesAgent",
+            status="completed",
+            started_at_us=now_us(),
+            stage_output={"result": "x" * 10000},
+        ))
+        base_us = now_us()
+        repository.create_llm_interaction(LLMInteraction(
+            interaction_id="llm-1",
+            session_id=sample_alert_session.session_id,
+            model_name="gpt-4",
+            conversation=LLMConversation(messages=[
+                LLMMessage(role=MessageRole.SYSTEM, content="You are a helpful assistant."),
+                LLMMessage(role=MessageRole.USER, content="Investigate"),
+                LLMMessage(role=MessageRole.ASSISTANT, content="R" * 1000),
+            ]),
+            timestamp_us=base_us,
+            input_tokens=100,
+            output_tokens=20,
+            total_tokens=120,
+            cached_input_tokens=64,
+            stage_execution_id=stage_execution_id,
+        ))
+        repository.create_mcp_communication(MCPInteraction(
+            communication_id="mcp-1",
+            session_id=sample_alert_session.session_id,
+            server_name="kubernetes-server",
+            communication_type="tool_call",
+            tool_name="kubectl_get",
+            tool_arguments={"resource": "pods"},
+            tool_result={"output": "pod " * 1000},
+            timestamp_us=base_us + 1,
+            step_description="Get pods",
+            success=True,
+            stage_execution_id=stage_execution_id,
+        ))
+        repository.create_mcp_communication(MCPInteraction(
+            communication_id="mcp-2",
+            session_id=sample_alert_session.session_id,
+            server_name="slack-server",
+            communication_type="tool_call",
+            tool_name="post_message",
+            timestamp_us=base_us + 2,
+            step_description="Send notification",
+            success=True,
+            stage_execution_id=None,
+        ))
+        
+        timeline = repository.get_session_timeline(sample_alert_session.session_id)
+        
+        assert timeline is not None
+        assert timeline.total_interactions == 3
+        assert timeline.llm_interaction_count == 1
+        assert timeline.mcp_communication_count == 2
+        assert timeline.session_total_tokens == 120
+        assert [i.communication_id for i in timeline.session_level_interactions] == ["mcp-2"]
+        
+        stage = timeline.stages[0]
+        assert stage.stage_total_tokens == 120
+        assert [i.type for i in stage.interactions] == ["llm", "mcp"]
+        llm_summary, mcp_summary = stage.interactions
+        assert llm_summary.response_preview == "R" * TIMELINE_PREVIEW_CHARS + "…"
+        assert llm_summary.total_tokens == 120
+        assert llm_summary.cached_input_tokens == 64
+        assert mcp_summary.arguments_preview == '{"resource": "pods"}'
+        assert mcp_summary.result_preview.startswith('{"output": "pod pod')
+        assert len(mcp_summary.result_preview) == TIMELINE_PREVIEW_CHARS + 1
+        assert "stage_output" not in stage.model_dump()
     
+    @pytest.mark.unit
+    def test_get_interaction_events_by_id(self, repository, sample_alert_session):
+        """Test that single interactions load with their payloads, only within their session."""
+        repository.create_alert_session(sample_alert_session)
+        repository.create_llm_interaction(LLMInteraction(
+            interaction_id="llm-1",
+            session_id=sample_alert_session.session_id,
+            model_name="gpt-4",
+            conversation=LLMConversation(messages=[
+                LLMMessage(role=MessageRole.SYSTEM, content="You are a helpful assistant."),
+                LLMMessage(role=MessageRole.USER, content="Investigate"),
+            ]),
+        ))
+        repository.create_mcp_communication(MCPInteraction(
+            communication_id="mcp-1",
+            session_id=sample_alert_session.session_id,
+            server_name="kubernetes-server",
+            communication_type="tool_call",
+            tool_name="kubectl_get",
+            tool_arguments={"resource": "pods"},
+            tool_result={"output": "pod-1 Running"},
+            step_description="Get pods",
+            success=True,
+        ))
+        
+        llm_event = repository.get_llm_interaction_event(sample_alert_session.session_id, "llm-1")
+        mcp_event = repository.get_mcp_interaction_event(sample_alert_session.session_id, "mcp-1")
+        
+        assert [m.content for m in llm_event.details.conversation.messages] == [
+            "You are a helpful assistant.", "Investigate",
+        ]
+        assert mcp_event.details.tool_result == {"output": "pod-1 Running"}
+        assert repository.get_llm_interaction_event("other-session", "llm-1") is None
+        assert repository.get_mcp_interaction_event(sample_alert_session.session_id, "missing") is None
+
+    @pytest.mark.unit
+    def test_conversation_messages_stored_once_per_session(self, repository, db_session, sample_alert_session):
+        """Test that ReAct iterations only add new messages and conversations are rehydrated on read."""
+        from sqlmodel import select
+
+        from tarsy.models.unified_interactions import LLMConversationMessage
+
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        messages = [
+            LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE assistant."),
+            LLMMessage(role=MessageRole.USER, content="Investigate the alert."),
+        ]
+        for i in range(3):
+            messages = messages + [
+                LLMMessage(role=MessageRole.ASSISTANT, content=f"Thought: step {i}\nAction: get_pods"),
+                LLMMessage(role=MessageRole.USER, content="Observation: pods are running"),
+            ]
+            interaction = LLMInteraction(
+                interaction_id=f"llm-{i}",
+                session_id=session_id,
+                model_name="gpt-4",
+                timestamp_us=1_000_000 + i,
+                conversation=LLMConversation(messages=messages),
+            )
+            created = repository.create_llm_interaction(interaction)
+            assert created.conversation.messages == messages
+            assert interaction.message_hashes is None  # Caller's instance is left unchanged
+        # Rows written before messages were stored by hash keep their conversation inline
+        repository.create_llm_interaction(LLMInteraction(
+            interaction_id="llm-legacy", session_id=session_id, model_name="gpt-4", timestamp_us=1_000_003,
+        ))
+        legacy = db_session.get(LLMInteraction, "llm-legacy")
+        legacy.conversation = LLMConversation(messages=messages[:2])
+        db_session.commit()
+        db_session.expunge_all()
+
+        stored = db_session.exec(select(LLMConversationMessage)).all()
+        assert len(stored) == 6  # system, user, 3 thoughts and the repeated observation once
+        assert len(db_session.get(LLMInteraction, "llm-2").message_hashes) == 8
+        db_session.expunge_all()
+
+        interactions = repository.get_llm_interactions_for_session(session_id)
+        assert [len(i.conversation.messages) for i in interactions] == [4, 6, 8, 2]
+        assert interactions[2].conversation.messages == messages
+        assert interactions[0].conversation.messages[0] is not interactions[1].conversation.messages[0]
+        assert not db_session.dirty  # Rehydrated conversations are never written back
+
+        last = repository.get_last_llm_interaction_with_conversation(session_id, prefer_final_analysis=False)
+        assert last.interaction_id == "llm-legacy"
+
+        details = repository.get_session_details(session_id)
+        events = [event.details for event in details.session_level_interactions if event.type == "llm"]
+        assert [len(e.conversation.messages) for e in events] == [4, 6, 8, 2]
+        assert "message_hashes" not in details.model_dump(mode="json")["session_level_interactions"][0]["details"]
+
+    @pytest.mark.unit
+    def test_session_stats_maintained_on_writes(self, repository, sample_alert_session):
+        """Test that interaction, chat and stage writes keep the session list rollup current."""
+        from tarsy.models.constants import ParallelType, StageStatus
+        from tarsy.models.db_models import Chat, ChatUserMessage
+
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        repository.create_alert_session(AlertSession(
+            session_id="session-without-tokens", alert_data={}, agent_type="KubernetesAgent",
+            status="completed", started_at_us=sample_alert_session.started_at_us - 1, chain_id="test-chain-123",
+        ))
+
+        repository.create_llm_interaction(LLMInteraction(
+            session_id=session_id, model_name="gpt-4", input_tokens=100, output_tokens=20, total_tokens=120,
+        ))
+        repository.create_llm_interaction(LLMInteraction(session_id=session_id, model_name="gpt-4"))
+        repository.create_interactions(
+            [LLMInteraction(session_id=session_id, model_name="gpt-4", input_tokens=5, total_tokens=5)],
+            [MCPInteraction(
+                session_id=session_id, server_name="k8s", communication_type="tool_call", step_description="list pods",
+            )],
+            [session_id],
+        )
+        repository.create_mcp_communication(MCPInteraction(
+            session_id="session-without-tokens", server_name="k8s", communication_type="tool_call",
+            step_description="list pods",
+        ))
+        repository.create_chat(Chat(
+            chat_id="chat-1", session_id=session_id, created_by="user", conversation_history="",
+            chain_id="test-chain-123", context_captured_at_us=1,
+        ))
+        for i in range(2):
+            repository.create_chat_user_message(ChatUserMessage(chat_id="chat-1", content=f"q{i}", author="user"))
+        repository.create_stage_execution(StageExecution(
+            session_id=session_id, stage_id="s0", stage_index=0, stage_name="s0", agent="A",
+            status=StageStatus.COMPLETED.value, parallel_type=ParallelType.MULTI_AGENT.value,
+        ))
+
+        result = repository.get_alert_sessions(sort_by="session_total_tokens", sort_order="asc")
+
+        assert [s.session_id for s in result.sessions] == [session_id, "session-without-tokens"]
+        overview, without_tokens = result.sessions
+        assert (overview.llm_interaction_count, overview.mcp_communication_count) == (3, 1)
+        assert (overview.session_input_tokens, overview.session_output_tokens) == (105, 20)
+        assert overview.session_total_tokens == 125
+        assert overview.chat_message_count == 2
+        assert overview.has_parallel_stages is True
+        assert (without_tokens.llm_interaction_count, without_tokens.mcp_communication_count) == (0, 1)
+        assert without_tokens.session_total_tokens is None
+        assert without_tokens.chat_message_count is None
+        assert without_tokens.has_parallel_stages is False
+        assert repository.verify_session_stats() == []
+
+    @pytest.mark.unit
+    def test_verify_session_stats_repairs_drift(self, repository, db_session, sample_alert_session):
+        """Test that rows written without the rollup are detected and repaired."""
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        repository.create_llm_interaction(LLMInteraction(session_id=session_id, model_name="gpt-4", total_tokens=10))
+        # Written by a pod that does not maintain the rollup yet
+        db_session.add(LLMInteraction(session_id=session_id, model_name="gpt-4", total_tokens=7))
+        db_session.commit()
+
+        assert repository.verify_session_stats(repair=False) == [session_id]
+        assert repository.get_alert_sessions().sessions[0].session_total_tokens == 10
+
+        assert repository.verify_session_stats(started_since_us=sample_alert_session.started_at_us) == [session_id]
+        overview = repository.get_alert_sessions().sessions[0]
+        assert (overview.llm_interaction_count, overview.session_total_tokens) == (2, 17)
+        assert repository.verify_session_stats() == []
+
+    @pytest.mark.unit
+    def test_verify_session_stats_keeps_concurrent_writes(self, repository, db_session, sample_alert_session):
+        """Test that a write committed while checking a session is neither lost nor reported as drift."""
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        repository.create_llm_interaction(LLMInteraction(session_id=session_id, model_name="gpt-4", total_tokens=10))
+        find_drift = repository._find_session_stats_drift
+
+        def write_after_first_check(session_ids, lock=False):
+            drift = find_drift(session_ids, lock=lock)
+            if not lock:
+                # Another writer commits an interaction (with its rollup increment) mid-check
+                repository.create_llm_interaction(
+                    LLMInteraction(session_id=session_id, model_name="gpt-4", total_tokens=5)
+                )
+            return drift
+
+        # Written by a pod that does not maintain the rollup yet
+        db_session.add(LLMInteraction(session_id=session_id, model_name="gpt-4", total_tokens=7))
+        db_session.commit()
+        with patch.object(repository, "_find_session_stats_drift", side_effect=write_after_first_check):
+            assert repository.verify_session_stats() == [session_id]
+
+        overview = repository.get_alert_sessions().sessions[0]
+        assert (overview.llm_interaction_count, overview.session_total_tokens) == (3, 22)
+        assert repository.verify_session_stats() == []
+
+    @pytest.mark.unit
+    def test_tool_lists_stored_once_per_catalog(self, repository, db_session, sample_alert_session):
+        """Test that repeated tool lists share one catalog row and are hydrated in session details."""
+        from sqlmodel import select
+
+        from tarsy.models.unified_interactions import MCPToolCatalog
+
+        repository.create_alert_session(sample_alert_session)
+        tools = [{"name": "get_pods", "description": "List pods", "inputSchema": {"type": "object"}}]
+        for i in range(2):
+            repository.create_mcp_communication(MCPInteraction(
+                communication_id=f"mcp-list-{i}",
+                session_id=sample_alert_session.session_id,
+                server_name="kubernetes-server",
+                communication_type="tool_list",
+                timestamp_us=1_000_000 + i,
+                step_description="Discover available tools from kubernetes-server",
+                available_tools={"kubernetes-server": list(reversed(tools)) if i else tools},
+            ))
+        # Rows written before catalogs existed keep their tool lists inline
+        repository.create_mcp_communication(MCPInteraction(
+            communication_id="mcp-list-legacy",
+            session_id=sample_alert_session.session_id,
+            server_name="kubernetes-server",
+            communication_type="tool_list",
+            timestamp_us=1_000_002,
+            step_description="Discover available tools from kubernetes-server",
+        ))
+        legacy = db_session.get(MCPInteraction, "mcp-list-legacy")
+        legacy.available_tools = {"kubernetes-server": tools}
+        db_session.commit()
+
+        catalogs = db_session.exec(select(MCPToolCatalog)).all()
+        assert len(catalogs) == 1
+        assert catalogs[0].tools == tools
+        stored = db_session.get(MCPInteraction, "mcp-list-0")
+        assert stored.available_tools is None
+        assert stored.tool_catalog_hashes == {"kubernetes-server": catalogs[0].catalog_hash}
+
+        result = repository.get_session_details(sample_alert_session.session_id)
+
+        assert [
+            event.details.available_tools for event in result.session_level_interactions
+        ] == [{"kubernetes-server": tools}] * 3
+
+    @pytest.mark.unit
+    def test_tool_list_rewritten_after_rollback(self, repository, db_session, sample_alert_session):
+        """Test that a rolled-back write leaves the tool list on the caller's instance for the retry."""
+        from sqlmodel import select
+
+        from tarsy.models.unified_interactions import MCPToolCatalog
+
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        tools = {"kubernetes-server": [{"name": "get_pods", "description": "List pods"}]}
+        tool_list = MCPInteraction(
+            communication_id="mcp-list", session_id=session_id, server_name="kubernetes-server",
+            communication_type="tool_list", timestamp_us=1_000_000,
+            step_description="Discover available tools", available_tools=tools,
+        )
+        poisoned = MCPInteraction(
+            communication_id="mcp-call", session_id=session_id, server_name="kubernetes-server",
+            communication_type="tool_call", tool_name="get_pods", timestamp_us=1_000_001,
+            step_description="Get pods", tool_result={"pods": object()},  # Not JSON serializable
+        )
+
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            repository.create_interactions([], [tool_list, poisoned], [session_id])
+        assert tool_list.available_tools == tools
+        assert tool_list.tool_catalog_hashes is None
+        assert db_session.exec(select(MCPToolCatalog)).all() == []
+
+        repository.create_interactions([], [tool_list], [session_id])
+        db_session.expunge_all()
+
+        catalog = db_session.exec(select(MCPToolCatalog)).one()
+        stored = db_session.get(MCPInteraction, "mcp-list")
+        assert stored.tool_catalog_hashes == {"kubernetes-server": catalog.catalog_hash}
+        details = repository.get_session_details(session_id).session_level_interactions[0].details
+        assert details.available_tools == tools
+
+    @pytest.mark.unit
+    def test_large_payloads_stored_compressed(self, repository, db_session, sample_alert_session):
+        """Test that large tool results, tool lists and messages are compressed and read back transparently."""
+        import json
+
+        from sqlmodel import select
+
+        from tarsy.models.unified_interactions import (
+            LLMConversationMessage,
+            MCPToolCatalog,
+        )
+
+        repository.create_alert_session(sample_alert_session)
+        session_id = sample_alert_session.session_id
+        tool_result = {"output": "pod-1 Running\n" * 1000}
+        tools = [{"name": f"tool_{i}", "description": "Kubernetes tool " * 20} for i in range(20)]
+        observation = "Observation: pod-1 Running\n" * 1000
+        messages = [
+            LLMMessage(role=MessageRole.SYSTEM, content="You are an SRE assistant."),
+            LLMMessage(role=MessageRole.USER, content=observation),
+        ]
+
+        communication = MCPInteraction(
+            communication_id="mcp-call", session_id=session_id, server_name="kubernetes-server",
+            communication_type="tool_call", tool_name="kubectl_get", timestamp_us=1_000_000,
+            step_description="Get pods", tool_result=tool_result,
+        )
+        created = repository.create_mcp_communication(communication)
+        assert created.tool_result == tool_result
+        assert communication.tool_result == tool_result  # Caller's instance keeps its result
+        repository.create_interactions(
+            [LLMInteraction(
+                interaction_id="llm-1", session_id=session_id, model_name="gpt-4", timestamp_us=1_000_001,
+                conversation=LLMConversation(messages=messages),
+            )],
+            [MCPInteraction(
+                communication_id="mcp-list", session_id=session_id, server_name="kubernetes-server",
+                communication_type="tool_list", timestamp_us=1_000_002,
+                step_description="Discover available tools", available_tools={"kubernetes-server": tools},
+            )],
+            [session_id],
+        )
+        db_session.expunge_all()
+
+        stored_call = db_session.get(MCPInteraction, "mcp-call")
+        assert stored_call.tool_result is None
+        assert len(stored_call.tool_result_compressed) < 1000
+        assert db_session.exec(select(MCPToolCatalog)).one().tools_compressed is not None
+        stored_messages = {m.role: m for m in db_session.exec(select(LLMConversationMessage)).all()}
+        assert stored_messages["system"].content_compressed is None
+        assert stored_messages["user"].content == ""
+        db_session.expunge_all()
+
+        interactions = repository.get_llm_interactions_for_session(session_id)
+        assert interactions[0].conversation.messages == messages
+        result = repository.get_session_details(session_id)
+        details = {event.id: event.details for event in result.session_level_interactions}
+        assert details["mcp-call"].tool_result == tool_result
+        assert details["mcp-list"].available_tools == {"kubernetes-server": tools}
+        event = repository.get_mcp_interaction_event(session_id, "mcp-call")
+        assert event.details.tool_result == tool_result
+        assert not db_session.dirty  # Decompressed payloads are never written back
+
+        summaries = {
+            getattr(summary, "communication_id", None) or summary.interaction_id: summary
+            for summary in repository.get_session_timeline(session_id).session_level_interactions
+        }
+        assert summaries["mcp-call"].result_preview == json.dumps(tool_result)[:200] + "…"
+        assert summaries["llm-1"].response_preview == observation[:200] + "…"
+
     @pytest.mark.unit
     def test_get_alert_sessions_with_mcp_selection(self, repository):
         """Test that get_alert_sessions includes mcp_selection in SessionOverview."""
@@ -1854,6 +2465,31 @@ class TestHistoryRepository:
         with pytest.raises(ValueError, match="Stage execution with id non-existent-id not found"):
             repository.update_stage_execution(stage_execution)
 
+    @pytest.mark.unit
+    def test_delete_sessions_older_than_deletes_in_batches(self, repository, sample_alert_session):
+        """Test expired sessions are deleted in batches and newer sessions are kept."""
+        for i in range(3):
+            repository.create_alert_session(AlertSession(
+                session_id=f"old-{i}",
+                alert_data={"alert_type": "NamespaceTerminating"},
+                agent_type="KubernetesAgent",
+                alert_type="NamespaceTerminating",
+                status="completed",
+                started_at_us=1000 + i,
+                chain_id="test-chain-123"
+            ))
+        repository.create_alert_session(sample_alert_session)
+
+        assert repository.delete_sessions_older_than(5000, batch_size=1) == 3
+        assert repository.get_alert_session("test-session-123") is not None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_delete_sessions_older_than_rejects_empty_batches(self, repository, batch_size):
+        """Test a batch size below 1 is rejected instead of looping forever or deleting without a limit."""
+        with pytest.raises(ValueError, match="batch_size must be >= 1"):
+            repository.delete_sessions_older_than(5000, batch_size=batch_size)
+
 
 class TestHistoryRepositoryErrorHandling:
     """Test suite for HistoryRepository error handling scenarios."""
@@ -2417,7 +3053,7 @@ class TestHistoryRepositoryChatMessageCount:
             chain_id="k8s-chain",
             context_captured_at_us=now_us()
         )
-        repository.session.add(chat)
+        repository.create_chat(chat)
         repository.session.commit()
         
         # Create chat messages
@@ -2429,7 +3065,7 @@ class TestHistoryRepositoryChatMessageCount:
                 author="test-user",
                 created_at_us=now_us() + (i * 1000)
             )
-            repository.session.add(msg)
+            repository.create_chat_user_message(msg)
         repository.session.commit()
         
         # Test get_alert_sessions
@@ -2497,7 +3133,7 @@ class TestHistoryRepositoryChatMessageCount:
             chain_id="k8s-chain",
             context_captured_at_us=now_us()
         )
-        repository.session.add(chat1)
+        repository.create_chat(chat1)
         
         for i in range(5):
             msg = ChatUserMessage(
@@ -2507,7 +3143,7 @@ class TestHistoryRepositoryChatMessageCount:
                 author="user1",
                 created_at_us=now_us() + (i * 1000)
             )
-            repository.session.add(msg)
+            repository.create_chat_user_message(msg)
         
         # Create second session without chat
         session2 = AlertSession(
@@ -2544,7 +3180,7 @@ class TestHistoryRepositoryChatMessageCount:
             chain_id="db-chain",
             context_captured_at_us=now_us()
         )
-        repository.session.add(chat3)
+        repository.create_chat(chat3)
         
         for i in range(2):
             msg = ChatUserMessage(
@@ -2554,7 +3190,7 @@ class TestHistoryRepositoryChatMessageCount:
                 author="user2",
                 created_at_us=now_us() + (i * 1000)
             )
-            repository.session.add(msg)
+            repository.create_chat_user_message(msg)
         
         repository.session.commit()
         
@@ -2601,7 +3237,7 @@ class TestHistoryRepositoryChatMessageCount:
             chain_id="k8s-chain",
             context_captured_at_us=now_us()
         )
-        repository.session.add(chat)
+        repository.create_chat(chat)
         repository.session.commit()
         
         # Test get_alert_sessions
@@ -2643,7 +3279,7 @@ class TestHistoryRepositoryChatMessageCount:
             chain_id="k8s-chain",
             context_captured_at_us=now_us()
         )
-        repository.session.add(chat)
+        repository.create_chat(chat)
         
         # Create chat messages
         for i in range(7):
@@ -2654,7 +3290,7 @@ class TestHistoryRepositoryChatMessageCount:
                 author="test-user",
                 created_at_us=now_us() + (i * 1000)
             )
-            repository.session.add(msg)
+            repository.create_chat_user_message(msg)
         repository.session.commit()
         
         # Test get_session_overview
@@ -2,11 +2,16 @@
 Unit tests for HistoryRepository queue methods
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, SQLModel, create_engine, select
 
-from tarsy.models.constants import AlertSessionStatus
-from tarsy.models.db_models import AlertSession
+from tarsy.models.agent_config import AlertTypeQueueConfig, QueueConfig
+from tarsy.models.constants import AlertPriority, AlertSessionStatus
+from tarsy.models.db_models import AlertSession, PodHeartbeat, SessionLease
 from tarsy.repositories.history_repository import HistoryRepository
 from tarsy.utils.timestamp import now_us
 
@@ -22,12 +27,17 @@ def history_repository(test_database_session: Session):
 @pytest.fixture
 def create_pending_session(test_database_session: Session):
     """Helper to create a pending session."""
-    def _create(session_id: str, alert_type: str = "test-alert") -> AlertSession:
+    def _create(
+        session_id: str,
+        alert_type: str = "test-alert",
+        priority: int = AlertPriority.NORMAL.value
+    ) -> AlertSession:
         session = AlertSession(
             session_id=session_id,
             alert_type=alert_type,
             agent_type="test-agent",
             status=AlertSessionStatus.PENDING.value,
+            priority=priority,
             started_at_us=now_us(),
             alert_data={"test": "data"},
             chain_id="test-chain-1"
@@ -231,3 +241,394 @@ def test_claim_next_pending_session_dialect_specific(
     assert claimed is not None
     assert claimed.session_id == "session-1"
     assert claimed.pod_id == "pod-1"
+
+
+def test_claim_pending_sessions_batch_fifo(
+    history_repository: HistoryRepository,
+    create_pending_session,
+    create_in_progress_session
+):
+    """Test batch claiming returns up to `limit` oldest pending sessions."""
+    import time
+    
+    create_in_progress_session("session-0")
+    for i in range(1, 5):
+        create_pending_session(f"session-{i}")
+        time.sleep(0.01)
+    
+    claimed = history_repository.claim_pending_sessions("pod-1", limit=3)
+    
+    assert [s.session_id for s in claimed] == ["session-1", "session-2", "session-3"]
+    assert all(s.status == AlertSessionStatus.IN_PROGRESS.value for s in claimed)
+    assert all(s.pod_id == "pod-1" for s in claimed)
+    assert all(s.last_interaction_at is not None for s in claimed)
+    
+    # Remainder is left for the next claim
+    assert history_repository.count_pending_sessions() == 1
+    remaining = history_repository.claim_pending_sessions("pod-2", limit=3)
+    assert [s.session_id for s in remaining] == ["session-4"]
+
+
+def test_claim_pending_sessions_skips_candidates_no_longer_pending(
+    history_repository: HistoryRepository,
+    create_pending_session,
+    create_in_progress_session
+):
+    """Test a candidate another pod claimed after the candidate snapshot is not claimed again."""
+    create_in_progress_session("session-1", pod_id="pod-2")
+    create_pending_session("session-2")
+    
+    # Stale candidate set: still lists session-1 as if it were PENDING
+    with patch.object(
+        history_repository, "_fair_share_candidates", return_value=select(AlertSession.session_id)
+    ):
+        claimed = history_repository.claim_pending_sessions("pod-1", limit=2)
+    
+    assert [s.session_id for s in claimed] == ["session-2"]
+    session = history_repository.get_alert_session("session-1")
+    assert session.pod_id == "pod-2"
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_claim_pending_sessions_non_positive_limit(
+    history_repository: HistoryRepository,
+    create_pending_session,
+    limit
+):
+    """Test batch claiming with no free capacity claims nothing."""
+    create_pending_session("session-1")
+    
+    assert history_repository.claim_pending_sessions("pod-1", limit=limit) == []
+    assert history_repository.count_pending_sessions() == 1
+
+
+def test_claim_pending_sessions_records_leases_and_caps_by_global_limit(
+    history_repository: HistoryRepository,
+    test_database_session: Session,
+    create_pending_session
+):
+    """Test capacity-capped claims record a lease per session and stop at the global limit."""
+    for i in range(1, 5):
+        create_pending_session(f"session-{i}")
+    
+    first = history_repository.claim_pending_sessions("pod-1", limit=2, max_active_sessions=3)
+    assert len(first) == 2
+    assert history_repository.count_active_leases() == 2
+    
+    # Another pod asks for more than the global limit allows
+    second = history_repository.claim_pending_sessions("pod-2", limit=5, max_active_sessions=3)
+    assert len(second) == 1
+    assert history_repository.count_active_leases() == 3
+    assert history_repository.count_leases_by_pod() == {"pod-1": 2, "pod-2": 1}
+    
+    # At global capacity nothing more is claimed
+    assert history_repository.claim_pending_sessions("pod-2", limit=5, max_active_sessions=3) == []
+    assert history_repository.count_pending_sessions() == 1
+    
+    # Lease is kept while the session is still IN_PROGRESS
+    assert history_repository.release_session_lease(first[0].session_id) is False
+    
+    # Releasing the lease of a finished session frees a slot
+    finished = first[0]
+    finished.status = AlertSessionStatus.COMPLETED.value
+    test_database_session.add(finished)
+    test_database_session.commit()
+    assert history_repository.release_session_lease(finished.session_id) is True
+    assert history_repository.release_session_lease(finished.session_id) is False
+    third = history_repository.claim_pending_sessions("pod-1", limit=5, max_active_sessions=3)
+    assert [s.session_id for s in third] == ["session-4"]
+
+
+def test_pod_heartbeats_track_live_pods(
+    history_repository: HistoryRepository,
+    test_database_session: Session
+):
+    """Test heartbeats list live pods and forget pods that stopped refreshing."""
+    test_database_session.add(PodHeartbeat(pod_id="pod-stale", last_seen_at_us=now_us() - 60_000_000))
+    test_database_session.add(PodHeartbeat(pod_id="pod-2", last_seen_at_us=now_us()))
+    test_database_session.commit()
+    
+    live = history_repository.record_pod_heartbeat("pod-1", live_since_us=now_us() - 30_000_000)
+    assert sorted(live) == ["pod-1", "pod-2"]
+    
+    # Refreshing again keeps a single row per pod
+    live = history_repository.record_pod_heartbeat("pod-1", live_since_us=now_us() - 30_000_000)
+    assert sorted(live) == ["pod-1", "pod-2"]
+    
+    assert history_repository.delete_pod_heartbeat("pod-2") is True
+    assert history_repository.delete_pod_heartbeat("pod-2") is False
+    assert history_repository.record_pod_heartbeat("pod-1", live_since_us=now_us() - 30_000_000) == ["pod-1"]
+
+
+def test_reconcile_session_leases(
+    history_repository: HistoryRepository,
+    test_database_session: Session,
+    create_pending_session,
+    create_in_progress_session
+):
+    """Test reconciliation drops stale leases and adds missing ones for IN_PROGRESS sessions."""
+    create_pending_session("session-1")
+    create_pending_session("session-2")
+    claimed = history_repository.claim_pending_sessions("pod-1", limit=2, max_active_sessions=5)
+    assert history_repository.count_active_leases() == 2
+    
+    # Session finished but its pod crashed before releasing the lease
+    finished = claimed[0]
+    finished.status = AlertSessionStatus.COMPLETED.value
+    test_database_session.add(finished)
+    test_database_session.commit()
+    
+    # Session started outside the claim path has no lease
+    create_in_progress_session("session-3", pod_id="pod-2")
+    
+    removed, added = history_repository.reconcile_session_leases()
+    
+    assert (removed, added) == (1, 1)
+    leases = test_database_session.exec(select(SessionLease)).all()
+    assert {lease.session_id: lease.pod_id for lease in leases} == {
+        claimed[1].session_id: "pod-1",
+        "session-3": "pod-2",
+    }
+    
+    # Already consistent
+    assert history_repository.reconcile_session_leases() == (0, 0)
+
+
+def test_claim_pending_sessions_by_priority(
+    history_repository: HistoryRepository,
+    create_pending_session
+):
+    """Test higher-priority sessions are claimed before older lower-priority ones."""
+    import time
+    
+    create_pending_session("low", priority=AlertPriority.LOW.value)
+    time.sleep(0.01)
+    create_pending_session("normal")
+    time.sleep(0.01)
+    create_pending_session("critical", priority=AlertPriority.CRITICAL.value)
+    
+    claimed = history_repository.claim_pending_sessions("pod-1", limit=3)
+    
+    assert [s.session_id for s in claimed] == ["critical", "normal", "low"]
+    assert history_repository.claim_next_pending_session("pod-1") is None
+
+
+def test_claim_pending_sessions_fair_share_across_alert_types(
+    history_repository: HistoryRepository,
+    create_pending_session
+):
+    """Test a storm of one alert type does not starve alert types queued later."""
+    import time
+    
+    for i in range(1, 6):
+        create_pending_session(f"noisy-{i}", alert_type="noisy")
+        time.sleep(0.01)
+    create_pending_session("quiet-1", alert_type="quiet")
+    
+    claimed = history_repository.claim_pending_sessions("pod-1", limit=2, max_active_sessions=10)
+    assert {s.session_id for s in claimed} == {"noisy-1", "quiet-1"}
+    
+    # Running sessions count towards the type's share
+    claimed = history_repository.claim_pending_sessions("pod-1", limit=2, max_active_sessions=10)
+    assert [s.session_id for s in claimed] == ["noisy-2", "noisy-3"]
+
+
+def test_claim_pending_sessions_weighted_fair_share(
+    history_repository: HistoryRepository,
+    create_pending_session
+):
+    """Test alert types receive free slots proportionally to their weight."""
+    import time
+    
+    for i in range(1, 5):
+        create_pending_session(f"a-{i}", alert_type="type-a")
+        time.sleep(0.01)
+    for i in range(1, 5):
+        create_pending_session(f"b-{i}", alert_type="type-b")
+        time.sleep(0.01)
+    queue_config = QueueConfig(alert_types={"type-b": AlertTypeQueueConfig(weight=3.0)})
+    
+    claimed = history_repository.claim_pending_sessions("pod-1", limit=4, queue_config=queue_config)
+    
+    assert sorted(s.session_id for s in claimed) == ["a-1", "b-1", "b-2", "b-3"]
+
+
+def test_claim_pending_sessions_respects_alert_type_cap(
+    history_repository: HistoryRepository,
+    create_pending_session
+):
+    """Test per-alert-type max_concurrent caps across claims, counting running sessions."""
+    for i in range(1, 4):
+        create_pending_session(f"capped-{i}", alert_type="capped")
+    create_pending_session("other-1", alert_type="other")
+    queue_config = QueueConfig(alert_types={"capped": AlertTypeQueueConfig(max_concurrent=1)})
+    
+    claimed = history_repository.claim_pending_sessions(
+        "pod-1", limit=5, max_active_sessions=10, queue_config=queue_config
+    )
+    assert sorted(s.session_id for s in claimed) == ["capped-1", "other-1"]
+    leases = history_repository.session.exec(select(SessionLease)).all()
+    assert {lease.session_id: lease.alert_type for lease in leases} == {
+        "capped-1": "capped",
+        "other-1": "other",
+    }
+    
+    # Type stays at its cap while its session holds a lease
+    assert history_repository.claim_pending_sessions(
+        "pod-2", limit=5, max_active_sessions=10, queue_config=queue_config
+    ) == []
+    assert history_repository.count_pending_sessions() == 2
+
+
+@pytest.fixture
+def create_fingerprinted_session(test_database_session: Session):
+    """Helper to create a session carrying a dedup fingerprint."""
+    def _create(
+        session_id: str,
+        status: str,
+        fingerprint: str = "fp-1",
+        completed_at_us: int = None
+    ) -> AlertSession:
+        session = AlertSession(
+            session_id=session_id,
+            alert_type="test-alert",
+            agent_type="test-agent",
+            status=status,
+            started_at_us=now_us(),
+            completed_at_us=completed_at_us,
+            alert_data={"test": "data"},
+            chain_id="test-chain-1",
+            alert_fingerprint=fingerprint
+        )
+        test_database_session.add(session)
+        test_database_session.commit()
+        test_database_session.refresh(session)
+        return session
+    return _create
+
+
+@pytest.mark.parametrize("status", [
+    AlertSessionStatus.PENDING.value,
+    AlertSessionStatus.IN_PROGRESS.value,
+    AlertSessionStatus.PAUSED.value,
+])
+def test_attach_duplicate_alert_to_in_flight_session(
+    history_repository: HistoryRepository,
+    create_fingerprinted_session,
+    status: str
+):
+    """Test duplicates attach to queued, running and paused sessions."""
+    create_fingerprinted_session("session-1", status)
+    
+    assert history_repository.attach_duplicate_alert("fp-1", completed_since_us=now_us()) == "session-1"
+    assert history_repository.attach_duplicate_alert("fp-1", completed_since_us=now_us()) == "session-1"
+    
+    session = history_repository.get_alert_session("session-1")
+    history_repository.session.refresh(session)
+    assert session.duplicate_count == 2
+
+
+def test_attach_duplicate_alert_completed_window(
+    history_repository: HistoryRepository,
+    create_fingerprinted_session
+):
+    """Test completed sessions absorb duplicates only within the window."""
+    completed_at = now_us()
+    create_fingerprinted_session("session-1", AlertSessionStatus.COMPLETED.value, completed_at_us=completed_at)
+    
+    assert history_repository.attach_duplicate_alert("fp-1", completed_since_us=completed_at) == "session-1"
+    assert history_repository.attach_duplicate_alert("fp-1", completed_since_us=completed_at + 1) is None
+
+
+@pytest.mark.parametrize("status", [
+    AlertSessionStatus.FAILED.value,
+    AlertSessionStatus.CANCELLED.value,
+    AlertSessionStatus.TIMED_OUT.value,
+])
+def test_attach_duplicate_alert_ignores_unsuccessful_sessions(
+    history_repository: HistoryRepository,
+    create_fingerprinted_session,
+    status: str
+):
+    """Test failed, cancelled and timed-out sessions never absorb duplicates."""
+    create_fingerprinted_session("session-1", status, completed_at_us=now_us())
+    
+    assert history_repository.attach_duplicate_alert("fp-1", completed_since_us=0) is None
+
+
+def test_attach_duplicate_alert_matches_fingerprint_only(
+    history_repository: HistoryRepository,
+    create_fingerprinted_session
+):
+    """Test sessions with another fingerprint are left alone."""
+    create_fingerprinted_session("session-1", AlertSessionStatus.PENDING.value, fingerprint="fp-other")
+    
+    assert history_repository.attach_duplicate_alert("fp-1", completed_since_us=0) is None
+    assert history_repository.get_alert_session("session-1").duplicate_count == 0
+
+
+def _fingerprinted_alert_session(session_id: str, fingerprint: str = "fp-1") -> AlertSession:
+    return AlertSession(
+        session_id=session_id,
+        alert_type="test-alert",
+        agent_type="test-agent",
+        status=AlertSessionStatus.PENDING.value,
+        alert_data={"test": "data"},
+        chain_id="test-chain-1",
+        alert_fingerprint=fingerprint
+    )
+
+
+def test_create_alert_session_unless_duplicate(
+    history_repository: HistoryRepository
+):
+    """Test a fingerprinted session is created once and re-fires are attached to it."""
+    created = history_repository.create_alert_session_unless_duplicate(
+        _fingerprinted_alert_session("session-1"), completed_since_us=now_us()
+    )
+    attached = history_repository.create_alert_session_unless_duplicate(
+        _fingerprinted_alert_session("session-2"), completed_since_us=now_us()
+    )
+    
+    assert (created, attached) == ("session-1", "session-1")
+    assert history_repository.get_alert_session("session-2") is None
+    session = history_repository.get_alert_session("session-1")
+    history_repository.session.refresh(session)
+    assert session.duplicate_count == 1
+
+
+def test_create_alert_session_unless_duplicate_concurrent_refires(tmp_path):
+    """Test concurrent re-fires that all miss the duplicate lookup still start one session."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'dedup.db'}")
+    SQLModel.metadata.create_all(engine)
+    refires = 5
+    lookups_done = threading.Barrier(refires)
+    
+    def submit(n: int) -> str:
+        with Session(engine) as session:
+            repository = HistoryRepository(session)
+            attach = repository._attach_duplicate_alert
+            first_lookup = [True]
+            
+            def attach_after_all_lookups(*args):
+                session_id = attach(*args)
+                if first_lookup:
+                    # Every re-fire has found no session before any of them inserts
+                    first_lookup.clear()
+                    lookups_done.wait(timeout=10)
+                return session_id
+            
+            repository._attach_duplicate_alert = attach_after_all_lookups
+            return repository.create_alert_session_unless_duplicate(
+                _fingerprinted_alert_session(f"session-{n}"), completed_since_us=now_us()
+            )
+    
+    with ThreadPoolExecutor(max_workers=refires) as pool:
+        results = list(pool.map(submit, range(refires)))
+    
+    with Session(engine) as session:
+        sessions = session.exec(select(AlertSession)).all()
+    assert len(sessions) == 1
+    assert set(results) == {sessions[0].session_id}
+    assert sessions[0].duplicate_count == refires - 1
+    engine.dispose()
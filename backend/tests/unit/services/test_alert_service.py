@@ -79,9 +79,10 @@ class TestAlertServiceInitialization:
             # Verify RunbookService created with settings and None for http_client
             mock_runbook.assert_called_once_with(mock_settings, None)
             
-            # Verify health check MCP client created with settings and registry
+            # Verify health check MCP client created with settings, registry and shared tool catalog
             mock_mcp_client.assert_called_once_with(
-                mock_settings, mock_mcp_registry.return_value
+                mock_settings, mock_mcp_registry.return_value,
+                tool_catalog=mock_mcp_factory.return_value.tool_catalog
             )
             
             # Verify MCP client factory created with settings and registry
@@ -105,6 +106,8 @@ class TestAlertServiceAsyncInitialization:
         mock_settings.llm_provider = "test-provider"  # Add configured provider
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'), \
              patch('tarsy.services.alert_service.get_history_service'), \
@@ -640,6 +643,8 @@ class TestHistorySessionManagement:
         mock_settings.agent_config_path = None  # No agent config for unit tests
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'), \
              patch('tarsy.services.alert_service.get_history_service') as mock_history, \
@@ -841,6 +846,8 @@ class TestCleanup:
         mock_settings.agent_config_path = None  # No agent config for unit tests
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService') as mock_runbook, \
              patch('tarsy.services.alert_service.get_history_service'), \
@@ -927,6 +934,8 @@ class TestAlertServiceDuplicatePrevention:
         mock_settings.github_token = "test_token"
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         mock_settings.agent_config_path = None  # No agent config for unit tests
         
         service = AlertService(mock_settings)
@@ -984,6 +993,8 @@ class TestChainErrorAggregation:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'), \
              patch('tarsy.services.alert_service.get_history_service'), \
@@ -74,6 +74,8 @@ class TestCancelAgentValidation:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             service = AlertService(settings=mock_settings)
@@ -186,6 +188,8 @@ class TestCancelAgentStatusUpdate:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             service = AlertService(settings=mock_settings)
@@ -350,6 +354,8 @@ class TestCancelAgentPolicyEvaluation:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             service = AlertService(settings=mock_settings)
@@ -554,6 +560,8 @@ class TestCancelAgentMixedStatuses:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             service = AlertService(settings=mock_settings)
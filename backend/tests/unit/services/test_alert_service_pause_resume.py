@@ -56,6 +56,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         mock_settings.llm_iteration_timeout = 180  # Required for asyncio.wait_for
         
         # Create alert service
@@ -158,6 +160,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             alert_service = AlertService(settings=mock_settings)
@@ -182,6 +186,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             alert_service = AlertService(settings=mock_settings)
@@ -211,6 +217,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             alert_service = AlertService(settings=mock_settings)
@@ -271,6 +279,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         mock_settings.llm_iteration_timeout = 180  # Required for asyncio.wait_for
         
         with patch('tarsy.services.alert_service.RunbookService'):
@@ -348,6 +358,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             alert_service = AlertService(settings=mock_settings)
@@ -422,6 +434,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             alert_service = AlertService(settings=mock_settings)
@@ -469,6 +483,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('tarsy.services.alert_service.RunbookService'):
             alert_service = AlertService(settings=mock_settings)
@@ -512,6 +528,8 @@ class TestAlertServiceResumePausedSession:
         mock_settings.agent_config_path = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
             
         with patch('tarsy.services.alert_service.RunbookService'):
             alert_service = AlertService(settings=mock_settings)
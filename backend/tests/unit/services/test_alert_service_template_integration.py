@@ -141,6 +141,8 @@ class TestAlertServiceTemplateIntegration:
         mock_settings.get_template_default.return_value = None
         mock_settings.slack_bot_token = None
         mock_settings.slack_channel = None
+        mock_settings.mcp_session_pool_enabled = False
+        mock_settings.mcp_tool_catalog_ttl_seconds = 0
         
         # Mock other services
         with patch('tarsy.services.alert_service.RunbookService'), \
@@ -0,0 +1,206 @@
+"""
+Unit tests for EventBatchPublisher.
+
+Tests batching, ID ordering, NOTIFY grouping, backpressure and shutdown.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from tarsy.models.db_models import Event
+from tarsy.models.event_models import SessionCreatedEvent, SessionProgressUpdateEvent
+from tarsy.repositories.event_repository import EventRepository
+from tarsy.services.events.base import EVENT_REFERENCE_TYPE
+from tarsy.services.events.batch_publisher import (
+    NOTIFY_PAYLOAD_LIMIT,
+    EventBatchPublisher,
+    split_notify_payloads,
+)
+
+
+@pytest.fixture
+async def session_factory():
+    """In-memory SQLite database with the events table."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Event.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _stored_events(session_factory) -> list:
+    async with session_factory() as session:
+        return await EventRepository(session).get_events_after("sessions", after_id=0, limit=1000)
+
+
+def _progress(session_id: str, n: int) -> SessionProgressUpdateEvent:
+    return SessionProgressUpdateEvent(session_id=session_id, phase="investigating", metadata={"n": n})
+
+
+@pytest.mark.unit
+class TestEventBatchPublisher:
+    """Test queued, batched event persistence."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_written_in_one_batch_in_order(self, session_factory):
+        """Test that events submitted together share a batch and keep their order."""
+        publisher = EventBatchPublisher(session_factory, max_latency_ms=20)
+        await publisher.start()
+
+        for n in range(10):
+            await publisher.submit("sessions", _progress("s1", n))
+        await publisher.flush()
+
+        events = await _stored_events(session_factory)
+        assert [e.payload["metadata"]["n"] for e in events] == list(range(10))
+        assert [e.id for e in events] == sorted(e.id for e in events)
+        assert publisher.batches_written == 1
+        assert publisher.events_written == 10
+        await publisher.stop()
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_max_batch_size(self, session_factory):
+        """Test that large bursts are split into batches of at most max_batch_size."""
+        publisher = EventBatchPublisher(session_factory, max_latency_ms=0, max_batch_size=4)
+        await publisher.start()
+
+        for n in range(10):
+            await publisher.submit("sessions", _progress("s1", n))
+        await publisher.flush()
+
+        events = await _stored_events(session_factory)
+        assert [e.payload["metadata"]["n"] for e in events] == list(range(10))
+        assert publisher.batches_written >= 3
+        await publisher.stop()
+
+    @pytest.mark.asyncio
+    async def test_submit_waits_when_queue_is_full(self, session_factory):
+        """Test backpressure: submit() blocks until the flusher frees queue space."""
+        publisher = EventBatchPublisher(
+            session_factory, max_latency_ms=0, max_batch_size=1, max_pending=2
+        )
+        release = asyncio.Event()
+        write_batch = publisher._write_batch
+
+        async def slow_write(batch):
+            await release.wait()
+            await write_batch(batch)
+
+        publisher._write_batch = slow_write
+        await publisher.start()
+
+        for n in range(3):  # First one is taken by the flusher, two fill the queue
+            await publisher.submit("sessions", _progress("s1", n))
+            await asyncio.sleep(0)
+        blocked = asyncio.create_task(publisher.submit("sessions", _progress("s1", 3)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await publisher.flush()
+        assert len(await _stored_events(session_factory)) == 4
+        await publisher.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_dropped_and_flusher_continues(self, session_factory):
+        """Test that a database error drops one batch without stopping publishing."""
+        publisher = EventBatchPublisher(session_factory, max_latency_ms=0)
+        await publisher.start()
+
+        with patch.object(EventRepository, "create_events", side_effect=Exception("DB down")):
+            await publisher.submit("sessions", _progress("s1", 0))
+            await publisher.flush()
+        await publisher.submit("sessions", _progress("s1", 1))
+        await publisher.flush()
+
+        events = await _stored_events(session_factory)
+        assert [e.payload["metadata"]["n"] for e in events] == [1]
+        assert publisher.events_dropped == 1
+        await publisher.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_writes_queued_events_and_rejects_new_ones(self, session_factory):
+        """Test that stop() drains the queue and later submits raise."""
+        publisher = EventBatchPublisher(session_factory, max_latency_ms=50)
+        await publisher.start()
+        await publisher.submit("sessions", _progress("s1", 0))
+
+        await publisher.stop()
+
+        assert len(await _stored_events(session_factory)) == 1
+        with pytest.raises(RuntimeError, match="not running"):
+            await publisher.submit("sessions", _progress("s1", 1))
+
+    @pytest.mark.asyncio
+    async def test_postgresql_sends_one_notify_per_channel_per_batch(self):
+        """Test that a PostgreSQL batch NOTIFYs each channel once with its events in ID order."""
+        session = MagicMock()
+        session.bind.dialect.name = "postgresql"
+        session.execute = AsyncMock()
+        session.commit = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        publisher = EventBatchPublisher(session_factory)
+
+        created = SessionCreatedEvent(session_id="s1", alert_type="test").model_dump()
+        batch = [
+            ("sessions", created),
+            ("session:s1", created),
+            ("sessions", _progress("s1", 1).model_dump()),
+            ("session:s1", _progress("s1", 1).model_dump()),
+        ]
+        with patch.object(EventRepository, "create_events", AsyncMock(return_value=[11, 12, 13, 14])):
+            await publisher._write_batch(batch)
+
+        notify_sql = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert len(notify_sql) == 2
+        assert notify_sql[0].startswith('NOTIFY "sessions"')
+        assert notify_sql[1].startswith('NOTIFY "session:s1"')
+        payload = json.loads(notify_sql[0].split(", '", 1)[1].rsplit("'", 1)[0])
+        assert [e["id"] for e in payload] == [11, 13]
+        session.commit.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestSplitNotifyPayloads:
+    """Test NOTIFY payload packing."""
+
+    def test_single_event_is_sent_as_object(self):
+        """Test that a lone event keeps the single-event payload format."""
+        payloads, oversized = split_notify_payloads([{"type": "a", "id": 1}])
+
+        assert payloads == [json.dumps({"type": "a", "id": 1})]
+        assert oversized == 0
+
+    def test_events_are_split_to_fit_size_limit(self):
+        """Test that payloads stay under the NOTIFY limit and keep event order."""
+        events = [{"id": n, "data": "x" * 1000} for n in range(20)]
+
+        payloads, _ = split_notify_payloads(events)
+
+        assert len(payloads) > 1
+        assert all(len(p.encode()) < NOTIFY_PAYLOAD_LIMIT for p in payloads)
+        ids = []
+        for payload in payloads:
+            decoded = json.loads(payload)
+            ids.extend(e["id"] for e in (decoded if isinstance(decoded, list) else [decoded]))
+        assert ids == list(range(20))
+
+    def test_oversized_event_is_sent_as_reference(self):
+        """Test that an event too large for NOTIFY is replaced by a reference to its row."""
+        payloads, oversized = split_notify_payloads(
+            [{"id": 1, "data": "x" * NOTIFY_PAYLOAD_LIMIT}, {"id": 2}]
+        )
+
+        assert oversized == 1
+        assert len(payloads) == 1
+        assert json.loads(payloads[0]) == [{"type": EVENT_REFERENCE_TYPE, "id": 1}, {"id": 2}]
@@ -168,6 +168,31 @@ class TestEventCleanupServiceCleanup:
             # Verify commit
             mock_session.commit.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_cleanup_rotates_partitions_when_partitioned(self, service, mock_session):
+        """Test that a partitioned events table is cleaned up by dropping partitions."""
+        mock_session.connection.return_value = Mock(dialect=Mock())
+        mock_session.connection.return_value.dialect.name = "postgresql"
+
+        with patch('tarsy.services.events.cleanup.EventRepository') as mock_repo_class:
+            mock_repo = Mock(spec=EventRepository)
+            mock_repo.is_partitioned = AsyncMock(return_value=True)
+            mock_repo.create_event_partitions = AsyncMock(return_value=["events_p2025010112"])
+            mock_repo.drop_event_partitions_before = AsyncMock(return_value=["events_p2025010110"])
+            mock_repo.delete_default_partition_events_before = AsyncMock(return_value=0)
+            mock_repo.delete_events_before = AsyncMock()
+            mock_repo_class.return_value = mock_repo
+
+            await service._cleanup_old_events()
+
+            start, end = mock_repo.create_event_partitions.call_args[0]
+            assert end - start == timedelta(hours=24)
+            cutoff = mock_repo.drop_event_partitions_before.call_args[0][0]
+            assert abs((start - timedelta(hours=24) - cutoff).total_seconds()) < 1
+            mock_repo.delete_default_partition_events_before.assert_awaited_once_with(cutoff)
+            mock_repo.delete_events_before.assert_not_awaited()
+            mock_session.commit.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_cleanup_with_no_old_events(self, service, mock_session):
         """Test cleanup when no old events exist."""
@@ -8,8 +8,8 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from tarsy.services.events.channels import EventChannel
 from tarsy.models.constants import ProgressPhase
+from tarsy.services.events.channels import EventChannel
 from tarsy.services.events.event_helpers import (
     publish_agent_cancelled,
     publish_chat_cancel_request,
@@ -855,3 +855,25 @@ class TestPublishAgentCancelled:
                 agent_name="KubernetesAgent",
                 parent_stage_execution_id="parent-exec-789"
             )
+
+
+@pytest.mark.unit
+class TestBatchedPublishing:
+    """Test that helpers use the event system's batch publisher when it is running."""
+
+    @pytest.mark.asyncio
+    async def test_submits_to_batch_publisher_without_opening_a_session(self):
+        """Test that both channels are queued on the batch publisher in order."""
+        batch_publisher = Mock()
+        batch_publisher.submit = AsyncMock()
+
+        with patch("tarsy.services.events.event_helpers.get_event_batch_publisher", return_value=batch_publisher), \
+             patch("tarsy.services.events.event_helpers.get_async_session_factory") as mock_factory, \
+             patch("tarsy.services.events.event_helpers.publish_event", new_callable=AsyncMock) as mock_publish:
+            await publish_session_completed("test-session-123")
+
+        mock_factory.assert_not_called()
+        mock_publish.assert_not_called()
+        channels = [call.args[0] for call in batch_publisher.submit.await_args_list]
+        assert channels == [EventChannel.SESSIONS, "session:test-session-123"]
+        assert batch_publisher.submit.await_args.args[1].type == "session.completed"
@@ -175,6 +175,10 @@ class TestHistoryCleanupServiceCleanup:
 
             expected_cutoff = now_us() - (90 * 24 * 3600 * 1_000_000)
             assert abs(cutoff_arg - expected_cutoff) < 1_000_000  # Within 1 second
+            assert mock_repo.delete_sessions_older_than.call_args.kwargs == {
+                "batch_size": 500,
+                "batch_pause_seconds": 0.2,
+            }
 
     @pytest.mark.asyncio
     async def test_cleanup_respects_retention_period(self, service, mock_session):
@@ -245,6 +249,37 @@ class TestHistoryCleanupServiceCleanup:
             with pytest.raises(Exception, match="Unexpected error"):
                 await service._cleanup_old_history()
 
+    @pytest.mark.asyncio
+    async def test_verify_session_stats_checks_recent_sessions(self, service):
+        """Test that session stats of sessions started within two cleanup intervals are verified."""
+        with patch(
+            "tarsy.services.history_cleanup_service.HistoryRepository"
+        ) as mock_repo_class:
+            mock_repo = Mock()
+            mock_repo_class.return_value = mock_repo
+            mock_repo.verify_session_stats.return_value = ["session-1", "session-2"]
+
+            repaired = await service._verify_session_stats()
+
+            assert repaired == 2
+            from tarsy.utils.timestamp import now_us
+
+            since_us = mock_repo.verify_session_stats.call_args.kwargs["started_since_us"]
+            expected_since_us = now_us() - (24 * 3600 * 1_000_000)
+            assert abs(since_us - expected_since_us) < 1_000_000  # Within 1 second
+
+    @pytest.mark.asyncio
+    async def test_verify_session_stats_errors_are_not_raised(self, service):
+        """Test that a failing session stats check does not fail the cleanup loop."""
+        with patch(
+            "tarsy.services.history_cleanup_service.HistoryRepository"
+        ) as mock_repo_class:
+            mock_repo = Mock()
+            mock_repo_class.return_value = mock_repo
+            mock_repo.verify_session_stats.side_effect = Exception("Unexpected error")
+
+            assert await service._verify_session_stats() == 0
+
 
 @pytest.mark.unit
 class TestHistoryCleanupServiceLoopBehavior:
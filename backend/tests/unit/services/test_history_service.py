@@ -374,6 +374,31 @@ class TestHistoryService:
                 )
                 assert result is None
     
+    @pytest.mark.unit
+    def test_get_sessions_list_caches_approximate_counts(self, history_service):
+        """Test that approximate totals are counted once per filter combination within the cache window."""
+        history_service._infra.settings.history_session_count_cache_seconds = 30
+        repository = Mock()
+        repository.get_alert_sessions.return_value = MockFactory.create_mock_paginated_sessions(
+            sessions=MockFactory.create_mock_session_overviews(count=2),
+            total_items=120
+        )
+
+        with patch.object(history_service._infra, 'get_repository') as mock_get_repo:
+            mock_get_repo.return_value.__enter__.return_value = repository
+            mock_get_repo.return_value.__exit__.return_value = None
+
+            for _ in range(2):
+                history_service.get_sessions_list(filters={"status": ["completed"]}, count_mode="approximate")
+            history_service.get_sessions_list(filters={"status": ["failed"]}, count_mode="approximate")
+            history_service.get_sessions_list(filters={"status": ["completed"]})
+
+        known_totals = [
+            call.kwargs["known_total_items"] for call in repository.get_alert_sessions.call_args_list
+        ]
+        # Cached for the repeated filters only; exact requests always count
+        assert known_totals == [None, 120, None, None]
+
     @pytest.mark.unit
     def test_get_session_details_success(self, history_service):
         """Test successful session timeline retrieval."""
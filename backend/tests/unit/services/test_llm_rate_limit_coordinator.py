@@ -0,0 +1,108 @@
+"""Unit tests for LLMRateLimitCoordinator."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tarsy.integrations.llm.rate_limiter import ProviderRateLimiters
+from tarsy.services.llm_rate_limit_coordinator import LLMRateLimitCoordinator
+
+
+@pytest.mark.unit
+class TestLLMRateLimitCoordinator:
+    """Test suite for LLMRateLimitCoordinator."""
+
+    @pytest.fixture
+    def history_service(self) -> MagicMock:
+        service = MagicMock()
+        service.count_leases_by_pod_async = AsyncMock(return_value={})
+        service.record_pod_heartbeat_async = AsyncMock(return_value=["pod-1"])
+        service.delete_pod_heartbeat_async = AsyncMock(return_value=True)
+        return service
+
+    @pytest.fixture
+    def rate_limiters(self) -> ProviderRateLimiters:
+        limiters = ProviderRateLimiters()
+        limiters.get("openai-default", requests_per_minute=100, tokens_per_minute=100_000)
+        return limiters
+
+    @pytest.fixture
+    def coordinator(self, history_service, rate_limiters) -> LLMRateLimitCoordinator:
+        return LLMRateLimitCoordinator(history_service, "pod-1", interval_seconds=0.01, rate_limiters=rate_limiters)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "leases,expected_share",
+        [
+            ({}, 1.0),
+            ({"pod-1": 3}, 1.0),
+            ({"pod-1": 3, "pod-2": 1}, 0.75),
+            ({"pod-2": 4}, 0.2),
+        ],
+    )
+    async def test_share_follows_session_leases(
+        self, coordinator, history_service, rate_limiters, leases, expected_share
+    ):
+        """Each pod gets a share of the limits proportional to its sessions (at least one)."""
+        history_service.record_pod_heartbeat_async.return_value = sorted({"pod-1", *leases})
+        history_service.count_leases_by_pod_async.return_value = leases
+
+        assert await coordinator.refresh() == pytest.approx(expected_share)
+
+        stats = rate_limiters.get_stats()["openai-default"]
+        assert stats["share"] == pytest.approx(expected_share)
+        assert stats["requests_per_minute"] == int(100 * expected_share)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "live_pods,leases,expected_share",
+        [
+            (["pod-1", "pod-2", "pod-3"], {}, 1 / 3),
+            (["pod-1", "pod-2", "pod-3"], {"pod-2": 2}, 0.25),
+            (["pod-1", "pod-2"], {"pod-1": 3}, 0.75),
+        ],
+    )
+    async def test_idle_live_pods_count_as_one_session(
+        self, coordinator, history_service, live_pods, leases, expected_share
+    ):
+        """Pods without leases still use the budget, so the shares of all pods add up to 1."""
+        history_service.record_pod_heartbeat_async.return_value = live_pods
+        history_service.count_leases_by_pod_async.return_value = leases
+
+        assert await coordinator.refresh() == pytest.approx(expected_share)
+
+        pod_id, live_since_us = history_service.record_pod_heartbeat_async.await_args.args
+        assert pod_id == "pod-1"
+        assert live_since_us > 0
+
+    @pytest.mark.asyncio
+    async def test_leases_of_dead_pods_are_ignored(self, coordinator, history_service):
+        """Leases left by pods that stopped heartbeating do not shrink the live pods' shares."""
+        history_service.record_pod_heartbeat_async.return_value = ["pod-1", "pod-2"]
+        history_service.count_leases_by_pod_async.return_value = {"pod-1": 1, "pod-2": 1, "dead-pod": 6}
+
+        assert await coordinator.refresh() == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_stop_deletes_heartbeat(self, coordinator, history_service):
+        await coordinator.start()
+        await coordinator.stop()
+
+        history_service.delete_pod_heartbeat_async.assert_awaited_once_with("pod-1")
+
+    @pytest.mark.asyncio
+    async def test_loop_keeps_share_when_database_fails(self, coordinator, history_service):
+        history_service.record_pod_heartbeat_async.return_value = ["pod-1", "pod-2"]
+        history_service.count_leases_by_pod_async.side_effect = [
+            {"pod-1": 1, "pod-2": 1},
+            Exception("database unavailable"),
+            Exception("database unavailable"),
+        ]
+
+        await coordinator.start()
+        while history_service.count_leases_by_pod_async.await_count < 3:
+            await asyncio.sleep(0.01)
+        await coordinator.stop()
+
+        assert coordinator.share == 0.5
@@ -378,15 +378,15 @@ class TestMCPHealthMonitor:
         """Test get_cached_tools returns a copy, not the original dict."""
         # Add something to internal cache
         test_tool = Tool(name="test-tool", description="Test", inputSchema={})
-        health_monitor._tool_cache["server1"] = [test_tool]
+        health_monitor._tool_catalog.put("server1", [test_tool])
         
         # Get cached tools and modify it
         cached_tools = health_monitor.get_cached_tools()
         cached_tools["server2"] = []
         
         # Original cache should not be modified
-        assert "server2" not in health_monitor._tool_cache
-        assert "server1" in health_monitor._tool_cache
+        assert "server2" not in health_monitor.get_cached_tools()
+        assert "server1" in health_monitor.get_cached_tools()
     
     @pytest.mark.asyncio
     async def test_get_cached_tools_returns_list_copies(
@@ -396,7 +396,7 @@ class TestMCPHealthMonitor:
         # Add tools to internal cache
         tool1 = Tool(name="tool-1", description="Tool 1", inputSchema={})
         tool2 = Tool(name="tool-2", description="Tool 2", inputSchema={})
-        health_monitor._tool_cache["server1"] = [tool1, tool2]
+        health_monitor._tool_catalog.put("server1", [tool1, tool2])
         
         # Get cached tools and modify the list
         cached_tools = health_monitor.get_cached_tools()
@@ -404,8 +404,8 @@ class TestMCPHealthMonitor:
         cached_tools["server1"].append(fake_tool)
         
         # Original cache's list should not be modified
-        assert len(health_monitor._tool_cache["server1"]) == 2
-        assert fake_tool not in health_monitor._tool_cache["server1"]
+        assert len(health_monitor.get_cached_tools()["server1"]) == 2
+        assert fake_tool not in health_monitor.get_cached_tools()["server1"]
         # But the returned copy should have the modification
         assert len(cached_tools["server1"]) == 3
         assert fake_tool in cached_tools["server1"]
@@ -513,7 +513,7 @@ class TestMCPHealthMonitor:
         """Test that cache is retained even when server becomes unhealthy."""
         # Pre-populate cache with tools
         test_tool = Tool(name="test-tool", description="Test", inputSchema={})
-        health_monitor._tool_cache["server1"] = [test_tool]
+        health_monitor._tool_catalog.put("server1", [test_tool])
         
         # Mock enabled server config
         mock_config = MagicMock()
@@ -403,6 +403,8 @@ class TestErrorScenariosAndEdgeCases:
         settings.github_token = "test_token"
         settings.slack_bot_token = None
         settings.slack_channel = None
+        settings.mcp_session_pool_enabled = False
+        settings.mcp_tool_catalog_ttl_seconds = 0
         
         with patch('httpx.AsyncClient') as mock_client:
             mock_client_instance = AsyncMock()
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from tarsy.models.agent_config import AlertTypeQueueConfig, QueueConfig
 from tarsy.models.constants import AlertSessionStatus
 from tarsy.services.session_claim_worker import SessionClaimWorker
 
@@ -18,6 +19,9 @@ def mock_history_service():
     """Create a mock history service."""
     service = MagicMock()
     service.repository = MagicMock()
+    service.claim_pending_sessions_async = AsyncMock(return_value=[])
+    service.release_session_lease_async = AsyncMock(return_value=True)
+    service.reconcile_session_leases_async = AsyncMock(return_value=0)
     return service
 
 
@@ -61,58 +65,30 @@ async def test_worker_double_start(worker, caplog):
 
 
 @pytest.mark.asyncio
-async def test_worker_has_capacity_true(mock_history_service, mock_process_callback):
-    """Test capacity check when slots are available."""
-    # Configure mock on history_service, not repository
-    mock_history_service.count_sessions_by_status.return_value = 3
-    
-    # Create worker with pre-configured mock
-    worker = SessionClaimWorker(
-        history_service=mock_history_service,
-        max_global_concurrent=5,
-        claim_interval=0.1,
-        process_callback=mock_process_callback,
-        pod_id="test-pod"
-    )
+async def test_worker_available_slots(worker, mock_history_service):
+    """Test capacity check uses the local ledger without querying the database."""
+    worker._active_sessions.update({"s-1", "s-2", "s-3"})
     
-    has_capacity = await worker._has_capacity()
+    available_slots = await worker._available_slots()
     
-    assert has_capacity is True
+    assert available_slots == 2
+    mock_history_service.count_sessions_by_status.assert_not_called()
+    mock_history_service.count_active_leases.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_worker_has_capacity_false(worker, mock_history_service):
-    """Test capacity check when at max capacity."""
-    mock_history_service.count_sessions_by_status.return_value = 5
+async def test_worker_available_slots_at_capacity(worker):
+    """Test capacity check when this pod alone is at max capacity."""
+    worker._active_sessions.update({f"s-{i}" for i in range(5)})
     
-    has_capacity = await worker._has_capacity()
+    available_slots = await worker._available_slots()
     
-    assert has_capacity is False
+    assert available_slots == 0
 
 
 @pytest.mark.asyncio
-async def test_worker_count_active_sessions(mock_history_service, mock_process_callback):
-    """Test counting active sessions."""
-    # Configure mock on history_service, not repository
-    mock_history_service.count_sessions_by_status.return_value = 3
-    
-    # Create worker with pre-configured mock
-    worker = SessionClaimWorker(
-        history_service=mock_history_service,
-        max_global_concurrent=5,
-        claim_interval=0.1,
-        process_callback=mock_process_callback,
-        pod_id="test-pod"
-    )
-    
-    count = await worker._count_active_sessions()
-    
-    assert count == 3
-
-
-@pytest.mark.asyncio
-async def test_worker_claim_next_session_success(mock_history_service, mock_process_callback):
-    """Test successful session claiming."""
+async def test_worker_claim_sessions_success(mock_history_service, mock_process_callback):
+    """Test successful batch session claiming."""
     # Create a proper mock session object with all required attributes
     mock_session = MagicMock()
     mock_session.session_id = "test-session-123"
@@ -125,7 +101,9 @@ async def test_worker_claim_next_session_success(mock_history_service, mock_proc
     mock_session.started_at_us = 1234567890
     
     # Configure mock on history_service, not repository
-    mock_history_service.claim_next_pending_session.return_value = mock_session
+    mock_history_service.claim_pending_sessions_async.return_value = [mock_session]
+    
+    queue_config = QueueConfig(alert_types={"test-alert": AlertTypeQueueConfig(max_concurrent=2)})
     
     # Create worker with pre-configured mock
     worker = SessionClaimWorker(
@@ -133,22 +111,25 @@ async def test_worker_claim_next_session_success(mock_history_service, mock_proc
         max_global_concurrent=5,
         claim_interval=0.1,
         process_callback=mock_process_callback,
-        pod_id="test-pod"
+        pod_id="test-pod",
+        queue_config=queue_config
     )
     
-    session_data = await worker._claim_next_session()
+    claimed = await worker._claim_sessions(3)
     
-    assert session_data is not None
+    mock_history_service.claim_pending_sessions_async.assert_called_once_with("test-pod", 3, 5, queue_config)
+    assert len(claimed) == 1
+    session_data = claimed[0]
     assert session_data["session_id"] == "test-session-123"
     assert session_data["alert_data"] == {"test": "data"}
     assert session_data["alert_type"] == "test-alert"
 
 
 @pytest.mark.asyncio
-async def test_worker_claim_next_session_none(mock_history_service, mock_process_callback):
+async def test_worker_claim_sessions_none(mock_history_service, mock_process_callback):
     """Test claiming when no pending sessions available."""
     # Configure mock on history_service, not repository
-    mock_history_service.claim_next_pending_session.return_value = None
+    mock_history_service.claim_pending_sessions_async.return_value = []
     
     # Create worker with pre-configured mock
     worker = SessionClaimWorker(
@@ -159,9 +140,19 @@ async def test_worker_claim_next_session_none(mock_history_service, mock_process
         pod_id="test-pod"
     )
     
-    session_data = await worker._claim_next_session()
+    claimed = await worker._claim_sessions(5)
+    
+    assert claimed == []
+
+
+@pytest.mark.asyncio
+async def test_worker_claim_sessions_error(worker, mock_history_service):
+    """Test claiming returns an empty batch when the database call fails."""
+    mock_history_service.claim_pending_sessions_async.side_effect = Exception("Database error")
     
-    assert session_data is None
+    claimed = await worker._claim_sessions(5)
+    
+    assert claimed == []
 
 
 @pytest.mark.asyncio
@@ -206,11 +197,13 @@ async def test_worker_dispatch_session_error_handling(worker, mock_history_servi
     # Should not raise exception, but should mark session as failed
     await worker._dispatch_session(session_data)
     
-    # Verify session was marked as failed
+    # Verify session was marked as failed and its slot freed
     mock_history_service.update_session_status.assert_called_once()
     call_args = mock_history_service.update_session_status.call_args
     assert call_args[1]["session_id"] == "test-session-123"
     assert call_args[1]["status"] == AlertSessionStatus.FAILED.value
+    mock_history_service.release_session_lease.assert_called_once_with("test-session-123")
+    assert "test-session-123" not in worker._active_sessions
 
 
 @pytest.mark.asyncio
@@ -224,13 +217,16 @@ async def test_worker_claim_loop_with_capacity(mock_history_service, mock_proces
     mock_session.runbook_url = None
     mock_session.mcp_selection = None
     mock_session.session_metadata = None
+    mock_session.slack_message_fingerprint = None
     mock_session.started_at_us = 1234567890
     
-    # Configure mocks on history_service - has capacity, has pending session (then none to stop loop)
-    mock_history_service.count_sessions_by_status.return_value = 2
-    mock_history_service.claim_next_pending_session.side_effect = [
-        mock_session,
-        None
+    # Configure mocks on history_service - has pending session (then none)
+    mock_history_service.claim_pending_sessions_async.side_effect = [
+        [mock_session],
+        [],
+        [],
+        [],
+        [],
     ]
     
     # Create worker with pre-configured mock
@@ -242,6 +238,8 @@ async def test_worker_claim_loop_with_capacity(mock_history_service, mock_proces
         pod_id="test-pod"
     )
     
+    worker._active_sessions.update({"running-1", "running-2"})
+    
     # Start worker
     await worker.start()
     
@@ -251,15 +249,18 @@ async def test_worker_claim_loop_with_capacity(mock_history_service, mock_proces
     # Stop worker
     await worker.stop()
     
-    # Verify session was claimed and dispatched
-    assert mock_history_service.claim_next_pending_session.call_count >= 1
+    # Verify session was claimed in a batch sized to the free local capacity,
+    # capped globally by the lease limit, and dispatched
+    assert mock_history_service.claim_pending_sessions_async.call_count >= 1
+    mock_history_service.claim_pending_sessions_async.assert_any_call("test-pod", 3, 5, worker.queue_config)
+    mock_process_callback.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_worker_claim_loop_no_capacity(worker, mock_history_service):
     """Test claim loop when at capacity."""
     # No capacity
-    mock_history_service.count_sessions_by_status.return_value = 5
+    worker._active_sessions.update({f"s-{i}" for i in range(5)})
     
     # Start worker
     await worker.start()
@@ -271,14 +272,14 @@ async def test_worker_claim_loop_no_capacity(worker, mock_history_service):
     await worker.stop()
     
     # Verify no sessions were claimed
-    mock_history_service.claim_next_pending_session.assert_not_called()
+    mock_history_service.claim_pending_sessions_async.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_worker_claim_loop_error_handling(mock_history_service, mock_process_callback, caplog):
     """Test claim loop handles errors gracefully."""
-    # Configure mock on history_service to raise error in capacity check
-    mock_history_service.count_sessions_by_status.side_effect = Exception("Database error")
+    # Configure mock on history_service to raise error while claiming
+    mock_history_service.claim_pending_sessions_async.side_effect = Exception("Database error")
     
     # Create worker with pre-configured mock
     worker = SessionClaimWorker(
@@ -306,7 +307,7 @@ async def test_worker_claim_loop_error_handling(mock_history_service, mock_proce
 async def test_worker_stop_timeout(worker, mock_history_service):
     """Test worker stop with timeout."""
     # Simulate stuck claim loop
-    mock_history_service.count_sessions_by_status.return_value = 0
+    mock_history_service.claim_pending_sessions_async.return_value = []
     
     await worker.start()
     
@@ -320,3 +321,76 @@ async def test_worker_stop_timeout(worker, mock_history_service):
     
     # Verify cancel was called due to timeout
     cancel_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_worker_notify_wakes_claim_loop(mock_history_service, mock_process_callback):
+    """Test queue notification triggers a claim attempt without waiting for the poll interval."""
+    mock_history_service.claim_pending_sessions_async.return_value = []
+    
+    worker = SessionClaimWorker(
+        history_service=mock_history_service,
+        max_global_concurrent=5,
+        claim_interval=60.0,  # Polling fallback never fires during the test
+        process_callback=mock_process_callback,
+        pod_id="test-pod"
+    )
+    
+    await worker.start()
+    await asyncio.sleep(0.05)
+    assert mock_history_service.claim_pending_sessions_async.call_count == 1
+    
+    await worker.handle_queue_event({"type": "session.enqueued", "session_id": "s-1"})
+    await asyncio.sleep(0.05)
+    
+    await worker.stop()
+    
+    assert mock_history_service.claim_pending_sessions_async.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_session_completion_wakes_claim_loop(mock_history_service):
+    """Test a finished session frees its slot and wakes the claim loop so it is refilled."""
+    session_done = asyncio.Event()
+    
+    async def process_callback(_session_id, _alert_context):
+        await session_done.wait()
+    
+    worker = SessionClaimWorker(
+        history_service=mock_history_service,
+        max_global_concurrent=5,
+        claim_interval=60.0,
+        process_callback=process_callback,
+        pod_id="test-pod"
+    )
+    
+    session_data = {
+        "session_id": "test-session-123",
+        "alert_data": {"test": "data"},
+        "alert_type": "test-alert",
+        "author": "test-user",
+        "started_at_us": 1234567890
+    }
+    await worker._dispatch_session(session_data)
+    assert not worker._wake_event.is_set()
+    assert worker._active_sessions == {"test-session-123"}
+    
+    session_done.set()
+    await asyncio.sleep(0.05)
+    
+    assert worker._wake_event.is_set()
+    assert worker._active_sessions == set()
+    mock_history_service.release_session_lease_async.assert_called_once_with("test-session-123")
+
+
+@pytest.mark.asyncio
+async def test_worker_lease_release_failure_still_wakes_claim_loop(worker, mock_history_service):
+    """Test a failed lease release is tolerated (reconciled later) and still wakes the loop."""
+    mock_history_service.release_session_lease_async.side_effect = Exception("Database error")
+    worker._active_sessions.add("test-session-123")
+    
+    worker._on_session_done("test-session-123")
+    await asyncio.sleep(0.05)
+    
+    assert worker._active_sessions == set()
+    assert worker._wake_event.is_set()
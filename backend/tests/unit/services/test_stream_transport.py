@@ -0,0 +1,289 @@
+"""
+Unit tests for StreamingTransport.
+
+Tests coalescing, delta encoding, keyframes, NOTIFY size splitting and
+recovery from connection failures.
+"""
+
+import asyncio
+import json
+from typing import List, Optional
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tarsy.models.event_models import LLMStreamChunkEvent
+from tarsy.services.events.batch_publisher import NOTIFY_PAYLOAD_LIMIT
+from tarsy.services.events.stream_transport import (
+    StreamingTransport,
+    merge_stream_chunks,
+    split_for_payload,
+)
+
+
+def _snapshot(content: str, is_complete: bool = False, interaction: str = "llm-1") -> LLMStreamChunkEvent:
+    return LLMStreamChunkEvent(
+        session_id="s1",
+        stage_execution_id="stage-1",
+        chunk=content,
+        stream_type="thought",
+        is_complete=is_complete,
+        llm_interaction_id=interaction,
+    )
+
+
+def _apply(content: Optional[str], last_seq: Optional[int], message: dict):
+    """Client-side reassembly (mirrors the dashboard); returns (content, seq)."""
+    if message.get("offset") is None or message["offset"] == 0:
+        return message["chunk"], message.get("seq")
+    if message["base_seq"] != last_seq:
+        return None, None  # Gap: wait for the next keyframe
+    # Offsets are UTF-16 code units, like JavaScript string indices
+    prefix = content.encode("utf-16-le")[:message["offset"] * 2].decode("utf-16-le")
+    return prefix + message["chunk"], message["seq"]
+
+
+@pytest.fixture
+def conn():
+    """Fake asyncpg connection recording NOTIFY payloads."""
+    connection = Mock()
+    connection.is_closed = Mock(return_value=False)
+    connection.executemany = AsyncMock()
+    connection.close = AsyncMock()
+    with patch(
+        "tarsy.services.events.stream_transport.asyncpg.connect", AsyncMock(return_value=connection)
+    ):
+        yield connection
+
+
+def _sent(conn) -> List[dict]:
+    messages = []
+    for call in conn.executemany.await_args_list:
+        for channel, payload in call.args[1]:
+            assert channel == "session:s1"
+            assert len(payload.encode()) < NOTIFY_PAYLOAD_LIMIT
+            messages.append(json.loads(payload))
+    return messages
+
+
+def _reassemble(messages: List[dict]) -> Optional[str]:
+    content, seq = None, None
+    for message in messages:
+        content, seq = _apply(content, seq, message)
+    return content
+
+
+@pytest.mark.unit
+class TestStreamingTransport:
+    """Test delta-encoded delivery of LLM stream snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_snapshots_within_window_are_coalesced(self, conn):
+        """Test that only the latest snapshot of a burst is sent."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=20)
+        await transport.start()
+
+        for n in range(1, 11):
+            transport.submit(_snapshot("word " * n))
+        await asyncio.sleep(0.1)
+
+        messages = _sent(conn)
+        assert len(messages) == 1
+        assert messages[0]["chunk"] == "word " * 10
+        assert messages[0]["offset"] == 0
+        assert transport.snapshots_received == 10
+        await transport.stop()
+
+    @pytest.mark.asyncio
+    async def test_appended_content_is_sent_as_delta(self, conn):
+        """Test that later messages carry only new content chained by sequence numbers."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0)
+
+        transport.submit(_snapshot("Thought: checking"))
+        await transport.flush()
+        transport.submit(_snapshot("Thought: checking pods"))
+        await transport.flush()
+
+        first, second = _sent(conn)
+        assert (first["offset"], first["seq"]) == (0, 1)
+        assert second["chunk"] == " pods"
+        assert (second["offset"], second["seq"], second["base_seq"]) == (17, 2, 1)
+        assert _reassemble([first, second]) == "Thought: checking pods"
+
+    @pytest.mark.asyncio
+    async def test_rewritten_content_resends_from_common_prefix(self, conn):
+        """Test that a snapshot that is not an extension replaces the differing tail."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0)
+
+        for content in ("Thought: pods are\nAct", "Thought: pods are fine"):
+            transport.submit(_snapshot(content))
+            await transport.flush()
+
+        messages = _sent(conn)
+        assert messages[1]["offset"] == len("Thought: pods are")
+        assert _reassemble(messages) == "Thought: pods are fine"
+
+    @pytest.mark.asyncio
+    async def test_offset_counts_utf16_units_after_non_bmp_characters(self, conn):
+        """Test that offsets match JavaScript string indices when content has emoji."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0)
+
+        for content in ("ok 😀 a", "ok 😀 ab"):
+            transport.submit(_snapshot(content))
+            await transport.flush()
+
+        messages = _sent(conn)
+        assert (messages[1]["offset"], messages[1]["chunk"]) == (7, "b")
+        assert _reassemble(messages) == "ok 😀 ab"
+
+    @pytest.mark.asyncio
+    async def test_completion_is_sent_immediately_as_keyframe(self, conn):
+        """Test that completion skips the coalescing window and carries the full content."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=10_000)
+        await transport.start()
+
+        transport.submit(_snapshot("partial"))
+        transport.submit(_snapshot("partial answer", is_complete=True))
+        await asyncio.sleep(0.05)
+
+        messages = _sent(conn)
+        assert len(messages) == 1
+        assert messages[0]["is_complete"] is True
+        assert (messages[0]["offset"], messages[0]["chunk"]) == (0, "partial answer")
+        assert transport._streams == {}
+        await transport.stop()
+
+    @pytest.mark.asyncio
+    async def test_streams_are_encoded_independently(self, conn):
+        """Test that interleaved streams keep separate sequences and content."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0)
+
+        transport.submit(_snapshot("a1", interaction="llm-a"))
+        transport.submit(_snapshot("b1", interaction="llm-b"))
+        await transport.flush()
+        transport.submit(_snapshot("a1 a2", interaction="llm-a"))
+        await transport.flush()
+
+        by_stream = {}
+        for message in _sent(conn):
+            by_stream.setdefault(message["llm_interaction_id"], []).append(message)
+        assert [m["seq"] for m in by_stream["llm-a"]] == [1, 2]
+        assert _reassemble(by_stream["llm-a"]) == "a1 a2"
+        assert _reassemble(by_stream["llm-b"]) == "b1"
+
+    @pytest.mark.asyncio
+    async def test_keyframe_is_sent_periodically(self, conn):
+        """Test that every keyframe_interval messages the full content is resent."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0, keyframe_interval=3)
+
+        for n in range(1, 7):
+            transport.submit(_snapshot("x" * n))
+            await transport.flush()
+
+        assert [m["offset"] for m in _sent(conn)] == [0, 1, 2, 3, 0, 5]
+
+    @pytest.mark.asyncio
+    async def test_large_content_is_split_under_notify_limit(self, conn):
+        """Test that content above the NOTIFY limit is sent as consecutive deltas."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0)
+        content = ('quote " and ünïcödé ' * 1000)
+
+        transport.submit(_snapshot(content, is_complete=True))
+        await transport.flush()
+
+        messages = _sent(conn)
+        assert len(messages) > 1
+        assert [m["seq"] for m in messages] == list(range(1, len(messages) + 1))
+        assert [m["is_complete"] for m in messages] == [False] * (len(messages) - 1) + [True]
+        assert _reassemble(messages) == content
+
+    @pytest.mark.asyncio
+    async def test_failed_send_reconnects_and_resends_keyframe(self, conn):
+        """Test that after a delivery failure clients resync from a keyframe."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0)
+        transport.submit(_snapshot("one"))
+        await transport.flush()
+
+        conn.executemany.side_effect = [Exception("connection lost"), None]
+        transport.submit(_snapshot("one two"))
+        await transport.flush()
+        assert transport.messages_dropped == 1
+
+        transport.submit(_snapshot("one two three"))
+        await transport.flush()
+
+        last = json.loads(conn.executemany.await_args.args[1][-1][1])
+        assert (last["offset"], last["chunk"]) == (0, "one two three")
+        assert conn.close.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_completion_is_resent_without_new_snapshots(self, conn):
+        """Test that a completion lost to a failed send is resent as a keyframe by the flusher."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0)
+        conn.executemany.side_effect = [Exception("connection lost"), None]
+
+        with patch("tarsy.services.events.stream_transport.RESYNC_DELAY_SECONDS", 0.01):
+            await transport.start()
+            transport.submit(_snapshot("final answer", is_complete=True))
+            await asyncio.sleep(0.1)
+
+        assert transport.messages_dropped == 1
+        last = json.loads(conn.executemany.await_args.args[1][-1][1])
+        assert (last["offset"], last["chunk"], last["is_complete"]) == (0, "final answer", True)
+        assert transport._streams == {}
+        await transport.stop()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_database_drops_chunks_without_raising(self):
+        """Test that a connection failure only drops chunks and backs off."""
+        transport = StreamingTransport("postgresql://db", coalesce_ms=0)
+        connect = AsyncMock(side_effect=OSError("refused"))
+
+        with patch("tarsy.services.events.stream_transport.asyncpg.connect", connect):
+            transport.submit(_snapshot("one"))
+            await transport.flush()
+            transport.submit(_snapshot("one two"))
+            await transport.flush()
+
+        assert transport.messages_dropped == 2
+        assert connect.await_count == 1  # Second flush is within the reconnect delay
+
+
+@pytest.mark.unit
+class TestStreamChunkHelpers:
+    """Test payload splitting and merging of queued stream messages."""
+
+    def test_split_for_payload_respects_escaped_size(self):
+        """Test that pieces fit the budget after JSON escaping and rejoin losslessly."""
+        text = '"\\ü😀x' * 200
+
+        pieces = split_for_payload(text, 100)
+
+        assert "".join(pieces) == text
+        assert all(len(json.dumps(piece)) - 2 <= 100 for piece in pieces)
+
+    def test_split_for_payload_keeps_small_text_whole(self):
+        """Test that text within budget (including empty text) is one piece."""
+        assert split_for_payload("", 10) == [""]
+        assert split_for_payload("short", 10) == ["short"]
+
+    @pytest.mark.parametrize(
+        "older,newer",
+        [
+            ({"chunk": "bc", "offset": 1, "seq": 2, "base_seq": 1}, {"chunk": "d", "offset": 3, "seq": 3, "base_seq": 2}),
+            ({"chunk": "bc", "offset": 1, "seq": 2, "base_seq": 1}, {"chunk": "X", "offset": 2, "seq": 3, "base_seq": 2}),
+            ({"chunk": "bcd", "offset": 1, "seq": 2, "base_seq": 1}, {"chunk": "Y", "offset": 1, "seq": 3, "base_seq": 2}),
+            ({"chunk": "abc", "offset": 0, "seq": 2, "base_seq": 1}, {"chunk": "d", "offset": 3, "seq": 3, "base_seq": 2}),
+            ({"chunk": "bc", "offset": 1, "seq": 2, "base_seq": 1}, {"chunk": "new", "offset": 0, "seq": 3, "base_seq": 2}),
+            ({"chunk": "😀bc", "offset": 1, "seq": 2, "base_seq": 1}, {"chunk": "X", "offset": 4, "seq": 3, "base_seq": 2}),
+        ],
+    )
+    def test_merged_message_equals_applying_both(self, older, newer):
+        """Test that a merged message reassembles to the same content as the pair."""
+        base = "a"
+        expected, _ = _apply(*_apply(base, 1, older), newer)
+
+        merged = merge_stream_chunks(older, newer)
+
+        assert _apply(base, 1, merged)[0] == expected
+        assert merged.get("seq") == newer.get("seq")
@@ -4,11 +4,13 @@ Unit tests for WebSocketConnectionManager.
 Tests connection lifecycle, subscription management, broadcasting, and error handling.
 """
 
+import asyncio
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from tarsy.models.constants import WebSocketOverflowPolicy
 from tarsy.services.websocket_connection_manager import WebSocketConnectionManager
 
 
@@ -23,6 +25,7 @@ class TestWebSocketConnectionManagerInitialization:
         assert manager.connections == {}
         assert manager.subscriptions == {}
         assert manager.channel_subscribers == {}
+        assert manager.senders == {}
 
 
 @pytest.mark.unit
@@ -289,6 +292,7 @@ class TestWebSocketConnectionManagerBroadcast:
 
         event = {"type": "test.event", "data": "hello"}
         await manager.broadcast_to_channel("test_channel", event)
+        await manager.flush()
 
         expected_json = json.dumps(event)
         mock_ws1.send_text.assert_called_once_with(expected_json)
@@ -302,6 +306,7 @@ class TestWebSocketConnectionManagerBroadcast:
 
         # Should handle gracefully without errors
         await manager.broadcast_to_channel("nonexistent_channel", {"type": "test"})
+        await manager.flush()
 
     @pytest.mark.asyncio
     async def test_broadcast_handles_send_errors(self):
@@ -322,6 +327,7 @@ class TestWebSocketConnectionManagerBroadcast:
 
         event = {"type": "test.event"}
         await manager.broadcast_to_channel("test_channel", event)
+        await manager.flush()
 
         # Both should be called, even though ws1 failed
         mock_ws1.send_text.assert_called_once()
@@ -346,6 +352,7 @@ class TestWebSocketConnectionManagerBroadcast:
 
         event = {"type": "test.event"}
         await manager.broadcast_to_channel("channel_a", event)
+        await manager.flush()
 
         # Only conn1 should receive the event
         mock_ws1.send_text.assert_called_once()
@@ -374,6 +381,8 @@ class TestWebSocketConnectionManagerBroadcast:
 
         await manager.broadcast_to_channel("test_channel", complex_event)
 
+        await manager.flush()
+
         # Verify JSON serialization works correctly
         expected_json = json.dumps(complex_event)
         mock_websocket.send_text.assert_called_once_with(expected_json)
@@ -427,9 +436,335 @@ class TestWebSocketConnectionManagerEdgeCases:
         # Simulate error during broadcast
         mock_websocket.send_text.side_effect = Exception("Send failed")
         await manager.broadcast_to_channel("channel1", {"type": "test"})
+        await manager.flush()
 
         # State should remain consistent
         assert "conn1" in manager.connections
         assert "channel1" in manager.subscriptions["conn1"]
         assert "conn1" in manager.channel_subscribers["channel1"]
 
+
+
+@pytest.mark.unit
+class TestWebSocketConnectionManagerFanout:
+    """Test per-channel listener registration and queued delivery."""
+
+    @pytest.mark.asyncio
+    async def test_one_listener_callback_per_channel(self):
+        """Test that the EventListener gets one callback per channel regardless of subscribers."""
+        manager = WebSocketConnectionManager()
+        listener = AsyncMock()
+
+        for connection_id in ("conn1", "conn2", "conn3"):
+            await manager.connect(connection_id, AsyncMock())
+            manager.subscribe(connection_id, "sessions")
+            await manager.attach_channel("sessions", listener)
+
+        listener.subscribe.assert_awaited_once()
+        assert listener.subscribe.await_args.args[0] == "sessions"
+
+        manager.unsubscribe("conn1", "sessions")
+        await manager.detach_channel("sessions", listener)
+        manager.disconnect("conn2")
+        await manager.detach_channel("sessions", listener)
+        listener.unsubscribe.assert_not_called()
+
+        manager.disconnect("conn3")
+        await manager.detach_channel("sessions", listener)
+        listener.unsubscribe.assert_awaited_once_with(
+            "sessions", listener.subscribe.await_args.args[1]
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_attach_registers_once(self):
+        """Test that concurrent first subscribers register a single callback."""
+        manager = WebSocketConnectionManager()
+        listener = AsyncMock()
+
+        async def slow_subscribe(*_):
+            await asyncio.sleep(0.01)
+
+        listener.subscribe.side_effect = slow_subscribe
+        await manager.connect("conn1", AsyncMock())
+        await manager.connect("conn2", AsyncMock())
+        manager.subscribe("conn1", "sessions")
+        manager.subscribe("conn2", "sessions")
+
+        await asyncio.gather(
+            manager.attach_channel("sessions", listener),
+            manager.attach_channel("sessions", listener),
+        )
+
+        listener.subscribe.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_listener_callback_serializes_event_once(self):
+        """Test that one event is serialized once and delivered to every subscriber."""
+        manager = WebSocketConnectionManager()
+        listener = AsyncMock()
+        websockets = [AsyncMock() for _ in range(3)]
+        for i, websocket in enumerate(websockets):
+            await manager.connect(f"conn{i}", websocket)
+            manager.subscribe(f"conn{i}", "sessions")
+        await manager.attach_channel("sessions", listener)
+        callback = listener.subscribe.await_args.args[1]
+
+        with patch(
+            "tarsy.services.websocket_connection_manager.json.dumps", wraps=json.dumps
+        ) as dumps:
+            await callback({"type": "session.started", "id": 7})
+        await manager.flush()
+
+        dumps.assert_called_once()
+        for websocket in websockets:
+            websocket.send_text.assert_called_once_with(json.dumps({"type": "session.started", "id": 7}))
+
+    @pytest.mark.asyncio
+    async def test_slow_connection_does_not_block_others(self):
+        """Test that a stalled client does not delay delivery to other clients."""
+        manager = WebSocketConnectionManager()
+        stalled = AsyncMock()
+        release = asyncio.Event()
+
+        async def block(_):
+            await release.wait()
+
+        stalled.send_text.side_effect = block
+        healthy = AsyncMock()
+        await manager.connect("stalled", stalled)
+        await manager.connect("healthy", healthy)
+        manager.subscribe("stalled", "sessions")
+        manager.subscribe("healthy", "sessions")
+
+        await manager.broadcast_to_channel("sessions", {"type": "a"})
+        await asyncio.wait_for(manager.senders["healthy"].wait_idle(), timeout=1)
+
+        healthy.send_text.assert_called_once()
+        release.set()
+        await manager.flush()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("policy", list(WebSocketOverflowPolicy))
+    async def test_queue_full_of_persisted_events_evicts_instead_of_dropping(self, policy):
+        """Test that persisted events are never silently dropped; the client is closed to catch up."""
+        manager = WebSocketConnectionManager(send_queue_size=2, overflow_policy=policy)
+        websocket = AsyncMock()
+        release = asyncio.Event()
+        sent = []
+
+        async def send(text):
+            await release.wait()
+            sent.append(json.loads(text)["n"])
+
+        websocket.send_text.side_effect = send
+        await manager.connect("conn1", websocket)
+        manager.subscribe("conn1", "sessions")
+
+        await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": 0})
+        await asyncio.sleep(0)  # Event 0 is in flight
+        for n in range(1, 4):
+            await manager.broadcast_to_channel("sessions", {"type": "session.completed", "n": n})
+        await asyncio.sleep(0)
+
+        websocket.close.assert_awaited_once_with(code=1013, reason="Slow consumer")
+        stats = manager.get_connection_stats()["conn1"]
+        assert stats["evicted"] is True
+        # The writer stopped with the connection: no event was delivered past a gap, catchup replays them all
+        release.set()
+        await manager.flush()
+        assert sent == []
+
+    @pytest.mark.asyncio
+    async def test_replies_are_sent_by_the_writer_in_order(self):
+        """Test that replies queue behind pending broadcasts and are never sent concurrently."""
+        manager = WebSocketConnectionManager()
+        websocket = AsyncMock()
+        in_flight = 0
+        sent = []
+
+        async def send(text):
+            nonlocal in_flight
+            in_flight += 1
+            assert in_flight == 1
+            await asyncio.sleep(0)
+            sent.append(json.loads(text)["n"])
+            in_flight -= 1
+
+        websocket.send_text.side_effect = send
+        await manager.connect("conn1", websocket)
+        manager.subscribe("conn1", "sessions")
+
+        await manager.broadcast_to_channel("sessions", {"n": 0})
+        manager.send_to_connection("conn1", {"n": 1}, {"n": 2})
+        await manager.broadcast_to_channel("sessions", {"n": 3})
+        await manager.flush()
+
+        assert sent == [0, 1, 2, 3]
+        websocket.send_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self):
+        """Test that disconnect stops the writer and discards pending events."""
+        manager = WebSocketConnectionManager()
+        await manager.connect("conn1", AsyncMock())
+        writer = manager._writers["conn1"]
+
+        manager.disconnect("conn1")
+        await asyncio.sleep(0)
+
+        assert writer.cancelled()
+        assert "conn1" not in manager.senders
+
+
+def _chunk(n: int, stream: str = "llm-1") -> dict:
+    """LLM stream chunk event carrying the accumulated content of `stream`."""
+    return {
+        "type": "llm.stream.chunk",
+        "session_id": "s1",
+        "stream_type": "thought",
+        "llm_interaction_id": stream,
+        "chunk": "x" * n,
+        "n": n,
+    }
+
+
+async def _stalled_connection(manager: WebSocketConnectionManager):
+    """Connect a client whose sends block until the returned event is set."""
+    websocket = AsyncMock()
+    release = asyncio.Event()
+    sent = []
+
+    async def send(text):
+        await release.wait()
+        sent.append(json.loads(text)["n"])
+
+    websocket.send_text.side_effect = send
+    await manager.connect("conn1", websocket)
+    manager.subscribe("conn1", "sessions")
+    return websocket, release, sent
+
+
+@pytest.mark.unit
+class TestWebSocketConnectionManagerOverflow:
+    """Test overflow policies and lag metrics of per-connection send queues."""
+
+    @pytest.mark.asyncio
+    async def test_drop_transient_drops_oldest_stream_chunk(self):
+        """Test that the oldest pending chunk gives way before persisted events."""
+        manager = WebSocketConnectionManager(send_queue_size=3)
+        _, release, sent = await _stalled_connection(manager)
+
+        await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": 0})
+        await asyncio.sleep(0)  # Event 0 is in flight
+        await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": 1})
+        await manager.broadcast_to_channel("sessions", _chunk(2))
+        await manager.broadcast_to_channel("sessions", {"type": "stage.completed", "n": 3})
+        await manager.broadcast_to_channel("sessions", {"type": "session.completed", "n": 4})
+        release.set()
+        await manager.flush()
+
+        assert sent == [0, 1, 3, 4]
+        assert manager.get_connection_stats()["conn1"]["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drop_transient_drops_incoming_chunk_when_no_chunk_pending(self):
+        """Test that a chunk arriving at a queue full of persisted events is dropped."""
+        manager = WebSocketConnectionManager(send_queue_size=1)
+        _, release, sent = await _stalled_connection(manager)
+
+        await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": 0})
+        await asyncio.sleep(0)
+        await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": 1})
+        await manager.broadcast_to_channel("sessions", _chunk(2))
+        release.set()
+        await manager.flush()
+
+        assert sent == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_coalesce_replaces_pending_chunk_of_same_stream(self):
+        """Test that a newer chunk takes the place of the pending chunk of its stream."""
+        manager = WebSocketConnectionManager(
+            send_queue_size=2, overflow_policy=WebSocketOverflowPolicy.COALESCE
+        )
+        _, release, sent = await _stalled_connection(manager)
+
+        await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": 0})
+        await asyncio.sleep(0)
+        await manager.broadcast_to_channel("sessions", _chunk(1))
+        await manager.broadcast_to_channel("sessions", _chunk(2, stream="llm-2"))
+        await manager.broadcast_to_channel("sessions", _chunk(3))
+        await manager.broadcast_to_channel("sessions", _chunk(4))
+        release.set()
+        await manager.flush()
+
+        # Chunk 4 supersedes 3, which superseded 1; stream order is preserved
+        assert sent == [0, 4, 2]
+        stats = manager.get_connection_stats()["conn1"]
+        assert stats["coalesced"] == 2
+        assert stats["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_merges_pending_delta_of_same_stream(self):
+        """Test that coalesced deltas still reassemble to the stream's content."""
+        manager = WebSocketConnectionManager(
+            send_queue_size=1, overflow_policy=WebSocketOverflowPolicy.COALESCE
+        )
+        websocket, release, _ = await _stalled_connection(manager)
+
+        def delta(chunk: str, offset: int, seq: int) -> dict:
+            return {**_chunk(0), "chunk": chunk, "offset": offset, "seq": seq, "base_seq": seq - 1}
+
+        await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": 0})
+        await asyncio.sleep(0)
+        await manager.broadcast_to_channel("sessions", delta("Thought: a", 0, 1))
+        await manager.broadcast_to_channel("sessions", delta("ll pods", 10, 2))
+        release.set()
+        await manager.flush()
+
+        merged = json.loads(websocket.send_text.await_args.args[0])
+        assert (merged["chunk"], merged["offset"], merged["seq"]) == ("Thought: all pods", 0, 2)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_evicts_slow_consumer(self):
+        """Test that overflowing a queue closes only that connection."""
+        manager = WebSocketConnectionManager(
+            send_queue_size=1, overflow_policy="disconnect"
+        )
+        slow, _, _ = await _stalled_connection(manager)
+        healthy = AsyncMock()
+        await manager.connect("conn2", healthy)
+        manager.subscribe("conn2", "sessions")
+
+        for n in range(3):
+            await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": n})
+            await asyncio.sleep(0)
+        await manager.flush()
+        await asyncio.sleep(0)
+
+        slow.close.assert_awaited_once_with(code=1013, reason="Slow consumer")
+        assert manager.get_connection_stats()["conn1"]["evicted"] is True
+        assert healthy.send_text.call_count == 3
+        healthy.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_connection_stats_report_lag(self):
+        """Test that stats expose queue depth and the age of pending events."""
+        manager = WebSocketConnectionManager()
+        _, release, _ = await _stalled_connection(manager)
+
+        for n in range(3):
+            await manager.broadcast_to_channel("sessions", {"type": "stage.started", "n": n})
+        await asyncio.sleep(0.02)
+
+        stats = manager.get_connection_stats()["conn1"]
+        assert stats["queue_depth"] == 2
+        assert stats["channels"] == ["sessions"]
+        assert stats["oldest_pending_ms"] >= 10
+
+        release.set()
+        await manager.flush()
+        stats = manager.get_connection_stats()["conn1"]
+        assert stats["sent"] == 3
+        assert stats["queue_depth"] == 0
+        assert stats["max_lag_ms"] >= 10
@@ -0,0 +1,61 @@
+"""
+Unit tests for alert fingerprinting.
+"""
+
+import pytest
+
+from tarsy.utils.alert_fingerprint import compute_alert_fingerprint
+
+pytestmark = pytest.mark.unit
+
+
+class TestComputeAlertFingerprint:
+    """Test cases for compute_alert_fingerprint."""
+
+    def test_same_key_fields_same_fingerprint(self):
+        """Re-fires differing only in non-key fields share a fingerprint."""
+        first = {"fingerprint": "abc", "message": "first", "startsAt": "10:00"}
+        second = {"fingerprint": "abc", "message": "second", "startsAt": "10:05"}
+
+        assert compute_alert_fingerprint("PodCrash", first, ["fingerprint"]) == \
+            compute_alert_fingerprint("PodCrash", second, ["fingerprint"])
+
+    def test_alert_type_is_part_of_fingerprint(self):
+        """The same key values under different alert types do not collide."""
+        data = {"fingerprint": "abc"}
+
+        assert compute_alert_fingerprint("PodCrash", data, ["fingerprint"]) != \
+            compute_alert_fingerprint("NodeDown", data, ["fingerprint"])
+
+    def test_different_key_values_different_fingerprint(self):
+        """Different key values produce different fingerprints."""
+        assert compute_alert_fingerprint("PodCrash", {"fingerprint": "abc"}, ["fingerprint"]) != \
+            compute_alert_fingerprint("PodCrash", {"fingerprint": "xyz"}, ["fingerprint"])
+
+    def test_nested_key_fields(self):
+        """Dotted paths address nested fields; dict key order does not matter."""
+        first = {"labels": {"namespace": "prod", "pod": "api-1"}, "value": 1}
+        second = {"value": 2, "labels": {"pod": "api-1", "namespace": "prod"}}
+        other = {"labels": {"namespace": "prod", "pod": "api-2"}}
+        key_fields = ["labels.pod", "labels.namespace"]
+
+        assert compute_alert_fingerprint("PodCrash", first, key_fields) == \
+            compute_alert_fingerprint("PodCrash", second, key_fields)
+        assert compute_alert_fingerprint("PodCrash", first, key_fields) != \
+            compute_alert_fingerprint("PodCrash", other, key_fields)
+
+    @pytest.mark.parametrize("alert_data", [
+        {},
+        {"message": "no key fields"},
+        {"labels": "not-a-dict"},
+    ])
+    def test_no_key_fields_present_returns_none(self, alert_data):
+        """Alerts without any key field are never deduplicated."""
+        assert compute_alert_fingerprint("PodCrash", alert_data, ["fingerprint", "labels.pod"]) is None
+
+    def test_partially_present_key_fields(self):
+        """Missing key fields are skipped, present ones still identify the alert."""
+        fingerprint = compute_alert_fingerprint("PodCrash", {"fingerprint": "abc"}, ["fingerprint", "labels.pod"])
+
+        assert fingerprint is not None
+        assert len(fingerprint) == 64
@@ -0,0 +1,83 @@
+"""
+Unit tests for history payload compression.
+"""
+
+import os
+
+import pytest
+
+from tarsy.utils import payload_compression
+from tarsy.utils.payload_compression import (
+    COMPRESSION_THRESHOLD_BYTES,
+    PREVIEW_COMPRESSED_BYTES,
+    compress_payload,
+    decompress_payload,
+    decompress_payload_prefix,
+    get_compression_stats,
+    reset_compression_stats,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_compression_stats()
+    yield
+    reset_compression_stats()
+
+
+class TestCompressPayload:
+    """Test cases for compress_payload and decompress_payload."""
+
+    def test_large_payload_round_trips(self):
+        """Large compressible payloads are compressed and restored exactly."""
+        text = "pod-é Running\n" * 2000
+
+        compressed = compress_payload(text, "tool_result")
+
+        assert compressed is not None
+        assert len(compressed) < len(text) / 10
+        assert decompress_payload(compressed) == text
+
+    def test_small_payload_is_not_compressed(self):
+        """Payloads under the threshold are stored as they are."""
+        assert compress_payload("x" * (COMPRESSION_THRESHOLD_BYTES - 1), "tool_result") is None
+
+    def test_poorly_compressible_payload_is_not_compressed(self, monkeypatch):
+        """Payloads that do not shrink by MIN_SAVINGS_RATIO are stored as they are."""
+        # Random hex compresses to about half its size
+        monkeypatch.setattr(payload_compression, "MIN_SAVINGS_RATIO", 0.6)
+
+        assert compress_payload(os.urandom(COMPRESSION_THRESHOLD_BYTES).hex(), "tool_result") is None
+        assert get_compression_stats()["tool_result"]["compressed_payloads"] == 0
+
+    def test_stats_report_compression_ratio_per_kind(self):
+        """Every offered payload is counted, with raw and stored bytes."""
+        compress_payload("a" * 10000, "tool_result")
+        compress_payload("small", "tool_result")
+        compress_payload("b" * 10000, "llm_message")
+
+        stats = get_compression_stats()
+
+        assert set(stats) == {"tool_result", "llm_message"}
+        assert stats["tool_result"]["payloads"] == 2
+        assert stats["tool_result"]["compressed_payloads"] == 1
+        assert stats["tool_result"]["raw_bytes"] == 10005
+        assert stats["tool_result"]["compression_ratio"] > 50
+
+
+class TestDecompressPayloadPrefix:
+    """Test cases for decompress_payload_prefix."""
+
+    def test_prefix_of_compressed_bytes_gives_leading_characters(self):
+        """A preview needs only the first compressed bytes."""
+        text = "".join(f"line {i}: ünïcode output\n" for i in range(5000))
+        compressed = compress_payload(text, "tool_result")
+
+        preview = decompress_payload_prefix(compressed[:PREVIEW_COMPRESSED_BYTES], 201)
+
+        assert preview == text[:201]
+
+    def test_none_stays_none(self):
+        assert decompress_payload_prefix(None, 201) is None
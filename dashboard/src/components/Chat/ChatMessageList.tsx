@@ -15,6 +15,7 @@ import {
   STREAMING_CONTENT_TYPES, 
   parseStreamingContentType 
 } from '../../utils/eventTypes';
+import { applyStreamChunk } from '../../utils/streamChunks';
 import { LLM_INTERACTION_TYPES } from '../../constants/llmInteractionTypes';
 
 interface ChatMessageListProps {
@@ -302,20 +303,27 @@ export default function ChatMessageList({ sessionId, chatId }: ChatMessageListPr
             : `${event.llm_interaction_id}-${event.stream_type}`;
           
           const streamType = parseStreamingContentType(event.stream_type);
+          const existing = prev.get(key);
+          const next = applyStreamChunk(existing, event);
+          if (!next) {
+            // Missed a delta - keep the current content until the next keyframe
+            return prev;
+          }
           
           if (event.is_complete) {
             // Stream completed - mark as waiting for DB update
-            const existing = prev.get(key);
             if (existing) {
               updated.set(key, {
                 ...existing,
-                content: event.chunk,
+                content: next.content,
+                seq: next.seq,
                 waitingForDb: true
               });
             } else {
               updated.set(key, {
                 type: streamType,
-                content: event.chunk,
+                content: next.content,
+                seq: next.seq,
                 stage_execution_id: event.stage_execution_id,
                 mcp_event_id: event.mcp_event_id,
                 llm_interaction_id: event.llm_interaction_id,
@@ -330,7 +338,8 @@ export default function ChatMessageList({ sessionId, chatId }: ChatMessageListPr
             // Still streaming - update content
             updated.set(key, {
               type: streamType,
-              content: event.chunk,
+              content: next.content,
+              seq: next.seq,
               stage_execution_id: event.stage_execution_id,
               mcp_event_id: event.mcp_event_id,
               llm_interaction_id: event.llm_interaction_id,
@@ -26,6 +26,7 @@ import {
   STREAMING_CONTENT_TYPES, 
   parseStreamingContentType 
 } from '../utils/eventTypes';
+import { applyStreamChunk } from '../utils/streamChunks';
 import { CHAT_FLOW_ITEM_TYPES } from '../constants/chatFlowItemTypes';
 import { generateItemKey } from '../utils/chatFlowItemKey';
 // Auto-scroll is now handled by the centralized system in SessionDetailPageBase
@@ -939,21 +940,28 @@ function ConversationTimeline({
             : `${event.llm_interaction_id}-${event.stream_type}`;
           
           const streamType = parseStreamingContentType(event.stream_type);
+          const existing = prev.get(key);
+          const next = applyStreamChunk(existing, event);
+          if (!next) {
+            // Missed a delta - keep the current content until the next keyframe
+            return prev;
+          }
           
           if (event.is_complete) {
             // Stream completed - mark as waiting for DB update
-            const existing = prev.get(key);
             if (existing) {
               updated.set(key, {
                 ...existing,
-                content: event.chunk, // Final content update
+                content: next.content, // Final content update
+                seq: next.seq,
                 waitingForDb: true // Mark as waiting for DB confirmation
               });
             } else {
               // Seed a new entry for completion event with no prior partial entry
               updated.set(key, {
                 type: streamType,
-                content: event.chunk,
+                content: next.content,
+                seq: next.seq,
                 stage_execution_id: event.stage_execution_id,
                 mcp_event_id: event.mcp_event_id,
                 llm_interaction_id: event.llm_interaction_id,
@@ -969,7 +977,8 @@ function ConversationTimeline({
             // Still streaming - update content
             updated.set(key, {
               type: streamType,
-              content: event.chunk,
+              content: next.content,
+              seq: next.seq,
               stage_execution_id: event.stage_execution_id,
               mcp_event_id: event.mcp_event_id,
               llm_interaction_id: event.llm_interaction_id,
@@ -77,13 +77,12 @@ const HistoricalAlertsList: React.FC<EnhancedHistoricalAlertsListProps> = ({
     { field: 'author', label: 'Submitted by' },
     { field: 'started_at_us', label: 'Time' },
     { field: 'duration_ms', label: 'Duration' },
-    // Note: session_total_tokens sorting not implemented in backend (requires complex aggregation)
-    // Column is still displayed but not sortable
+    { field: 'session_total_tokens', label: 'Tokens' },
   ];
 
   // Calculate total column count dynamically:
-  // 1 (Status) + 1 (Parallel Agents icon) + sortableColumns.length + 1 (Tokens) + 1 (Follow-up Chats icon) + 1 (Actions)
-  const totalColumns = 1 + 1 + sortableColumns.length + 1 + 1 + 1;
+  // 1 (Status) + 1 (Parallel Agents icon) + sortableColumns.length + 1 (Follow-up Chats icon) + 1 (Actions)
+  const totalColumns = 1 + 1 + sortableColumns.length + 1 + 1;
 
   return (
     <Paper sx={{ p: 3 }}>
@@ -184,7 +183,6 @@ const HistoricalAlertsList: React.FC<EnhancedHistoricalAlertsListProps> = ({
                       )}
                     </TableCell>
                   ))}
-                  <TableCell sx={{ fontWeight: 600 }}>Tokens</TableCell>
                   <TableCell sx={{ width: 40, px: 0.5, textAlign: 'center' }}>
                     <Tooltip title="Follow-up Chats" arrow>
                       <ChatIcon 
@@ -22,6 +22,8 @@ import {
 export interface StreamingItem {
   type: StreamingContentType | 'tool_call' | 'user_message';
   content?: string;
+  // Last applied llm.stream.chunk sequence number (see applyStreamChunk)
+  seq?: number;
   stage_execution_id?: string;
   mcp_event_id?: string;
   waitingForDb?: boolean;
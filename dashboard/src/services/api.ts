@@ -1,5 +1,5 @@
 import axios, { type AxiosInstance, AxiosError } from 'axios';
-import type { SessionsResponse, Session, DetailedSession, SessionFilter, FilterOptions, SearchResult, SystemWarning, MCPServersResponse, Chat, ChatUserMessage, ChatAvailabilityResponse, MCPSelectionConfig } from '../types';
+import type { SessionsResponse, Session, DetailedSession, SessionTimeline, LLMInteractionDetail, MCPInteractionDetail, SessionFilter, FilterOptions, SearchResult, SystemWarning, MCPServersResponse, Chat, ChatUserMessage, ChatAvailabilityResponse, MCPSelectionConfig } from '../types';
 import { authService } from './auth';
 import { TERMINAL_SESSION_STATUSES } from '../utils/statusConstants';
 
@@ -283,6 +283,53 @@ class APIClient {
     }
   }
 
+  /**
+   * Get session timeline: stages and interaction summaries without payloads (lightweight).
+   * The response carries an ETag, so the browser revalidates it with a 304 when unchanged.
+   */
+  async getSessionTimeline(sessionId: string): Promise<SessionTimeline> {
+    try {
+      const response = await this.client.get<SessionTimeline>(`/api/v1/history/sessions/${sessionId}/timeline`);
+      return response.data;
+    } catch (error) {
+      console.error('Failed to fetch session timeline:', error);
+      if (axios.isAxiosError?.(error) && error.response?.status === 404) {
+        throw new Error('Session not found');
+      }
+      throw error;
+    }
+  }
+
+  /**
+   * Get the full conversation of one LLM interaction of a session (cached by the browser)
+   */
+  async getLLMInteraction(sessionId: string, interactionId: string): Promise<LLMInteractionDetail> {
+    try {
+      const response = await this.client.get<LLMInteractionDetail>(
+        `/api/v1/history/sessions/${sessionId}/llm-interactions/${interactionId}`
+      );
+      return response.data;
+    } catch (error) {
+      console.error('Failed to fetch LLM interaction:', error);
+      throw error;
+    }
+  }
+
+  /**
+   * Get the tool arguments, result and available tools of one MCP interaction (cached by the browser)
+   */
+  async getMCPInteraction(sessionId: string, communicationId: string): Promise<MCPInteractionDetail> {
+    try {
+      const response = await this.client.get<MCPInteractionDetail>(
+        `/api/v1/history/sessions/${sessionId}/mcp-interactions/${communicationId}`
+      );
+      return response.data;
+    } catch (error) {
+      console.error('Failed to fetch MCP interaction:', error);
+      throw error;
+    }
+  }
+
   /**
    * Get session summary statistics only (lightweight)
    */
@@ -0,0 +1,41 @@
+/**
+ * Tests for delta-encoded stream chunk reassembly
+ */
+
+import { describe, it, expect } from 'vitest';
+import { applyStreamChunk } from '../../utils/streamChunks';
+
+describe('applyStreamChunk', () => {
+  it('uses full-content snapshots as they are', () => {
+    expect(applyStreamChunk({ content: 'old', seq: 3 }, { chunk: 'full content' }))
+      .toEqual({ content: 'full content', seq: undefined });
+  });
+
+  it('starts a stream from a keyframe', () => {
+    expect(applyStreamChunk(undefined, { chunk: 'Thought: a', offset: 0, seq: 1, base_seq: 0 }))
+      .toEqual({ content: 'Thought: a', seq: 1 });
+  });
+
+  it('appends and rewrites from the delta offset', () => {
+    const first = applyStreamChunk(undefined, { chunk: 'Thought: pods\nAct', offset: 0, seq: 1, base_seq: 0 });
+    const second = applyStreamChunk(first!, { chunk: ' are fine', offset: 13, seq: 2, base_seq: 1 });
+
+    expect(second).toEqual({ content: 'Thought: pods are fine', seq: 2 });
+  });
+
+  it('applies offsets as UTF-16 indices around non-BMP characters', () => {
+    const first = applyStreamChunk(undefined, { chunk: 'ok 😀 a', offset: 0, seq: 1, base_seq: 0 });
+    const second = applyStreamChunk(first!, { chunk: 'b', offset: 7, seq: 2, base_seq: 1 });
+
+    expect(second).toEqual({ content: 'ok 😀 ab', seq: 2 });
+  });
+
+  it('rejects a delta after a missed message until the next keyframe', () => {
+    const current = { content: 'Thought: a', seq: 1 };
+
+    expect(applyStreamChunk(current, { chunk: 'c', offset: 12, seq: 3, base_seq: 2 })).toBeNull();
+    expect(applyStreamChunk(undefined, { chunk: 'c', offset: 12, seq: 3, base_seq: 2 })).toBeNull();
+    expect(applyStreamChunk(current, { chunk: 'Thought: abc', offset: 0, seq: 4, base_seq: 3 }))
+      .toEqual({ content: 'Thought: abc', seq: 4 });
+  });
+});
@@ -52,6 +52,7 @@ export interface Session {
   final_analysis_summary?: string | null;
   
   chat_message_count?: number; // Number of user messages in follow-up chat (if chat exists)
+  search_snippet?: string | null; // Search results: HTML-escaped excerpt with matches in <mark></mark>
 }
 
 // Phase 5: Interaction summary for stages
@@ -260,6 +261,100 @@ export interface MCPInteractionDetail extends BaseInteraction {
 // Union type for all interactions
 export type InteractionDetail = LLMInteractionDetail | MCPInteractionDetail;
 
+// Session timeline: interactions without payloads (fetched per interaction on demand)
+export interface LLMInteractionSummary {
+  type: 'llm';
+  interaction_id: string;
+  timestamp_us: number;
+  step_description: string;
+  model_name: string;
+  duration_ms: number | null;
+  stage_execution_id: string | null;
+  provider: string | null;
+  interaction_type: string | null;
+  success: boolean;
+  error_message: string | null;
+  input_tokens: number | null;
+  output_tokens: number | null;
+  total_tokens: number | null;
+  mcp_event_id: string | null;
+  response_preview: string | null; // Start of the last conversation message
+}
+
+export interface MCPCommunicationSummary {
+  type: 'mcp';
+  communication_id: string;
+  timestamp_us: number;
+  step_description: string;
+  server_name: string;
+  tool_name: string | null;
+  success: boolean;
+  duration_ms: number | null;
+  stage_execution_id: string | null;
+  communication_type: string | null;
+  error_message: string | null;
+  arguments_preview: string | null; // Start of the tool arguments JSON
+  result_preview: string | null; // Start of the tool result JSON
+}
+
+export type InteractionSummary = LLMInteractionSummary | MCPCommunicationSummary;
+
+export interface TimelineStage {
+  execution_id: string;
+  session_id: string;
+  stage_id: string;
+  stage_index: number;
+  stage_name: string;
+  agent: string;
+  iteration_strategy: string | null;
+  status: StageStatus;
+  started_at_us: number | null;
+  completed_at_us: number | null;
+  duration_ms: number | null;
+  error_message: string | null;
+  chat_id: string | null;
+  chat_user_message_id: string | null;
+  chat_user_message: StageExecution['chat_user_message'];
+  parent_stage_execution_id: string | null;
+  parallel_index: number;
+  parallel_type: string; // "single" | "multi_agent" | "replica"
+  parallel_executions: TimelineStage[] | null;
+  interactions: InteractionSummary[];
+  llm_interaction_count: number;
+  mcp_communication_count: number;
+  total_interactions: number;
+  stage_input_tokens: number | null;
+  stage_output_tokens: number | null;
+  stage_total_tokens: number | null;
+}
+
+export interface SessionTimeline {
+  session_id: string;
+  alert_type: string | null;
+  agent_type: string;
+  status: Session['status'];
+  author: string | null;
+  runbook_url: string | null;
+  started_at_us: number;
+  completed_at_us: number | null;
+  duration_ms: number | null;
+  error_message: string | null;
+  pause_metadata: Session['pause_metadata'];
+  chain_id: string;
+  current_stage_index: number | null;
+  current_stage_id: string | null;
+  mcp_selection: MCPSelectionConfig | null;
+  slack_message_fingerprint: string | null;
+  total_interactions: number;
+  llm_interaction_count: number;
+  mcp_communication_count: number;
+  session_input_tokens: number | null;
+  session_output_tokens: number | null;
+  session_total_tokens: number | null;
+  stages: TimelineStage[];
+  session_level_interactions: InteractionSummary[];
+}
+
 // Legacy timeline item for backward compatibility
 export interface TimelineItem {
   event_id: string;
@@ -287,6 +382,8 @@ export interface Pagination {
   page_size: number;
   total_pages: number;
   total_items: number;
+  total_is_estimate?: boolean;  // total_items is a planner estimate or cached count (count=approximate)
+  next_cursor?: string | null;  // Keyset cursor of the next page (pass as `cursor`)
 }
 
 // Filters applied (for future phases)
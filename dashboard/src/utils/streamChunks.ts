@@ -0,0 +1,43 @@
+/**
+ * Reassembly of delta-encoded llm.stream.chunk events
+ *
+ * The backend sends each stream as messages numbered by `seq`. A message
+ * replaces the content from `offset` on with `chunk`; `base_seq` names the
+ * message it applies on top of. Messages with offset 0 (keyframes) or without
+ * an offset (full-content snapshots) can always be applied. Offsets count
+ * UTF-16 code units, so they index JavaScript strings directly.
+ */
+
+export interface StreamChunkFields {
+  chunk: string;
+  offset?: number | null;
+  seq?: number | null;
+  base_seq?: number | null;
+}
+
+export interface StreamContentState {
+  content?: string;
+  seq?: number;
+}
+
+/**
+ * Apply a stream chunk event to the content received so far
+ *
+ * @param current - Content and last applied seq of the stream (undefined for a new stream)
+ * @param event - llm.stream.chunk event
+ * @returns New content and seq, or null if a message was missed and the
+ *          delta cannot be applied (keep the current content until the next keyframe)
+ */
+export function applyStreamChunk(
+  current: StreamContentState | undefined,
+  event: StreamChunkFields
+): (StreamContentState & { content: string }) | null {
+  const seq = event.seq ?? undefined;
+  if (!event.offset) {
+    return { content: event.chunk, seq };
+  }
+  if (current?.content === undefined || current.seq !== event.base_seq) {
+    return null;
+  }
+  return { content: current.content.slice(0, event.offset) + event.chunk, seq };
+}